@@ -0,0 +1,107 @@
+"""Микробенчмарк пакетного расчёта доходности и риск-метрик облигаций.
+
+Сравнивает решатель `analyze_bonds` (начальное приближение по средневзвешенному
+сроку выплат, дюрация и выпуклость за один проход) с наивным: метод Ньютона от
+фиксированной начальной ставки и отдельные проходы по потоку для дюрации и
+выпуклости. Наивный решатель подставляется в модуль на время замера, поэтому
+сравниваются одни и те же пакеты облигаций и одна и та же функция.
+
+Запуск::
+
+    uv run python packages/finsight-api/benchmarks/bench_bond_analytics.py
+"""
+
+import random
+import timeit
+from array import array
+from decimal import Decimal
+from typing import Final
+from unittest.mock import patch
+
+from finsight_api.domain.analytics import bond
+from finsight_api.domain.analytics.bond import analyze_bonds, BondCashFlows
+
+BONDS: Final[int] = 2_000
+MAX_COUPONS: Final[int] = 40
+REPEAT: Final[int] = 7
+MAX_YIELD_DIFF: Final[float] = 1e-9
+
+
+def _naive_solve_yield(
+    flows: BondCashFlows,
+    dirty_price: float,
+    *,
+    tolerance: float,
+    max_iterations: int,
+) -> tuple[float, float, float] | None:
+    ytm = bond.DEFAULT_YIELD_GUESS
+    for _ in range(max_iterations):
+        value = slope = 0.0
+        for time, amount in zip(flows.times, flows.amounts, strict=True):
+            present_value = amount * (1 + ytm) ** -time
+            value += present_value
+            slope += time * present_value
+        step = (value - dirty_price) * (1 + ytm) / slope
+        ytm += step
+        if abs(step) < tolerance:
+            break
+    else:
+        return None
+
+    value = weighted = curvature = 0.0
+    for time, amount in zip(flows.times, flows.amounts, strict=True):
+        present_value = amount * (1 + ytm) ** -time
+        value += present_value
+        weighted += time * present_value
+    for time, amount in zip(flows.times, flows.amounts, strict=True):
+        curvature += time * (time + 1) * amount * (1 + ytm) ** -time
+    return ytm, weighted / value, curvature / value / (1 + ytm) ** 2
+
+
+def make_bonds(rng: random.Random) -> tuple[list[BondCashFlows], list[Decimal]]:
+    cash_flows, prices = [], []
+    for i in range(BONDS):
+        coupons = rng.randint(2, MAX_COUPONS)
+        first = rng.randint(30, 182) / 365
+        coupon = rng.randint(10, 60)
+        amounts = array('d', [coupon] * coupons)
+        amounts[-1] += 1000
+        cash_flows.append(
+            BondCashFlows(
+                figi=f'FIGI{i:06d}',
+                times=memoryview(array('d', (first + k / 2 for k in range(coupons)))),
+                amounts=memoryview(amounts),
+                accrued_interest=Decimal(0),
+                current_coupon=Decimal(coupon),
+                coupons_per_year=2,
+                estimated=False,
+            )
+        )
+        prices.append(Decimal(rng.randint(700, 1100)))
+    return cash_flows, prices
+
+
+def main() -> None:
+    """Печатает время расчёта наивным и текущим решателем и ускорение."""
+    cash_flows, prices = make_bonds(random.Random(42))
+
+    def run() -> list[bond.BondAnalytics]:
+        return analyze_bonds(cash_flows, prices)
+
+    with patch.object(bond, '_solve_yield', _naive_solve_yield):
+        expected = run()
+        naive = min(timeit.repeat(run, number=1, repeat=REPEAT))
+    actual = run()
+    current = min(timeit.repeat(run, number=1, repeat=REPEAT))
+
+    for old, new in zip(expected, actual, strict=True):
+        assert old.ytm is not None and new.ytm is not None, old.figi  # noqa: S101
+        assert abs(old.ytm - new.ytm) < MAX_YIELD_DIFF, old.figi  # noqa: S101
+
+    name = f'analyze_bonds ({BONDS} bonds)'
+    print(f'{"scenario":<40} {"naive, ms":>12} {"current, ms":>12} {"speedup":>8}')
+    print(f'{name:<40} {naive * 1e3:>12.2f} {current * 1e3:>12.2f} {naive / current:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
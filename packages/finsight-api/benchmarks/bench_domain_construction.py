@@ -0,0 +1,109 @@
+"""Микробенчмарк создания доменных объектов: конструктор против `_from_trusted`.
+
+Для каждого доменного типа, который мапперы создают тысячами, сравнивает обычный
+конструктор frozen-dataclass с внутренним конструктором `_from_trusted` для
+доверенных данных (см. `domain.trusted`).
+
+Запуск::
+
+    uv run python packages/finsight-api/benchmarks/bench_domain_construction.py
+"""
+
+import timeit
+from datetime import datetime, UTC
+from decimal import Decimal
+from typing import Final
+
+from finsight_api.domain.entities.candle import CandleEntity
+from finsight_api.domain.value_objects.bond_coupon import BondCoupon
+from finsight_api.domain.value_objects.candle_interval import CandleInterval
+from finsight_api.domain.value_objects.instrument_type import InstrumentType
+from finsight_api.domain.value_objects.money import Money
+from finsight_api.domain.value_objects.order_book import OrderBookLevel
+from finsight_api.domain.value_objects.portfolio_position import PortfolioPosition
+
+NUMBER: Final[int] = 100_000
+REPEAT: Final[int] = 5
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+RUB = Money(currency='rub', amount=Decimal('12.5'))
+
+TWO, ZERO, PRICE, VALUE = Decimal(2), Decimal(0), Decimal(1000), Decimal(2000)
+
+# Аргументы передаются явно, как в мапперах: распаковка **kwargs исказила бы замер.
+SCENARIOS: Final = {
+    'CandleEntity': (
+        lambda: CandleEntity(
+            figi='FIGI', time=NOW, open=1.0, close=2.0, high=3.0, low=0.5, volume=10, interval=CandleInterval.MIN_1
+        ),
+        lambda: CandleEntity._from_trusted(
+            figi='FIGI', time=NOW, open=1.0, close=2.0, high=3.0, low=0.5, volume=10, interval=CandleInterval.MIN_1
+        ),
+    ),
+    'OrderBookLevel': (
+        lambda: OrderBookLevel(price=RUB, quantity=3),
+        lambda: OrderBookLevel._from_trusted(price=RUB, quantity=3),
+    ),
+    'BondCoupon': (
+        lambda: BondCoupon(
+            figi='FIGI',
+            coupon_date=NOW,
+            coupon_number=1,
+            fix_date=NOW,
+            pay_one_bond=RUB,
+            coupon_type='COUPON_TYPE_CONSTANT',
+            coupon_start_date=NOW,
+            coupon_end_date=NOW,
+            coupon_period=182,
+        ),
+        lambda: BondCoupon._from_trusted(
+            figi='FIGI',
+            coupon_date=NOW,
+            coupon_number=1,
+            fix_date=NOW,
+            pay_one_bond=RUB,
+            coupon_type='COUPON_TYPE_CONSTANT',
+            coupon_start_date=NOW,
+            coupon_end_date=NOW,
+            coupon_period=182,
+        ),
+    ),
+    'PortfolioPosition': (
+        lambda: PortfolioPosition(
+            figi='FIGI',
+            instrument_type=InstrumentType.BOND,
+            quantity=TWO,
+            expected_yield=ZERO,
+            average_position_price=PRICE,
+            current_price=PRICE,
+            current_nkd=None,
+            value=VALUE,
+            instrument_uid='uid',
+        ),
+        lambda: PortfolioPosition._from_trusted(
+            figi='FIGI',
+            instrument_type=InstrumentType.BOND,
+            quantity=TWO,
+            expected_yield=ZERO,
+            average_position_price=PRICE,
+            current_price=PRICE,
+            current_nkd=None,
+            value=VALUE,
+            instrument_uid='uid',
+        ),
+    ),
+}
+
+
+def main() -> None:
+    """Печатает стоимость одного создания объекта обоими путями и ускорение."""
+    print(f'{"type":<20} {"__init__, ns":>14} {"_from_trusted, ns":>18} {"speedup":>8}')
+    for name, (validated, trusted) in SCENARIOS.items():
+        assert validated() == trusted(), name  # noqa: S101
+        init = min(timeit.repeat(validated, number=NUMBER, repeat=REPEAT)) / NUMBER
+        fast = min(timeit.repeat(trusted, number=NUMBER, repeat=REPEAT)) / NUMBER
+        print(f'{name:<20} {init * 1e9:>14.0f} {fast * 1e9:>18.0f} {init / fast:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
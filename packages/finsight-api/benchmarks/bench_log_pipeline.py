@@ -0,0 +1,101 @@
+"""Микробенчмарк записи событий StructlogLogger при медленном выводе.
+
+Поток вывода тратит на каждую запись фиксированное время, как stdout под
+backpressure. Прежний путь — синхронный `StreamHandler`: рендер JSON и запись
+выполняются в вызывающем потоке (в приложении — в event loop). Текущий — очередь
+логов (`finsight_core.telemetry.log_queue`): вызывающий поток только кладёт
+запись в очередь, рендер и запись выполняет фоновый поток.
+
+Для каждого пути печатается время вызова `logger.info` в вызывающем потоке и
+полное время до записи всех событий.
+
+Запуск::
+
+    uv run python packages/finsight-api/benchmarks/bench_log_pipeline.py
+"""
+
+import contextlib
+import time
+from typing import Final, TYPE_CHECKING
+from unittest.mock import patch
+
+from finsight_api.domain.constants import AppEnv, LogLevel
+from finsight_api.infrastructure.adapters.telemetry.logger.structlog import adapter, flush_logging, log_queue_stats
+
+if TYPE_CHECKING:
+    import logging
+    from typing import Any
+
+EVENTS: Final[int] = 5_000
+WRITE_DELAY_SECONDS: Final[float] = 50e-6
+
+
+class SlowStream:
+    """Поток вывода, который тратит фиксированное время на каждую запись."""
+
+    def __init__(self) -> None:
+        """Инициализирует счётчик строк."""
+        self.lines = 0
+
+    def write(self, text: str) -> int:
+        """Ждёт WRITE_DELAY_SECONDS (отпуская GIL, как блокирующий write) и считает строки."""
+        time.sleep(WRITE_DELAY_SECONDS)
+        self.lines += text.count('\n')
+        return len(text)
+
+    def flush(self) -> None:
+        """Ничего не делает: текст не буферизуется."""
+
+
+class SyncPipeline:
+    """Прежний синхронный вывод: логгеры пишут прямо в обработчик вывода."""
+
+    def __init__(self, target: 'logging.Handler', **_: 'Any') -> None:
+        """Запоминает обработчик вывода."""
+        self.handler = target
+
+    def start(self) -> None:
+        """Ничего не делает: фонового потока нет."""
+
+    def stop(self) -> None:
+        """Ничего не делает: фонового потока нет."""
+
+    def flush(self) -> None:
+        """Ничего не делает: записи уже выведены."""
+
+
+def measure(app_instance: str) -> tuple[float, float]:
+    """Возвращает время вызова и полное время записи одного события (секунды)."""
+    logger = adapter.StructlogLogger(
+        app_name='finsight-bench',
+        app_version='0.0.0',
+        app_env=AppEnv.LOCAL,
+        app_instance=app_instance,
+        log_level=LogLevel.INFO,
+    )
+    started = time.perf_counter()
+    for number in range(EVENTS):
+        logger.info('request', number=number, path='/api/v1/portfolio', status_code=200)
+    called = time.perf_counter() - started
+    flush_logging()
+    return called / EVENTS, (time.perf_counter() - started) / EVENTS
+
+
+def main() -> None:
+    """Печатает время вызова и полное время записи события для обоих путей."""
+    stream = SlowStream()
+    with contextlib.redirect_stderr(stream):
+        with patch.object(adapter, 'LogPipeline', SyncPipeline):
+            legacy = measure('legacy')
+        current = measure('current')
+        stats = log_queue_stats()
+
+    assert stream.lines == 2 * EVENTS, stream.lines  # noqa: S101
+    print(f'{"path":<8} {"call, µs":>9} {"total, µs":>10}')
+    for name, (called, total) in (('legacy', legacy), ('current', current)):
+        print(f'{name:<8} {called * 1e6:>9.1f} {total * 1e6:>10.1f}')
+    print(f'call speedup: {legacy[0] / current[0]:.1f}x; queue: {stats}')
+
+
+if __name__ == '__main__':
+    main()
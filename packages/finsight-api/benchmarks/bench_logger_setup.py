@@ -0,0 +1,113 @@
+"""Микробенчмарк создания StructlogLogger на запрос и записи события.
+
+Каждый «запрос» создаёт `StructlogLogger` (как прежний `Factory` в контейнере) и
+пишет одно событие. Прежний путь — настройка logging при каждом создании: на
+корневом логгере копятся обработчики, и одно событие записывается столько раз,
+сколько логгеров было создано. Текущий — однократная настройка
+(`configure_logging`). Вывод пишется в счётчик строк вместо stderr.
+
+Прежний путь квадратичен по числу запросов, поэтому для него запросов меньше.
+
+Запуск::
+
+    uv run python packages/finsight-api/benchmarks/bench_logger_setup.py
+"""
+
+import contextlib
+import logging
+import time
+from typing import Final, TYPE_CHECKING
+from unittest.mock import patch
+
+from finsight_api.domain.constants import AppEnv, LogLevel
+from finsight_api.infrastructure.adapters.telemetry.logger import StructlogLogger
+from finsight_api.infrastructure.adapters.telemetry.logger.structlog import adapter, flush_logging
+from finsight_api.presentation.webserver.constants import DEFAULT_DISABLED_LOGGER_NAMES
+
+if TYPE_CHECKING:
+    from typing import Any
+
+LEGACY_REQUESTS: Final[int] = 1_000
+CURRENT_REQUESTS: Final[int] = 10_000
+
+
+class LineCounter:
+    """Поток вывода, который только считает записанные строки."""
+
+    def __init__(self) -> None:
+        """Инициализирует счётчик."""
+        self.lines = 0
+
+    def write(self, text: str) -> int:
+        """Считает строки текста."""
+        self.lines += text.count('\n')
+        return len(text)
+
+    def flush(self) -> None:
+        """Ничего не делает: текст не буферизуется."""
+
+
+class SyncPipeline:
+    """Прежний синхронный вывод: логгеры пишут прямо в обработчик вывода."""
+
+    def __init__(self, target: logging.Handler, **_: 'Any') -> None:
+        """Запоминает обработчик вывода."""
+        self.handler = target
+
+    def start(self) -> None:
+        """Ничего не делает: фонового потока нет."""
+
+
+def _legacy_configure_logging(**kwargs: 'Any') -> None:
+    with patch.object(adapter, 'LogPipeline', SyncPipeline):
+        adapter._configure(disabled_logger_names=DEFAULT_DISABLED_LOGGER_NAMES, previous_pipeline=None, **kwargs)
+    # Прежняя настройка не отключала передачу записей корневому логгеру.
+    for logger_name in logging.root.manager.loggerDict:
+        if not logger_name.startswith('uvicorn'):
+            logging.getLogger(logger_name).propagate = True
+
+
+def make_logger() -> StructlogLogger:
+    """Создаёт логгер, как прежний Factory в контейнере на каждый запрос."""
+    return StructlogLogger(
+        app_name='finsight-bench',
+        app_version='0.0.0',
+        app_env=AppEnv.LOCAL,
+        app_instance='localhost',
+        log_level=LogLevel.INFO,
+    )
+
+
+def measure(requests: int, sink: LineCounter) -> tuple[float, int, int]:
+    """Возвращает время запроса (секунды), число обработчиков и строк одного события."""
+    started = time.perf_counter()
+    for number in range(requests):
+        make_logger().info('request', number=number)
+    elapsed = (time.perf_counter() - started) / requests
+
+    flush_logging()
+    lines = sink.lines
+    make_logger().info('request', number=requests)
+    flush_logging()
+    return elapsed, len(logging.getLogger().handlers), sink.lines - lines
+
+
+def main() -> None:
+    """Печатает стоимость запроса, число обработчиков и дублирование событий."""
+    sink = LineCounter()
+    with contextlib.redirect_stderr(sink):
+        current = measure(CURRENT_REQUESTS, sink)
+        with patch.object(adapter, 'configure_logging', _legacy_configure_logging):
+            legacy = measure(LEGACY_REQUESTS, sink)
+
+    print(f'{"path":<8} {"requests":>9} {"request, µs":>12} {"root handlers":>14} {"lines/event":>12}')
+    for name, requests, (elapsed, handlers, lines) in (
+        ('legacy', LEGACY_REQUESTS, legacy),
+        ('current', CURRENT_REQUESTS, current),
+    ):
+        print(f'{name:<8} {requests:>9} {elapsed * 1e6:>12.1f} {handlers:>14} {lines:>12}')
+    print(f'speedup: {legacy[0] / current[0]:.0f}x')
+
+
+if __name__ == '__main__':
+    main()
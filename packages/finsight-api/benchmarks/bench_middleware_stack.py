@@ -0,0 +1,161 @@
+"""Микробенчмарк пропускной способности стека middlewares на один HTTP-запрос.
+
+Сравнивает прежние `RequestIDMiddleware` и `RequestLoggingMiddleware` на
+`BaseHTTPMiddleware` (каждый запрос и ответ идёт через дополнительные задачи и
+memory streams, путь URL-кодируется и для исключённых URL) с текущими
+ASGI-middlewares. Запросы подаются в приложение Starlette напрямую через ASGI,
+без сети; вывод логов отбрасывается.
+
+Запуск::
+
+    APP_TINKOFF_INVEST_API__TOKEN=bench uv run python packages/finsight-api/benchmarks/bench_middleware_stack.py
+"""
+
+import asyncio
+import contextlib
+import os
+import time
+from typing import Final, TYPE_CHECKING
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+os.environ.setdefault('APP_TINKOFF_INVEST_API__TOKEN', 'bench')
+
+from finsight_api.infrastructure.container import app_container  # noqa: E402
+from finsight_api.presentation.webserver.middlewares.request_id import RequestIDMiddleware  # noqa: E402
+from finsight_api.presentation.webserver.middlewares.request_logging import RequestLoggingMiddleware  # noqa: E402
+from finsight_core.telemetry.context import (  # noqa: E402
+    DEFAULT_REQUEST_ID_HEADER,
+    extract_request_id,
+    set_request_id,
+)
+
+if TYPE_CHECKING:
+    from starlette.middleware.base import RequestResponseEndpoint
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from starlette.types import ASGIApp, Message
+
+REQUESTS: Final[int] = 5_000
+EXCLUDED_URLS: Final[frozenset[str]] = frozenset({'/health', '/metrics'})
+PATHS: Final[tuple[tuple[str, bytes], ...]] = (
+    ('/api/v1/portfolio', b'account_id=1'),
+    ('/health', b''),
+)
+
+
+class NullStream:
+    """Поток вывода, отбрасывающий текст."""
+
+    def write(self, text: str) -> int:
+        """Отбрасывает текст."""
+        return len(text)
+
+    def flush(self) -> None:
+        """Ничего не делает."""
+
+
+class LegacyRequestIDMiddleware(BaseHTTPMiddleware):
+    """Прежний RequestIDMiddleware на BaseHTTPMiddleware."""
+
+    async def dispatch(self, request: 'Request', call_next: 'RequestResponseEndpoint') -> 'Response':
+        """Добавляет X-Request-ID в контекст и ответ."""
+        request_id = set_request_id(extract_request_id(request))
+        response = await call_next(request)
+        response.headers[DEFAULT_REQUEST_ID_HEADER] = request_id
+        return response
+
+
+class LegacyRequestLoggingMiddleware(BaseHTTPMiddleware):
+    """Прежний RequestLoggingMiddleware на BaseHTTPMiddleware."""
+
+    def __init__(self, app: 'ASGIApp', exclude_urls_from_logging: frozenset[str] = frozenset()) -> None:
+        """Инициализирует middleware."""
+        super().__init__(app)
+        self.exclude_urls_from_logging = exclude_urls_from_logging
+        self._logger = app_container.logger()
+
+    async def dispatch(self, request: 'Request', call_next: 'RequestResponseEndpoint') -> 'Response':
+        """Логирует завершение запроса."""
+        start_time = time.perf_counter_ns()
+        response = await call_next(request)
+        elapsed_time = (time.perf_counter_ns() - start_time) // 1_000_000
+        host = request.client.host if request.client else None
+        url = RequestLoggingMiddleware.get_path_with_query_string(request.scope)
+        http_method, http_version = request.method, request.scope.get('http_version', '')
+        if url not in self.exclude_urls_from_logging:
+            self._logger.info(
+                f'{host} - {http_method} {url} HTTP/{http_version} {response.status_code}',
+                elapsed_time=elapsed_time,
+                client={'host': host},
+                http={'method': http_method, 'status_code': response.status_code, 'version': http_version, 'url': url},
+            )
+        return response
+
+
+async def endpoint(_: 'Request') -> PlainTextResponse:
+    """Возвращает короткий ответ."""
+    return PlainTextResponse('ok')
+
+
+def make_app(request_id: type, request_logging: type) -> Starlette:
+    """Собирает приложение с middlewares в порядке AppFactory."""
+    app = Starlette(routes=[Route(path, endpoint) for path, _ in PATHS])
+    app.add_middleware(request_logging, exclude_urls_from_logging=EXCLUDED_URLS)
+    app.add_middleware(request_id)
+    return app
+
+
+async def measure(app: Starlette, path: str, query_string: bytes) -> float:
+    """Возвращает число запросов в секунду через приложение."""
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': query_string,
+        'root_path': '',
+        'headers': [(b'host', b'bench')],
+        'client': ('127.0.0.1', 50000),
+        'server': ('bench', 80),
+    }
+
+    async def receive() -> 'Message':
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message: 'Message') -> None:
+        pass
+
+    await app(dict(scope), receive, send)
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        await app(dict(scope), receive, send)
+    return REQUESTS / (time.perf_counter() - started)
+
+
+async def run() -> None:
+    """Печатает число запросов в секунду для обоих стеков и ускорение."""
+    legacy = make_app(LegacyRequestIDMiddleware, LegacyRequestLoggingMiddleware)
+    current = make_app(RequestIDMiddleware, RequestLoggingMiddleware)
+    print(f'{"path":<20} {"legacy, req/s":>14} {"current, req/s":>15} {"speedup":>8}')
+    for path, query_string in PATHS:
+        before = await measure(legacy, path, query_string)
+        after = await measure(current, path, query_string)
+        print(f'{path:<20} {before:>14.0f} {after:>15.0f} {after / before:>7.2f}x')
+
+
+def main() -> None:
+    """Запускает бенчмарк, отбрасывая вывод логов."""
+    with contextlib.redirect_stderr(NullStream()):
+        app_container.logger()
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Микробенчмарк разрешения зависимостей FastAPI на один HTTP-запрос.
+
+Сравнивает прежний путь — синхронная зависимость (FastAPI вызывает её в пуле
+потоков), новый `AppContainer()` со своими адаптерами и use case на запрос,
+плюс `AppContainer.logger()` (Factory `StructlogLogger`) в middleware — с
+текущим: асинхронная зависимость возвращает синглтон use case из общего
+`app_container`, а middleware использует общий логгер.
+
+Запуск::
+
+    APP_TINKOFF_INVEST_API__TOKEN=bench uv run python packages/finsight-api/benchmarks/bench_request_di.py
+"""
+
+import asyncio
+import os
+import time
+from typing import Final, TYPE_CHECKING
+
+from starlette.concurrency import run_in_threadpool
+
+os.environ.setdefault('APP_TINKOFF_INVEST_API__TOKEN', 'bench')
+
+from finsight_api.application.use_cases.get_portfolio import GetPortfolioUseCase  # noqa: E402
+from finsight_api.infrastructure.adapters.telemetry.logger import StructlogLogger  # noqa: E402
+from finsight_api.infrastructure.container import app_container, AppContainer  # noqa: E402
+from finsight_api.presentation.webserver.dependencies.get_portfolio_use_case import (  # noqa: E402
+    get_portfolio_use_case,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+LEGACY_REQUESTS: Final[int] = 200
+CURRENT_REQUESTS: Final[int] = 20_000
+
+
+def _legacy_resolve() -> GetPortfolioUseCase:
+    settings = AppContainer.settings()
+    StructlogLogger(
+        app_name=settings.app.name,
+        app_version=settings.app.version,
+        app_env=settings.app.env,
+        app_instance=settings.app.host,
+        log_level=settings.logging.log_level,
+    )
+    return GetPortfolioUseCase(gateway=AppContainer().tinkoff_invest())
+
+
+async def _legacy_request() -> GetPortfolioUseCase:
+    return await run_in_threadpool(_legacy_resolve)
+
+
+async def _current_request() -> GetPortfolioUseCase:
+    app_container.logger()
+    return await get_portfolio_use_case()
+
+
+async def measure(request: 'Callable[[], Awaitable[GetPortfolioUseCase]]', requests: int) -> float:
+    """Возвращает среднее время разрешения зависимостей одного запроса (секунды)."""
+    await request()
+    started = time.perf_counter()
+    for _ in range(requests):
+        await request()
+    return (time.perf_counter() - started) / requests
+
+
+async def run() -> None:
+    """Печатает стоимость разрешения зависимостей запроса обоими путями и ускорение."""
+    current = await measure(_current_request, CURRENT_REQUESTS)
+    legacy = await measure(_legacy_request, LEGACY_REQUESTS)
+    shared = await _current_request() is await _current_request()
+    print(f'{"scenario":<40} {"legacy, us":>12} {"current, us":>12} {"speedup":>8}')
+    print(f'{"resolve GetPortfolioUseCase":<40} {legacy * 1e6:>12.1f} {current * 1e6:>12.1f} {legacy / current:>7.0f}x')
+    print(f'use case shared between requests: {shared}')
+
+
+def main() -> None:
+    """Запускает замер в цикле событий."""
+    asyncio.run(run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+"""Микробенчмарк мапперов Tinkoff: Decimal из units/nano.
+
+Сравнивает текущие мапперы (нано-единицы и кэш Decimal/Money) с прежним путём,
+который строил два Decimal и делил их для каждого MoneyValue и Quotation, а цены
+свечей собирал из отдельных float-операций. Прежний путь подставляется в модуль
+мапперов на время замера, поэтому сравниваются одни и те же функции маппинга.
+
+Данные имитируют опрос: один и тот же большой портфель и стаканы с небольшим
+сдвигом цен маппятся многократно, как при обновлении дашборда.
+
+Запуск::
+
+    uv run python packages/finsight-api/benchmarks/bench_tinkoff_mappers.py
+"""
+
+import random
+import timeit
+from contextlib import ExitStack
+from datetime import datetime, UTC
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Final, TYPE_CHECKING
+from unittest.mock import patch
+
+from finsight_api.domain.entities.candle import CandleEntity
+from finsight_api.domain.value_objects.candle_interval import CandleInterval
+from finsight_api.domain.value_objects.money import Money
+from finsight_api.domain.value_objects.order_book import OrderBook, OrderBookLevel
+from finsight_api.infrastructure.adapters.tinkoff import mappers
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+POSITIONS: Final[int] = 2_000
+ORDER_BOOKS: Final[int] = 200
+ORDER_BOOK_DEPTH: Final[int] = 50
+CANDLES: Final[int] = 20_000
+REPEAT: Final[int] = 7
+
+_LEGACY_NANO_FACTOR = Decimal('1_000_000_000')
+
+
+def _legacy_to_decimal(value: SimpleNamespace) -> Decimal:
+    return Decimal(int(value.units)) + (Decimal(int(value.nano)) / _LEGACY_NANO_FACTOR)
+
+
+def _legacy_order_book_levels(orders: 'Iterable[SimpleNamespace]') -> list[OrderBookLevel]:
+    return [
+        OrderBookLevel(price=Money(currency='rub', amount=_legacy_to_decimal(o.price)), quantity=int(o.quantity))
+        for o in orders
+    ]
+
+
+def _legacy_map_order_book(response: SimpleNamespace) -> OrderBook:
+    return OrderBook(
+        figi=response.figi,
+        depth=int(response.depth),
+        bids=_legacy_order_book_levels(response.bids),
+        asks=_legacy_order_book_levels(response.asks),
+        last_price=Money(currency='rub', amount=_legacy_to_decimal(response.last_price)),
+        close_price=Money(currency='rub', amount=_legacy_to_decimal(response.close_price)),
+        timestamp=None,
+    )
+
+
+def _legacy_map_candle(candle: SimpleNamespace, *, figi: str, interval: CandleInterval) -> CandleEntity:
+    return CandleEntity(
+        time=candle.time,
+        open=float(candle.open.units) + candle.open.nano / 1e9,
+        close=float(candle.close.units) + candle.close.nano / 1e9,
+        high=float(candle.high.units) + candle.high.nano / 1e9,
+        low=float(candle.low.units) + candle.low.nano / 1e9,
+        volume=candle.volume,
+        figi=figi,
+        interval=interval,
+    )
+
+
+# Прежние реализации, подставляемые в модуль мапперов на время замера.
+LEGACY: Final[dict[str, object]] = {
+    '_money_value_to_decimal': _legacy_to_decimal,
+    '_quotation_to_decimal': _legacy_to_decimal,
+    'map_order_book_from_sdk': _legacy_map_order_book,
+    'map_candle_from_sdk': _legacy_map_candle,
+}
+
+
+def _value(nanos: int, currency: str = 'rub') -> SimpleNamespace:
+    units, nano = divmod(nanos, mappers.NANO_FACTOR)
+    return SimpleNamespace(units=units, nano=nano, currency=currency)
+
+
+def make_portfolio(rng: random.Random) -> SimpleNamespace:
+    positions = [
+        SimpleNamespace(
+            figi=f'FIGI{i:06d}',
+            instrument_type='bond' if i % 2 else 'share',
+            quantity=_value(rng.randint(1, 500) * mappers.NANO_FACTOR),
+            expected_yield=_value(rng.randint(-(10**12), 10**12)),
+            average_position_price=_value(rng.randint(10**9, 10**13)),
+            current_price=_value(rng.randint(10**9, 10**13)),
+            current_nkd=_value(rng.randint(0, 10**11)),
+            instrument_uid=f'uid-{i}',
+        )
+        for i in range(POSITIONS)
+    ]
+    total = _value(10**15)
+    return SimpleNamespace(
+        positions=positions,
+        total_amount_shares=total,
+        total_amount_bonds=total,
+        total_amount_etf=total,
+        total_amount_futures=total,
+        total_amount_portfolio=total,
+        total_amount_currencies=total,
+    )
+
+
+def make_order_books(rng: random.Random) -> list[SimpleNamespace]:
+    tick = 10_000_000
+    books = []
+    for _ in range(ORDER_BOOKS):
+        mid = 100 * mappers.NANO_FACTOR + rng.randint(-20, 20) * tick
+        books.append(
+            SimpleNamespace(
+                figi='FIGI000001',
+                depth=ORDER_BOOK_DEPTH,
+                bids=[SimpleNamespace(price=_value(mid - i * tick), quantity=i + 1) for i in range(ORDER_BOOK_DEPTH)],
+                asks=[SimpleNamespace(price=_value(mid + i * tick), quantity=i + 1) for i in range(ORDER_BOOK_DEPTH)],
+                last_price=_value(mid),
+                close_price=_value(mid),
+                orderbook_ts=None,
+            )
+        )
+    return books
+
+
+def make_candles(rng: random.Random) -> list[SimpleNamespace]:
+    time = datetime(2025, 1, 1, tzinfo=UTC)
+    return [
+        SimpleNamespace(
+            time=time,
+            open=_value(rng.randint(10**9, 10**12)),
+            close=_value(rng.randint(10**9, 10**12)),
+            high=_value(rng.randint(10**9, 10**12)),
+            low=_value(rng.randint(10**9, 10**12)),
+            volume=rng.randint(1, 10_000),
+        )
+        for _ in range(CANDLES)
+    ]
+
+
+def measure(run: 'Callable[[], object]', *, legacy: bool) -> float:
+    """Возвращает лучшее время одного прогона из REPEAT (секунды)."""
+    with ExitStack() as stack:
+        if legacy:
+            for name, replacement in LEGACY.items():
+                stack.enter_context(patch.object(mappers, name, replacement))
+        mappers._decimal_from_nanos.cache_clear()
+        mappers._rub_from_nanos.cache_clear()
+        return min(timeit.repeat(run, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    """Печатает время маппинга прежним и текущим путём и ускорение."""
+    rng = random.Random(42)
+    portfolio = make_portfolio(rng)
+    order_books = make_order_books(rng)
+    candles = make_candles(rng)
+
+    scenarios: dict[str, Callable[[], object]] = {
+        f'portfolio ({POSITIONS} positions)': lambda: mappers.map_portfolio_from_sdk(portfolio, account_id='bench'),
+        f'order books ({ORDER_BOOKS} x {ORDER_BOOK_DEPTH * 2} levels)': lambda: [
+            mappers.map_order_book_from_sdk(book) for book in order_books
+        ],
+        f'candles ({CANDLES})': lambda: [
+            mappers.map_candle_from_sdk(candle, figi='FIGI000001', interval=CandleInterval.MIN_1) for candle in candles
+        ],
+    }
+
+    print(f'{"scenario":<40} {"legacy, ms":>12} {"current, ms":>12} {"speedup":>8}')
+    for name, run in scenarios.items():
+        legacy = measure(run, legacy=True)
+        current = measure(run, legacy=False)
+        print(f'{name:<40} {legacy * 1e3:>12.2f} {current * 1e3:>12.2f} {legacy / current:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
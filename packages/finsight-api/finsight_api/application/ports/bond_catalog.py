@@ -0,0 +1,50 @@
+"""Порт локального каталога облигаций.
+
+Каталог держит в памяти метаданные всего доступного универса облигаций и отвечает
+на поиск по идентификатору без сетевого вызова. Отсутствие облигации в каталоге —
+не ошибка: use case обращается к внешнему API напрямую.
+"""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from finsight_api.domain.entities.bond import BondEntity
+    from finsight_api.domain.value_objects.isin import ISIN
+
+
+class BondCatalogPort(ABC):
+    """Интерфейс каталога облигаций."""
+
+    @abstractmethod
+    async def get_by_isin(self, isin: 'ISIN') -> 'BondEntity | None':
+        """Возвращает облигацию по ISIN.
+
+        Args:
+            isin: ISIN облигации.
+
+        Returns:
+            Доменная сущность облигации или None, если её нет в каталоге.
+        """
+
+    @abstractmethod
+    async def get_by_figi(self, figi: str) -> 'BondEntity | None':
+        """Возвращает облигацию по FIGI.
+
+        Args:
+            figi: FIGI облигации.
+
+        Returns:
+            Доменная сущность облигации или None, если её нет в каталоге.
+        """
+
+    @abstractmethod
+    async def get_by_uid(self, uid: str) -> 'BondEntity | None':
+        """Возвращает облигацию по UID.
+
+        Args:
+            uid: UID облигации.
+
+        Returns:
+            Доменная сущность облигации или None, если её нет в каталоге.
+        """
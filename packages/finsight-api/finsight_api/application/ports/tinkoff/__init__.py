@@ -3,18 +3,21 @@
 Пакет группирует контракты по подсервисам внешнего API:
 - операции (портфель и счета),
 - инструменты (метаданные, купоны, бренды),
-- маркет-данные (свечи, стакан).
+- маркет-данные (свечи, стакан),
+- поток маркет-данных (подписки на стаканы, последние цены и свечи).
 """
 
 from .base import TinkoffInvestPort
 from .instruments import TinkoffInstrumentsPort
 from .market_data import TinkoffMarketDataPort
+from .market_data_stream import TinkoffMarketDataStreamPort
 from .operations import TinkoffOperationsPort
 
 
 __all__ = [
     'TinkoffInstrumentsPort',
     'TinkoffMarketDataPort',
+    'TinkoffMarketDataStreamPort',
     'TinkoffOperationsPort',
     'TinkoffInvestPort',
 ]
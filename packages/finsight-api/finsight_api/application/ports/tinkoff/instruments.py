@@ -22,6 +22,20 @@ class TinkoffInstrumentsPort(ABC):
     # - Добавить доменные ошибки порта и маппинг SDK-ошибок на них.
     # - Добавить входные/выходные DTO порта для стабильных контрактов use cases.
 
+    @abstractmethod
+    async def get_figi_by_isin(self, isin: str) -> str:
+        """Возвращает FIGI инструмента по ISIN.
+
+        Args:
+            isin: ISIN инструмента.
+
+        Returns:
+            FIGI-идентификатор инструмента.
+
+        Raises:
+            InstrumentNotFoundError: Если инструмент по ISIN не найден.
+        """
+
     @abstractmethod
     async def get_bond_by_figi(self, figi: str) -> 'BondEntity':
         """Возвращает метаданные облигации по FIGI.
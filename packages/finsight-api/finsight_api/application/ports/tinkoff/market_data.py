@@ -7,10 +7,11 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncIterator, Sequence
     from datetime import date
 
     from finsight_api.domain.entities.candle import CandleEntity
+    from finsight_api.domain.entities.candle_frame import CandleFrame
     from finsight_api.domain.value_objects.candle_interval import CandleInterval
     from finsight_api.domain.value_objects.order_book import OrderBook
 
@@ -42,6 +43,49 @@ class TinkoffMarketDataPort(ABC):
             Последовательность доменных сущностей свечей.
         """
 
+    @abstractmethod
+    async def get_candle_frame_by_isin(
+        self,
+        isin: str,
+        from_date: 'date',
+        to_date: 'date',
+        interval: 'CandleInterval',
+    ) -> 'CandleFrame':
+        """Возвращает историю котировок по ISIN в колоночном виде.
+
+        Args:
+            isin: ISIN-идентификатор ценной бумаги.
+            from_date: Начальная дата интервала.
+            to_date: Конечная дата интервала.
+            interval: Интервал свечей.
+
+        Returns:
+            Колоночная серия свечей инструмента.
+        """
+
+    @abstractmethod
+    def stream_candle_frames_by_isin(
+        self,
+        isin: str,
+        from_date: 'date',
+        to_date: 'date',
+        interval: 'CandleInterval',
+    ) -> 'AsyncIterator[CandleFrame]':
+        """Загружает историю котировок по ISIN окнами и отдаёт их по мере готовности.
+
+        Период делится на окна, допустимые API для интервала; окна загружаются
+        параллельно и отдаются в порядке времени без повторяющихся свечей.
+
+        Args:
+            isin: ISIN-идентификатор ценной бумаги.
+            from_date: Начальная дата интервала.
+            to_date: Конечная дата интервала.
+            interval: Интервал свечей.
+
+        Returns:
+            Асинхронный итератор колоночных серий свечей по окнам.
+        """
+
     @abstractmethod
     async def get_order_book(self, *, figi: str, depth: int = 1) -> 'OrderBook':
         """Возвращает стакан по инструменту.
@@ -0,0 +1,85 @@
+"""Порт потоковых маркет-данных Tinkoff Invest API.
+
+Стаканы, последние цены и минутные свечи приходят по подписке через поток
+маркет-данных и хранятся в памяти. Чтение возвращает только актуальное
+состояние: пока по инструменту нет данных текущей подписки, возвращается None,
+и use case запрашивает снимок unary-вызовом.
+"""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection
+
+    from finsight_api.domain.entities.candle import CandleEntity
+    from finsight_api.domain.value_objects.last_price import LastPrice
+    from finsight_api.domain.value_objects.order_book import OrderBook
+
+
+class TinkoffMarketDataStreamPort(ABC):
+    """Интерфейс потоковых маркет-данных Tinkoff Invest API."""
+
+    @abstractmethod
+    def watch(self, figis: 'Collection[str]', *, order_book_depth: int = 1) -> 'Callable[[], None]':
+        """Подписывается на стаканы, последние цены и свечи инструментов.
+
+        Не ждёт первых данных: подписка оформляется в фоне. Повторная подписка на
+        уже отслеживаемый инструмент не создаёт новой подписки в потоке (кроме
+        увеличения глубины стакана). Инструмент отслеживается, пока не освобождены
+        все полученные на него подписки.
+
+        Args:
+            figis: FIGI инструментов.
+            order_book_depth: Глубина стакана.
+
+        Returns:
+            Функция освобождения подписки.
+        """
+
+    @abstractmethod
+    def get_order_book(self, figi: str, *, depth: int = 1) -> 'OrderBook | None':
+        """Возвращает актуальный стакан из потока.
+
+        Args:
+            figi: FIGI инструмента.
+            depth: Требуемая глубина стакана.
+
+        Returns:
+            Стакан (не глубже depth) или None, если актуального стакана такой глубины нет.
+        """
+
+    @abstractmethod
+    def get_last_price(self, figi: str) -> 'LastPrice | None':
+        """Возвращает актуальную последнюю цену из потока.
+
+        Args:
+            figi: FIGI инструмента.
+
+        Returns:
+            Последняя цена или None, если её нет.
+        """
+
+    @abstractmethod
+    def get_candle(self, figi: str) -> 'CandleEntity | None':
+        """Возвращает последнюю минутную свечу из потока.
+
+        Args:
+            figi: FIGI инструмента.
+
+        Returns:
+            Свеча или None, если её нет.
+        """
+
+    @abstractmethod
+    def add_last_price_listener(self, listener: 'Callable[[LastPrice], None]') -> 'Callable[[], None]':
+        """Подписывает слушателя на последние цены из потока.
+
+        Слушатель вызывается синхронно в цикле чтения потока и не должен блокировать.
+
+        Args:
+            listener: Функция, вызываемая с каждой новой последней ценой.
+
+        Returns:
+            Функция отписки слушателя.
+        """
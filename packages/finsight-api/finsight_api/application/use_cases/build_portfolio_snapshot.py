@@ -3,18 +3,39 @@
 UC строит снапшот на основе портфеля (positions) и дополнительных данных по
 инструментам (bond_by_figi, coupons, order_book). Обогащение выполняется
 по каждой позиции независимо: ошибки не прерывают сборку всего снапшота.
+
+Шаги обогащения всех позиций выполняются параллельно: общее число одновременных
+запросов к провайдеру ограничено `concurrency`, каждый шаг — `step_timeout_seconds`.
+
+Если передан поток маркет-данных, UC на время сборки подписывается на инструменты
+портфеля, и стакан позиции с актуальными данными потока берётся из него без
+запроса к API.
+
+После обогащения по всем полученным стаканам одним пакетом считаются метрики
+ликвидности (`domain.analytics.order_book`) для продажи всей позиции по рынку,
+а по купонам и номиналам облигаций — помесячный прогноз выплат портфеля
+(`domain.analytics.cash_flows`).
 """
 
+import asyncio
+import time
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import date, datetime, UTC
 from typing import TYPE_CHECKING
 
+from finsight_api.domain.analytics.cash_flows import CashFlowPeriod, CashFlowProjection
+from finsight_api.domain.analytics.order_book import analyze_order_books
 from finsight_api.domain.value_objects.instrument_type import InstrumentType
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from finsight_api.application.ports.logger import LoggerPort
     from finsight_api.application.ports.tinkoff import TinkoffInvestPort
+    from finsight_api.application.ports.tinkoff.market_data_stream import TinkoffMarketDataStreamPort
+    from finsight_api.domain.analytics.cash_flows import CashFlowBucket
+    from finsight_api.domain.analytics.order_book import OrderBookMetrics
     from finsight_api.domain.entities.bond import BondEntity
     from finsight_api.domain.entities.portfolio import PortfolioEntity
     from finsight_api.domain.value_objects.bond_coupon import BondCoupon
@@ -31,12 +52,16 @@ class BuildPortfolioSnapshotInput:
         order_book_depth: Глубина стакана для snapshot.
         coupons_from_date: Нижняя граница периода купонов (включительно).
         coupons_to_date: Верхняя граница периода купонов (включительно).
+        concurrency: Максимальное число одновременных запросов обогащения.
+        step_timeout_seconds: Таймаут одного шага обогащения (None — без таймаута).
     """
 
     account_id: str
-    order_book_depth: int = 1
+    order_book_depth: int = 10
     coupons_from_date: 'date | None' = None
     coupons_to_date: 'date | None' = None
+    concurrency: int = 8
+    step_timeout_seconds: float | None = 10.0
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -56,6 +81,23 @@ class EnrichmentError:
     message: str
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class EnrichmentStepTiming:
+    """Время выполнения шага обогащения позиции.
+
+    Attributes:
+        figi: FIGI позиции.
+        step: Шаг обогащения (bond_by_figi / coupons / order_book).
+        duration_ms: Время выполнения шага, мс (включая ожидание слота concurrency).
+        succeeded: Шаг завершился без ошибки.
+    """
+
+    figi: str
+    step: str
+    duration_ms: float
+    succeeded: bool
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class BondEnrichment:
     """Обогащение для облигационной позиции.
@@ -67,12 +109,15 @@ class BondEnrichment:
         credit_ratings: Кредитные рейтинги. На текущем этапе не поддерживаются.
             Всегда None (не “пустой список”), чтобы явно обозначать отсутствие
             источника данных/подсистемы.
+        order_book_metrics: Метрики ликвидности стакана для продажи всей позиции
+            (None, если стакан не получен).
     """
 
     bond: 'BondEntity | None'
     coupons: Sequence['BondCoupon']
     order_book: 'OrderBook | None'
     credit_ratings: None
+    order_book_metrics: 'OrderBookMetrics | None' = None
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -98,6 +143,10 @@ class BuildPortfolioSnapshotOutput:
         positions: Список позиций с обогащением.
         enrichment_errors: Ошибки обогащения (по позициям).
         enrichment_failed_count: Количество ошибок обогащения.
+        enrichment_timings: Время выполнения шагов обогащения (по позициям).
+        enrichment_duration_ms: Общее время обогащения всех позиций, мс.
+        income_calendar: Прогноз купонов и погашений облигаций по месяцам и валютам
+            (с даты снапшота или coupons_from_date до coupons_to_date).
     """
 
     created_at: 'datetime'
@@ -106,6 +155,9 @@ class BuildPortfolioSnapshotOutput:
     positions: Sequence['PositionSnapshot']
     enrichment_errors: Sequence['EnrichmentError']
     enrichment_failed_count: int
+    enrichment_timings: Sequence['EnrichmentStepTiming'] = ()
+    enrichment_duration_ms: float = 0.0
+    income_calendar: Sequence['CashFlowBucket'] = ()
 
 
 class BuildPortfolioSnapshotUseCase:
@@ -115,17 +167,28 @@ class BuildPortfolioSnapshotUseCase:
     дополнительно запрашивает метаданные облигации, купоны и стакан. Обогащение
     по каждой позиции и каждому шагу изолировано: ошибки шага логируются и
     фиксируются в результате, не прерывая сборку остального снапшота.
+
+    Шаги и позиции обогащаются параллельно, при этом порядок позиций, ошибок и
+    замеров в результате совпадает с порядком позиций портфеля и шагов.
     """
 
-    def __init__(self, *, tinkoff: 'TinkoffInvestPort', logger: 'LoggerPort') -> None:
+    def __init__(
+        self,
+        *,
+        tinkoff: 'TinkoffInvestPort',
+        logger: 'LoggerPort',
+        market_data_stream: 'TinkoffMarketDataStreamPort | None' = None,
+    ) -> None:
         """Инициализирует Use Case.
 
         Args:
             tinkoff: Порт интеграции с Tinkoff Invest API.
             logger: Логгер приложения.
+            market_data_stream: Поток маркет-данных (опционально).
         """
         self._tinkoff = tinkoff
         self._logger = logger
+        self._market_data_stream = market_data_stream
 
     async def execute(self, data: BuildPortfolioSnapshotInput) -> BuildPortfolioSnapshotOutput:
         """Строит снапшот портфеля с обогащением.
@@ -138,80 +201,139 @@ class BuildPortfolioSnapshotUseCase:
 
         Returns:
             BuildPortfolioSnapshotOutput: Снапшот портфеля.
+
+        Raises:
+            ValueError: Если concurrency не является положительным числом.
         """
+        if data.concurrency <= 0:
+            raise ValueError('Concurrency must be a positive integer')
+
         portfolio = await self._tinkoff.get_portfolio(data.account_id)
+        bond_positions = [pos for pos in portfolio.positions if pos.instrument_type == InstrumentType.BOND]
+
+        release = None
+        if self._market_data_stream is not None:
+            release = self._market_data_stream.watch(
+                [pos.figi for pos in bond_positions],
+                order_book_depth=data.order_book_depth,
+            )
+
+        semaphore = asyncio.Semaphore(data.concurrency)
+        started = time.perf_counter()
+
+        try:
+            enrichments = await asyncio.gather(
+                *(self._enrich_bond_position(figi=pos.figi, data=data, semaphore=semaphore) for pos in bond_positions)
+            )
+        finally:
+            if release is not None:
+                release()
+
+        enrichment_duration_ms = _elapsed_ms(started)
+
+        # Объём исполнения — количество бумаг позиции: облигации торгуются лотом в одну бумагу.
+        order_book_metrics = {
+            metrics.figi: metrics
+            for metrics in analyze_order_books(
+                (enrichment.order_book, int(pos.quantity))
+                for pos, (enrichment, _, _) in zip(bond_positions, enrichments, strict=True)
+                if enrichment.order_book is not None
+            )
+        }
 
         positions: list[PositionSnapshot] = []
         errors: list[EnrichmentError] = []
+        timings: list[EnrichmentStepTiming] = []
 
+        bond_enrichments = iter(enrichments)
         for pos in portfolio.positions:
             if pos.instrument_type != InstrumentType.BOND:
                 positions.append(PositionSnapshot(position=pos, enrichment=None))
                 continue
 
-            enrichment, pos_errors = await self._enrich_bond_position(
-                figi=pos.figi,
-                order_book_depth=data.order_book_depth,
-                coupons_from_date=data.coupons_from_date,
-                coupons_to_date=data.coupons_to_date,
-            )
+            enrichment, pos_errors, pos_timings = next(bond_enrichments)
             errors.extend(pos_errors)
+            timings.extend(pos_timings)
+            enrichment = replace(enrichment, order_book_metrics=order_book_metrics.get(pos.figi))
             positions.append(PositionSnapshot(position=pos, enrichment=enrichment))
 
+        created_at = datetime.now(tz=UTC)
+        projection_start = max(created_at.date(), data.coupons_from_date or date.min)
+        income_calendar = CashFlowProjection.from_positions(
+            (
+                (snapshot.position, snapshot.enrichment.bond, snapshot.enrichment.coupons)
+                for snapshot in positions
+                if snapshot.enrichment is not None and snapshot.enrichment.bond is not None
+            ),
+            start=projection_start,
+            end=data.coupons_to_date,
+        ).buckets(CashFlowPeriod.MONTH)
+
         return BuildPortfolioSnapshotOutput(
-            created_at=datetime.now(tz=UTC),
+            created_at=created_at,
             portfolio=portfolio,
             positions=positions,
             enrichment_errors=tuple(errors),
             enrichment_failed_count=len(errors),
+            enrichment_timings=tuple(timings),
+            enrichment_duration_ms=enrichment_duration_ms,
+            income_calendar=income_calendar,
         )
 
     async def _enrich_bond_position(
         self,
         *,
         figi: str,
-        order_book_depth: int,
-        coupons_from_date: date | None,
-        coupons_to_date: date | None,
-    ) -> tuple[BondEnrichment, list[EnrichmentError]]:
-        """Обогащает одну bond-позицию.
+        data: BuildPortfolioSnapshotInput,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[BondEnrichment, list[EnrichmentError], list[EnrichmentStepTiming]]:
+        """Обогащает одну bond-позицию, выполняя шаги параллельно.
 
         Args:
             figi: FIGI инструмента.
-            order_book_depth: Глубина стакана.
-            coupons_from_date: Нижняя граница периода купонов (включительно).
-            coupons_to_date: Верхняя граница периода купонов (включительно).
+            data: Входные параметры Use Case (глубина стакана, период купонов, таймаут).
+            semaphore: Общий для всех позиций ограничитель одновременных запросов.
 
         Returns:
-            tuple[BondEnrichment, list[EnrichmentError]]: Обогащение и список ошибок.
+            Обогащение, список ошибок и замеры шагов в порядке bond_by_figi, coupons, order_book.
         """
-        bond: BondEntity | None = None
-        coupons: Sequence[BondCoupon] = ()
-        order_book: OrderBook | None = None
-
-        errors: list[EnrichmentError] = []
-
-        try:
-            bond = await self._tinkoff.get_bond_by_figi(figi)
-        except Exception as exc:
-            errors.append(self._build_error(figi=figi, step='bond_by_figi', exc=exc))
-            self._logger.warning(f'Position enrichment failed for {figi} at step bond_by_figi: {exc!r}')
+        timeout = data.step_timeout_seconds
 
-        try:
-            coupons = await self._tinkoff.get_bond_coupons(
+        bond_step, coupons_step, order_book_step = await asyncio.gather(
+            self._run_step(
                 figi=figi,
-                from_date=coupons_from_date,
-                to_date=coupons_to_date,
-            )
-        except Exception as exc:
-            errors.append(self._build_error(figi=figi, step='coupons', exc=exc))
-            self._logger.warning(f'Position enrichment failed for {figi} at step coupons: {exc!r}')
+                step='bond_by_figi',
+                call=lambda: self._tinkoff.get_bond_by_figi(figi),
+                semaphore=semaphore,
+                timeout_seconds=timeout,
+            ),
+            self._run_step(
+                figi=figi,
+                step='coupons',
+                call=lambda: self._tinkoff.get_bond_coupons(
+                    figi=figi,
+                    from_date=data.coupons_from_date,
+                    to_date=data.coupons_to_date,
+                ),
+                semaphore=semaphore,
+                timeout_seconds=timeout,
+            ),
+            self._run_step(
+                figi=figi,
+                step='order_book',
+                call=lambda: self._get_order_book(figi=figi, depth=data.order_book_depth),
+                semaphore=semaphore,
+                timeout_seconds=timeout,
+            ),
+        )
 
-        try:
-            order_book = await self._tinkoff.get_order_book(figi=figi, depth=order_book_depth)
-        except Exception as exc:
-            errors.append(self._build_error(figi=figi, step='order_book', exc=exc))
-            self._logger.warning(f'Position enrichment failed for {figi} at step order_book: {exc!r}')
+        bond: BondEntity | None = bond_step[0]
+        coupons: Sequence[BondCoupon] = coupons_step[0] if coupons_step[0] is not None else ()
+        order_book: OrderBook | None = order_book_step[0]
+
+        steps = (bond_step, coupons_step, order_book_step)
+        errors = [error for _, error, _ in steps if error is not None]
+        timings = [timing for _, _, timing in steps]
 
         return (
             BondEnrichment(
@@ -221,8 +343,85 @@ class BuildPortfolioSnapshotUseCase:
                 credit_ratings=None,
             ),
             errors,
+            timings,
         )
 
+    async def _get_order_book(self, *, figi: str, depth: int) -> 'OrderBook':
+        """Возвращает стакан из потока маркет-данных или запрашивает снимок в API.
+
+        Args:
+            figi: FIGI инструмента.
+            depth: Глубина стакана.
+
+        Returns:
+            Стакан инструмента.
+        """
+        if self._market_data_stream is not None:
+            streamed = self._market_data_stream.get_order_book(figi, depth=depth)
+            if streamed is not None:
+                return streamed
+        return await self._tinkoff.get_order_book(figi=figi, depth=depth)
+
+    async def _run_step[T](
+        self,
+        *,
+        figi: str,
+        step: str,
+        call: 'Callable[[], Awaitable[T]]',
+        semaphore: asyncio.Semaphore,
+        timeout_seconds: float | None,
+    ) -> tuple[T | None, EnrichmentError | None, EnrichmentStepTiming]:
+        """Выполняет один шаг обогащения с ограничением параллелизма и таймаутом.
+
+        Таймаут и замер времени начинаются после получения слота семафора, поэтому
+        ожидание в очереди к провайдеру не расходует время шага. Шаг считается
+        прерванным по таймауту, только если истёк именно его таймаут, а не
+        `TimeoutError` из самого вызова (например, дедлайн повторов).
+
+        Args:
+            figi: FIGI позиции.
+            step: Название шага.
+            call: Фабрика корутины запроса к провайдеру.
+            semaphore: Ограничитель одновременных запросов.
+            timeout_seconds: Таймаут шага в секундах (None — без таймаута).
+
+        Returns:
+            Результат шага (None при ошибке), ошибка шага (None при успехе) и замер времени.
+        """
+        result: T | None = None
+        error: EnrichmentError | None = None
+
+        async with semaphore:
+            started = time.perf_counter()
+            timeout = asyncio.timeout(timeout_seconds)
+            try:
+                async with timeout:
+                    result = await call()
+            except TimeoutError as exc:
+                if timeout.expired():
+                    error = EnrichmentError(
+                        figi=figi,
+                        step=step,
+                        error_type=TimeoutError.__name__,
+                        message=f'Step timed out after {timeout_seconds}s',
+                    )
+                    self._logger.warning(f'Position enrichment timed out for {figi} at step {step}')
+                else:
+                    error = self._build_error(figi=figi, step=step, exc=exc)
+                    self._logger.warning(f'Position enrichment failed for {figi} at step {step}: {exc!r}')
+            except Exception as exc:
+                error = self._build_error(figi=figi, step=step, exc=exc)
+                self._logger.warning(f'Position enrichment failed for {figi} at step {step}: {exc!r}')
+            duration_ms = _elapsed_ms(started)
+
+        timing = EnrichmentStepTiming(
+            figi=figi,
+            step=step,
+            duration_ms=duration_ms,
+            succeeded=error is None,
+        )
+        return result, error, timing
+
     def _build_error(self, *, figi: str, step: str, exc: Exception) -> EnrichmentError:
         """Строит объект ошибки обогащения.
 
@@ -240,3 +439,15 @@ class BuildPortfolioSnapshotUseCase:
             error_type=type(exc).__name__,
             message=str(exc),
         )
+
+
+def _elapsed_ms(started: float) -> float:
+    """Возвращает время, прошедшее с отметки perf_counter, в миллисекундах.
+
+    Args:
+        started: Отметка time.perf_counter().
+
+    Returns:
+        Прошедшее время, мс (округлено до 0.1).
+    """
+    return round((time.perf_counter() - started) * 1000, 1)
@@ -2,36 +2,58 @@
 
 Используется для получения исторических котировок инструмента с Tinkoff Invest API
 и сохранения их в локальное хранилище для последующего анализа и обучения модели.
+
+В инкрементальном режиме загружаются только периоды, которых нет в покрытии
+хранилища (CandleCoverage): хвост после watermark и дыры внутри сохранённого
+периода. Повторный ночной запуск по тому же инструменту стоит одного короткого
+запроса, а не перезагрузки всей истории.
 """
 
+from datetime import datetime, UTC
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from datetime import datetime
+    from collections.abc import Callable
 
     from finsight_api.application.ports.tinkoff import TinkoffInvestPort
     from finsight_api.domain.repositories.candle_repository import CandleRepository
     from finsight_api.domain.value_objects.candle_interval import CandleInterval
+    from finsight_core.market_data.candle_coverage import CandleCoverage
 
 
 class DownloadHistoricalCandlesUseCase:
-    """Сценарий получения и сохранения исторических свечей."""
+    """Сценарий получения и сохранения исторических свечей.
+
+    Свечи загружаются окнами (см. TinkoffMarketDataPort.stream_candle_frames_by_isin)
+    и сохраняются по мере получения окна, поэтому весь период не держится в памяти.
+    """
 
     def __init__(
         self,
         gateway: 'TinkoffInvestPort',
         repository: 'CandleRepository',
+        clock: 'Callable[[], datetime] | None' = None,
     ) -> None:
         """Инициализирует use case с API-шлюзом и репозиторием хранения свечей.
 
         Args:
             gateway: Шлюз для обращения к Tinkoff Invest API.
             repository: Репозиторий для сохранения свечей.
+            clock: Источник текущего времени (UTC). По умолчанию datetime.now(UTC).
         """
         self._gateway = gateway
         self._repository = repository
+        self._clock = clock or (lambda: datetime.now(UTC))
 
-    async def execute(self, isin: str, from_: 'datetime', to: 'datetime', interval: 'CandleInterval') -> None:
+    async def execute(
+        self,
+        isin: str,
+        from_: 'datetime',
+        to: 'datetime',
+        interval: 'CandleInterval',
+        *,
+        incremental: bool = False,
+    ) -> int:
         """Выполняет загрузку и сохранение исторических свечей.
 
         Args:
@@ -39,6 +61,75 @@ class DownloadHistoricalCandlesUseCase:
             from_: Начальная дата.
             to: Конечная дата.
             interval: Интервал свечей (например, 'day', 'hour').
+            incremental: Загружать только периоды, отсутствующие в покрытии хранилища.
+
+        Returns:
+            Количество новых свечей, которых ещё не было в хранилище.
+        """
+        if incremental:
+            return await self._sync(isin, from_, to, interval)
+
+        saved = 0
+        async for frame in self._gateway.stream_candle_frames_by_isin(isin, from_, to, interval):
+            saved += await self._repository.append(frame)
+        return saved
+
+    async def _sync(self, isin: str, from_: 'datetime', to: 'datetime', interval: 'CandleInterval') -> int:
+        """Догружает непокрытые периоды и расширяет покрытие по мере сохранения.
+
+        Покрытие сохраняется после каждого окна (до времени последней полученной
+        свечи), поэтому прерванная синхронизация продолжается с места остановки.
+        Период, который ещё не закончился, покрывается только до начала последней
+        полученной свечи: незакрытая свеча будет перезапрошена следующим запуском.
+
+        Args:
+            isin: ISIN инструмента.
+            from_: Начало периода (включительно).
+            to: Конец периода (не включительно).
+            interval: Интервал свечей.
+
+        Returns:
+            Количество новых свечей.
+        """
+        figi = await self._gateway.get_figi_by_isin(isin)
+        coverage = await self._repository.load_coverage(figi=figi, interval=interval)
+
+        saved = 0
+        for gap_start, gap_end in coverage.missing(from_, to):
+            last_time: datetime | None = None
+            async for frame in self._gateway.stream_candle_frames_by_isin(isin, gap_start, gap_end, interval):
+                saved += await self._repository.append(frame)
+                last_time = datetime.fromtimestamp(frame.time[-1], tz=UTC)
+                coverage = await self._extend(coverage, gap_start, last_time, figi=figi, interval=interval)
+
+            now = self._clock()
+            covered_end = gap_end if gap_end <= now else (last_time or now)
+            coverage = await self._extend(coverage, gap_start, covered_end, figi=figi, interval=interval)
+
+        return saved
+
+    async def _extend(
+        self,
+        coverage: 'CandleCoverage',
+        from_: 'datetime',
+        to: 'datetime',
+        *,
+        figi: str,
+        interval: 'CandleInterval',
+    ) -> 'CandleCoverage':
+        """Добавляет период в покрытие и сохраняет его.
+
+        Args:
+            coverage: Текущее покрытие.
+            from_: Начало загруженного периода.
+            to: Конец загруженного периода.
+            figi: Идентификатор инструмента.
+            interval: Интервал свечей.
+
+        Returns:
+            Расширенное покрытие.
         """
-        candles = await self._gateway.get_candles_by_isin(isin, from_, to, interval)
-        await self._repository.save_all(candles)
+        extended = coverage.add(from_, to)
+        if extended != coverage:
+            await self._repository.save_coverage(extended, figi=figi, interval=interval)
+        return extended
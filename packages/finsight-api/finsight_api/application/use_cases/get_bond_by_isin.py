@@ -1,9 +1,14 @@
-"""Use Case получения облигации по ISIN."""
+"""Use Case получения облигации по ISIN.
+
+Если передан каталог облигаций (BondCatalogPort), облигация сначала ищется в нём,
+и только при промахе запрашивается у TinkoffInstrumentsPort.
+"""
 
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from finsight_api.application.ports.bond_catalog import BondCatalogPort
     from finsight_api.application.ports.logger import LoggerPort
     from finsight_api.application.ports.tinkoff.instruments import TinkoffInstrumentsPort
     from finsight_api.domain.entities.bond import BondEntity
@@ -37,20 +42,32 @@ class GetBondByIsinOutput:
 
 
 class GetBondByIsinUseCase:
-    """Use Case получения облигации по ISIN."""
+    """Use Case получения облигации по ISIN.
+
+    Если передан каталог облигаций (BondCatalogPort), облигация сначала ищется в нём,
+    и только при промахе запрашивается у TinkoffInstrumentsPort.
+    """
 
-    def __init__(self, *, tinkoff: 'TinkoffInstrumentsPort', logger: 'LoggerPort') -> None:
+    def __init__(
+        self,
+        *,
+        tinkoff: 'TinkoffInstrumentsPort',
+        logger: 'LoggerPort',
+        catalog: 'BondCatalogPort | None' = None,
+    ) -> None:
         """Инициализирует Use Case.
 
         Args:
             tinkoff: Порт инструментов Tinkoff.
             logger: Логгер приложения.
+            catalog: Каталог облигаций. Если None — каждый запрос идёт в Tinkoff.
         """
         self._tinkoff = tinkoff
         self._logger = logger
+        self._catalog = catalog
 
     async def execute(self, data: GetBondByIsinInput) -> GetBondByIsinOutput:
-        """Выполняет получение облигации по ISIN через TinkoffInstrumentsPort.
+        """Выполняет получение облигации по ISIN из каталога или через TinkoffInstrumentsPort.
 
         Ошибка получения не пробрасывается: она логируется и возвращается в
         поле error результата с пустым bond.
@@ -62,7 +79,9 @@ class GetBondByIsinUseCase:
             Результат получения облигации по ISIN.
         """
         try:
-            bond = await self._tinkoff.get_bond_by_isin(data.isin)
+            bond = await self._catalog.get_by_isin(data.isin) if self._catalog is not None else None
+            if bond is None:
+                bond = await self._tinkoff.get_bond_by_isin(data.isin)
             return GetBondByIsinOutput(isin=data.isin, bond=bond, error=None)
         except Exception as exc:
             self._logger.error(f'Failed to fetch bond by ISIN {data.isin.value}: {exc!r}')
@@ -1,12 +1,22 @@
-"""Use Case получения облигаций по списку ISIN."""
+"""Use Case получения облигаций по списку ISIN.
+
+Список ISIN (например, выгрузка скринера на тысячи бумаг) обрабатывается потоково:
+`stream` отдаёт результат по каждому ISIN, как только он получен, и держит в памяти
+только выполняющиеся запросы и (в упорядоченном режиме) небольшое окно ответов,
+ожидающих своей очереди. `execute` собирает поток в один результат.
+
+Если передан каталог облигаций (BondCatalogPort), облигации ищутся в нём, и в
+Tinkoff запрашиваются только промахи.
+"""
 
 import asyncio
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncIterator, Sequence
 
+    from finsight_api.application.ports.bond_catalog import BondCatalogPort
     from finsight_api.application.ports.logger import LoggerPort
     from finsight_api.application.ports.tinkoff.instruments import TinkoffInstrumentsPort
     from finsight_api.domain.entities.bond import BondEntity
@@ -18,12 +28,14 @@ class GetBondsByIsinInput:
     """Входные данные для bulk-получения облигаций по ISIN.
 
     Attributes:
-        isins: Список ISIN.
+        isins: Список ISIN. Повторяющиеся ISIN запрашиваются один раз.
         concurrency: Максимальное число параллельных запросов к провайдеру.
+        preserve_order: Отдавать результаты в порядке входного списка, а не по мере готовности.
     """
 
     isins: 'Sequence[ISIN]'
     concurrency: int = 5
+    preserve_order: bool = True
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -39,6 +51,21 @@ class BondFetchError:
     error: str
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BondLookupResult:
+    """Результат получения облигации по одному ISIN.
+
+    Attributes:
+        isin: ISIN облигации.
+        bond: Облигация или None, если получить её не удалось.
+        error: Текст ошибки или None при успехе.
+    """
+
+    isin: 'ISIN'
+    bond: 'BondEntity | None' = None
+    error: str | None = None
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class GetBondsByIsinOutput:
     """Результат bulk-получения облигаций по ISIN.
@@ -57,22 +84,29 @@ class GetBondsByIsinOutput:
 class GetBondsByIsinUseCase:
     """Use Case bulk-получения облигаций по ISIN."""
 
-    def __init__(self, *, tinkoff: 'TinkoffInstrumentsPort', logger: 'LoggerPort') -> None:
+    def __init__(
+        self,
+        *,
+        tinkoff: 'TinkoffInstrumentsPort',
+        logger: 'LoggerPort',
+        catalog: 'BondCatalogPort | None' = None,
+    ) -> None:
         """Инициализирует Use Case.
 
         Args:
             tinkoff: Порт инструментов Tinkoff.
             logger: Логгер приложения.
+            catalog: Каталог облигаций. Если None — каждый ISIN запрашивается в Tinkoff.
         """
         self._tinkoff = tinkoff
         self._logger = logger
+        self._catalog = catalog
 
     async def execute(self, data: GetBondsByIsinInput) -> GetBondsByIsinOutput:
         """Выполняет bulk-получение облигаций по ISIN.
 
-        Запросы к TinkoffInstrumentsPort выполняются параллельно с ограничением
-        по concurrency. Ошибка по отдельному ISIN логируется и попадает в errors,
-        не прерывая обработку остальных.
+        Собирает результаты `stream` в один ответ. Ошибка по отдельному ISIN
+        логируется и попадает в errors, не прерывая обработку остальных.
 
         Args:
             data: Входные данные.
@@ -83,26 +117,93 @@ class GetBondsByIsinUseCase:
         Raises:
             ValueError: Если concurrency не является положительным числом.
         """
-        if data.concurrency <= 0:
-            raise ValueError('Concurrency must be a positive integer')
-
-        semaphore = asyncio.Semaphore(data.concurrency)
         bonds: list[BondEntity] = []
         errors: list[BondFetchError] = []
 
-        async def _fetch_one(isin: 'ISIN') -> None:
-            async with semaphore:
-                try:
-                    bond = await self._tinkoff.get_bond_by_isin(isin)
-                    bonds.append(bond)
-                except Exception as exc:
-                    self._logger.error(f'Failed to fetch bond by ISIN {isin.value}: {exc!r}')
-                    errors.append(BondFetchError(isin=isin, error=str(exc)))
-
-        await asyncio.gather(*(_fetch_one(isin) for isin in data.isins))
+        async for result in self.stream(data):
+            if result.bond is not None:
+                bonds.append(result.bond)
+            else:
+                errors.append(BondFetchError(isin=result.isin, error=result.error or ''))
 
         return GetBondsByIsinOutput(
             bonds=tuple(bonds),
             errors=tuple(errors),
             failed_count=len(errors),
         )
+
+    async def stream(self, data: GetBondsByIsinInput) -> 'AsyncIterator[BondLookupResult]':
+        """Получает облигации по ISIN и отдаёт результаты по мере готовности.
+
+        Одновременно выполняется не больше concurrency запросов; следующий ISIN
+        запрашивается, когда освобождается место. В режиме preserve_order готовые
+        ответы ждут, пока будут отданы все предыдущие, а запросы не забегают вперёд
+        первого неотданного ISIN больше чем на 2 * concurrency позиций — так
+        память ограничена даже при медленном ответе в начале списка.
+
+        Если потребитель прекращает итерацию, незавершённые запросы отменяются.
+
+        Args:
+            data: Входные данные.
+
+        Yields:
+            Результат по каждому уникальному ISIN.
+
+        Raises:
+            ValueError: Если concurrency не является положительным числом.
+        """
+        if data.concurrency <= 0:
+            raise ValueError('Concurrency must be a positive integer')
+
+        pending = enumerate(dict.fromkeys(data.isins))
+        window = data.concurrency * 2
+        in_flight: dict[asyncio.Task[BondLookupResult], int] = {}
+        ready: dict[int, BondLookupResult] = {}
+        started = 0
+        next_index = 0
+
+        try:
+            while True:
+                while len(in_flight) < data.concurrency and (not data.preserve_order or started - next_index < window):
+                    item = next(pending, None)
+                    if item is None:
+                        break
+                    index, isin = item
+                    in_flight[asyncio.create_task(self._lookup(isin))] = index
+                    started += 1
+
+                if not in_flight:
+                    return
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = in_flight.pop(task)
+                    if data.preserve_order:
+                        ready[index] = task.result()
+                    else:
+                        yield task.result()
+
+                while next_index in ready:
+                    yield ready.pop(next_index)
+                    next_index += 1
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    async def _lookup(self, isin: 'ISIN') -> BondLookupResult:
+        """Получает облигацию по одному ISIN из каталога или Tinkoff, превращая ошибку в результат.
+
+        Args:
+            isin: ISIN облигации.
+
+        Returns:
+            Результат получения облигации.
+        """
+        try:
+            bond = await self._catalog.get_by_isin(isin) if self._catalog is not None else None
+            if bond is None:
+                bond = await self._tinkoff.get_bond_by_isin(isin)
+        except Exception as exc:
+            self._logger.error(f'Failed to fetch bond by ISIN {isin.value}: {exc!r}')
+            return BondLookupResult(isin=isin, error=str(exc))
+        return BondLookupResult(isin=isin, bond=bond)
@@ -0,0 +1,298 @@
+"""Use Case наблюдения за стоимостью портфеля в реальном времени.
+
+Подписчик сначала получает портфель целиком, затем — изменения стоимости позиций
+по последним ценам из потока маркет-данных. Стоимость позиции пересчитывается
+локально (`value = current_price * quantity`), без повторных запросов портфеля.
+
+Все подписчики одного счёта разделяют одну подписку: портфель запрашивается при
+первом подписчике, изменения раздаются всем, а с уходом последнего подписчика
+подписка на цены снимается. Медленный подписчик получает только последнее
+изменение по каждой позиции, а не всю очередь тиков.
+"""
+
+import asyncio
+import weakref
+from dataclasses import dataclass, replace
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from finsight_api.domain.value_objects.instrument_type import InstrumentType
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Sequence
+    from datetime import datetime
+
+    from finsight_api.application.ports.logger import LoggerPort
+    from finsight_api.application.ports.tinkoff import TinkoffInvestPort
+    from finsight_api.application.ports.tinkoff.market_data_stream import TinkoffMarketDataStreamPort
+    from finsight_api.domain.entities.portfolio import PortfolioEntity
+    from finsight_api.domain.value_objects.last_price import LastPrice
+    from finsight_api.domain.value_objects.portfolio_position import PortfolioPosition
+
+
+# Инструменты, последняя цена которых выражена в валюте за единицу.
+_UNIT_PRICED_TYPES = frozenset({InstrumentType.SHARE, InstrumentType.ETF, InstrumentType.CURRENCY})
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PositionValuation:
+    """Изменение стоимости позиции по новой последней цене.
+
+    Attributes:
+        figi: FIGI инструмента.
+        current_price: Цена единицы инструмента в валюте.
+        value: Новая стоимость позиции.
+        total_value: Новая стоимость портфеля (сумма стоимостей позиций).
+        time: Время сделки, давшей цену (если известно).
+    """
+
+    figi: str
+    current_price: 'Decimal'
+    value: 'Decimal'
+    total_value: 'Decimal'
+    time: 'datetime | None'
+
+
+class _Subscriber:
+    """Получатель изменений: хранит последнее непрочитанное изменение по каждой позиции."""
+
+    __slots__ = ('_pending', '_ready')
+
+    def __init__(self) -> None:
+        """Инициализирует подписчика без изменений."""
+        self._pending: dict[str, PositionValuation] = {}
+        self._ready = asyncio.Event()
+
+    def push(self, valuation: PositionValuation) -> None:
+        """Добавляет изменение, заменяя непрочитанное изменение той же позиции.
+
+        Args:
+            valuation: Изменение стоимости позиции.
+        """
+        self._pending[valuation.figi] = valuation
+        self._ready.set()
+
+    async def drain(self) -> list[PositionValuation]:
+        """Ждёт изменений и забирает все накопленные.
+
+        Returns:
+            Изменения в порядке первого поступления по позиции.
+        """
+        await self._ready.wait()
+        self._ready.clear()
+        valuations = list(self._pending.values())
+        self._pending.clear()
+        return valuations
+
+
+class _PortfolioFeed:
+    """Общая подписка на стоимость портфеля одного счёта."""
+
+    def __init__(self, portfolio: 'PortfolioEntity', price_scales: dict[str, Decimal]) -> None:
+        """Инициализирует подписку текущим портфелем.
+
+        Args:
+            portfolio: Портфель на момент подписки.
+            price_scales: Множитель последней цены до цены единицы в валюте по FIGI.
+        """
+        self._portfolio = portfolio
+        self._positions: dict[str, PortfolioPosition] = {position.figi: position for position in portfolio.positions}
+        self._total_value = sum((position.value for position in portfolio.positions), start=Decimal(0))
+        self.price_scales = price_scales
+        self.subscribers: set[_Subscriber] = set()
+        self.remove_listener: Callable[[], None] | None = None
+        self.release_instruments: Callable[[], None] | None = None
+
+    def snapshot(self) -> 'PortfolioEntity':
+        """Возвращает портфель с текущими пересчитанными стоимостями позиций.
+
+        Returns:
+            Доменная сущность портфеля.
+        """
+        return replace(self._portfolio, positions=tuple(self._positions.values()), total_value=self._total_value)
+
+    def on_last_price(self, last_price: 'LastPrice') -> None:
+        """Пересчитывает стоимость позиции и раздаёт изменение подписчикам.
+
+        Args:
+            last_price: Последняя цена из потока маркет-данных.
+        """
+        position = self._positions.get(last_price.figi)
+        scale = self.price_scales.get(last_price.figi)
+        if position is None or scale is None:
+            return
+
+        current_price = last_price.price * scale
+        if current_price == position.current_price:
+            return
+
+        value = current_price * position.quantity
+        self._total_value += value - position.value
+        self._positions[position.figi] = replace(position, current_price=current_price, value=value)
+
+        valuation = PositionValuation(
+            figi=position.figi,
+            current_price=current_price,
+            value=value,
+            total_value=self._total_value,
+            time=last_price.time,
+        )
+        for subscriber in self.subscribers:
+            subscriber.push(valuation)
+
+
+class WatchPortfolioUseCase:
+    """Сценарий подписки на стоимость портфеля с раздачей изменений подписчикам счёта.
+
+    Экземпляр хранит подписки счетов и должен быть общим для всех запросов.
+    """
+
+    def __init__(
+        self,
+        *,
+        tinkoff: 'TinkoffInvestPort',
+        market_data_stream: 'TinkoffMarketDataStreamPort',
+        logger: 'LoggerPort',
+    ) -> None:
+        """Инициализирует Use Case.
+
+        Args:
+            tinkoff: Порт интеграции с Tinkoff Invest API.
+            market_data_stream: Поток маркет-данных.
+            logger: Логгер приложения.
+        """
+        self._tinkoff = tinkoff
+        self._market_data_stream = market_data_stream
+        self._logger = logger
+        self._feeds: dict[str, _PortfolioFeed] = {}
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+
+    @property
+    def account_ids(self) -> frozenset[str]:
+        """Счета, на которые есть подписчики."""
+        return frozenset(self._feeds)
+
+    async def watch(self, account_id: str) -> 'AsyncGenerator[PortfolioEntity | PositionValuation]':
+        """Отдаёт портфель, затем изменения стоимости его позиций.
+
+        Итератор бесконечен; подписчик отписывается, закрывая его (или отменяя задачу).
+
+        Args:
+            account_id: Идентификатор счёта.
+
+        Yields:
+            Сначала PortfolioEntity, затем PositionValuation по мере прихода цен.
+        """
+        subscriber = _Subscriber()
+        feed = await self._join(account_id, subscriber)
+        try:
+            yield feed.snapshot()
+            while True:
+                for valuation in await subscriber.drain():
+                    yield valuation
+        finally:
+            self._leave(account_id, feed, subscriber)
+
+    async def _join(self, account_id: str, subscriber: _Subscriber) -> _PortfolioFeed:
+        """Добавляет подписчика в подписку счёта, открывая её при необходимости.
+
+        Подписка открывается под блокировкой своего счёта: первые подписчики одного
+        счёта ждут одну загрузку портфеля, а подписки других счетов не ждут её.
+
+        Args:
+            account_id: Идентификатор счёта.
+            subscriber: Подписчик.
+
+        Returns:
+            Подписка счёта.
+        """
+        async with self._account_lock(account_id):
+            feed = self._feeds.get(account_id)
+            if feed is None:
+                feed = await self._open(account_id)
+                self._feeds[account_id] = feed
+            feed.subscribers.add(subscriber)
+            return feed
+
+    def _account_lock(self, account_id: str) -> asyncio.Lock:
+        """Возвращает блокировку открытия подписки счёта.
+
+        Блокировки хранятся по слабым ссылкам и удаляются, когда их никто не ждёт.
+
+        Args:
+            account_id: Идентификатор счёта.
+
+        Returns:
+            Блокировка счёта.
+        """
+        lock = self._locks.get(account_id)
+        if lock is None:
+            lock = self._locks[account_id] = asyncio.Lock()
+        return lock
+
+    def _leave(self, account_id: str, feed: _PortfolioFeed, subscriber: _Subscriber) -> None:
+        """Удаляет подписчика и закрывает подписку счёта, если он был последним.
+
+        Args:
+            account_id: Идентификатор счёта.
+            feed: Подписка счёта.
+            subscriber: Подписчик.
+        """
+        feed.subscribers.discard(subscriber)
+        if feed.subscribers or self._feeds.get(account_id) is not feed:
+            return
+        del self._feeds[account_id]
+        if feed.remove_listener is not None:
+            feed.remove_listener()
+        if feed.release_instruments is not None:
+            feed.release_instruments()
+
+    async def _open(self, account_id: str) -> _PortfolioFeed:
+        """Загружает портфель и подписывается на последние цены его позиций.
+
+        Подписка на инструменты в общем потоке маркет-данных освобождается при
+        закрытии подписки счёта.
+
+        Args:
+            account_id: Идентификатор счёта.
+
+        Returns:
+            Подписка счёта.
+        """
+        portfolio = await self._tinkoff.get_portfolio(account_id)
+        feed = _PortfolioFeed(portfolio, await self._price_scales(portfolio.positions))
+        feed.remove_listener = self._market_data_stream.add_last_price_listener(feed.on_last_price)
+        feed.release_instruments = self._market_data_stream.watch(list(feed.price_scales))
+        self._logger.info(
+            'Portfolio valuation feed opened',
+            account_id=account_id,
+            positions=len(portfolio.positions),
+            priced_positions=len(feed.price_scales),
+        )
+        return feed
+
+    async def _price_scales(self, positions: 'Sequence[PortfolioPosition]') -> dict[str, Decimal]:
+        """Определяет множители последней цены для пересчитываемых позиций.
+
+        Цена облигации в потоке — процент от номинала, поэтому её множитель —
+        номинал / 100. Позиции без известного множителя (фьючерсы, облигации с
+        ошибкой получения номинала) не пересчитываются.
+
+        Args:
+            positions: Позиции портфеля.
+
+        Returns:
+            Множитель по FIGI.
+        """
+        scales = {position.figi: Decimal(1) for position in positions if position.instrument_type in _UNIT_PRICED_TYPES}
+        bond_figis = [position.figi for position in positions if position.instrument_type == InstrumentType.BOND]
+        bonds = await asyncio.gather(
+            *(self._tinkoff.get_bond_by_figi(figi) for figi in bond_figis),
+            return_exceptions=True,
+        )
+        for figi, bond in zip(bond_figis, bonds, strict=True):
+            if isinstance(bond, BaseException):
+                self._logger.warning(f'Bond nominal is unavailable, position is not revalued: {bond!r}', figi=figi)
+                continue
+            scales[figi] = bond.nominal.amount / 100
+        return scales
@@ -0,0 +1,345 @@
+"""Доходность и риск-метрики облигаций.
+
+Денежный поток облигации на дату расчёта — будущие купоны из графика `BondCoupon`
+и погашение номинала в дату погашения. Метрики считаются по эффективной годовой
+доходности (как на Московской бирже): `P = Σ CF_i / (1 + y)^t_i`, где `t_i` —
+срок выплаты в годах (дни / 365), а `P` — грязная цена (чистая цена + НКД).
+
+Поток выплат хранится в колонках float64 (`memoryview` над `array('d')`, как
+колонки `CandleFrame`) и строится один раз на дату расчёта; `analyze_bonds`
+решает доходность к погашению методом Ньютона для пакета облигаций. Начальное
+приближение строится по средневзвешенному сроку выплат, поэтому решение обычно
+сходится за 3–4 итерации, а дюрация и выпуклость считаются одним проходом по
+потоку при найденной доходности.
+
+Особые случаи:
+    - плавающий купон (`floating_coupon_flag`): будущие купоны, размер которых
+      ещё не установлен (выплата 0), принимаются равными последнему известному
+      купону;
+    - амортизация (`amortization_flag`): график частичных погашений в данных
+      инструмента отсутствует, поэтому непогашенный номинал (`nominal`) считается
+      погашаемым в дату погашения, а размеры купонов берутся из графика как есть.
+
+Метрики, посчитанные по таким допущениям, помечаются `estimated=True`.
+"""
+
+import math
+import operator
+from array import array
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Final, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from datetime import date
+
+    from finsight_api.domain.entities.bond import BondEntity
+    from finsight_api.domain.value_objects.bond_coupon import BondCoupon
+
+
+DAYS_IN_YEAR: Final[int] = 365
+DEFAULT_YIELD_GUESS: Final[float] = 0.1
+DEFAULT_TOLERANCE: Final[float] = 1e-10
+DEFAULT_MAX_ITERATIONS: Final[int] = 50
+
+# Нижняя граница доходности: дисконт-фактор (1 + y)^-t должен оставаться конечным.
+_MIN_YIELD: Final[float] = -0.99
+_ACCRUED_INTEREST_QUANT: Final = Decimal('0.01')
+_FLOAT64_TYPECODE: Final[str] = 'd'
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BondCashFlows:
+    """Будущие выплаты по одной облигации на дату расчёта.
+
+    Attributes:
+        figi: FIGI облигации.
+        times: Сроки выплат в годах от даты расчёта (float64, по возрастанию).
+        amounts: Выплаты на одну облигацию в валюте (float64).
+        accrued_interest: НКД на дату расчёта.
+        current_coupon: Купон текущего периода (для плавающего купона — последний известный).
+        coupons_per_year: Количество купонных выплат в год.
+        estimated: Поток построен с допущениями (плавающий купон или амортизация).
+    """
+
+    figi: str
+    times: memoryview
+    amounts: memoryview
+    accrued_interest: Decimal
+    current_coupon: Decimal
+    coupons_per_year: int
+    estimated: bool
+
+    def __post_init__(self) -> None:
+        """Проверяет, что колонки сроков и выплат имеют одинаковую длину.
+
+        Raises:
+            ValueError: Если колонки имеют разную длину.
+        """
+        if len(self.times) != len(self.amounts):
+            raise ValueError('BondCashFlows columns must have equal length')
+
+    def __len__(self) -> int:
+        """Возвращает количество будущих выплат."""
+        return len(self.times)
+
+    @classmethod
+    def from_schedule(
+        cls,
+        bond: 'BondEntity',
+        coupons: 'Sequence[BondCoupon]',
+        *,
+        settlement: 'date',
+    ) -> 'BondCashFlows':
+        """Строит поток выплат по метаданным облигации и графику купонов.
+
+        Args:
+            bond: Метаданные облигации.
+            coupons: Полный график купонов облигации.
+            settlement: Дата расчёта.
+
+        Returns:
+            Будущие выплаты на одну облигацию.
+        """
+        times: array[float] = array(_FLOAT64_TYPECODE)
+        amounts: array[float] = array(_FLOAT64_TYPECODE)
+        current: BondCoupon | None = None
+        current_amount = Decimal(0)
+        estimated = bond.amortization_flag
+
+        for coupon, amount, projected in project_coupons(bond, coupons):
+            estimated = estimated or projected
+            payment_date = coupon.coupon_date.date()
+            if payment_date <= settlement:
+                continue
+            if current is None:
+                current, current_amount = coupon, amount
+            times.append((payment_date - settlement).days / DAYS_IN_YEAR)
+            amounts.append(float(amount))
+
+        maturity = bond.maturity_date.date()
+        if maturity > settlement:
+            redemption = float(bond.nominal.amount)
+            time = (maturity - settlement).days / DAYS_IN_YEAR
+            if times and times[-1] == time:
+                amounts[-1] += redemption
+            else:
+                times.append(time)
+                amounts.append(redemption)
+
+        return cls(
+            figi=bond.figi,
+            times=memoryview(times),
+            amounts=memoryview(amounts),
+            accrued_interest=_accrued_interest(current, current_amount, settlement=settlement),
+            current_coupon=current_amount,
+            coupons_per_year=bond.coupon_quantity_per_year,
+            estimated=estimated,
+        )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BondAnalytics:
+    """Доходность и риск-метрики облигации.
+
+    Метрики, для которых нет решения (нет будущих выплат, метод Ньютона не
+    сошёлся), равны None.
+
+    Attributes:
+        figi: FIGI облигации.
+        dirty_price: Грязная цена (чистая цена + НКД) на одну облигацию.
+        accrued_interest: НКД на дату расчёта.
+        ytm: Эффективная доходность к погашению, доля в год.
+        macaulay_duration: Дюрация Маколея, лет.
+        modified_duration: Модифицированная дюрация, лет.
+        convexity: Выпуклость, лет².
+        current_yield: Текущая доходность (годовой купон / чистая цена), доля в год.
+        estimated: Метрики посчитаны с допущениями (плавающий купон или амортизация).
+    """
+
+    figi: str
+    dirty_price: Decimal
+    accrued_interest: Decimal
+    ytm: float | None
+    macaulay_duration: float | None
+    modified_duration: float | None
+    convexity: float | None
+    current_yield: float | None
+    estimated: bool
+
+
+def project_coupons(
+    bond: 'BondEntity',
+    coupons: 'Iterable[BondCoupon]',
+) -> list[tuple['BondCoupon', Decimal, bool]]:
+    """Упорядочивает купоны по дате выплаты и определяет размер каждой выплаты.
+
+    Неустановленный размер плавающего купона (выплата 0) принимается равным
+    последнему известному купону.
+
+    Args:
+        bond: Метаданные облигации.
+        coupons: График купонов облигации.
+
+    Returns:
+        Тройки (купон, размер выплаты на одну облигацию, размер принят по допущению).
+    """
+    known_coupon = Decimal(0)
+    projected = []
+    for coupon in sorted(coupons, key=lambda coupon: coupon.coupon_date):
+        amount = coupon.pay_one_bond.amount
+        if amount > 0:
+            known_coupon = amount
+            projected.append((coupon, amount, False))
+        elif bond.floating_coupon_flag:
+            projected.append((coupon, known_coupon, True))
+        else:
+            projected.append((coupon, amount, False))
+    return projected
+
+
+def analyze_bonds(
+    cash_flows: 'Sequence[BondCashFlows]',
+    clean_prices: 'Sequence[Decimal]',
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+) -> list[BondAnalytics]:
+    """Считает доходность и риск-метрики для пакета облигаций.
+
+    Args:
+        cash_flows: Потоки выплат облигаций на одну дату расчёта.
+        clean_prices: Чистые цены на одну облигацию в валюте, в порядке cash_flows.
+        tolerance: Точность решения доходности.
+        max_iterations: Максимальное число итераций метода Ньютона.
+
+    Returns:
+        Метрики в порядке переданных облигаций.
+
+    Raises:
+        ValueError: Если число цен не совпадает с числом потоков.
+    """
+    if len(cash_flows) != len(clean_prices):
+        raise ValueError('Each bond must have a clean price')
+
+    results = []
+    for flows, clean_price in zip(cash_flows, clean_prices, strict=True):
+        dirty_price = clean_price + flows.accrued_interest
+        solution = _solve_yield(flows, float(dirty_price), tolerance=tolerance, max_iterations=max_iterations)
+        ytm, duration, convexity = solution if solution is not None else (None, None, None)
+        annual_coupon = flows.current_coupon * flows.coupons_per_year
+        results.append(
+            BondAnalytics(
+                figi=flows.figi,
+                dirty_price=dirty_price,
+                accrued_interest=flows.accrued_interest,
+                ytm=ytm,
+                macaulay_duration=duration,
+                modified_duration=None if ytm is None or duration is None else duration / (1 + ytm),
+                convexity=convexity,
+                current_yield=float(annual_coupon / clean_price) if clean_price > 0 else None,
+                estimated=flows.estimated,
+            )
+        )
+    return results
+
+
+def _solve_yield(
+    flows: BondCashFlows,
+    dirty_price: float,
+    *,
+    tolerance: float,
+    max_iterations: int,
+) -> tuple[float, float, float] | None:
+    """Решает доходность к погашению методом Ньютона и считает дюрацию и выпуклость.
+
+    Шаг для доходности y: `y += (PV(y) - P) * (1 + y) / Σ t_i * PV_i(y)`.
+
+    Начальное приближение — доходность, при которой все выплаты, сведённые в
+    одну в их средневзвешенный срок, стоят P. Для бескупонной облигации это точное
+    решение, для купонной — обычно на одну-две итерации ближе к корню, чем
+    фиксированная начальная ставка.
+
+    Args:
+        flows: Поток выплат облигации.
+        dirty_price: Грязная цена облигации.
+        tolerance: Точность решения.
+        max_iterations: Максимальное число итераций.
+
+    Returns:
+        Доходность, дюрация Маколея и выпуклость; None, если решение не найдено.
+    """
+    times, amounts = flows.times, flows.amounts
+    total = sum(amounts)
+    if dirty_price <= 0 or total <= 0:
+        return None
+
+    ytm = _initial_yield_guess(total / dirty_price, sum(map(operator.mul, times, amounts)) / total)
+    for _ in range(max_iterations):
+        growth = 1 + ytm
+        value = slope = 0.0
+        for time, amount in zip(times, amounts, strict=True):
+            present_value = amount * growth**-time
+            value += present_value
+            slope += time * present_value
+        if slope <= 0:
+            return None
+        step = (value - dirty_price) * growth / slope
+        ytm = max(ytm + step, _MIN_YIELD)
+        if abs(step) < tolerance:
+            break
+    else:
+        return None
+
+    growth = 1 + ytm
+    value = weighted = curvature = 0.0
+    for time, amount in zip(times, amounts, strict=True):
+        present_value = amount * growth**-time
+        value += present_value
+        weighted += time * present_value
+        curvature += time * (time + 1) * present_value
+    return ytm, weighted / value, curvature / value / growth**2
+
+
+def _initial_yield_guess(growth: float, average_time: float) -> float:
+    """Возвращает начальное приближение доходности по средневзвешенному сроку выплат.
+
+    Для очень короткого срока и низкой цены `growth ** (1 / average_time)` не
+    помещается во float64; тогда, как и для нулевого срока, используется
+    `DEFAULT_YIELD_GUESS`.
+
+    Args:
+        growth: Отношение суммы выплат к грязной цене.
+        average_time: Средневзвешенный срок выплат в годах.
+
+    Returns:
+        Начальное приближение доходности.
+    """
+    if average_time <= 0:
+        return DEFAULT_YIELD_GUESS
+    try:
+        return math.pow(growth, 1 / average_time) - 1
+    except OverflowError:
+        return DEFAULT_YIELD_GUESS
+
+
+def _accrued_interest(coupon: 'BondCoupon | None', amount: Decimal, *, settlement: 'date') -> Decimal:
+    """Считает НКД на дату расчёта в купонном периоде.
+
+    Args:
+        coupon: Ближайший будущий купон (None, если купонов больше нет).
+        amount: Размер купона (для плавающего купона — с учётом допущения).
+        settlement: Дата расчёта.
+
+    Returns:
+        НКД на одну облигацию, округлённый до копеек.
+    """
+    if coupon is None:
+        return Decimal(0)
+    start = coupon.coupon_start_date.date()
+    period = coupon.coupon_period or (coupon.coupon_end_date.date() - start).days
+    elapsed = (settlement - start).days
+    if period <= 0 or elapsed <= 0:
+        return Decimal(0)
+    return (amount * min(elapsed, period) / period).quantize(_ACCRUED_INTEREST_QUANT)
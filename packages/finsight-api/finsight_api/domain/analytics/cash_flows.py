@@ -0,0 +1,276 @@
+"""Прогноз купонных выплат и погашений по облигационным позициям портфеля.
+
+Выплаты позиции (купоны по графику `BondCoupon` и погашение номинала в дату
+погашения, умноженные на количество бумаг) хранятся в колонках: дата — int64
+порядковый номер дня (`date.toordinal()`), суммы — int64 в нано-единицах (как цены
+в `CandleFrame`), поэтому суммирование точное. Колонки всех позиций один раз
+сводятся в дневные итоги по валютам; месячные и годовые корзины получаются
+группировкой дневных итогов.
+
+Изменение одной позиции пересчитывается инкрементально: её прежние выплаты
+вычитаются из дневных итогов, новые — прибавляются, остальные позиции не
+перебираются.
+
+Размер неустановленного плавающего купона принимается равным последнему
+известному (см. `analytics.bond.project_coupons`).
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from enum import auto, StrEnum, unique
+from typing import Final, TYPE_CHECKING
+
+from finsight_api.domain.analytics.bond import project_coupons
+from finsight_api.domain.entities.candle_frame import int64_column
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from finsight_api.domain.entities.bond import BondEntity
+    from finsight_api.domain.value_objects.bond_coupon import BondCoupon
+    from finsight_api.domain.value_objects.portfolio_position import PortfolioPosition
+
+
+_NANO_EXPONENT: Final[int] = 9
+
+
+@unique
+class CashFlowPeriod(StrEnum):
+    """Период корзины прогноза выплат."""
+
+    DAY = auto()
+    MONTH = auto()
+    YEAR = auto()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CashFlowBucket:
+    """Сумма выплат портфеля за период в одной валюте.
+
+    Attributes:
+        currency: Валюта выплат.
+        period_start: Первый день периода.
+        coupons: Купонные выплаты.
+        redemptions: Погашения номинала.
+    """
+
+    currency: str
+    period_start: date
+    coupons: Decimal
+    redemptions: Decimal
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PositionCashFlows:
+    """Будущие выплаты по позиции в колоночном виде.
+
+    Attributes:
+        figi: FIGI облигации.
+        days: Даты выплат, порядковые номера дней (int64).
+        coupons: Купонные выплаты на всю позицию, нано-единицы (int64).
+        redemptions: Погашения номинала на всю позицию, нано-единицы (int64).
+        currencies: Валюта каждой выплаты.
+    """
+
+    figi: str
+    days: memoryview
+    coupons: memoryview
+    redemptions: memoryview
+    currencies: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        """Проверяет, что все колонки имеют одинаковую длину.
+
+        Raises:
+            ValueError: Если колонки имеют разную длину.
+        """
+        if len({len(self.days), len(self.coupons), len(self.redemptions), len(self.currencies)}) > 1:
+            raise ValueError('PositionCashFlows columns must have equal length')
+
+    def __len__(self) -> int:
+        """Возвращает количество выплат."""
+        return len(self.days)
+
+    @classmethod
+    def from_schedule(
+        cls,
+        position: 'PortfolioPosition',
+        bond: 'BondEntity',
+        coupons: 'Sequence[BondCoupon]',
+        *,
+        start: date,
+        end: date | None = None,
+    ) -> 'PositionCashFlows':
+        """Строит выплаты позиции по графику купонов и номиналу облигации.
+
+        Args:
+            position: Позиция портфеля (количество бумаг).
+            bond: Метаданные облигации.
+            coupons: График купонов облигации.
+            start: Начало прогноза (включительно).
+            end: Конец прогноза (включительно; None — до погашения).
+
+        Returns:
+            Выплаты позиции в пределах периода прогноза.
+        """
+        quantity = position.quantity
+        days, coupon_nanos, redemption_nanos, currencies = [], [], [], []
+
+        def add(payment_date: date, amount: Decimal, currency: str, *, redemption: bool) -> None:
+            if payment_date < start or (end is not None and payment_date > end) or not amount:
+                return
+            nanos = int((amount * quantity).scaleb(_NANO_EXPONENT))
+            days.append(payment_date.toordinal())
+            coupon_nanos.append(0 if redemption else nanos)
+            redemption_nanos.append(nanos if redemption else 0)
+            currencies.append(currency)
+
+        for coupon, amount, _ in project_coupons(bond, coupons):
+            add(coupon.coupon_date.date(), amount, coupon.pay_one_bond.currency, redemption=False)
+        add(bond.maturity_date.date(), bond.nominal.amount, bond.nominal.currency, redemption=True)
+
+        return cls(
+            figi=position.figi,
+            days=int64_column(days),
+            coupons=int64_column(coupon_nanos),
+            redemptions=int64_column(redemption_nanos),
+            currencies=tuple(currencies),
+        )
+
+
+class CashFlowProjection:
+    """Прогноз выплат портфеля с дневными итогами по валютам.
+
+    Позиции идентифицируются FIGI. Экземпляр не потокобезопасен.
+    """
+
+    def __init__(self, *, start: date, end: date | None = None) -> None:
+        """Инициализирует пустой прогноз.
+
+        Args:
+            start: Начало прогноза (включительно).
+            end: Конец прогноза (включительно; None — до погашения).
+        """
+        self.start = start
+        self.end = end
+        self._positions: dict[str, PositionCashFlows] = {}
+        # (валюта, порядковый номер дня) -> [купоны, погашения] в нано-единицах.
+        self._daily: dict[tuple[str, int], list[int]] = {}
+
+    @classmethod
+    def from_positions(
+        cls,
+        holdings: 'Iterable[tuple[PortfolioPosition, BondEntity, Sequence[BondCoupon]]]',
+        *,
+        start: date,
+        end: date | None = None,
+    ) -> 'CashFlowProjection':
+        """Строит прогноз по облигационным позициям портфеля.
+
+        Args:
+            holdings: Тройки (позиция, метаданные облигации, график купонов).
+            start: Начало прогноза (включительно).
+            end: Конец прогноза (включительно; None — до погашения).
+
+        Returns:
+            Прогноз выплат портфеля.
+        """
+        projection = cls(start=start, end=end)
+        for position, bond, coupons in holdings:
+            projection.set_position(position, bond, coupons)
+        return projection
+
+    @property
+    def figis(self) -> frozenset[str]:
+        """FIGI позиций в прогнозе."""
+        return frozenset(self._positions)
+
+    def set_position(
+        self,
+        position: 'PortfolioPosition',
+        bond: 'BondEntity',
+        coupons: 'Sequence[BondCoupon]',
+    ) -> None:
+        """Добавляет позицию или заменяет её прежние выплаты.
+
+        Args:
+            position: Позиция портфеля.
+            bond: Метаданные облигации.
+            coupons: График купонов облигации.
+        """
+        self.remove_position(position.figi)
+        flows = PositionCashFlows.from_schedule(position, bond, coupons, start=self.start, end=self.end)
+        self._positions[position.figi] = flows
+        self._apply(flows, sign=1)
+
+    def remove_position(self, figi: str) -> None:
+        """Удаляет выплаты позиции из прогноза (если позиция есть).
+
+        Args:
+            figi: FIGI облигации.
+        """
+        flows = self._positions.pop(figi, None)
+        if flows is not None:
+            self._apply(flows, sign=-1)
+
+    def buckets(self, period: CashFlowPeriod = CashFlowPeriod.MONTH) -> list[CashFlowBucket]:
+        """Группирует выплаты по периодам.
+
+        Args:
+            period: Период корзины.
+
+        Returns:
+            Корзины с ненулевыми выплатами, по валюте и началу периода.
+        """
+        totals: dict[tuple[str, date], list[int]] = {}
+        for (currency, day), (coupons, redemptions) in self._daily.items():
+            key = (currency, _period_start(date.fromordinal(day), period))
+            bucket = totals.setdefault(key, [0, 0])
+            bucket[0] += coupons
+            bucket[1] += redemptions
+
+        return [
+            CashFlowBucket(
+                currency=currency,
+                period_start=period_start,
+                coupons=Decimal(coupons).scaleb(-_NANO_EXPONENT),
+                redemptions=Decimal(redemptions).scaleb(-_NANO_EXPONENT),
+            )
+            for (currency, period_start), (coupons, redemptions) in sorted(totals.items())
+        ]
+
+    def _apply(self, flows: PositionCashFlows, *, sign: int) -> None:
+        """Прибавляет или вычитает выплаты позиции из дневных итогов.
+
+        Args:
+            flows: Выплаты позиции.
+            sign: 1 — прибавить, -1 — вычесть.
+        """
+        daily = self._daily
+        for currency, day, coupons, redemptions in zip(
+            flows.currencies, flows.days, flows.coupons, flows.redemptions, strict=True
+        ):
+            key = (currency, day)
+            totals = daily.setdefault(key, [0, 0])
+            totals[0] += sign * coupons
+            totals[1] += sign * redemptions
+            if not totals[0] and not totals[1]:
+                del daily[key]
+
+
+def _period_start(day: date, period: CashFlowPeriod) -> date:
+    """Возвращает первый день периода, в который попадает дата.
+
+    Args:
+        day: Дата.
+        period: Период.
+
+    Returns:
+        Первый день периода.
+    """
+    if period == CashFlowPeriod.MONTH:
+        return day.replace(day=1)
+    if period == CashFlowPeriod.YEAR:
+        return day.replace(month=1, day=1)
+    return day
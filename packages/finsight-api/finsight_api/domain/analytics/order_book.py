@@ -0,0 +1,283 @@
+"""Аналитика ликвидности по снимкам стакана.
+
+`OrderBook` хранит уровни как объекты с ценой в `Money`. Для расчёта метрик
+стакан переводится в колонки: цены — int64 в нано-единицах (как в `CandleFrame`),
+объёмы — int64 в лотах. Вместе с колонками один раз считаются накопленные объём и
+стоимость уровней, поэтому VWAP исполнения любого объёма — это бинарный поиск по
+накопленному объёму, а не проход по уровням.
+
+Метрики:
+    - лучшие bid/ask, mid (середина спреда) и спред, в том числе в б.п. от mid;
+    - microprice — цена лучших уровней, взвешенная объёмом противоположной стороны;
+    - глубина сторон (суммарный объём) и накопленная глубина по уровням;
+    - VWAP исполнения N лотов по рынку и оценка влияния на цену (impact) в б.п. от mid.
+
+Цены метрик выражены в единицах цены стакана (для облигаций — процент от номинала).
+"""
+
+import bisect
+import operator
+from array import array
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Final, TYPE_CHECKING
+
+from finsight_api.domain.entities.candle_frame import int64_column, NANO_FACTOR
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from finsight_api.domain.value_objects.order_book import OrderBook, OrderBookLevel
+
+
+BPS_FACTOR: Final[int] = 10_000
+
+_FLOAT64_TYPECODE: Final[str] = 'd'
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class OrderBookSide:
+    """Одна сторона стакана в колоночном виде, от лучшей цены к худшей.
+
+    Attributes:
+        prices: Цены уровней, нано-единицы (int64).
+        quantities: Объёмы уровней в лотах (int64).
+        cumulative_quantities: Накопленный объём по уровням, лоты (int64).
+        cumulative_notional: Накопленная стоимость уровней, нано-единицы * лоты (float64).
+    """
+
+    prices: memoryview
+    quantities: memoryview
+    cumulative_quantities: memoryview
+    cumulative_notional: memoryview
+
+    def __post_init__(self) -> None:
+        """Проверяет, что колонки имеют одинаковую длину.
+
+        Raises:
+            ValueError: Если колонки имеют разную длину.
+        """
+        columns = (self.prices, self.quantities, self.cumulative_quantities, self.cumulative_notional)
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError('OrderBookSide columns must have equal length')
+
+    def __len__(self) -> int:
+        """Возвращает количество уровней."""
+        return len(self.prices)
+
+    @classmethod
+    def from_columns(cls, prices: memoryview, quantities: memoryview) -> 'OrderBookSide':
+        """Строит сторону стакана из колонок цен и объёмов.
+
+        Args:
+            prices: Цены уровней от лучшей к худшей, нано-единицы (int64).
+            quantities: Объёмы уровней в лотах (int64).
+
+        Returns:
+            Сторона стакана с накопленными объёмом и стоимостью.
+        """
+        return cls(
+            prices=prices,
+            quantities=quantities,
+            cumulative_quantities=int64_column(accumulate(quantities)),
+            cumulative_notional=memoryview(array(_FLOAT64_TYPECODE, accumulate(map(operator.mul, prices, quantities)))),
+        )
+
+    @classmethod
+    def from_levels(cls, levels: 'Sequence[OrderBookLevel]') -> 'OrderBookSide':
+        """Строит сторону стакана из уровней доменного стакана.
+
+        Args:
+            levels: Уровни от лучшей цены к худшей.
+
+        Returns:
+            Сторона стакана в колоночном виде.
+        """
+        return cls.from_columns(
+            int64_column(int(level.price.amount.scaleb(9)) for level in levels),
+            int64_column(level.quantity for level in levels),
+        )
+
+    @property
+    def best_price(self) -> int | None:
+        """Лучшая цена стороны, нано-единицы (None для пустой стороны)."""
+        return self.prices[0] if self.prices else None
+
+    @property
+    def depth(self) -> int:
+        """Суммарный объём стороны в лотах."""
+        return self.cumulative_quantities[-1] if self.cumulative_quantities else 0
+
+    def fill_notional(self, lots: int) -> float | None:
+        """Считает стоимость исполнения объёма по рынку с этой стороны.
+
+        Args:
+            lots: Объём исполнения в лотах.
+
+        Returns:
+            Стоимость исполнения, нано-единицы * лоты; None, если объём не
+            положителен или глубины стороны не хватает.
+        """
+        if lots <= 0 or lots > self.depth:
+            return None
+        level = bisect.bisect_left(self.cumulative_quantities, lots)
+        if level == 0:
+            return float(self.prices[0] * lots)
+        filled = self.cumulative_quantities[level - 1]
+        return self.cumulative_notional[level - 1] + self.prices[level] * (lots - filled)
+
+    def vwap(self, lots: int) -> float | None:
+        """Считает средневзвешенную цену исполнения объёма по рынку.
+
+        Args:
+            lots: Объём исполнения в лотах.
+
+        Returns:
+            VWAP в единицах цены; None, если объём нельзя исполнить.
+        """
+        notional = self.fill_notional(lots)
+        return None if notional is None else notional / lots / NANO_FACTOR
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class OrderBookMetrics:
+    """Метрики ликвидности стакана для исполнения заданного объёма.
+
+    Метрики, которые нельзя посчитать (пустая сторона, недостаточная глубина),
+    равны None.
+
+    Attributes:
+        figi: FIGI инструмента.
+        lots: Объём исполнения в лотах, для которого посчитаны VWAP и impact.
+        best_bid: Лучшая цена покупки.
+        best_ask: Лучшая цена продажи.
+        mid: Середина спреда.
+        spread: Спред (best_ask - best_bid).
+        spread_bps: Спред в базисных пунктах от mid.
+        microprice: Цена лучших уровней, взвешенная объёмом противоположной стороны.
+        bid_depth: Суммарный объём bid-стороны в лотах.
+        ask_depth: Суммарный объём ask-стороны в лотах.
+        buy_vwap: VWAP покупки объёма по рынку (по ask-стороне).
+        sell_vwap: VWAP продажи объёма по рынку (по bid-стороне).
+        buy_impact_bps: Отклонение buy_vwap от mid вверх, б.п.
+        sell_impact_bps: Отклонение sell_vwap от mid вниз, б.п.
+    """
+
+    figi: str
+    lots: int
+    best_bid: float | None
+    best_ask: float | None
+    mid: float | None
+    spread: float | None
+    spread_bps: float | None
+    microprice: float | None
+    bid_depth: int
+    ask_depth: int
+    buy_vwap: float | None
+    sell_vwap: float | None
+    buy_impact_bps: float | None
+    sell_impact_bps: float | None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class OrderBookFrame:
+    """Стакан инструмента в колоночном виде.
+
+    Attributes:
+        figi: FIGI инструмента.
+        bids: Сторона покупки, от лучшей (наибольшей) цены.
+        asks: Сторона продажи, от лучшей (наименьшей) цены.
+    """
+
+    figi: str
+    bids: OrderBookSide
+    asks: OrderBookSide
+
+    @classmethod
+    def from_order_book(cls, order_book: 'OrderBook') -> 'OrderBookFrame':
+        """Строит колоночное представление доменного стакана.
+
+        Args:
+            order_book: Снимок стакана.
+
+        Returns:
+            Стакан в колоночном виде.
+        """
+        return cls(
+            figi=order_book.figi,
+            bids=OrderBookSide.from_levels(order_book.bids),
+            asks=OrderBookSide.from_levels(order_book.asks),
+        )
+
+    def metrics(self, lots: int) -> OrderBookMetrics:
+        """Считает метрики ликвидности для исполнения объёма.
+
+        Args:
+            lots: Объём исполнения в лотах.
+
+        Returns:
+            Метрики стакана.
+        """
+        bid, ask = self.bids.best_price, self.asks.best_price
+        buy_vwap, sell_vwap = self.asks.vwap(lots), self.bids.vwap(lots)
+        if bid is None or ask is None:
+            return OrderBookMetrics(
+                figi=self.figi,
+                lots=lots,
+                best_bid=_to_price(bid),
+                best_ask=_to_price(ask),
+                mid=None,
+                spread=None,
+                spread_bps=None,
+                microprice=None,
+                bid_depth=self.bids.depth,
+                ask_depth=self.asks.depth,
+                buy_vwap=buy_vwap,
+                sell_vwap=sell_vwap,
+                buy_impact_bps=None,
+                sell_impact_bps=None,
+            )
+
+        mid = (bid + ask) / 2 / NANO_FACTOR
+        bid_quantity, ask_quantity = self.bids.quantities[0], self.asks.quantities[0]
+        top_quantity = bid_quantity + ask_quantity
+        return OrderBookMetrics(
+            figi=self.figi,
+            lots=lots,
+            best_bid=bid / NANO_FACTOR,
+            best_ask=ask / NANO_FACTOR,
+            mid=mid,
+            spread=(ask - bid) / NANO_FACTOR,
+            spread_bps=(ask - bid) * 2 * BPS_FACTOR / (bid + ask),
+            microprice=(bid * ask_quantity + ask * bid_quantity) / top_quantity / NANO_FACTOR if top_quantity else mid,
+            bid_depth=self.bids.depth,
+            ask_depth=self.asks.depth,
+            buy_vwap=buy_vwap,
+            sell_vwap=sell_vwap,
+            buy_impact_bps=None if buy_vwap is None else (buy_vwap - mid) / mid * BPS_FACTOR,
+            sell_impact_bps=None if sell_vwap is None else (mid - sell_vwap) / mid * BPS_FACTOR,
+        )
+
+
+def analyze_order_books(orders: 'Iterable[tuple[OrderBook, int]]') -> list[OrderBookMetrics]:
+    """Считает метрики ликвидности для набора стаканов.
+
+    Args:
+        orders: Пары (стакан, объём исполнения в лотах).
+
+    Returns:
+        Метрики в порядке переданных стаканов.
+    """
+    return [OrderBookFrame.from_order_book(order_book).metrics(lots) for order_book, lots in orders]
+
+
+def _to_price(nanos: int | None) -> float | None:
+    """Переводит цену из нано-единиц.
+
+    Args:
+        nanos: Цена в нано-единицах.
+
+    Returns:
+        Цена в единицах (None, если цены нет).
+    """
+    return None if nanos is None else nanos / NANO_FACTOR
@@ -3,6 +3,8 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from finsight_api.domain.trusted import slot_setters
+
 if TYPE_CHECKING:
     from datetime import datetime
 
@@ -35,3 +37,37 @@ class CandleEntity:
     low: float
     volume: int
     interval: 'CandleInterval'
+
+    @classmethod
+    def _from_trusted(  # noqa: PLR0913
+        cls,
+        *,
+        figi: str,
+        time: 'datetime',
+        open: float,
+        close: float,
+        high: float,
+        low: float,
+        volume: int,
+        interval: 'CandleInterval',
+    ) -> 'CandleEntity':
+        """Создаёт свечу из доверенных данных в обход `__init__` (см. `domain.trusted`).
+
+        Returns:
+            Свеча с переданными полями.
+        """
+        candle = object.__new__(cls)
+        _SET_FIGI(candle, figi)
+        _SET_TIME(candle, time)
+        _SET_OPEN(candle, open)
+        _SET_CLOSE(candle, close)
+        _SET_HIGH(candle, high)
+        _SET_LOW(candle, low)
+        _SET_VOLUME(candle, volume)
+        _SET_INTERVAL(candle, interval)
+        return candle
+
+
+_SET_FIGI, _SET_TIME, _SET_OPEN, _SET_CLOSE, _SET_HIGH, _SET_LOW, _SET_VOLUME, _SET_INTERVAL = slot_setters(
+    CandleEntity, 'figi', 'time', 'open', 'close', 'high', 'low', 'volume', 'interval'
+)
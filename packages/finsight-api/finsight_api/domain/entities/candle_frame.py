@@ -0,0 +1,239 @@
+"""Колоночное представление серии свечей одного инструмента и интервала.
+
+`CandleEntity` — отдельный объект на каждую свечу с собственными строками figi и
+interval и aware-datetime. Для длинных серий (год минутных свечей — сотни тысяч
+объектов) это дорого по памяти и времени. `CandleFrame` хранит серию в колонках:
+время — int64 секунды Unix-эпохи (UTC), цены OHLC — int64 в нано-единицах
+(units * 10^9 + nano, как в Quotation API), объём — int64.
+
+Колонки — read-only `memoryview` над `array.array('q')` (или над отображённым в
+память файлом): срезы по индексам и по времени не копируют данные, а буфер можно
+передать в любой код, понимающий buffer protocol. Серия неизменяема, поэтому
+сравнивается и хешируется по идентичности, а не по содержимому колонок.
+"""
+
+import bisect
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import Final, TYPE_CHECKING
+
+from finsight_api.domain.entities.candle import CandleEntity
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from finsight_api.domain.value_objects.candle_interval import CandleInterval
+
+
+NANO_FACTOR: Final[int] = 1_000_000_000
+
+_INT64_TYPECODE: Final[str] = 'q'
+
+
+def int64_column(values: 'Iterable[int]' = ()) -> memoryview:
+    """Создаёт колонку int64 из последовательности целых чисел.
+
+    Args:
+        values: Значения колонки.
+
+    Returns:
+        Read-only memoryview над array('q') с переданными значениями.
+    """
+    return memoryview(array(_INT64_TYPECODE, values)).toreadonly()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, eq=False)
+class CandleFrame:
+    """Серия свечей одного инструмента и интервала в колоночном виде.
+
+    Свечи упорядочены по времени по возрастанию. Все колонки имеют одинаковую длину.
+
+    Attributes:
+        figi: Идентификатор инструмента.
+        interval: Интервал свечей.
+        time: Время начала свечи, секунды Unix-эпохи (UTC).
+        open: Цена открытия, нано-единицы.
+        high: Максимальная цена, нано-единицы.
+        low: Минимальная цена, нано-единицы.
+        close: Цена закрытия, нано-единицы.
+        volume: Объём торгов в лотах.
+    """
+
+    figi: str
+    interval: 'CandleInterval'
+    time: memoryview
+    open: memoryview
+    high: memoryview
+    low: memoryview
+    close: memoryview
+    volume: memoryview
+
+    def __post_init__(self) -> None:
+        """Проверяет, что все колонки — read-only int64 одинаковой длины.
+
+        Raises:
+            ValueError: Если колонки имеют разную длину, не являются int64 или доступны на запись.
+        """
+        columns = (self.time, self.open, self.high, self.low, self.close, self.volume)
+        if any(column.format != _INT64_TYPECODE for column in columns):
+            raise ValueError('CandleFrame columns must be int64 memoryviews')
+        if not all(column.readonly for column in columns):
+            raise ValueError('CandleFrame columns must be read-only memoryviews')
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError('CandleFrame columns must have equal length')
+
+    def __len__(self) -> int:
+        """Возвращает количество свечей в серии."""
+        return len(self.time)
+
+    @classmethod
+    def empty(cls, *, figi: str, interval: 'CandleInterval') -> 'CandleFrame':
+        """Создаёт пустую серию.
+
+        Args:
+            figi: Идентификатор инструмента.
+            interval: Интервал свечей.
+
+        Returns:
+            Серия без свечей.
+        """
+        return cls(
+            figi=figi,
+            interval=interval,
+            time=int64_column(),
+            open=int64_column(),
+            high=int64_column(),
+            low=int64_column(),
+            close=int64_column(),
+            volume=int64_column(),
+        )
+
+    @classmethod
+    def from_entities(
+        cls,
+        candles: 'Sequence[CandleEntity]',
+        *,
+        figi: str,
+        interval: 'CandleInterval',
+    ) -> 'CandleFrame':
+        """Строит серию из доменных свечей.
+
+        Args:
+            candles: Свечи, упорядоченные по времени.
+            figi: Идентификатор инструмента.
+            interval: Интервал свечей.
+
+        Returns:
+            Колоночная серия свечей.
+        """
+        return cls(
+            figi=figi,
+            interval=interval,
+            time=int64_column(int(candle.time.timestamp()) for candle in candles),
+            open=int64_column(round(candle.open * NANO_FACTOR) for candle in candles),
+            high=int64_column(round(candle.high * NANO_FACTOR) for candle in candles),
+            low=int64_column(round(candle.low * NANO_FACTOR) for candle in candles),
+            close=int64_column(round(candle.close * NANO_FACTOR) for candle in candles),
+            volume=int64_column(candle.volume for candle in candles),
+        )
+
+    @classmethod
+    def concat(
+        cls,
+        frames: 'Iterable[CandleFrame]',
+        *,
+        figi: str,
+        interval: 'CandleInterval',
+    ) -> 'CandleFrame':
+        """Склеивает последовательные серии одного инструмента в одну (с копированием).
+
+        Args:
+            frames: Серии в порядке времени, не пересекающиеся по времени.
+            figi: Идентификатор инструмента.
+            interval: Интервал свечей.
+
+        Returns:
+            Серия со свечами всех переданных серий.
+        """
+        columns = tuple(array(_INT64_TYPECODE) for _ in range(6))
+        for frame in frames:
+            for column, part in zip(
+                columns,
+                (frame.time, frame.open, frame.high, frame.low, frame.close, frame.volume),
+                strict=True,
+            ):
+                column.frombytes(part.cast('B'))
+
+        time, open_, high, low, close, volume = (memoryview(column).toreadonly() for column in columns)
+        return cls(figi=figi, interval=interval, time=time, open=open_, high=high, low=low, close=close, volume=volume)
+
+    def to_entities(self) -> list[CandleEntity]:
+        """Разворачивает серию в список доменных свечей.
+
+        Returns:
+            Доменные свечи в порядке времени.
+        """
+        return [
+            CandleEntity._from_trusted(
+                figi=self.figi,
+                time=datetime.fromtimestamp(ts, tz=UTC),
+                open=open_ / NANO_FACTOR,
+                close=close / NANO_FACTOR,
+                high=high / NANO_FACTOR,
+                low=low / NANO_FACTOR,
+                volume=volume,
+                interval=self.interval,
+            )
+            for ts, open_, high, low, close, volume in zip(
+                self.time, self.open, self.high, self.low, self.close, self.volume, strict=True
+            )
+        ]
+
+    def slice(self, start: int, stop: int) -> 'CandleFrame':
+        """Возвращает срез серии по индексам без копирования данных.
+
+        Args:
+            start: Индекс первой свечи (включительно).
+            stop: Индекс последней свечи (не включительно).
+
+        Returns:
+            Серия, разделяющая буферы с исходной.
+        """
+        return CandleFrame(
+            figi=self.figi,
+            interval=self.interval,
+            time=self.time[start:stop],
+            open=self.open[start:stop],
+            high=self.high[start:stop],
+            low=self.low[start:stop],
+            close=self.close[start:stop],
+            volume=self.volume[start:stop],
+        )
+
+    def after(self, epoch_seconds: int) -> 'CandleFrame':
+        """Возвращает свечи строго позже указанного времени без копирования данных.
+
+        Используется для отбрасывания свечей, уже полученных в предыдущем окне загрузки.
+
+        Args:
+            epoch_seconds: Время в секундах Unix-эпохи.
+
+        Returns:
+            Серия, разделяющая буферы с исходной.
+        """
+        return self.slice(bisect.bisect_right(self.time, epoch_seconds), len(self))
+
+    def between(self, from_: datetime, to: datetime) -> 'CandleFrame':
+        """Возвращает свечи в полуинтервале времени [from_, to) без копирования данных.
+
+        Args:
+            from_: Начало периода (включительно), aware-datetime.
+            to: Конец периода (не включительно), aware-datetime.
+
+        Returns:
+            Серия, разделяющая буферы с исходной.
+        """
+        start = bisect.bisect_left(self.time, int(from_.timestamp()))
+        stop = bisect.bisect_left(self.time, int(to.timestamp()), lo=start)
+        return self.slice(start, stop)
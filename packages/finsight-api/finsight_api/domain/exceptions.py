@@ -16,3 +16,16 @@ class BaseAppError(Exception):
         """
         self.message = message
         self.status_code = int(status_code)
+
+
+class InstrumentNotFoundError(BaseAppError):
+    """Инструмент не найден по идентификатору."""
+
+    def __init__(self, isin: str) -> None:
+        """Инициализирует ошибку для ненайденного инструмента.
+
+        Args:
+            isin: ISIN, по которому искали инструмент.
+        """
+        super().__init__(f'Инструмент не найден по ISIN: {isin}', HTTPStatus.NOT_FOUND)
+        self.isin = isin
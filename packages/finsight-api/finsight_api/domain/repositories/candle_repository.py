@@ -5,15 +5,25 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Collection
+    from datetime import datetime
 
     from finsight_api.domain.entities.candle import CandleEntity
+    from finsight_api.domain.entities.candle_frame import CandleFrame
+    from finsight_api.domain.value_objects.candle_interval import CandleInterval
+    from finsight_core.market_data.candle_coverage import CandleCoverage
 
 
 class CandleRepository(ABC):
     """Доменный порт для сохранения исторических свечей.
 
     Реализации (адаптеры) находятся в инфраструктурном слое; домен зависит
-    только от этого интерфейса.
+    только от этого интерфейса. Свечи идентифицируются парой (figi, interval) и
+    временем свечи: повторное сохранение свечи с тем же временем заменяет её, а не
+    дублирует.
+
+    Кроме свечей репозиторий хранит покрытие (CandleCoverage) — периоды, уже
+    загруженные из источника, — по которому инкрементальная синхронизация
+    определяет, что ещё нужно догрузить.
     """
 
     @abstractmethod
@@ -23,3 +33,57 @@ class CandleRepository(ABC):
         Args:
             candles: Свечи для сохранения.
         """
+
+    @abstractmethod
+    async def append(self, frame: 'CandleFrame') -> int:
+        """Дописывает колоночную серию свечей в хранилище.
+
+        Args:
+            frame: Серия свечей одного инструмента и интервала, упорядоченная по времени.
+
+        Returns:
+            Количество свечей, которых ещё не было в хранилище.
+        """
+
+    @abstractmethod
+    async def load(
+        self,
+        *,
+        figi: str,
+        interval: 'CandleInterval',
+        from_: 'datetime',
+        to: 'datetime',
+    ) -> 'CandleFrame':
+        """Читает сохранённые свечи за полуинтервал времени [from_, to).
+
+        Args:
+            figi: Идентификатор инструмента.
+            interval: Интервал свечей.
+            from_: Начало периода (включительно), aware-datetime.
+            to: Конец периода (не включительно), aware-datetime.
+
+        Returns:
+            Колоночная серия сохранённых свечей (пустая, если данных нет).
+        """
+
+    @abstractmethod
+    async def load_coverage(self, *, figi: str, interval: 'CandleInterval') -> 'CandleCoverage':
+        """Читает покрытие загруженных периодов инструмента и интервала.
+
+        Args:
+            figi: Идентификатор инструмента.
+            interval: Интервал свечей.
+
+        Returns:
+            Покрытие (пустое, если синхронизация ещё не выполнялась).
+        """
+
+    @abstractmethod
+    async def save_coverage(self, coverage: 'CandleCoverage', *, figi: str, interval: 'CandleInterval') -> None:
+        """Сохраняет покрытие загруженных периодов инструмента и интервала.
+
+        Args:
+            coverage: Новое покрытие, заменяющее сохранённое.
+            figi: Идентификатор инструмента.
+            interval: Интервал свечей.
+        """
@@ -0,0 +1,41 @@
+"""Быстрое создание неизменяемых доменных объектов из доверенных данных.
+
+`__init__` frozen-dataclass записывает каждое поле через `object.__setattr__`, а
+value objects с `__post_init__` проверяют значение при каждом создании. Мапперы
+ответов Tinkoff API и колонок CandleFrame создают тысячи объектов из данных, уже
+проверенных источником, поэтому у горячих доменных типов есть внутренний
+конструктор `_from_trusted`: объект создаётся через `object.__new__`, а поля
+записываются дескрипторами слотов напрямую, минуя `__init__`, `__setattr__` и
+валидацию.
+
+Пользовательский ввод по-прежнему создаётся обычным конструктором с валидацией.
+"""
+
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+type SlotSetter = Callable[[object, Any], None]
+
+
+def slot_setters(cls: type, *names: str) -> tuple[SlotSetter, ...]:
+    """Возвращает функции записи слотов класса в обход его `__setattr__`.
+
+    Args:
+        cls: Dataclass с `slots=True`.
+        names: Имена полей.
+
+    Returns:
+        Функции записи значения поля, в порядке names.
+
+    Raises:
+        TypeError: Если поле класса не является слотом.
+    """
+    setters = []
+    for name in names:
+        descriptor = cls.__dict__.get(name)
+        if descriptor is None or not hasattr(descriptor, '__set__'):
+            raise TypeError(f'{cls.__name__}.{name} is not a slot')
+        setters.append(descriptor.__set__)
+    return tuple(setters)
@@ -3,6 +3,8 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from finsight_api.domain.trusted import slot_setters
+
 if TYPE_CHECKING:
     from datetime import datetime
 
@@ -34,3 +36,58 @@ class BondCoupon:
     coupon_start_date: 'datetime'
     coupon_end_date: 'datetime'
     coupon_period: int
+
+    @classmethod
+    def _from_trusted(  # noqa: PLR0913
+        cls,
+        *,
+        figi: str,
+        coupon_date: 'datetime',
+        coupon_number: int,
+        fix_date: 'datetime',
+        pay_one_bond: 'Money',
+        coupon_type: str,
+        coupon_start_date: 'datetime',
+        coupon_end_date: 'datetime',
+        coupon_period: int,
+    ) -> 'BondCoupon':
+        """Создаёт купон из доверенных данных в обход `__init__` (см. `domain.trusted`).
+
+        Returns:
+            Купон с переданными полями.
+        """
+        coupon = object.__new__(cls)
+        _SET_FIGI(coupon, figi)
+        _SET_COUPON_DATE(coupon, coupon_date)
+        _SET_COUPON_NUMBER(coupon, coupon_number)
+        _SET_FIX_DATE(coupon, fix_date)
+        _SET_PAY_ONE_BOND(coupon, pay_one_bond)
+        _SET_COUPON_TYPE(coupon, coupon_type)
+        _SET_COUPON_START_DATE(coupon, coupon_start_date)
+        _SET_COUPON_END_DATE(coupon, coupon_end_date)
+        _SET_COUPON_PERIOD(coupon, coupon_period)
+        return coupon
+
+
+(
+    _SET_FIGI,
+    _SET_COUPON_DATE,
+    _SET_COUPON_NUMBER,
+    _SET_FIX_DATE,
+    _SET_PAY_ONE_BOND,
+    _SET_COUPON_TYPE,
+    _SET_COUPON_START_DATE,
+    _SET_COUPON_END_DATE,
+    _SET_COUPON_PERIOD,
+) = slot_setters(
+    BondCoupon,
+    'figi',
+    'coupon_date',
+    'coupon_number',
+    'fix_date',
+    'pay_one_bond',
+    'coupon_type',
+    'coupon_start_date',
+    'coupon_end_date',
+    'coupon_period',
+)
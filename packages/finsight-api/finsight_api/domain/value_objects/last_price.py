@@ -0,0 +1,26 @@
+"""Value Object последней цены сделки по инструменту."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from decimal import Decimal
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LastPrice:
+    """Последняя цена сделки по инструменту.
+
+    Цена — котировка в единицах торгов инструмента (для облигаций — процент от
+    номинала), как её отдаёт Tinkoff Invest API.
+
+    Attributes:
+        figi: FIGI инструмента.
+        price: Цена последней сделки.
+        time: Время последней сделки (если известно).
+    """
+
+    figi: str
+    price: 'Decimal'
+    time: 'datetime | None'
@@ -3,6 +3,8 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from finsight_api.domain.trusted import slot_setters
+
 if TYPE_CHECKING:
     from datetime import datetime
 
@@ -21,6 +23,18 @@ class OrderBookLevel:
     price: 'Money'
     quantity: int
 
+    @classmethod
+    def _from_trusted(cls, *, price: 'Money', quantity: int) -> 'OrderBookLevel':
+        """Создаёт уровень стакана из доверенных данных в обход `__init__` (см. `domain.trusted`).
+
+        Returns:
+            Уровень стакана с переданными полями.
+        """
+        level = object.__new__(cls)
+        _SET_LEVEL_PRICE(level, price)
+        _SET_LEVEL_QUANTITY(level, quantity)
+        return level
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class OrderBook:
@@ -43,3 +57,6 @@ class OrderBook:
     last_price: 'Money | None'
     close_price: 'Money | None'
     timestamp: 'datetime | None'
+
+
+_SET_LEVEL_PRICE, _SET_LEVEL_QUANTITY = slot_setters(OrderBookLevel, 'price', 'quantity')
@@ -6,6 +6,8 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from finsight_api.domain.trusted import slot_setters
+
 if TYPE_CHECKING:
     from decimal import Decimal
 
@@ -37,3 +39,58 @@ class PortfolioPosition:
     current_nkd: 'Decimal | None'
     value: 'Decimal'
     instrument_uid: str
+
+    @classmethod
+    def _from_trusted(  # noqa: PLR0913
+        cls,
+        *,
+        figi: str,
+        instrument_type: 'InstrumentType',
+        quantity: 'Decimal',
+        expected_yield: 'Decimal',
+        average_position_price: 'Decimal',
+        current_price: 'Decimal',
+        current_nkd: 'Decimal | None',
+        value: 'Decimal',
+        instrument_uid: str,
+    ) -> 'PortfolioPosition':
+        """Создаёт позицию из доверенных данных в обход `__init__` (см. `domain.trusted`).
+
+        Returns:
+            Позиция с переданными полями.
+        """
+        position = object.__new__(cls)
+        _SET_FIGI(position, figi)
+        _SET_INSTRUMENT_TYPE(position, instrument_type)
+        _SET_QUANTITY(position, quantity)
+        _SET_EXPECTED_YIELD(position, expected_yield)
+        _SET_AVERAGE_POSITION_PRICE(position, average_position_price)
+        _SET_CURRENT_PRICE(position, current_price)
+        _SET_CURRENT_NKD(position, current_nkd)
+        _SET_VALUE(position, value)
+        _SET_INSTRUMENT_UID(position, instrument_uid)
+        return position
+
+
+(
+    _SET_FIGI,
+    _SET_INSTRUMENT_TYPE,
+    _SET_QUANTITY,
+    _SET_EXPECTED_YIELD,
+    _SET_AVERAGE_POSITION_PRICE,
+    _SET_CURRENT_PRICE,
+    _SET_CURRENT_NKD,
+    _SET_VALUE,
+    _SET_INSTRUMENT_UID,
+) = slot_setters(
+    PortfolioPosition,
+    'figi',
+    'instrument_type',
+    'quantity',
+    'expected_yield',
+    'average_position_price',
+    'current_price',
+    'current_nkd',
+    'value',
+    'instrument_uid',
+)
@@ -1,28 +1,39 @@
 """Адаптер парсинга кредитных рейтингов с analytics.dohod.ru.
 
 Источник: публичные страницы вида https://analytics.dohod.ru/bond/<ISIN>.
-Извлекаем рейтинги только от АКРА и Эксперт РА.
+Извлекаем рейтинги только от АКРА и Эксперт РА. Сетевые сбои, 429 и 5xx
+повторяются политикой Retrier (с учётом заголовка Retry-After).
 """
 
 from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from http import HTTPStatus
+from typing import Final, TYPE_CHECKING
+
+import httpx
 
 from finsight_api.application.ports.credit_ratings import CreditRatingsPort
 from finsight_api.domain.value_objects.credit_rating_agency import CreditRatingAgency
 from finsight_api.domain.value_objects.credit_ratings import CreditRating, CreditRatings
+from finsight_api.infrastructure.utils.retry import NO_RETRY, Retrier, RETRY, RetryDecision
 
 if TYPE_CHECKING:
-    import httpx
-
     from finsight_api.application.ports.logger import LoggerPort
     from finsight_api.domain.value_objects.isin import ISIN
 
 
 _ACRA_PATTERN = re.compile(r'АКРА\s*-\s*([^\(\r\n]+)')
 _EXPERT_PATTERN = re.compile(r'Эксперт\s*-\s*([^\(\r\n]+)')
+_RETRYABLE_STATUSES: Final[frozenset[int]] = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    },
+)
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -52,6 +63,7 @@ class DohodCreditRatingsAdapter(CreditRatingsPort):
         http: httpx.AsyncClient,
         logger: LoggerPort,
         settings: DohodAdapterSettings | None = None,
+        retrier: Retrier | None = None,
     ) -> None:
         """Инициализирует адаптер.
 
@@ -59,10 +71,13 @@ class DohodCreditRatingsAdapter(CreditRatingsPort):
             http: Асинхронный HTTP-клиент.
             logger: Логгер приложения.
             settings: Настройки адаптера. Если None — используются настройки по умолчанию.
+            retrier: Политика повторов запросов. Если None — повторы по classify_dohod_error
+                с параметрами RetryPolicy по умолчанию.
         """
         self._http = http
         self._logger = logger
         self._settings = settings or DohodAdapterSettings()
+        self._retrier = retrier or Retrier(classify=classify_dohod_error, logger=logger)
 
     async def get_ratings(self, *, isin: ISIN) -> CreditRatings:
         """Возвращает кредитные рейтинги для указанного ISIN.
@@ -81,12 +96,7 @@ class DohodCreditRatingsAdapter(CreditRatingsPort):
         url = f'{self._settings.base_url}/bond/{isin.value}'
 
         try:
-            response = await self._http.get(
-                url,
-                headers={'User-Agent': 'FinSight/1.0'},
-                timeout=self._settings.timeout_seconds,
-            )
-            response.raise_for_status()
+            response = await self._retrier.call(lambda: self._fetch(url), name='dohod.get_ratings')
         except Exception as exc:
             # Ошибка не должна “ронять” приложение без явного решения выше.
             # Возвращаем пустой набор и логируем причину.
@@ -96,6 +106,26 @@ class DohodCreditRatingsAdapter(CreditRatingsPort):
         items = self._parse_ratings_from_html(response.text)
         return CreditRatings.from_iterable(items)
 
+    async def _fetch(self, url: str) -> httpx.Response:
+        """Загружает страницу (одна попытка).
+
+        Args:
+            url: Адрес страницы.
+
+        Returns:
+            httpx.Response: Успешный ответ.
+
+        Raises:
+            httpx.HTTPError: Сетевая ошибка или ответ с кодом 4xx/5xx.
+        """
+        response = await self._http.get(
+            url,
+            headers={'User-Agent': 'FinSight/1.0'},
+            timeout=self._settings.timeout_seconds,
+        )
+        response.raise_for_status()
+        return response
+
     def _parse_ratings_from_html(self, html: str) -> tuple[CreditRating, ...]:
         """Извлекает рейтинги АКРА и Эксперт РА из HTML страницы.
 
@@ -137,3 +167,26 @@ class DohodCreditRatingsAdapter(CreditRatingsPort):
         value = value.replace('\xa0', ' ')
         value = re.sub(r'\s+', ' ', value).strip()
         return value or None
+
+
+def classify_dohod_error(exc: BaseException) -> RetryDecision:
+    """Решает, можно ли повторить запрос к analytics.dohod.ru после ошибки.
+
+    Повторяются сетевые ошибки и таймауты, а также ответы 429, 502, 503 и 504.
+    Заголовок Retry-After (в секундах) задаёт минимальную паузу перед повтором.
+
+    Args:
+        exc: Исключение запроса.
+
+    Returns:
+        RetryDecision: Решение о повторе.
+    """
+    if isinstance(exc, httpx.TransportError):
+        return RETRY
+    if not isinstance(exc, httpx.HTTPStatusError) or exc.response.status_code not in _RETRYABLE_STATUSES:
+        return NO_RETRY
+
+    retry_after = exc.response.headers.get('Retry-After', '')
+    if retry_after.isdigit():
+        return RetryDecision(retryable=True, retry_after=float(retry_after))
+    return RETRY
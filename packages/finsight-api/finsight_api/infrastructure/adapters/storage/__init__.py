@@ -0,0 +1,7 @@
+"""Пакет инфраструктурных адаптеров локального хранения данных."""
+
+from .candle_repository import ColumnarCandleRepository
+
+__all__ = [
+    'ColumnarCandleRepository',
+]
@@ -0,0 +1,467 @@
+"""Файловое колоночное хранилище исторических свечей.
+
+Свечи хранятся по партициям `<root>/<figi>/<interval>/<YYYY-MM>.candles`: одна
+партиция — один инструмент, интервал и календарный месяц (UTC). Поэтому чтение
+периода открывает только файлы нужных месяцев.
+
+Файл партиции — последовательность блоков. Блок: заголовок (magic `FSC1`, число
+свечей N, little-endian uint32) и шесть колонок по N значений int64 подряд —
+время (секунды эпохи), open, high, low, close (нано-единицы), volume. Формат
+колонок совпадает с CandleFrame, поэтому при чтении колонки блока отдаются как
+memoryview над mmap файла, без копирования и разбора.
+
+Запись только дописывает блоки в конец файла. Свечи, время которых не больше
+последней сохранённой, считаются повтором или заполнением пропуска: тогда
+партиция сливается (новые значения заменяют старые с тем же временем) и
+перезаписывается одним блоком через временный файл и атомарную замену.
+Перед заменой временный файл сбрасывается на диск (fsync). Недописанный или
+повреждённый блок в конце файла (обрыв записи) при чтении игнорируется вместе со
+всем, что за ним следует, и отрезается при следующей записи.
+
+Покрытие загруженных периодов (CandleCoverage) хранится рядом с партициями в
+`<root>/<figi>/<interval>/coverage.json` — пары секунд эпохи [start, end).
+"""
+
+import asyncio
+import bisect
+import mmap
+import os
+import struct
+import weakref
+from array import array
+from collections import defaultdict
+from datetime import datetime, UTC
+from typing import Final, TYPE_CHECKING
+
+import orjson
+
+from finsight_api.domain.entities.candle_frame import CandleFrame
+from finsight_api.domain.repositories.candle_repository import CandleRepository
+from finsight_core.market_data.candle_coverage import CandleCoverage
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterator
+    from pathlib import Path
+    from typing import BinaryIO
+
+    from finsight_api.application.ports.logger import LoggerPort
+    from finsight_api.domain.entities.candle import CandleEntity
+    from finsight_api.domain.value_objects.candle_interval import CandleInterval
+
+
+_BLOCK_MAGIC: Final[bytes] = b'FSC1'
+_BLOCK_HEADER: Final[struct.Struct] = struct.Struct('<4sI')
+_COLUMNS_COUNT: Final[int] = 6
+_INT64_SIZE: Final[int] = 8
+_PARTITION_SUFFIX: Final[str] = '.candles'
+_COVERAGE_FILENAME: Final[str] = 'coverage.json'
+_MONTHS_IN_YEAR: Final[int] = 12
+
+
+class ColumnarCandleRepository(CandleRepository):
+    """Реализация CandleRepository поверх колоночных файлов, партиционированных по месяцам.
+
+    Файловые операции выполняются в пуле потоков (asyncio.to_thread), запись в
+    один файл (партицию или покрытие) сериализуется блокировкой этого файла, а
+    запись в разные файлы идёт параллельно. Рассчитан на одного писателя на
+    каталог хранилища.
+    """
+
+    def __init__(self, *, root: 'Path', logger: 'LoggerPort') -> None:
+        """Инициализирует репозиторий.
+
+        Args:
+            root: Корневой каталог хранилища свечей.
+            logger: Логгер приложения.
+        """
+        self._root = root
+        self._logger = logger
+        self._write_locks: weakref.WeakValueDictionary[Path, asyncio.Lock] = weakref.WeakValueDictionary()
+
+    async def save_all(self, candles: 'Collection[CandleEntity]') -> None:
+        """Сохраняет набор свечей, группируя их по инструменту и интервалу.
+
+        Args:
+            candles: Свечи для сохранения (в любом порядке).
+        """
+        groups: defaultdict[tuple[str, CandleInterval], dict[datetime, CandleEntity]] = defaultdict(dict)
+        for candle in candles:
+            groups[candle.figi, candle.interval][candle.time] = candle
+
+        for (figi, interval), by_time in groups.items():
+            ordered = [by_time[time] for time in sorted(by_time)]
+            await self.append(CandleFrame.from_entities(ordered, figi=figi, interval=interval))
+
+    async def append(self, frame: CandleFrame) -> int:
+        """Дописывает серию свечей, разбивая её по месячным партициям.
+
+        Args:
+            frame: Серия свечей одного инструмента и интервала, упорядоченная по времени.
+
+        Returns:
+            Количество свечей, которых ещё не было в хранилище.
+        """
+        added = 0
+        for month, part in _split_by_month(frame):
+            path = self._partition_path(frame.figi, frame.interval, month)
+            async with self._write_lock(path):
+                added += await asyncio.to_thread(self._append_partition, path, part)
+        return added
+
+    async def load(
+        self,
+        *,
+        figi: str,
+        interval: 'CandleInterval',
+        from_: datetime,
+        to: datetime,
+    ) -> CandleFrame:
+        """Читает сохранённые свечи за полуинтервал времени [from_, to).
+
+        Если период укладывается в один блок одной партиции, колонки результата
+        ссылаются прямо на mmap файла; иначе блоки склеиваются в новую серию.
+
+        Args:
+            figi: Идентификатор инструмента.
+            interval: Интервал свечей.
+            from_: Начало периода (включительно), aware-datetime.
+            to: Конец периода (не включительно), aware-datetime.
+
+        Returns:
+            Колоночная серия сохранённых свечей (пустая, если данных нет).
+        """
+        return await asyncio.to_thread(self._load_sync, figi, interval, from_, to)
+
+    async def load_coverage(self, *, figi: str, interval: 'CandleInterval') -> CandleCoverage:
+        """Читает покрытие загруженных периодов инструмента и интервала.
+
+        Повреждённый файл покрытия не считается ошибкой: покрытие считается пустым,
+        и следующая синхронизация перезагрузит период целиком.
+
+        Args:
+            figi: Идентификатор инструмента.
+            interval: Интервал свечей.
+
+        Returns:
+            Покрытие (пустое, если файла покрытия нет).
+        """
+        return await asyncio.to_thread(self._load_coverage_sync, self._coverage_path(figi, interval))
+
+    async def save_coverage(self, coverage: CandleCoverage, *, figi: str, interval: 'CandleInterval') -> None:
+        """Атомарно сохраняет покрытие загруженных периодов инструмента и интервала.
+
+        Args:
+            coverage: Новое покрытие, заменяющее сохранённое.
+            figi: Идентификатор инструмента.
+            interval: Интервал свечей.
+        """
+        path = self._coverage_path(figi, interval)
+        async with self._write_lock(path):
+            await asyncio.to_thread(_write_coverage, path, coverage)
+
+    def _write_lock(self, path: 'Path') -> asyncio.Lock:
+        """Возвращает блокировку записи в файл.
+
+        Блокировка живёт, пока её удерживает хотя бы одна запись, поэтому словарь
+        блокировок не растёт с числом инструментов.
+
+        Args:
+            path: Путь к файлу партиции или покрытия.
+
+        Returns:
+            Блокировка, общая для всех конкурентных записей в этот файл.
+        """
+        lock = self._write_locks.get(path)
+        if lock is None:
+            lock = self._write_locks[path] = asyncio.Lock()
+        return lock
+
+    def _load_coverage_sync(self, path: 'Path') -> CandleCoverage:
+        """Синхронно читает файл покрытия.
+
+        Args:
+            path: Путь к файлу покрытия.
+
+        Returns:
+            Покрытие (пустое, если файла нет или он повреждён).
+        """
+        if not path.exists():
+            return CandleCoverage()
+
+        try:
+            return CandleCoverage.from_epoch_pairs(orjson.loads(path.read_bytes()))
+        except (OSError, ValueError, TypeError) as exc:
+            self._logger.warning(f'Failed to read candle coverage: {exc!r}', path=str(path))
+            return CandleCoverage()
+
+    def _append_partition(self, path: 'Path', part: CandleFrame) -> int:
+        """Дописывает свечи одного месяца в файл партиции.
+
+        Повреждённый хвост файла отрезается (при дозаписи) или отбрасывается (при
+        слиянии) с предупреждением в лог.
+
+        Args:
+            path: Путь к файлу партиции.
+            part: Свечи одного месяца.
+
+        Returns:
+            Количество новых свечей.
+        """
+        blocks, valid_size = _read_blocks(path, figi=part.figi, interval=part.interval)
+        last_time = blocks[-1].time[-1] if blocks else None
+        if path.exists() and path.stat().st_size != valid_size:
+            self._logger.warning('Truncating corrupted candle partition tail', path=str(path), valid_size=valid_size)
+
+        if last_time is None or part.time[0] > last_time:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'ab') as file:
+                if file.tell() != valid_size:
+                    file.truncate(valid_size)
+                    file.seek(valid_size)
+                _write_block(file, part)
+            return len(part)
+
+        merged = _merge(blocks, part)
+        tmp_path = path.with_name(f'{path.name}.tmp')
+        with open(tmp_path, 'wb') as file:
+            _write_block(file, merged)
+            file.flush()
+            os.fsync(file.fileno())
+        tmp_path.replace(path)
+        return len(merged) - sum(len(block) for block in blocks)
+
+    def _load_sync(
+        self,
+        figi: str,
+        interval: 'CandleInterval',
+        from_: datetime,
+        to: datetime,
+    ) -> CandleFrame:
+        """Синхронно читает свечи за период из нужных партиций.
+
+        Args:
+            figi: Идентификатор инструмента.
+            interval: Интервал свечей.
+            from_: Начало периода (включительно).
+            to: Конец периода (не включительно).
+
+        Returns:
+            Колоночная серия свечей периода.
+        """
+        parts: list[CandleFrame] = []
+        for month in _months_between(from_, to):
+            blocks, _ = _read_blocks(self._partition_path(figi, interval, month), figi=figi, interval=interval)
+            parts.extend(window for block in blocks if len(window := block.between(from_, to)))
+
+        if len(parts) == 1:
+            return parts[0]
+        return CandleFrame.concat(parts, figi=figi, interval=interval)
+
+    def _coverage_path(self, figi: str, interval: 'CandleInterval') -> 'Path':
+        """Возвращает путь к файлу покрытия.
+
+        Args:
+            figi: Идентификатор инструмента.
+            interval: Интервал свечей.
+
+        Returns:
+            Путь вида <root>/<figi>/<interval>/coverage.json.
+        """
+        return self._root / figi / interval.value / _COVERAGE_FILENAME
+
+    def _partition_path(self, figi: str, interval: 'CandleInterval', month: tuple[int, int]) -> 'Path':
+        """Возвращает путь к файлу партиции.
+
+        Args:
+            figi: Идентификатор инструмента.
+            interval: Интервал свечей.
+            month: Год и месяц партиции.
+
+        Returns:
+            Путь вида <root>/<figi>/<interval>/<YYYY-MM>.candles.
+        """
+        year, month_number = month
+        return self._root / figi / interval.value / f'{year:04d}-{month_number:02d}{_PARTITION_SUFFIX}'
+
+
+def _read_blocks(path: 'Path', *, figi: str, interval: 'CandleInterval') -> tuple[list[CandleFrame], int]:
+    """Читает блоки файла партиции через mmap.
+
+    Args:
+        path: Путь к файлу партиции.
+        figi: Идентификатор инструмента.
+        interval: Интервал свечей.
+
+    Чтение останавливается на первом недописанном или повреждённом (неверный
+    magic) блоке: он и всё, что за ним, в результат не попадают.
+
+    Returns:
+        Серии блоков (колонки — memoryview над mmap) и размер корректной части файла в байтах.
+    """
+    if not path.exists() or path.stat().st_size == 0:
+        return [], 0
+
+    with open(path, 'rb') as file:
+        view = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    blocks: list[CandleFrame] = []
+    offset = 0
+    while offset + _BLOCK_HEADER.size <= len(view):
+        magic, count = _BLOCK_HEADER.unpack_from(view, offset)
+        column_size = count * _INT64_SIZE
+        start = offset + _BLOCK_HEADER.size
+        end = start + column_size * _COLUMNS_COUNT
+        if magic != _BLOCK_MAGIC or end > len(view):
+            break
+
+        time, open_, high, low, close, volume = (
+            view[start + index * column_size : start + (index + 1) * column_size].cast('q')
+            for index in range(_COLUMNS_COUNT)
+        )
+        if count:
+            blocks.append(
+                CandleFrame(
+                    figi=figi,
+                    interval=interval,
+                    time=time,
+                    open=open_,
+                    high=high,
+                    low=low,
+                    close=close,
+                    volume=volume,
+                )
+            )
+        offset = end
+
+    return blocks, offset
+
+
+def _write_block(file: 'BinaryIO', frame: CandleFrame) -> None:
+    """Записывает серию свечей одним блоком в открытый файл.
+
+    Args:
+        file: Файл, открытый на запись в бинарном режиме.
+        frame: Серия свечей.
+    """
+    file.write(_BLOCK_HEADER.pack(_BLOCK_MAGIC, len(frame)))
+    for column in (frame.time, frame.open, frame.high, frame.low, frame.close, frame.volume):
+        file.write(column.cast('B'))
+
+
+def _write_coverage(path: 'Path', coverage: CandleCoverage) -> None:
+    """Записывает покрытие в файл через временный файл, fsync и атомарную замену.
+
+    Args:
+        path: Путь к файлу покрытия.
+        coverage: Покрытие.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'{path.name}.tmp')
+    with open(tmp_path, 'wb') as file:
+        file.write(orjson.dumps(coverage.to_epoch_pairs()))
+        file.flush()
+        os.fsync(file.fileno())
+    tmp_path.replace(path)
+
+
+def _merge(blocks: list[CandleFrame], part: CandleFrame) -> CandleFrame:
+    """Сливает сохранённые блоки партиции с новыми свечами по времени.
+
+    Новые значения заменяют сохранённые с тем же временем.
+
+    Args:
+        blocks: Сохранённые блоки партиции.
+        part: Новые свечи того же месяца.
+
+    Returns:
+        Упорядоченная по времени серия без повторов.
+    """
+    rows: dict[int, tuple[int, int, int, int, int]] = {}
+    for frame in (*blocks, part):
+        for time, open_, high, low, close, volume in zip(
+            frame.time, frame.open, frame.high, frame.low, frame.close, frame.volume, strict=True
+        ):
+            rows[time] = (open_, high, low, close, volume)
+
+    columns = tuple(array('q') for _ in range(_COLUMNS_COUNT))
+    for time in sorted(rows):
+        columns[0].append(time)
+        for column, value in zip(columns[1:], rows[time], strict=True):
+            column.append(value)
+
+    time_column, open_, high, low, close, volume = (memoryview(column).toreadonly() for column in columns)
+    return CandleFrame(
+        figi=part.figi,
+        interval=part.interval,
+        time=time_column,
+        open=open_,
+        high=high,
+        low=low,
+        close=close,
+        volume=volume,
+    )
+
+
+def _month_start(year: int, month: int) -> int:
+    """Возвращает начало месяца в секундах эпохи (UTC).
+
+    Args:
+        year: Год.
+        month: Месяц (1–12).
+
+    Returns:
+        Секунды Unix-эпохи.
+    """
+    return int(datetime(year, month, 1, tzinfo=UTC).timestamp())
+
+
+def _next_month(year: int, month: int) -> tuple[int, int]:
+    """Возвращает следующий месяц.
+
+    Args:
+        year: Год.
+        month: Месяц (1–12).
+
+    Returns:
+        Год и месяц, следующие за переданными.
+    """
+    return (year + 1, 1) if month == _MONTHS_IN_YEAR else (year, month + 1)
+
+
+def _split_by_month(frame: CandleFrame) -> 'Iterator[tuple[tuple[int, int], CandleFrame]]':
+    """Разбивает упорядоченную серию на месячные части без копирования.
+
+    Args:
+        frame: Серия свечей, упорядоченная по времени.
+
+    Yields:
+        Год и месяц партиции и свечи этого месяца.
+    """
+    start = 0
+    while start < len(frame):
+        first = datetime.fromtimestamp(frame.time[start], tz=UTC)
+        month = (first.year, first.month)
+        stop = bisect.bisect_left(frame.time, _month_start(*_next_month(*month)), lo=start)
+        yield month, frame.slice(start, stop)
+        start = stop
+
+
+def _months_between(from_: datetime, to: datetime) -> 'Iterator[tuple[int, int]]':
+    """Перечисляет месяцы (UTC), пересекающиеся с полуинтервалом [from_, to).
+
+    Args:
+        from_: Начало периода (включительно).
+        to: Конец периода (не включительно).
+
+    Yields:
+        Год и месяц.
+    """
+    if from_ >= to:
+        return
+
+    start = from_.astimezone(UTC)
+    last = to.astimezone(UTC)
+    month = (start.year, start.month)
+    while _month_start(*month) < last.timestamp():
+        yield month
+        month = _next_month(*month)
@@ -1,6 +1,9 @@
-from .adapter import StructlogLogger
+from .adapter import configure_logging, flush_logging, log_queue_stats, StructlogLogger
 
 
 __all__ = [
     'StructlogLogger',
+    'configure_logging',
+    'flush_logging',
+    'log_queue_stats',
 ]
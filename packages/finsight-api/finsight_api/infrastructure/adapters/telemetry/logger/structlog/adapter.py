@@ -1,7 +1,14 @@
-"""Реализация интерфейса логгера с использованием библиотеки structlog."""
+"""Реализация интерфейса логгера с использованием библиотеки structlog.
 
+Записи уходят в ограниченную очередь (`finsight_core.telemetry.log_queue`):
+рендер JSON через orjson и запись в stderr выполняются в фоновом потоке, а не в
+event loop.
+"""
+
+import copy
 import logging
 import sys
+import threading
 from contextvars import ContextVar
 from typing import cast, TYPE_CHECKING
 
@@ -20,6 +27,12 @@ from structlog.stdlib import (
 
 from finsight_api.application.ports.logger import LoggerPort
 from finsight_api.presentation.webserver.constants import DEFAULT_DISABLED_LOGGER_NAMES
+from finsight_core.telemetry.log_queue import (
+    DEFAULT_LOG_QUEUE_CAPACITY,
+    DEFAULT_LOG_QUEUE_OVERFLOW_POLICY,
+    LogPipeline,
+    OverflowPolicy,
+)
 
 from .processors import (
     CommonAttrsAdder,
@@ -38,21 +51,120 @@ if TYPE_CHECKING:
     from structlog.typing import Processor
 
     from finsight_api.domain.constants import AppEnv, LogLevel
+    from finsight_core.telemetry.log_queue import LogQueueStats
 
 
 _logger_ctx: ContextVar[LoggerPort | None] = ContextVar('_logger', default=None)
 
 
+class _LoggingBootstrap:
+    """Состояние однократной настройки logging процесса.
+
+    Attributes:
+        lock: Блокировка, сериализующая настройку.
+        settings: Параметры последней настройки (None — logging ещё не настроен).
+        pipeline: Очередь логов, установленная последней настройкой.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует состояние ненастроенного процесса."""
+        self.lock = threading.Lock()
+        self.settings: tuple[object, ...] | None = None
+        self.pipeline: LogPipeline | None = None
+
+
+_bootstrap = _LoggingBootstrap()
+
+
+def configure_logging(  # noqa: PLR0913
+    *,
+    app_name: str,
+    app_version: str,
+    app_env: 'AppEnv',
+    app_instance: str,
+    log_level: 'LogLevel',
+    disabled_logger_names: 'Iterable[str] | None' = None,
+    log_queue_capacity: int = DEFAULT_LOG_QUEUE_CAPACITY,
+    log_queue_overflow_policy: OverflowPolicy = DEFAULT_LOG_QUEUE_OVERFLOW_POLICY,
+) -> None:
+    """Настраивает structlog и стандартный logging для всего процесса один раз.
+
+    Повторный вызов с теми же параметрами ничего не делает. Вызов с другими
+    параметрами перенастраивает logging: очередь логов предыдущей настройки
+    дописывается и останавливается, а её обработчик заменяется новым.
+
+    Args:
+        app_name: Название приложения.
+        app_version: Версия приложения.
+        app_env: Текущая среда выполнения.
+        app_instance: Идентификатор инстанса приложения.
+        log_level: Уровень журналирования приложения.
+        disabled_logger_names: Имена логгеров, которые нужно отключить. Если None —
+            используется DEFAULT_DISABLED_LOGGER_NAMES.
+        log_queue_capacity: Ёмкость очереди логов.
+        log_queue_overflow_policy: Поведение при переполнении очереди логов.
+    """
+    disabled = frozenset(disabled_logger_names or DEFAULT_DISABLED_LOGGER_NAMES)
+    settings = (
+        app_name,
+        app_version,
+        app_env,
+        app_instance,
+        log_level,
+        disabled,
+        log_queue_capacity,
+        log_queue_overflow_policy,
+    )
+    if _bootstrap.settings == settings:
+        return
+
+    with _bootstrap.lock:
+        if _bootstrap.settings == settings:
+            return
+        _bootstrap.pipeline = _configure(
+            app_name=app_name,
+            app_version=app_version,
+            app_env=app_env,
+            app_instance=app_instance,
+            log_level=log_level,
+            disabled_logger_names=disabled,
+            log_queue_capacity=log_queue_capacity,
+            log_queue_overflow_policy=log_queue_overflow_policy,
+            previous_pipeline=_bootstrap.pipeline,
+        )
+        _bootstrap.settings = settings
+
+
+def log_queue_stats() -> 'LogQueueStats | None':
+    """Возвращает счётчики очереди логов процесса.
+
+    Returns:
+        Ёмкость, глубина очереди и число отброшенных записей; None, если logging
+        ещё не настроен.
+    """
+    pipeline = _bootstrap.pipeline
+    return None if pipeline is None else pipeline.stats()
+
+
+def flush_logging() -> None:
+    """Ждёт, пока очередь логов процесса будет записана."""
+    pipeline = _bootstrap.pipeline
+    if pipeline is not None:
+        pipeline.flush()
+
+
 class StructlogLogger(LoggerPort):
     """Реализация порта LoggerPort поверх structlog.
 
-    При инициализации настраивает structlog и стандартный logging: JSON-вывод через
-    orjson, проброс контекстных переменных, добавление общих атрибутов (env, instance,
-    система, версия). Перехватывает необработанные исключения через sys.excepthook
-    и переключает сторонние логгеры (включая uvicorn) на общий обработчик.
+    При первой инициализации в процессе настраивает structlog и стандартный logging
+    (см. `configure_logging`): JSON-вывод через orjson, проброс контекстных
+    переменных, добавление общих атрибутов (env, instance, система, версия).
+    Перехватывает необработанные исключения через sys.excepthook и переключает
+    сторонние логгеры (включая uvicorn) на общий обработчик. Последующие экземпляры
+    с теми же параметрами logging не перенастраивают.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         app_name: str,
@@ -60,6 +172,8 @@ class StructlogLogger(LoggerPort):
         app_env: 'AppEnv',
         app_instance: str,
         log_level: 'LogLevel',
+        log_queue_capacity: int = DEFAULT_LOG_QUEUE_CAPACITY,
+        log_queue_overflow_policy: OverflowPolicy = DEFAULT_LOG_QUEUE_OVERFLOW_POLICY,
     ) -> None:
         """Инициализирует экземпляр structlog логгера.
 
@@ -69,6 +183,8 @@ class StructlogLogger(LoggerPort):
             app_env: Текущая среда выполнения.
             app_instance: Идентификатор инстанса приложения.
             log_level: Уровень журналирования приложения.
+            log_queue_capacity: Ёмкость очереди логов.
+            log_queue_overflow_policy: Поведение при переполнении очереди логов.
         """
         self._logger = structlog.get_logger(app_name)
         self._app_name = app_name
@@ -77,14 +193,31 @@ class StructlogLogger(LoggerPort):
         self._app_instance = app_instance
         self._log_level = log_level
 
-        self._configure(
+        configure_logging(
             app_name=self._app_name,
             app_version=self._app_version,
             app_env=self._app_env,
             app_instance=self._app_instance,
             log_level=self._log_level,
+            log_queue_capacity=log_queue_capacity,
+            log_queue_overflow_policy=log_queue_overflow_policy,
         )
 
+    def bind(self, **kwargs: 'Any') -> 'StructlogLogger':
+        """Возвращает логгер с привязанными к каждому событию полями.
+
+        Logging при этом не перенастраивается, исходный логгер не меняется.
+
+        Args:
+            **kwargs: Поля, добавляемые в каждое событие.
+
+        Returns:
+            Новый экземпляр логгера.
+        """
+        bound = copy.copy(self)
+        bound._logger = self._logger.bind(**kwargs)
+        return bound
+
     def info(self, event: str, **kwargs: 'Any') -> None:
         """Логгирует информационное сообщение.
 
@@ -124,94 +257,118 @@ class StructlogLogger(LoggerPort):
         """Удаляет переменные из контекста логгера по ключам."""
         structlog.contextvars.unbind_contextvars(*keys)
 
-    def _configure(  # noqa: PLR0913
-        self,
-        *,
-        app_name: str,
-        app_version: str,
-        app_env: 'AppEnv',
-        app_instance: str,
-        log_level: 'LogLevel',
-        disabled_logger_names: 'Iterable[str] | None' = None,
-    ) -> None:
-        """Настраивает structlog и стандартный logging для всего процесса.
-
-        Args:
-            app_name: Название приложения.
-            app_version: Версия приложения.
-            app_env: Текущая среда выполнения.
-            app_instance: Идентификатор инстанса приложения.
-            log_level: Уровень журналирования приложения.
-            disabled_logger_names: Имена логгеров, которые нужно отключить. Если None —
-                используется DEFAULT_DISABLED_LOGGER_NAMES.
-        """
-        root_logger = logging.getLogger()
-
-        def handle_exception(
-            exc_type: type[BaseException], exc_value: BaseException, exc_traceback: 'TracebackType | None'
-        ) -> None:
-            if issubclass(exc_type, KeyboardInterrupt):
-                sys.__excepthook__(exc_type, exc_value, exc_traceback)
-                return
-
-            root_logger.exception('Unknown error', exc_info=(exc_type, exc_value, exc_traceback))
-
-        def serializer(*args: 'Any', **kwargs: 'Any') -> str:
-            """Сериализует словарь события в строку JSON."""
-            return orjson.dumps(*args, **kwargs).decode('utf-8')
-
-        sys.excepthook = handle_exception
-
-        shared_processors: list[Processor] = [
-            merge_contextvars,
-            UvicornColorMessageDropper(),
-            ExceptionInfoAttrRenamer(),
-            ExtraAdder(),
-            PositionalArgumentsFormatter(),
-            LogLevelNormalizer(),
-            MessageAttrRenamer(),
-            # RequestIdAdder(),
-            CommonAttrsAdder(app_name=app_name, app_version=app_version, app_env=app_env, instance=app_instance),
-        ]
-
-        configure(
-            processors=shared_processors + [ProcessorFormatter.wrap_for_formatter],
-            context_class=dict,
-            logger_factory=LoggerFactory(),
-            wrapper_class=BoundLogger,
-            cache_logger_on_first_use=True,
-        )
-
-        formatter = ProcessorFormatter(
-            foreign_pre_chain=shared_processors,
-            processors=[
-                ProcessorFormatter.remove_processors_meta,
-                JSONRenderer(serializer=serializer),
-            ],
-        )
-
-        handler: logging.Handler = logging.StreamHandler()
-        handler.setFormatter(formatter)
-
-        root_logger.addHandler(handler)
-        root_logger.setLevel(log_level.value.upper())
-
-        disabled = disabled_logger_names or DEFAULT_DISABLED_LOGGER_NAMES
 
-        for logger_name in logging.root.manager.loggerDict:
-            logger = logging.getLogger(logger_name)
-
-            logger.setLevel(root_logger.level)
-
-            logger.disabled, logger.handlers = False, cast('list[logging.Handler]', [handler])
-
-            if logger_name in disabled:
-                logger.disabled, logger.handlers = True, []
-
-        uvicorn_logger_names: Iterable[str] = ['uvicorn', 'uvicorn.error', 'uvicorn.access']
+def _configure(  # noqa: PLR0913
+    *,
+    app_name: str,
+    app_version: str,
+    app_env: 'AppEnv',
+    app_instance: str,
+    log_level: 'LogLevel',
+    disabled_logger_names: 'Iterable[str]',
+    log_queue_capacity: int,
+    log_queue_overflow_policy: OverflowPolicy,
+    previous_pipeline: LogPipeline | None,
+) -> LogPipeline:
+    """Настраивает structlog и стандартный logging для всего процесса.
+
+    Логгеры получают обработчик очереди логов; форматтер с JSON-рендером стоит на
+    обработчике вывода, который вызывается из фонового потока очереди. Логгеры, у
+    которых есть собственный обработчик, не передают записи корневому логгеру,
+    поэтому каждое событие записывается один раз.
+
+    Args:
+        app_name: Название приложения.
+        app_version: Версия приложения.
+        app_env: Текущая среда выполнения.
+        app_instance: Идентификатор инстанса приложения.
+        log_level: Уровень журналирования приложения.
+        disabled_logger_names: Имена логгеров, которые нужно отключить.
+        log_queue_capacity: Ёмкость очереди логов.
+        log_queue_overflow_policy: Поведение при переполнении очереди логов.
+        previous_pipeline: Очередь логов предыдущей настройки: дописывается,
+            останавливается и снимается с корневого логгера.
+
+    Returns:
+        Запущенная очередь логов.
+    """
+    root_logger = logging.getLogger()
 
-        for name in uvicorn_logger_names:
-            logger = logging.getLogger(name)
-            logger.handlers = [handler]
-            logger.setLevel(root_logger.level)
-            logger.propagate = False
+    def handle_exception(
+        exc_type: type[BaseException], exc_value: BaseException, exc_traceback: 'TracebackType | None'
+    ) -> None:
+        if issubclass(exc_type, KeyboardInterrupt):
+            sys.__excepthook__(exc_type, exc_value, exc_traceback)
+            return
+
+        root_logger.exception('Unknown error', exc_info=(exc_type, exc_value, exc_traceback))
+
+    def serializer(*args: 'Any', **kwargs: 'Any') -> str:
+        """Сериализует словарь события в строку JSON."""
+        return orjson.dumps(*args, **kwargs).decode('utf-8')
+
+    sys.excepthook = handle_exception
+
+    shared_processors: list[Processor] = [
+        merge_contextvars,
+        UvicornColorMessageDropper(),
+        ExceptionInfoAttrRenamer(),
+        ExtraAdder(),
+        PositionalArgumentsFormatter(),
+        LogLevelNormalizer(),
+        MessageAttrRenamer(),
+        # RequestIdAdder(),
+        CommonAttrsAdder(app_name=app_name, app_version=app_version, app_env=app_env, instance=app_instance),
+    ]
+
+    configure(
+        processors=shared_processors + [ProcessorFormatter.wrap_for_formatter],
+        context_class=dict,
+        logger_factory=LoggerFactory(),
+        wrapper_class=BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+
+    formatter = ProcessorFormatter(
+        foreign_pre_chain=shared_processors,
+        processors=[
+            ProcessorFormatter.remove_processors_meta,
+            JSONRenderer(serializer=serializer),
+        ],
+    )
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    pipeline = LogPipeline(stream_handler, capacity=log_queue_capacity, overflow_policy=log_queue_overflow_policy)
+    pipeline.start()
+    handler: logging.Handler = pipeline.handler
+
+    if previous_pipeline is not None:
+        root_logger.removeHandler(previous_pipeline.handler)
+        previous_pipeline.stop()
+    root_logger.addHandler(handler)
+    root_logger.setLevel(log_level.value.upper())
+
+    disabled = frozenset(disabled_logger_names)
+
+    for logger_name in logging.root.manager.loggerDict:
+        logger = logging.getLogger(logger_name)
+
+        logger.propagate = False
+        logger.setLevel(root_logger.level)
+
+        logger.disabled, logger.handlers = False, cast('list[logging.Handler]', [handler])
+
+        if logger_name in disabled:
+            logger.disabled, logger.handlers = True, []
+
+    uvicorn_logger_names: Iterable[str] = ['uvicorn', 'uvicorn.error', 'uvicorn.access']
+
+    for name in uvicorn_logger_names:
+        logger = logging.getLogger(name)
+        logger.handlers = [handler]
+        logger.setLevel(root_logger.level)
+        logger.propagate = False
+
+    return pipeline
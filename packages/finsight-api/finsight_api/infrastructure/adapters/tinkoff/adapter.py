@@ -1,7 +1,7 @@
 """Адаптер клиента Tinkoff Invest API с использованием официального SDK."""
 
 from collections.abc import Callable, Collection
-from datetime import date, datetime
+from datetime import date, datetime, time, UTC
 from typing import TYPE_CHECKING
 
 from t_tech.invest import (
@@ -12,20 +12,28 @@ from t_tech.invest import (
 )
 
 from finsight_api.application.ports.tinkoff import TinkoffInvestPort
+from finsight_api.domain.entities.candle_frame import CandleFrame
+from finsight_api.domain.exceptions import InstrumentNotFoundError
+from finsight_api.infrastructure.adapters.tinkoff.instrument_index import InstrumentRef
 from finsight_api.infrastructure.adapters.tinkoff.mappers import map_candle_interval_to_sdk
+from finsight_core.market_data.candle_windows import (
+    DEFAULT_CANDLE_WINDOW_CONCURRENCY,
+    fetch_windows,
+    split_candle_range,
+)
 
 from .mappers import (
     map_accounts_from_sdk,
     map_bond_from_sdk,
     map_brand_from_sdk,
-    map_candle_from_sdk,
+    map_candle_frame_from_sdk,
     map_coupon_from_sdk,
     map_order_book_from_sdk,
     map_portfolio_from_sdk,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncIterator, Sequence
     from contextlib import AbstractAsyncContextManager
 
     from t_tech.invest.async_services import AsyncServices
@@ -40,6 +48,7 @@ if TYPE_CHECKING:
     from finsight_api.domain.value_objects.candle_interval import CandleInterval
     from finsight_api.domain.value_objects.isin import ISIN
     from finsight_api.domain.value_objects.order_book import OrderBook
+    from finsight_api.infrastructure.adapters.tinkoff.instrument_index import TinkoffInstrumentIndex
 
 
 AsyncClientFactory = Callable[[], 'AbstractAsyncContextManager[AsyncServices]']
@@ -48,9 +57,16 @@ AsyncClientFactory = Callable[[], 'AbstractAsyncContextManager[AsyncServices]']
 class TinkoffInvestAdapter(TinkoffInvestPort):
     """Реализация порта TinkoffInvestPort поверх официального async SDK Tinkoff Invest.
 
-    На каждый вызов открывает сессию клиента через client_factory и маппит ответы SDK
-    в доменные сущности и value objects. Токен используется в режиме read-only:
-    торговые поручения недоступны.
+    На каждый вызов берёт сессию клиента через client_factory (в приложении это
+    TinkoffChannelPool с долгоживущими каналами) и маппит ответы SDK в доменные
+    сущности и value objects. Токен используется в режиме read-only: торговые
+    поручения недоступны.
+
+    Если передан instrument_index, ISIN разрешается в FIGI по локальному индексу
+    инструментов, а не поиском через API на каждый вызов.
+
+    История свечей загружается окнами, допустимыми API для интервала: окна
+    запрашиваются параллельно (не больше candles_concurrency одновременно).
     """
 
     def __init__(
@@ -58,17 +74,23 @@ class TinkoffInvestAdapter(TinkoffInvestPort):
         token: str,
         client_factory: 'AsyncClientFactory',
         logger: 'LoggerPort',
+        instrument_index: 'TinkoffInstrumentIndex | None' = None,
+        candles_concurrency: int = DEFAULT_CANDLE_WINDOW_CONCURRENCY,
     ) -> None:
         """Инициализирует адаптер с заданным токеном.
 
         Args:
             token: Токен авторизации в Tinkoff Invest API.
-            client_factory: Фабрика для создания асинхронного клиента SDK.
+            client_factory: Фабрика сессий асинхронного клиента SDK (например, пул каналов).
             logger: Логгер приложения.
+            instrument_index: Индекс идентификаторов инструментов (опционально).
+            candles_concurrency: Максимум одновременных запросов окон свечей.
         """
         self._token = token
         self._client_factory = client_factory
         self._logger = logger
+        self._instrument_index = instrument_index
+        self._candles_concurrency = candles_concurrency
 
     async def get_accounts(self) -> Collection['AccountEntity']:
         """Возвращает список счетов пользователя.
@@ -98,18 +120,106 @@ class TinkoffInvestAdapter(TinkoffInvestPort):
         Returns:
             Sequence[CandleModel]: список доменных свечей.
         """
+        return [
+            candle
+            async for frame in self.stream_candle_frames_by_isin(isin, from_date, to_date, interval)
+            for candle in frame.to_entities()
+        ]
+
+    async def get_candle_frame_by_isin(
+        self,
+        isin: str,
+        from_date: date,
+        to_date: date,
+        interval: 'CandleInterval',
+    ) -> 'CandleFrame':
+        """Возвращает историю котировок по ISIN в колоночном виде.
+
+        Свечи ответа SDK записываются сразу в колонки CandleFrame, минуя CandleEntity.
+
+        Args:
+            isin: ISIN-идентификатор ценной бумаги.
+            from_date: Начальная дата периода.
+            to_date: Конечная дата периода.
+            interval: Интервал свечей.
+
+        Returns:
+            Колоночная серия свечей.
+        """
+        frames = [frame async for frame in self.stream_candle_frames_by_isin(isin, from_date, to_date, interval)]
+        figi = frames[0].figi if frames else ''
+        return CandleFrame.concat(frames, figi=figi, interval=interval)
+
+    async def stream_candle_frames_by_isin(
+        self,
+        isin: str,
+        from_date: date,
+        to_date: date,
+        interval: 'CandleInterval',
+    ) -> 'AsyncIterator[CandleFrame]':
+        """Загружает историю котировок по ISIN окнами и отдаёт их по мере готовности.
+
+        Период [from_date, to_date) в UTC (дата — с начала суток, datetime — с
+        точным временем) делится на окна, допустимые API для интервала. Каждое
+        окно запрашивается отдельной сессией пула, результаты отдаются в порядке
+        времени; свечи, повторившиеся на границе окон, отбрасываются. Пустые окна
+        не отдаются.
+
+        Args:
+            isin: ISIN-идентификатор ценной бумаги.
+            from_date: Начальная дата периода.
+            to_date: Конечная дата периода.
+            interval: Интервал свечей.
+
+        Yields:
+            Колоночные серии свечей по окнам.
+        """
         async with self._client_factory() as client:
             figi = await self._get_figi_by_isin(client, isin)
-            sdk_interval = map_candle_interval_to_sdk(interval)
 
-            response = await client.market_data.get_candles(
-                figi=figi,
-                from_=datetime.combine(from_date, datetime.min.time()),
-                to=datetime.combine(to_date, datetime.min.time()),
-                interval=sdk_interval,
-            )
+        sdk_interval = map_candle_interval_to_sdk(interval)
+
+        async def _fetch_window(start: datetime, end: datetime) -> CandleFrame:
+            async with self._client_factory() as client:
+                response = await client.market_data.get_candles(
+                    figi=figi,
+                    from_=start,
+                    to=end,
+                    interval=sdk_interval,
+                )
+            return map_candle_frame_from_sdk(response.candles, figi=figi, interval=interval)
+
+        windows = split_candle_range(_as_utc_datetime(from_date), _as_utc_datetime(to_date), interval)
+        last_time: int | None = None
+
+        async for frame in fetch_windows(windows, _fetch_window, concurrency=self._candles_concurrency):
+            fresh = frame if last_time is None else frame.after(last_time)
+            if not len(fresh):
+                continue
+            last_time = fresh.time[-1]
+            yield fresh
+
+    async def get_figi_by_isin(self, isin: str) -> str:
+        """Возвращает FIGI инструмента по ISIN.
+
+        Если ISIN есть в индексе инструментов, сессия клиента не открывается.
+
+        Args:
+            isin: ISIN-идентификатор.
+
+        Returns:
+            FIGI-идентификатор.
+
+        Raises:
+            InstrumentNotFoundError: Если инструмент по ISIN не найден.
+        """
+        if self._instrument_index is not None:
+            ref = await self._instrument_index.get_by_isin(isin)
+            if ref is not None:
+                return ref.figi
 
-            return [map_candle_from_sdk(c, figi=figi, interval=interval) for c in response.candles]
+        async with self._client_factory() as client:
+            return await self._get_figi_by_isin(client, isin)
 
     async def _get_figi_by_isin(
         self,
@@ -118,6 +228,9 @@ class TinkoffInvestAdapter(TinkoffInvestPort):
     ) -> str:
         """Получает FIGI по ISIN.
 
+        Сначала ищет ISIN в индексе инструментов; поиск через API выполняется только
+        для инструментов вне индекса, и его результат запоминается в индексе.
+
         Args:
             client: Асинхронный клиент Tinkoff Invest API.
             isin: ISIN-идентификатор.
@@ -126,14 +239,31 @@ class TinkoffInvestAdapter(TinkoffInvestPort):
             str: FIGI-идентификатор.
 
         Raises:
-            ValueError: Если инструмент по ISIN не найден.
+            InstrumentNotFoundError: Если инструмент по ISIN не найден.
         """
+        if self._instrument_index is not None:
+            ref = await self._instrument_index.get_by_isin(isin)
+            if ref is not None:
+                return ref.figi
+
         instrument = await client.instruments.find_instrument(query=isin)
 
         if not instrument.instruments:
-            raise ValueError(f'Инструмент не найден по ISIN: {isin}')
+            raise InstrumentNotFoundError(isin)
+
+        found = instrument.instruments[0]
+        if self._instrument_index is not None:
+            self._instrument_index.remember(
+                InstrumentRef(
+                    figi=found.figi,
+                    isin=found.isin or isin,
+                    uid=found.uid,
+                    ticker=found.ticker,
+                    class_code=found.class_code,
+                )
+            )
 
-        return str(instrument.instruments[0].figi)
+        return str(found.figi)
 
     async def get_portfolio(self, account_id: str) -> 'PortfolioEntity':
         """Получает текущий портфель по идентификатору счёта.
@@ -167,6 +297,9 @@ class TinkoffInvestAdapter(TinkoffInvestPort):
     async def get_bond_by_isin(self, isin: 'ISIN') -> 'BondEntity':
         """Возвращает метаданные облигации по ISIN.
 
+        Если облигация есть в индексе инструментов, запрашивается по FIGI. Иначе
+        ISIN передаётся как тикер в режиме торгов TQCB.
+
         Args:
             isin: ISIN облигации.
 
@@ -176,13 +309,21 @@ class TinkoffInvestAdapter(TinkoffInvestPort):
         Raises:
             AioRequestError: Если SDK вернул ошибку (предварительно пишется в лог).
         """
+        ref = await self._instrument_index.get_by_isin(isin.value) if self._instrument_index is not None else None
+
         async with self._client_factory() as client:
             try:
-                response = await client.instruments.bond_by(
-                    id=isin.value,
-                    id_type=InstrumentIdType.INSTRUMENT_ID_TYPE_TICKER,
-                    class_code='TQCB',
-                )
+                if ref is not None:
+                    response = await client.instruments.bond_by(
+                        id=ref.figi,
+                        id_type=InstrumentIdType.INSTRUMENT_ID_TYPE_FIGI,
+                    )
+                else:
+                    response = await client.instruments.bond_by(
+                        id=isin.value,
+                        id_type=InstrumentIdType.INSTRUMENT_ID_TYPE_TICKER,
+                        class_code='TQCB',
+                    )
                 return map_bond_from_sdk(response.instrument)
             except AioRequestError as exc:
                 metadata = exc.metadata
@@ -299,3 +440,20 @@ class TinkoffInvestAdapter(TinkoffInvestPort):
         except Exception as ex:
             self._logger.warning(f'Ошибка при выводе отладочной информации: {ex!r}')
         self._logger.info('Отладочная проверка завершена успешно')
+
+
+def _as_utc_datetime(value: date) -> datetime:
+    """Приводит границу периода к aware-datetime в UTC.
+
+    Дата превращается в начало суток UTC, datetime сохраняет время (naive
+    считается временем UTC).
+
+    Args:
+        value: Дата или datetime.
+
+    Returns:
+        Aware-datetime в UTC.
+    """
+    if isinstance(value, datetime):
+        return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+    return datetime.combine(value, time.min, tzinfo=UTC)
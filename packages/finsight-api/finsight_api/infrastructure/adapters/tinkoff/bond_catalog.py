@@ -0,0 +1,191 @@
+"""Каталог облигаций Tinkoff Invest API, загружаемый одним вызовом `bonds()`.
+
+Получение 2000 облигаций через `bond_by` — 2000 unary-запросов. Справочник
+`instruments.bonds()` возвращает весь универс облигаций за один запрос: каталог
+загружает его, пакетно маппит в BondEntity и индексирует по ISIN, FIGI и UID.
+
+Каталог загружается лениво — при первом обращении и при обращении к каталогу,
+устаревшему дольше `ttl` секунд. Маппинг нескольких тысяч облигаций выполняется
+в отдельном потоке, чтобы не блокировать event loop. Если обновление не удалось,
+продолжает отвечать прежними данными; пока каталог ни разу не загружен, поиск
+возвращает None, и use case обращается к API напрямую.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Final, TYPE_CHECKING
+
+from finsight_api.application.ports.bond_catalog import BondCatalogPort
+from finsight_api.infrastructure.adapters.tinkoff.mappers import map_bond_from_sdk
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from t_tech.invest import Bond as SdkBond
+
+    from finsight_api.application.ports.logger import LoggerPort
+    from finsight_api.domain.entities.bond import BondEntity
+    from finsight_api.domain.value_objects.isin import ISIN
+    from finsight_api.infrastructure.adapters.tinkoff.adapter import AsyncClientFactory
+
+
+DEFAULT_BOND_CATALOG_TTL_SECONDS: Final[float] = 6 * 60 * 60
+
+_RETRY_AFTER_FAILURE_SECONDS: Final[float] = 60.0
+
+
+class TinkoffBondCatalog(BondCatalogPort):
+    """Каталог облигаций в памяти с индексами по ISIN, FIGI и UID."""
+
+    def __init__(
+        self,
+        *,
+        client_factory: 'AsyncClientFactory',
+        logger: 'LoggerPort',
+        ttl: float = DEFAULT_BOND_CATALOG_TTL_SECONDS,
+    ) -> None:
+        """Инициализирует пустой каталог.
+
+        Args:
+            client_factory: Фабрика сессий асинхронного клиента SDK.
+            logger: Логгер приложения.
+            ttl: Период обновления каталога в секундах.
+        """
+        self._client_factory = client_factory
+        self._logger = logger
+        self._ttl = ttl
+
+        self._by_isin: dict[str, BondEntity] = {}
+        self._by_figi: dict[str, BondEntity] = {}
+        self._by_uid: dict[str, BondEntity] = {}
+        self._expires_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        """Возвращает количество облигаций в каталоге."""
+        return len(self._by_figi)
+
+    def is_fresh(self) -> bool:
+        """Проверяет, что обновлять каталог пока не нужно.
+
+        После неудачной загрузки следующая попытка откладывается на минуту (или ttl,
+        если он меньше), чтобы сбой API не превращал каждый поиск в запрос справочника.
+
+        Returns:
+            True, если каталог загружен и не устарел или недавно не удалось его загрузить.
+        """
+        return self._expires_at is not None and time.monotonic() < self._expires_at
+
+    async def get_by_isin(self, isin: 'ISIN') -> 'BondEntity | None':
+        """Возвращает облигацию по ISIN.
+
+        Args:
+            isin: ISIN облигации.
+
+        Returns:
+            Доменная сущность облигации или None, если её нет в каталоге.
+        """
+        await self._ensure_fresh()
+        return self._by_isin.get(isin.value)
+
+    async def get_by_figi(self, figi: str) -> 'BondEntity | None':
+        """Возвращает облигацию по FIGI.
+
+        Args:
+            figi: FIGI облигации.
+
+        Returns:
+            Доменная сущность облигации или None, если её нет в каталоге.
+        """
+        await self._ensure_fresh()
+        return self._by_figi.get(figi)
+
+    async def get_by_uid(self, uid: str) -> 'BondEntity | None':
+        """Возвращает облигацию по UID.
+
+        Args:
+            uid: UID облигации.
+
+        Returns:
+            Доменная сущность облигации или None, если её нет в каталоге.
+        """
+        await self._ensure_fresh()
+        return self._by_uid.get(uid)
+
+    async def _ensure_fresh(self) -> None:
+        """Загружает каталог, если он не загружен или устарел."""
+        if self.is_fresh():
+            return
+
+        async with self._lock:
+            if not self.is_fresh():
+                await self._reload()
+
+    async def _reload(self) -> None:
+        """Загружает справочник облигаций и заменяет индексы каталога.
+
+        Ошибка загрузки пишется в лог; прежнее содержимое каталога сохраняется.
+        """
+        started = time.perf_counter()
+        try:
+            async with self._client_factory() as client:
+                response = await client.instruments.bonds()
+        except Exception as exc:
+            self._expires_at = time.monotonic() + min(self._ttl, _RETRY_AFTER_FAILURE_SECONDS)
+            self._logger.warning(f'Failed to load Tinkoff bond catalog: {exc!r}', bonds=len(self))
+            return
+
+        index = await asyncio.to_thread(_index_bonds, response.instruments)
+        self._by_isin, self._by_figi, self._by_uid = index.by_isin, index.by_figi, index.by_uid
+        self._expires_at = time.monotonic() + self._ttl
+        self._logger.info(
+            'Tinkoff bond catalog loaded',
+            bonds=len(index.by_figi),
+            skipped=index.skipped,
+            duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _BondIndex:
+    """Индексы каталога облигаций.
+
+    Attributes:
+        by_isin: Облигации по ISIN.
+        by_figi: Облигации по FIGI.
+        by_uid: Облигации по UID.
+        skipped: Сколько инструментов не удалось смаппить.
+    """
+
+    by_isin: dict[str, 'BondEntity']
+    by_figi: dict[str, 'BondEntity']
+    by_uid: dict[str, 'BondEntity']
+    skipped: int
+
+
+def _index_bonds(instruments: 'Iterable[SdkBond]') -> _BondIndex:
+    """Маппит облигации SDK в BondEntity и индексирует их по ISIN, FIGI и UID.
+
+    Args:
+        instruments: Облигации из ответа `instruments.bonds()`.
+
+    Returns:
+        Индексы каталога.
+    """
+    by_isin: dict[str, BondEntity] = {}
+    by_figi: dict[str, BondEntity] = {}
+    by_uid: dict[str, BondEntity] = {}
+    skipped = 0
+    for instrument in instruments:
+        try:
+            bond = map_bond_from_sdk(instrument)
+        except (ValueError, TypeError):
+            skipped += 1
+            continue
+        if bond.isin:
+            by_isin.setdefault(bond.isin, bond)
+        by_figi[bond.figi] = bond
+        if bond.uid:
+            by_uid[bond.uid] = bond
+    return _BondIndex(by_isin=by_isin, by_figi=by_figi, by_uid=by_uid, skipped=skipped)
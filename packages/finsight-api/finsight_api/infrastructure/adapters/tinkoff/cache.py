@@ -0,0 +1,459 @@
+"""Кэширующий декоратор порта Tinkoff Invest API.
+
+Метаданные облигаций, купонные графики и бренды меняются не чаще раза в сутки, но
+без кэша запрашиваются из API на каждый HTTP-запрос, команду CLI и позицию снимка
+портфеля. `CachingTinkoffInvestAdapter` реализует TinkoffInvestPort, оборачивает
+исходный адаптер и кэширует ответы справочных методов:
+
+- TTL задаётся для каждого метода отдельно (CachePolicy);
+- общий для всех методов объём ограничен, вытесняются давно не читанные записи (LRU);
+- ответ «не найдено» (InstrumentNotFoundError или gRPC NOT_FOUND) кэшируется
+  отдельно, с коротким TTL, и каждому вызову возбуждается копия ошибки;
+- после истечения TTL запись ещё `stale_ttl` секунд отдаётся как устаревшая, а
+  обновление запускается в фоне (stale-while-revalidate);
+- по каждому методу считаются попадания, промахи и вытеснения (stats).
+
+Маркет-данные, портфель и счета не кэшируются и передаются исходному адаптеру.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import cast, Final, TYPE_CHECKING
+
+from grpc import StatusCode
+
+from finsight_api.application.ports.tinkoff import TinkoffInvestPort
+from finsight_api.domain.exceptions import InstrumentNotFoundError
+from finsight_api.infrastructure.utils.errors import copy_error
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Collection, Mapping, Sequence
+    from datetime import date
+
+    from finsight_api.application.ports.logger import LoggerPort
+    from finsight_api.domain.entities.account import AccountEntity
+    from finsight_api.domain.entities.bond import BondEntity
+    from finsight_api.domain.entities.brand import BrandEntity
+    from finsight_api.domain.entities.candle import CandleEntity
+    from finsight_api.domain.entities.candle_frame import CandleFrame
+    from finsight_api.domain.entities.portfolio import PortfolioEntity
+    from finsight_api.domain.value_objects.bond_coupon import BondCoupon
+    from finsight_api.domain.value_objects.candle_interval import CandleInterval
+    from finsight_api.domain.value_objects.isin import ISIN
+    from finsight_api.domain.value_objects.order_book import OrderBook
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CachePolicy:
+    """Политика кэширования метода.
+
+    Attributes:
+        ttl: Сколько секунд ответ считается свежим.
+        stale_ttl: Сколько секунд после ttl ответ отдаётся устаревшим, пока он обновляется в фоне.
+        negative_ttl: Сколько секунд кэшируется ответ «не найдено» (0 — не кэшируется).
+    """
+
+    ttl: float
+    stale_ttl: float = 0.0
+    negative_ttl: float = 0.0
+
+
+@dataclass(slots=True, kw_only=True)
+class CacheStats:
+    """Счётчики кэша одного метода.
+
+    Attributes:
+        hits: Ответы из кэша (включая устаревшие и «не найдено»).
+        stale_hits: Ответы устаревшим значением с фоновым обновлением.
+        negative_hits: Ответы закэшированным «не найдено».
+        misses: Обращения к исходному адаптеру.
+        evictions: Записи метода, вытесненные из-за ограничения объёма.
+    """
+
+    hits: int = 0
+    stale_hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+_HOUR: Final[float] = 60 * 60
+
+DEFAULT_CACHE_MAX_ENTRIES: Final[int] = 4096
+
+DEFAULT_CACHE_POLICIES: Final['Mapping[str, CachePolicy]'] = {
+    'get_figi_by_isin': CachePolicy(ttl=24 * _HOUR, negative_ttl=10 * 60),
+    'get_bond_by_figi': CachePolicy(ttl=6 * _HOUR, stale_ttl=_HOUR, negative_ttl=10 * 60),
+    'get_bond_by_isin': CachePolicy(ttl=6 * _HOUR, stale_ttl=_HOUR, negative_ttl=10 * 60),
+    'get_bond_coupons': CachePolicy(ttl=6 * _HOUR, stale_ttl=_HOUR),
+    'get_brands': CachePolicy(ttl=24 * _HOUR, stale_ttl=_HOUR),
+}
+
+
+@dataclass(slots=True, kw_only=True, eq=False)
+class _Entry:
+    """Запись кэша.
+
+    Attributes:
+        method: Имя закэшированного метода.
+        value: Закэшированный ответ (если вызов завершился успешно).
+        error: Закэшированная ошибка «не найдено» (если вызов завершился ею).
+        fresh_until: Момент (time.monotonic), до которого запись свежая.
+        stale_until: Момент, до которого запись можно отдавать устаревшей.
+        refreshing: Для записи уже запущено фоновое обновление.
+    """
+
+    method: str
+    value: object = None
+    error: BaseException | None = None
+    fresh_until: float
+    stale_until: float
+    refreshing: bool = False
+
+
+class CachingTinkoffInvestAdapter(TinkoffInvestPort):
+    """Декоратор TinkoffInvestPort с TTL+LRU-кэшем справочных методов."""
+
+    def __init__(
+        self,
+        *,
+        inner: TinkoffInvestPort,
+        logger: 'LoggerPort',
+        policies: 'Mapping[str, CachePolicy] | None' = None,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        clock: 'Callable[[], float]' = time.monotonic,
+    ) -> None:
+        """Инициализирует кэширующий декоратор.
+
+        Args:
+            inner: Оборачиваемый адаптер Tinkoff Invest API.
+            logger: Логгер приложения.
+            policies: Политики кэширования по имени метода. Методы без политики не кэшируются.
+            max_entries: Максимальное число записей кэша (общее для всех методов).
+            clock: Монотонные часы в секундах.
+
+        Raises:
+            ValueError: Если max_entries не является положительным числом.
+        """
+        if max_entries <= 0:
+            raise ValueError('Cache max_entries must be a positive integer')
+
+        self._inner = inner
+        self._logger = logger
+        self._policies = dict(DEFAULT_CACHE_POLICIES if policies is None else policies)
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[tuple[object, ...], _Entry] = OrderedDict()
+        self._stats: dict[str, CacheStats] = {method: CacheStats() for method in self._policies}
+        self._refresh_tasks: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        """Возвращает количество записей в кэше."""
+        return len(self._entries)
+
+    def stats(self) -> dict[str, CacheStats]:
+        """Возвращает снимок счётчиков кэша по методам.
+
+        Returns:
+            Копии счётчиков по имени метода.
+        """
+        return {method: replace(stats) for method, stats in self._stats.items()}
+
+    def invalidate(self, method: str | None = None) -> None:
+        """Удаляет записи кэша.
+
+        Args:
+            method: Имя метода, записи которого нужно удалить. Если None — удаляются все записи.
+        """
+        for key in [key for key, entry in self._entries.items() if method is None or entry.method == method]:
+            del self._entries[key]
+
+    async def get_accounts(self) -> 'Collection[AccountEntity]':
+        """Возвращает счета пользователя без кэширования.
+
+        Returns:
+            Коллекция доменных сущностей счетов.
+        """
+        return await self._inner.get_accounts()
+
+    async def get_portfolio(self, account_id: str) -> 'PortfolioEntity':
+        """Возвращает портфель счёта без кэширования.
+
+        Args:
+            account_id: Идентификатор счёта.
+
+        Returns:
+            Доменная сущность портфеля.
+        """
+        return await self._inner.get_portfolio(account_id)
+
+    async def get_figi_by_isin(self, isin: str) -> str:
+        """Возвращает FIGI инструмента по ISIN (кэшируется).
+
+        Args:
+            isin: ISIN инструмента.
+
+        Returns:
+            FIGI-идентификатор инструмента.
+        """
+        return await self._cached('get_figi_by_isin', (isin,), lambda: self._inner.get_figi_by_isin(isin))
+
+    async def get_bond_by_figi(self, figi: str) -> 'BondEntity':
+        """Возвращает метаданные облигации по FIGI (кэшируется).
+
+        Args:
+            figi: FIGI-идентификатор облигации.
+
+        Returns:
+            Доменная сущность облигации.
+        """
+        return await self._cached('get_bond_by_figi', (figi,), lambda: self._inner.get_bond_by_figi(figi))
+
+    async def get_bond_by_isin(self, isin: 'ISIN') -> 'BondEntity':
+        """Возвращает метаданные облигации по ISIN (кэшируется).
+
+        Args:
+            isin: ISIN облигации.
+
+        Returns:
+            Доменная сущность облигации.
+        """
+        return await self._cached('get_bond_by_isin', (isin,), lambda: self._inner.get_bond_by_isin(isin))
+
+    async def get_bond_coupons(
+        self,
+        *,
+        figi: str,
+        from_date: 'date | None' = None,
+        to_date: 'date | None' = None,
+    ) -> list['BondCoupon']:
+        """Возвращает купоны облигации (кэшируется по FIGI и диапазону дат).
+
+        Args:
+            figi: FIGI облигации.
+            from_date: Начало диапазона (включительно). Если None — без нижней границы.
+            to_date: Конец диапазона (включительно). Если None — без верхней границы.
+
+        Returns:
+            Список купонов. Вызывающий код не должен изменять список.
+        """
+        return await self._cached(
+            'get_bond_coupons',
+            (figi, from_date, to_date),
+            lambda: self._inner.get_bond_coupons(figi=figi, from_date=from_date, to_date=to_date),
+        )
+
+    async def get_brands(self) -> list['BrandEntity']:
+        """Возвращает список брендов (кэшируется).
+
+        Returns:
+            Список брендов. Вызывающий код не должен изменять список.
+        """
+        return await self._cached('get_brands', (), self._inner.get_brands)
+
+    async def get_candles_by_isin(
+        self,
+        isin: str,
+        from_date: 'date',
+        to_date: 'date',
+        interval: 'CandleInterval',
+    ) -> 'Sequence[CandleEntity]':
+        """Возвращает историю котировок без кэширования.
+
+        Args:
+            isin: ISIN-идентификатор ценной бумаги.
+            from_date: Начальная дата интервала.
+            to_date: Конечная дата интервала.
+            interval: Интервал свечей.
+
+        Returns:
+            Последовательность доменных сущностей свечей.
+        """
+        return await self._inner.get_candles_by_isin(isin, from_date, to_date, interval)
+
+    async def get_candle_frame_by_isin(
+        self,
+        isin: str,
+        from_date: 'date',
+        to_date: 'date',
+        interval: 'CandleInterval',
+    ) -> 'CandleFrame':
+        """Возвращает историю котировок в колоночном виде без кэширования.
+
+        Args:
+            isin: ISIN-идентификатор ценной бумаги.
+            from_date: Начальная дата интервала.
+            to_date: Конечная дата интервала.
+            interval: Интервал свечей.
+
+        Returns:
+            Колоночная серия свечей инструмента.
+        """
+        return await self._inner.get_candle_frame_by_isin(isin, from_date, to_date, interval)
+
+    def stream_candle_frames_by_isin(
+        self,
+        isin: str,
+        from_date: 'date',
+        to_date: 'date',
+        interval: 'CandleInterval',
+    ) -> 'AsyncIterator[CandleFrame]':
+        """Загружает историю котировок окнами без кэширования.
+
+        Args:
+            isin: ISIN-идентификатор ценной бумаги.
+            from_date: Начальная дата интервала.
+            to_date: Конечная дата интервала.
+            interval: Интервал свечей.
+
+        Returns:
+            Асинхронный итератор колоночных серий свечей по окнам.
+        """
+        return self._inner.stream_candle_frames_by_isin(isin, from_date, to_date, interval)
+
+    async def get_order_book(self, *, figi: str, depth: int = 1) -> 'OrderBook':
+        """Возвращает стакан без кэширования.
+
+        Args:
+            figi: FIGI инструмента.
+            depth: Глубина стакана.
+
+        Returns:
+            Доменный снимок стакана.
+        """
+        return await self._inner.get_order_book(figi=figi, depth=depth)
+
+    async def _cached[T](self, method: str, args: tuple[object, ...], call: 'Callable[[], Awaitable[T]]') -> T:
+        """Возвращает ответ метода из кэша или из исходного адаптера.
+
+        Args:
+            method: Имя метода порта.
+            args: Аргументы вызова (часть ключа кэша).
+            call: Вызов исходного адаптера.
+
+        Returns:
+            Ответ метода.
+        """
+        policy = self._policies.get(method)
+        if policy is None:
+            return await call()
+
+        key = (method, *args)
+        stats = self._stats[method]
+        entry = self._entries.get(key)
+        now = self._clock()
+
+        if entry is not None and now < entry.stale_until:
+            self._entries.move_to_end(key)
+            stats.hits += 1
+            if now >= entry.fresh_until:
+                stats.stale_hits += 1
+                self._refresh_in_background(key, entry, policy, call)
+            if entry.error is not None:
+                stats.negative_hits += 1
+                raise copy_error(entry.error) from entry.error
+            return cast('T', entry.value)
+
+        stats.misses += 1
+        return await self._load(key, policy, call)
+
+    async def _load[T](self, key: tuple[object, ...], policy: CachePolicy, call: 'Callable[[], Awaitable[T]]') -> T:
+        """Вызывает исходный адаптер и сохраняет ответ в кэш.
+
+        Args:
+            key: Ключ кэша.
+            policy: Политика кэширования метода.
+            call: Вызов исходного адаптера.
+
+        Returns:
+            Ответ метода.
+        """
+        method = str(key[0])
+        try:
+            value = await call()
+        except Exception as exc:
+            if policy.negative_ttl > 0 and _is_not_found(exc):
+                now = self._clock()
+                until = now + policy.negative_ttl
+                self._store(key, _Entry(method=method, error=exc, fresh_until=until, stale_until=until))
+            raise
+
+        now = self._clock()
+        self._store(
+            key,
+            _Entry(
+                method=method,
+                value=value,
+                fresh_until=now + policy.ttl,
+                stale_until=now + policy.ttl + policy.stale_ttl,
+            ),
+        )
+        return value
+
+    def _store(self, key: tuple[object, ...], entry: _Entry) -> None:
+        """Сохраняет запись и вытесняет давно не читанные записи сверх лимита.
+
+        Args:
+            key: Ключ кэша.
+            entry: Новая запись.
+        """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._stats[evicted.method].evictions += 1
+
+    def _refresh_in_background[T](
+        self,
+        key: tuple[object, ...],
+        entry: _Entry,
+        policy: CachePolicy,
+        call: 'Callable[[], Awaitable[T]]',
+    ) -> None:
+        """Запускает фоновое обновление устаревшей записи, если оно ещё не запущено.
+
+        Ошибка обновления пишется в лог; устаревшая запись остаётся до истечения stale_ttl.
+
+        Args:
+            key: Ключ кэша.
+            entry: Устаревшая запись.
+            policy: Политика кэширования метода.
+            call: Вызов исходного адаптера.
+        """
+        if entry.refreshing:
+            return
+        entry.refreshing = True
+
+        async def _refresh() -> None:
+            try:
+                await self._load(key, policy, call)
+            except Exception as exc:
+                entry.refreshing = False
+                self._logger.warning(f'Background cache refresh failed: {exc!r}', method=entry.method)
+
+        task = asyncio.create_task(_refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+
+def _is_not_found(exc: BaseException) -> bool:
+    """Проверяет, что ошибка вызова означает «инструмент не найден».
+
+    Адаптер сообщает о ненайденном ISIN доменной ошибкой InstrumentNotFoundError;
+    ошибки SDK (AioRequestError) и grpc.aio несут статус gRPC в атрибуте или
+    методе `code`.
+
+    Args:
+        exc: Исключение вызова.
+
+    Returns:
+        True, если ответ можно закэшировать как отрицательный.
+    """
+    if isinstance(exc, InstrumentNotFoundError):
+        return True
+    code = getattr(exc, 'code', None)
+    if callable(code):
+        code = code()
+    return code == StatusCode.NOT_FOUND
@@ -0,0 +1,279 @@
+"""Пул долгоживущих gRPC-сессий Tinkoff Invest API.
+
+Вместо открытия нового `AsyncClient` (TLS-рукопожатие и HTTP/2-канал) на каждый
+вызов адаптер заимствует уже открытую сессию `AsyncServices` из пула. Пул открывается
+при старте приложения, закрывается при остановке и переподключает канал, если по нему
+пришла ошибка уровня транспорта (UNAVAILABLE).
+
+Пул сам является фабрикой сессий: `pool()` возвращает асинхронный контекстный
+менеджер, поэтому его можно передать в `TinkoffInvestAdapter` как `client_factory`.
+
+Examples:
+    pool = TinkoffChannelPool(connect=lambda: async_client_factory(token), logger=logger)
+    await pool.open()
+    async with pool() as client:
+        await client.users.get_accounts()
+    await pool.close()
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Final, TYPE_CHECKING
+
+from grpc import StatusCode
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from contextlib import AbstractAsyncContextManager
+    from types import TracebackType
+
+    from t_tech.invest.async_services import AsyncServices
+
+    from finsight_api.application.ports.logger import LoggerPort
+    from finsight_api.infrastructure.adapters.tinkoff.adapter import AsyncClientFactory
+
+
+DEFAULT_CHANNEL_POOL_SIZE: Final[int] = 2
+
+_RECONNECT_STATUS_CODES: Final[frozenset[StatusCode]] = frozenset({StatusCode.UNAVAILABLE})
+
+
+@dataclass(slots=True, kw_only=True, eq=False)
+class _Channel:
+    """Открытая сессия пула.
+
+    Attributes:
+        context: Контекстный менеджер клиента, через который сессия была открыта.
+        services: Открытая сессия AsyncServices.
+        in_flight: Количество вызовов, которые сейчас используют сессию.
+        retired: Сессия выведена из пула и будет закрыта после последнего вызова.
+    """
+
+    context: 'AbstractAsyncContextManager[AsyncServices]'
+    services: 'AsyncServices'
+    in_flight: int = 0
+    retired: bool = False
+
+
+class TinkoffChannelPool:
+    """Пул разделяемых сессий AsyncServices поверх долгоживущих gRPC-каналов.
+
+    gRPC-канал мультиплексирует вызовы поверх HTTP/2, поэтому одну сессию могут
+    одновременно использовать несколько корутин. Пул держит `size` каналов и отдаёт
+    наименее загруженный. Каналы открываются лениво (или заранее через `open`)
+    и привязаны к event loop, в котором были открыты: при смене loop (например,
+    новый `asyncio.run` в CLI) пул открывает каналы заново.
+    """
+
+    def __init__(
+        self,
+        *,
+        connect: 'AsyncClientFactory',
+        logger: 'LoggerPort',
+        size: int = DEFAULT_CHANNEL_POOL_SIZE,
+    ) -> None:
+        """Инициализирует пул.
+
+        Args:
+            connect: Фабрика, открывающая новую сессию клиента SDK.
+            logger: Логгер приложения.
+            size: Количество каналов в пуле.
+
+        Raises:
+            ValueError: Если size не является положительным числом.
+        """
+        if size <= 0:
+            raise ValueError('Channel pool size must be a positive integer')
+
+        self._connect = connect
+        self._logger = logger
+        self._slots: list[_Channel | None] = [None] * size
+        self._lock = asyncio.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def size(self) -> int:
+        """Количество каналов в пуле."""
+        return len(self._slots)
+
+    @property
+    def open_channels(self) -> int:
+        """Количество открытых в данный момент каналов."""
+        return sum(1 for channel in self._slots if channel is not None)
+
+    async def open(self) -> None:
+        """Заранее открывает все каналы пула (прогрев при старте приложения)."""
+        self._bind_loop()
+        for index in range(len(self._slots)):
+            await self._acquire(index)
+
+    async def close(self) -> None:
+        """Закрывает все каналы пула.
+
+        Каналы, которые сейчас используются, закрываются после завершения
+        последнего вызова.
+        """
+        for index, channel in enumerate(self._slots):
+            if channel is None:
+                continue
+            self._slots[index] = None
+            await self._retire(channel)
+
+        self._loop = None
+
+    async def __aenter__(self) -> 'TinkoffChannelPool':
+        """Открывает пул при входе в контекст.
+
+        Returns:
+            Открытый пул.
+        """
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: 'TracebackType | None',
+    ) -> None:
+        """Закрывает пул при выходе из контекста.
+
+        Args:
+            exc_type: Тип исключения (если произошло).
+            exc: Само исключение (если было).
+            tb: Трассировка стека (если была).
+        """
+        await self.close()
+
+    def __call__(self) -> 'AbstractAsyncContextManager[AsyncServices]':
+        """Возвращает контекстный менеджер заимствования сессии.
+
+        Позволяет использовать пул как AsyncClientFactory.
+
+        Returns:
+            Асинхронный контекстный менеджер сессии AsyncServices.
+        """
+        return self.session()
+
+    @asynccontextmanager
+    async def session(self) -> 'AsyncGenerator[AsyncServices]':
+        """Заимствует наименее загруженную сессию пула на время вызова.
+
+        Если вызов завершился ошибкой транспорта, канал выводится из пула:
+        следующий вызов откроет новый, а текущий будет закрыт после того, как
+        его отпустят все использующие его корутины.
+
+        Yields:
+            Открытая сессия AsyncServices.
+        """
+        self._bind_loop()
+
+        index = min(range(len(self._slots)), key=self._load)
+        channel = await self._acquire(index)
+        channel.in_flight += 1
+
+        try:
+            yield channel.services
+        except Exception as exc:
+            if _is_channel_failure(exc) and self._slots[index] is channel:
+                self._logger.warning(f'Tinkoff channel failed, reconnecting: {exc!r}', slot=index)
+                self._slots[index] = None
+                channel.retired = True
+            raise
+        finally:
+            channel.in_flight -= 1
+            if channel.retired and channel.in_flight == 0:
+                await self._close_channel(channel)
+
+    def _load(self, index: int) -> int:
+        """Возвращает текущую нагрузку на слот пула.
+
+        Args:
+            index: Индекс слота.
+
+        Returns:
+            Количество вызовов в работе (0 для ещё не открытого слота).
+        """
+        channel = self._slots[index]
+        return channel.in_flight if channel is not None else 0
+
+    def _bind_loop(self) -> None:
+        """Привязывает пул к текущему event loop.
+
+        gRPC aio-каналы нельзя использовать из другого loop, поэтому при смене loop
+        старые каналы отбрасываются без закрытия: их loop уже завершён.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        if self._loop is not None:
+            self._logger.warning('Event loop changed, Tinkoff channels will be reopened')
+
+        self._slots = [None] * len(self._slots)
+        self._loop = loop
+        self._lock = asyncio.Lock()
+
+    async def _acquire(self, index: int) -> _Channel:
+        """Возвращает открытый канал слота, открывая его при необходимости.
+
+        Args:
+            index: Индекс слота.
+
+        Returns:
+            Открытый канал.
+        """
+        channel = self._slots[index]
+        if channel is not None:
+            return channel
+
+        async with self._lock:
+            channel = self._slots[index]
+            if channel is None:
+                context = self._connect()
+                services = await context.__aenter__()
+                channel = _Channel(context=context, services=services)
+                self._slots[index] = channel
+                self._logger.info('Tinkoff channel opened', slot=index)
+
+        return channel
+
+    async def _retire(self, channel: _Channel) -> None:
+        """Выводит канал из пула и закрывает его, если он не используется.
+
+        Args:
+            channel: Канал для вывода из пула.
+        """
+        channel.retired = True
+        if channel.in_flight == 0:
+            await self._close_channel(channel)
+
+    async def _close_channel(self, channel: _Channel) -> None:
+        """Закрывает сессию канала, не пробрасывая ошибки закрытия.
+
+        Args:
+            channel: Канал для закрытия.
+        """
+        try:
+            await channel.context.__aexit__(None, None, None)
+        except Exception as exc:
+            self._logger.warning(f'Failed to close Tinkoff channel: {exc!r}')
+
+
+def _is_channel_failure(exc: BaseException) -> bool:
+    """Проверяет, что ошибка вызова говорит о неработоспособности канала.
+
+    Ошибки SDK (AioRequestError) и grpc.aio несут статус gRPC в атрибуте или
+    методе `code`.
+
+    Args:
+        exc: Исключение вызова.
+
+    Returns:
+        True, если канал нужно переоткрыть.
+    """
+    code = getattr(exc, 'code', None)
+    if callable(code):
+        code = code()
+    return code in _RECONNECT_STATUS_CODES
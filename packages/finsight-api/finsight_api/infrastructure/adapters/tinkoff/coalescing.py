@@ -0,0 +1,212 @@
+"""Декоратор порта Tinkoff Invest API, объединяющий одинаковые одновременные вызовы.
+
+Несколько HTTP-клиентов, одновременно открывших портфель одного счёта, или снимок
+портфеля с повторяющимися FIGI порождают одинаковые запросы к API в один и тот же
+момент. `CoalescingTinkoffInvestAdapter` выполняет такие запросы один раз (см.
+SingleFlight): ключ — имя метода и аргументы, результат или исключение получают
+все ждущие вызовы. Потоковая загрузка свечей передаётся без объединения.
+"""
+
+from typing import TYPE_CHECKING
+
+from finsight_api.application.ports.tinkoff import TinkoffInvestPort
+from finsight_api.infrastructure.utils.single_flight import SingleFlight
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Collection, Sequence
+    from datetime import date
+
+    from finsight_api.domain.entities.account import AccountEntity
+    from finsight_api.domain.entities.bond import BondEntity
+    from finsight_api.domain.entities.brand import BrandEntity
+    from finsight_api.domain.entities.candle import CandleEntity
+    from finsight_api.domain.entities.candle_frame import CandleFrame
+    from finsight_api.domain.entities.portfolio import PortfolioEntity
+    from finsight_api.domain.value_objects.bond_coupon import BondCoupon
+    from finsight_api.domain.value_objects.candle_interval import CandleInterval
+    from finsight_api.domain.value_objects.isin import ISIN
+    from finsight_api.domain.value_objects.order_book import OrderBook
+
+
+class CoalescingTinkoffInvestAdapter(TinkoffInvestPort):
+    """Декоратор TinkoffInvestPort с объединением одинаковых одновременных вызовов.
+
+    Ответы разделяются между вызывающими: изменять полученные списки нельзя.
+    """
+
+    def __init__(self, *, inner: TinkoffInvestPort, single_flight: SingleFlight | None = None) -> None:
+        """Инициализирует декоратор.
+
+        Args:
+            inner: Оборачиваемая реализация порта.
+            single_flight: Реестр выполняющихся вызовов. По умолчанию создаётся собственный.
+        """
+        self._inner = inner
+        self._flight = single_flight or SingleFlight()
+
+    @property
+    def single_flight(self) -> SingleFlight:
+        """Реестр выполняющихся вызовов (счётчики in_flight и coalesced)."""
+        return self._flight
+
+    async def get_accounts(self) -> 'Collection[AccountEntity]':
+        """Возвращает счета пользователя.
+
+        Returns:
+            Коллекция доменных сущностей счетов.
+        """
+        return await self._flight.do(('get_accounts',), self._inner.get_accounts)
+
+    async def get_portfolio(self, account_id: str) -> 'PortfolioEntity':
+        """Возвращает портфель счёта.
+
+        Args:
+            account_id: Идентификатор счёта.
+
+        Returns:
+            Доменная сущность портфеля.
+        """
+        return await self._flight.do(('get_portfolio', account_id), lambda: self._inner.get_portfolio(account_id))
+
+    async def get_figi_by_isin(self, isin: str) -> str:
+        """Возвращает FIGI инструмента по ISIN.
+
+        Args:
+            isin: ISIN инструмента.
+
+        Returns:
+            FIGI-идентификатор инструмента.
+        """
+        return await self._flight.do(('get_figi_by_isin', isin), lambda: self._inner.get_figi_by_isin(isin))
+
+    async def get_bond_by_figi(self, figi: str) -> 'BondEntity':
+        """Возвращает метаданные облигации по FIGI.
+
+        Args:
+            figi: FIGI-идентификатор облигации.
+
+        Returns:
+            Доменная сущность облигации.
+        """
+        return await self._flight.do(('get_bond_by_figi', figi), lambda: self._inner.get_bond_by_figi(figi))
+
+    async def get_bond_by_isin(self, isin: 'ISIN') -> 'BondEntity':
+        """Возвращает метаданные облигации по ISIN.
+
+        Args:
+            isin: ISIN облигации.
+
+        Returns:
+            Доменная сущность облигации.
+        """
+        return await self._flight.do(('get_bond_by_isin', isin), lambda: self._inner.get_bond_by_isin(isin))
+
+    async def get_bond_coupons(
+        self,
+        *,
+        figi: str,
+        from_date: 'date | None' = None,
+        to_date: 'date | None' = None,
+    ) -> list['BondCoupon']:
+        """Возвращает купоны облигации.
+
+        Args:
+            figi: FIGI облигации.
+            from_date: Начало диапазона (включительно). Если None — без нижней границы.
+            to_date: Конец диапазона (включительно). Если None — без верхней границы.
+
+        Returns:
+            Список купонов.
+        """
+        return await self._flight.do(
+            ('get_bond_coupons', figi, from_date, to_date),
+            lambda: self._inner.get_bond_coupons(figi=figi, from_date=from_date, to_date=to_date),
+        )
+
+    async def get_brands(self) -> list['BrandEntity']:
+        """Возвращает список брендов.
+
+        Returns:
+            Список брендов.
+        """
+        return await self._flight.do(('get_brands',), self._inner.get_brands)
+
+    async def get_candles_by_isin(
+        self,
+        isin: str,
+        from_date: 'date',
+        to_date: 'date',
+        interval: 'CandleInterval',
+    ) -> 'Sequence[CandleEntity]':
+        """Возвращает историю котировок.
+
+        Args:
+            isin: ISIN-идентификатор ценной бумаги.
+            from_date: Начальная дата интервала.
+            to_date: Конечная дата интервала.
+            interval: Интервал свечей.
+
+        Returns:
+            Последовательность доменных сущностей свечей.
+        """
+        return await self._flight.do(
+            ('get_candles_by_isin', isin, from_date, to_date, interval),
+            lambda: self._inner.get_candles_by_isin(isin, from_date, to_date, interval),
+        )
+
+    async def get_candle_frame_by_isin(
+        self,
+        isin: str,
+        from_date: 'date',
+        to_date: 'date',
+        interval: 'CandleInterval',
+    ) -> 'CandleFrame':
+        """Возвращает историю котировок в колоночном виде.
+
+        Args:
+            isin: ISIN-идентификатор ценной бумаги.
+            from_date: Начальная дата интервала.
+            to_date: Конечная дата интервала.
+            interval: Интервал свечей.
+
+        Returns:
+            Колоночная серия свечей инструмента.
+        """
+        return await self._flight.do(
+            ('get_candle_frame_by_isin', isin, from_date, to_date, interval),
+            lambda: self._inner.get_candle_frame_by_isin(isin, from_date, to_date, interval),
+        )
+
+    def stream_candle_frames_by_isin(
+        self,
+        isin: str,
+        from_date: 'date',
+        to_date: 'date',
+        interval: 'CandleInterval',
+    ) -> 'AsyncIterator[CandleFrame]':
+        """Загружает историю котировок окнами (без объединения вызовов).
+
+        Args:
+            isin: ISIN-идентификатор ценной бумаги.
+            from_date: Начальная дата интервала.
+            to_date: Конечная дата интервала.
+            interval: Интервал свечей.
+
+        Returns:
+            Асинхронный итератор колоночных серий свечей по окнам.
+        """
+        return self._inner.stream_candle_frames_by_isin(isin, from_date, to_date, interval)
+
+    async def get_order_book(self, *, figi: str, depth: int = 1) -> 'OrderBook':
+        """Возвращает стакан.
+
+        Args:
+            figi: FIGI инструмента.
+            depth: Глубина стакана.
+
+        Returns:
+            Доменный снимок стакана.
+        """
+        return await self._flight.do(
+            ('get_order_book', figi, depth), lambda: self._inner.get_order_book(figi=figi, depth=depth)
+        )
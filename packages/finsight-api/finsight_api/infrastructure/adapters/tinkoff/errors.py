@@ -0,0 +1,63 @@
+"""Классификация ошибок Tinkoff Invest API для повторов и ограничения частоты.
+
+Ошибки SDK (`AioRequestError`) несут gRPC-статус (`exc.code`) и метаданные
+ответа (`exc.metadata`: tracking_id, ratelimit_limit, ratelimit_remaining,
+ratelimit_reset). Повторять имеет смысл только временные сбои: недоступность
+сервиса, исчерпанный лимит запросов и истёкший таймаут вызова. Ошибки запроса
+(INVALID_ARGUMENT, NOT_FOUND, PERMISSION_DENIED, ...) при повторе не исчезнут.
+"""
+
+from typing import Final
+
+from grpc import StatusCode
+
+from finsight_api.infrastructure.utils.retry import NO_RETRY, RETRY, RetryDecision
+
+RETRYABLE_STATUS_CODES: Final[frozenset[StatusCode]] = frozenset(
+    {
+        StatusCode.UNAVAILABLE,
+        StatusCode.RESOURCE_EXHAUSTED,
+        StatusCode.DEADLINE_EXCEEDED,
+    },
+)
+
+# Время сброса окна лимита, если RESOURCE_EXHAUSTED пришёл без `ratelimit_reset`.
+DEFAULT_RATELIMIT_RESET_SECONDS: Final[float] = 60.0
+
+
+def status_code(exc: BaseException) -> object:
+    """Возвращает gRPC-статус ошибки вызова.
+
+    Args:
+        exc: Исключение вызова.
+
+    Returns:
+        StatusCode или None, если ошибка не несёт статуса.
+    """
+    code = getattr(exc, 'code', None)
+    return code() if callable(code) else code
+
+
+def classify_tinkoff_error(exc: BaseException) -> RetryDecision:
+    """Решает, можно ли повторить вызов после ошибки SDK.
+
+    Для RESOURCE_EXHAUSTED повтор откладывается до сброса окна лимита
+    (`metadata.ratelimit_reset`, без него — минута). Если окно сбрасывается позже
+    deadline операции, Retrier сразу возвращает ошибку, а не спит до таймаута.
+
+    Args:
+        exc: Исключение вызова.
+
+    Returns:
+        Решение о повторе.
+    """
+    code = status_code(exc)
+    if code not in RETRYABLE_STATUS_CODES:
+        return NO_RETRY
+    if code == StatusCode.RESOURCE_EXHAUSTED:
+        reset = getattr(getattr(exc, 'metadata', None), 'ratelimit_reset', None)
+        return RetryDecision(
+            retryable=True,
+            retry_after=float(reset) if reset is not None else DEFAULT_RATELIMIT_RESET_SECONDS,
+        )
+    return RETRY
@@ -0,0 +1,281 @@
+"""Локальный индекс идентификаторов инструментов Tinkoff Invest API.
+
+Поиск FIGI по ISIN через `instruments.find_instrument` — сетевой вызов на каждом
+запросе свечей или облигации. Индекс один раз загружает справочники инструментов
+(облигации, акции, фонды, валюты) целиком и отвечает на запросы из памяти.
+
+Индекс живёт `ttl` секунд, после чего перестраивается при следующем обращении.
+Если задан `snapshot_path`, построенный индекс сохраняется в JSON-файл: после
+перезапуска процесса он читается с диска, пока не истёк TTL.
+"""
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass
+from typing import Final, TYPE_CHECKING
+
+import orjson
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from t_tech.invest.async_services import AsyncServices
+
+    from finsight_api.application.ports.logger import LoggerPort
+    from finsight_api.infrastructure.adapters.tinkoff.adapter import AsyncClientFactory
+
+
+DEFAULT_INSTRUMENT_INDEX_TTL_SECONDS: Final[float] = 24 * 60 * 60
+
+_SNAPSHOT_VERSION: Final[int] = 1
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class InstrumentRef:
+    """Набор идентификаторов одного инструмента.
+
+    Attributes:
+        figi: FIGI инструмента.
+        isin: ISIN инструмента (пустая строка, если не присвоен).
+        uid: Уникальный идентификатор инструмента в Tinkoff Invest API.
+        ticker: Тикер инструмента.
+        class_code: Код режима торгов (например, TQCB или TQBR).
+    """
+
+    figi: str
+    isin: str
+    uid: str
+    ticker: str
+    class_code: str
+
+
+class TinkoffInstrumentIndex:
+    """Индекс ISIN/FIGI/UID → идентификаторы инструмента с TTL и снимком на диске.
+
+    Справочник загружается одной сессией клиента: запросы облигаций, акций, фондов
+    и валют выполняются параллельно. Конкурентные обращения к устаревшему индексу
+    ждут одного перестроения, а не запускают его каждое.
+    """
+
+    def __init__(
+        self,
+        *,
+        client_factory: 'AsyncClientFactory',
+        logger: 'LoggerPort',
+        ttl: float = DEFAULT_INSTRUMENT_INDEX_TTL_SECONDS,
+        snapshot_path: 'Path | None' = None,
+    ) -> None:
+        """Инициализирует пустой индекс.
+
+        Args:
+            client_factory: Фабрика сессий асинхронного клиента SDK.
+            logger: Логгер приложения.
+            ttl: Время жизни индекса в секундах.
+            snapshot_path: Путь к JSON-снимку индекса. Если None, снимок не используется.
+        """
+        self._client_factory = client_factory
+        self._logger = logger
+        self._ttl = ttl
+        self._snapshot_path = snapshot_path
+
+        self._by_isin: dict[str, InstrumentRef] = {}
+        self._by_figi: dict[str, InstrumentRef] = {}
+        self._by_uid: dict[str, InstrumentRef] = {}
+        self._built_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        """Возвращает количество инструментов в индексе."""
+        return len(self._by_figi)
+
+    def is_fresh(self) -> bool:
+        """Проверяет, что индекс построен и его TTL ещё не истёк.
+
+        Returns:
+            True, если индекс можно использовать без перестроения.
+        """
+        return self._built_at is not None and time.time() - self._built_at < self._ttl
+
+    async def get_by_isin(self, isin: str) -> InstrumentRef | None:
+        """Возвращает инструмент по ISIN.
+
+        Args:
+            isin: ISIN инструмента.
+
+        Returns:
+            Идентификаторы инструмента или None, если ISIN не найден.
+        """
+        await self._ensure_fresh()
+        return self._by_isin.get(isin)
+
+    async def get_by_figi(self, figi: str) -> InstrumentRef | None:
+        """Возвращает инструмент по FIGI.
+
+        Args:
+            figi: FIGI инструмента.
+
+        Returns:
+            Идентификаторы инструмента или None, если FIGI не найден.
+        """
+        await self._ensure_fresh()
+        return self._by_figi.get(figi)
+
+    async def get_by_uid(self, uid: str) -> InstrumentRef | None:
+        """Возвращает инструмент по UID.
+
+        Args:
+            uid: Уникальный идентификатор инструмента.
+
+        Returns:
+            Идентификаторы инструмента или None, если UID не найден.
+        """
+        await self._ensure_fresh()
+        return self._by_uid.get(uid)
+
+    def remember(self, ref: InstrumentRef) -> None:
+        """Добавляет в индекс инструмент, найденный в обход справочника.
+
+        Используется адаптером, когда инструмента нет в загруженных справочниках и он
+        был найден поиском: повторный запрос уже не пойдёт в сеть.
+
+        Args:
+            ref: Идентификаторы инструмента.
+        """
+        self._add(ref)
+
+    async def refresh(self) -> None:
+        """Принудительно перестраивает индекс из Tinkoff Invest API и сохраняет снимок."""
+        async with self._lock:
+            await self._rebuild()
+
+    async def _ensure_fresh(self) -> None:
+        """Загружает индекс из снимка или API, если он пуст или устарел."""
+        if self.is_fresh():
+            return
+
+        async with self._lock:
+            if self.is_fresh():
+                return
+            if self._built_at is None and self._load_snapshot():
+                return
+            await self._rebuild()
+
+    async def _rebuild(self) -> None:
+        """Загружает справочники инструментов и заменяет содержимое индекса."""
+        started = time.perf_counter()
+        async with self._client_factory() as client:
+            refs = await _fetch_instrument_refs(client)
+
+        self._replace(refs, built_at=time.time())
+        self._logger.info(
+            'Tinkoff instrument index built',
+            instruments=len(self),
+            duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+        self._save_snapshot()
+
+    def _replace(self, refs: 'Iterable[InstrumentRef]', *, built_at: float) -> None:
+        """Заменяет содержимое индекса.
+
+        Args:
+            refs: Идентификаторы инструментов.
+            built_at: Unix-время построения индекса.
+        """
+        self._by_isin = {}
+        self._by_figi = {}
+        self._by_uid = {}
+        for ref in refs:
+            self._add(ref)
+        self._built_at = built_at
+
+    def _add(self, ref: InstrumentRef) -> None:
+        """Добавляет инструмент во все словари индекса.
+
+        Для ISIN, торгуемого в нескольких режимах, сохраняется первый встреченный
+        инструмент: справочники возвращают основной режим торгов первым.
+
+        Args:
+            ref: Идентификаторы инструмента.
+        """
+        if ref.isin:
+            self._by_isin.setdefault(ref.isin, ref)
+        self._by_figi[ref.figi] = ref
+        if ref.uid:
+            self._by_uid[ref.uid] = ref
+
+    def _load_snapshot(self) -> bool:
+        """Читает индекс из снимка на диске, если он есть и не устарел.
+
+        Returns:
+            True, если индекс загружен из снимка.
+        """
+        if self._snapshot_path is None or not self._snapshot_path.exists():
+            return False
+
+        try:
+            payload = orjson.loads(self._snapshot_path.read_bytes())
+            if payload['version'] != _SNAPSHOT_VERSION:
+                return False
+            built_at = float(payload['built_at'])
+            refs = [InstrumentRef(**item) for item in payload['instruments']]
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            self._logger.warning(f'Failed to read instrument index snapshot: {exc!r}', path=str(self._snapshot_path))
+            return False
+
+        if time.time() - built_at >= self._ttl:
+            return False
+
+        self._replace(refs, built_at=built_at)
+        self._logger.info('Tinkoff instrument index loaded from snapshot', instruments=len(self))
+        return True
+
+    def _save_snapshot(self) -> None:
+        """Сохраняет индекс в снимок на диске (атомарно, через временный файл)."""
+        if self._snapshot_path is None:
+            return
+
+        payload = {
+            'version': _SNAPSHOT_VERSION,
+            'built_at': self._built_at,
+            'instruments': [asdict(ref) for ref in self._by_figi.values()],
+        }
+        tmp_path = self._snapshot_path.with_suffix(f'{self._snapshot_path.suffix}.tmp')
+        try:
+            self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(orjson.dumps(payload))
+            tmp_path.replace(self._snapshot_path)
+        except OSError as exc:
+            self._logger.warning(f'Failed to write instrument index snapshot: {exc!r}', path=str(self._snapshot_path))
+
+
+async def _fetch_instrument_refs(client: 'AsyncServices') -> list[InstrumentRef]:
+    """Загружает справочники инструментов, доступных для торговли через API.
+
+    Статус инструментов не передаётся: по умолчанию API возвращает базовый список
+    (INSTRUMENT_STATUS_BASE), в котором у ISIN, как правило, один режим торгов.
+
+    Args:
+        client: Асинхронный клиент Tinkoff Invest API.
+
+    Returns:
+        Идентификаторы инструментов всех загруженных справочников.
+    """
+    responses = await asyncio.gather(
+        client.instruments.bonds(),
+        client.instruments.shares(),
+        client.instruments.etfs(),
+        client.instruments.currencies(),
+    )
+
+    return [
+        InstrumentRef(
+            figi=instrument.figi,
+            isin=instrument.isin,
+            uid=instrument.uid,
+            ticker=instrument.ticker,
+            class_code=instrument.class_code,
+        )
+        for response in responses
+        for instrument in response.instruments
+    ]
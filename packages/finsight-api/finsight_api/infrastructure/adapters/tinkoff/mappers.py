@@ -3,11 +3,24 @@
 Модуль содержит функции конвертации числовых типов SDK (units/nano, MoneyValue,
 Quotation) в Decimal и доменные value objects, а также мапперы SDK-сущностей
 (Tinkoff Invest) в доменные модели FinSight.
+
+Числа SDK сначала сводятся к целому числу нано-единиц (units * 10^9 + nano), и
+Decimal строится по нему через кэш: цены в стаканах, купонах и портфеле
+повторяются от ответа к ответу, и повторное значение не создаёт новых Decimal.
+Целые значения (nano == 0) не требуют деления. Цены свечей (float) считаются
+одним делением целых нано-единиц: результат округляется один раз, как при
+чтении колонок CandleFrame.
+
+Массово создаваемые доменные объекты (свечи, уровни стакана, купоны, позиции)
+строятся через `_from_trusted` (см. `domain.trusted`): данные API не проверяются
+повторно.
 """
 
+from array import array
 from collections.abc import Collection
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import Final, TYPE_CHECKING
 
 from t_tech.invest import CandleInterval as SDKCandleInterval
 
@@ -15,44 +28,84 @@ from finsight_api.domain.entities.account import AccountEntity
 from finsight_api.domain.entities.bond import BondEntity
 from finsight_api.domain.entities.brand import BrandEntity
 from finsight_api.domain.entities.candle import CandleEntity
+from finsight_api.domain.entities.candle_frame import CandleFrame, NANO_FACTOR
 from finsight_api.domain.entities.portfolio import PortfolioEntity
 from finsight_api.domain.value_objects.account_status import AccountStatus
 from finsight_api.domain.value_objects.account_type import AccountType
 from finsight_api.domain.value_objects.bond_coupon import BondCoupon
 from finsight_api.domain.value_objects.candle_interval import CandleInterval
 from finsight_api.domain.value_objects.instrument_type import InstrumentType
+from finsight_api.domain.value_objects.last_price import LastPrice
 from finsight_api.domain.value_objects.money import Money
 from finsight_api.domain.value_objects.order_book import OrderBook, OrderBookLevel
 from finsight_api.domain.value_objects.portfolio_position import PortfolioPosition
 from finsight_api.domain.value_objects.risk_level import RiskLevel
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from t_tech.invest import Account as SdkAccount
     from t_tech.invest import Bond as SdkBond
     from t_tech.invest import Brand as SdkBrand
     from t_tech.invest import Coupon as SdkCoupon
     from t_tech.invest import GetOrderBookResponse, MoneyValue, Quotation
     from t_tech.invest import HistoricCandle as SdkHistoricCandle
+    from t_tech.invest import LastPrice as SdkLastPrice
+    from t_tech.invest import Order as SdkOrder
+    from t_tech.invest import OrderBook as SdkOrderBook
     from t_tech.invest import PortfolioPosition as SdkPortfolioPosition
     from t_tech.invest import PortfolioResponse as SdkPortfolioResponse
 
 
 _NANO_FACTOR = Decimal('1_000_000_000')
+# Число различных значений в кэшах Decimal и Money (порядка нескольких МБ).
+_DECIMAL_CACHE_SIZE: Final[int] = 65_536
+
+
+def _nanos(value: 'MoneyValue | Quotation') -> int:
+    """Сводит MoneyValue или Quotation к целому числу нано-единиц.
+
+    Args:
+        value: Числовое значение SDK.
+
+    Returns:
+        units * 10^9 + nano.
+    """
+    return int(value.units) * NANO_FACTOR + int(value.nano)
+
 
+@lru_cache(maxsize=_DECIMAL_CACHE_SIZE)
+def _decimal_from_nanos(nanos: int) -> Decimal:
+    """Конвертирует значение в нано-единицах в Decimal без потери точности.
 
-def _decimal_from_units_nano(units: int, nano: int) -> Decimal:
-    """Конвертирует пару (units, nano) в Decimal без потери точности.
+    Decimal неизменяем, поэтому один объект безопасно разделяется между всеми
+    ответами с тем же значением.
 
     Args:
-        units: Целая часть значения.
-        nano: Дробная часть в миллиардных долях (10^-9).
+        nanos: Значение в миллиардных долях (10^-9).
 
     Returns:
-        Decimal-представление значения units + nano / 1e9.
+        Decimal-представление значения nanos / 1e9.
     """
+    units, nano = divmod(nanos, NANO_FACTOR)
+    if not nano:
+        return Decimal(units)
     return Decimal(units) + (Decimal(nano) / _NANO_FACTOR)
 
 
+@lru_cache(maxsize=_DECIMAL_CACHE_SIZE)
+def _rub_from_nanos(nanos: int) -> Money:
+    """Возвращает рублёвую сумму по значению в нано-единицах.
+
+    Args:
+        nanos: Значение в миллиардных долях (10^-9).
+
+    Returns:
+        Доменный объект Money в рублях.
+    """
+    return Money(currency='rub', amount=_decimal_from_nanos(nanos))
+
+
 def _money_value_to_decimal(value: 'MoneyValue') -> Decimal:
     """Преобразует SDK MoneyValue в Decimal.
 
@@ -62,7 +115,7 @@ def _money_value_to_decimal(value: 'MoneyValue') -> Decimal:
     Returns:
         Денежное значение в виде Decimal.
     """
-    return _decimal_from_units_nano(int(value.units), int(value.nano))
+    return _decimal_from_nanos(_nanos(value))
 
 
 def _quotation_to_decimal(value: 'Quotation') -> Decimal:
@@ -74,7 +127,24 @@ def _quotation_to_decimal(value: 'Quotation') -> Decimal:
     Returns:
         Числовое значение котировки в виде Decimal.
     """
-    return _decimal_from_units_nano(int(value.units), int(value.nano))
+    return _decimal_from_nanos(_nanos(value))
+
+
+def _order_book_levels(orders: 'Iterable[SdkOrder]') -> list[OrderBookLevel]:
+    """Преобразует заявки стакана SDK в уровни стакана.
+
+    Args:
+        orders: Заявки одной стороны стакана.
+
+    Returns:
+        Уровни стакана с ценой в рублях.
+    """
+    return [
+        OrderBookLevel._from_trusted(
+            price=_rub_from_nanos(o.price.units * NANO_FACTOR + o.price.nano), quantity=o.quantity
+        )
+        for o in orders
+    ]
 
 
 def _money_from_sdk(value: 'MoneyValue') -> Money:
@@ -125,18 +195,60 @@ def map_candle_from_sdk(
     Returns:
         Доменная сущность CandleEntity.
     """
-    return CandleEntity(
+    open_, close, high, low = candle.open, candle.close, candle.high, candle.low
+    return CandleEntity._from_trusted(
         time=candle.time,
-        open=float(candle.open.units) + candle.open.nano / 1e9,
-        close=float(candle.close.units) + candle.close.nano / 1e9,
-        high=float(candle.high.units) + candle.high.nano / 1e9,
-        low=float(candle.low.units) + candle.low.nano / 1e9,
+        open=(open_.units * NANO_FACTOR + open_.nano) / NANO_FACTOR,
+        close=(close.units * NANO_FACTOR + close.nano) / NANO_FACTOR,
+        high=(high.units * NANO_FACTOR + high.nano) / NANO_FACTOR,
+        low=(low.units * NANO_FACTOR + low.nano) / NANO_FACTOR,
         volume=candle.volume,
         figi=figi,
         interval=interval,
     )
 
 
+def map_candle_frame_from_sdk(
+    candles: 'Iterable[SdkHistoricCandle]',
+    *,
+    figi: str,
+    interval: CandleInterval,
+) -> CandleFrame:
+    """Заполняет колоночную серию CandleFrame напрямую из SDK HistoricCandle.
+
+    Не создаёт промежуточных CandleEntity: цены переводятся в нано-единицы
+    целочисленной арифметикой и дописываются в колонки int64.
+
+    Args:
+        candles: Свечи из Tinkoff Invest SDK в порядке времени.
+        figi: FIGI инструмента.
+        interval: Доменный интервал свечей.
+
+    Returns:
+        Колоночная серия свечей.
+    """
+    time, open_, high, low, close, volume = (array('q') for _ in range(6))
+
+    for candle in candles:
+        time.append(int(candle.time.timestamp()))
+        open_.append(candle.open.units * NANO_FACTOR + candle.open.nano)
+        high.append(candle.high.units * NANO_FACTOR + candle.high.nano)
+        low.append(candle.low.units * NANO_FACTOR + candle.low.nano)
+        close.append(candle.close.units * NANO_FACTOR + candle.close.nano)
+        volume.append(candle.volume)
+
+    return CandleFrame(
+        figi=figi,
+        interval=interval,
+        time=memoryview(time).toreadonly(),
+        open=memoryview(open_).toreadonly(),
+        high=memoryview(high).toreadonly(),
+        low=memoryview(low).toreadonly(),
+        close=memoryview(close).toreadonly(),
+        volume=memoryview(volume).toreadonly(),
+    )
+
+
 def map_portfolio_position_from_sdk(position: 'SdkPortfolioPosition') -> PortfolioPosition:
     """Преобразует SDK PortfolioPosition в доменный VO PortfolioPosition.
 
@@ -156,7 +268,7 @@ def map_portfolio_position_from_sdk(position: 'SdkPortfolioPosition') -> Portfol
     if instrument_type == InstrumentType.BOND or current_nkd != Decimal(0):
         normalized_current_nkd = current_nkd
 
-    return PortfolioPosition(
+    return PortfolioPosition._from_trusted(
         figi=position.figi,
         instrument_type=instrument_type,
         quantity=quantity,
@@ -212,7 +324,7 @@ def map_coupon_from_sdk(coupon: 'SdkCoupon') -> BondCoupon:
     Returns:
         Доменный объект BondCoupon.
     """
-    return BondCoupon(
+    return BondCoupon._from_trusted(
         figi=coupon.figi,
         coupon_date=coupon.coupon_date,
         coupon_number=int(coupon.coupon_number),
@@ -234,39 +346,59 @@ def map_order_book_from_sdk(response: 'GetOrderBookResponse') -> OrderBook:
     Returns:
         Доменный объект OrderBook с уровнями bid/ask и ценами.
     """
-    bids = [
-        OrderBookLevel(
-            price=Money(currency='rub', amount=_quotation_to_decimal(o.price)),
-            quantity=int(o.quantity),
-        )
-        for o in response.bids
-    ]
-    asks = [
-        OrderBookLevel(
-            price=Money(currency='rub', amount=_quotation_to_decimal(o.price)),
-            quantity=int(o.quantity),
-        )
-        for o in response.asks
-    ]
-
-    last_price = (
-        Money(currency='rub', amount=_quotation_to_decimal(response.last_price)) if response.last_price else None
-    )
-    close_price = (
-        Money(currency='rub', amount=_quotation_to_decimal(response.close_price)) if response.close_price else None
-    )
+    last_price = _rub_from_nanos(_nanos(response.last_price)) if response.last_price else None
+    close_price = _rub_from_nanos(_nanos(response.close_price)) if response.close_price else None
 
     return OrderBook(
         figi=response.figi,
         depth=int(response.depth),
-        bids=bids,
-        asks=asks,
+        bids=_order_book_levels(response.bids),
+        asks=_order_book_levels(response.asks),
         last_price=last_price,
         close_price=close_price,
         timestamp=response.orderbook_ts if getattr(response, 'orderbook_ts', None) else None,
     )
 
 
+def map_stream_order_book_from_sdk(order_book: 'SdkOrderBook') -> OrderBook:
+    """Преобразует стакан из потока маркет-данных в доменный value object OrderBook.
+
+    В отличие от ответа GetOrderBook, стакан потока не содержит последней цены и
+    цены закрытия.
+
+    Args:
+        order_book: Объект OrderBook из MarketDataResponse.
+
+    Returns:
+        Доменный объект OrderBook.
+    """
+    return OrderBook(
+        figi=order_book.figi,
+        depth=int(order_book.depth),
+        bids=_order_book_levels(order_book.bids),
+        asks=_order_book_levels(order_book.asks),
+        last_price=None,
+        close_price=None,
+        timestamp=order_book.time,
+    )
+
+
+def map_last_price_from_sdk(last_price: 'SdkLastPrice') -> LastPrice:
+    """Преобразует последнюю цену из потока маркет-данных в доменный value object.
+
+    Args:
+        last_price: Объект LastPrice из MarketDataResponse.
+
+    Returns:
+        Доменный объект LastPrice.
+    """
+    return LastPrice(
+        figi=last_price.figi,
+        price=_quotation_to_decimal(last_price.price),
+        time=last_price.time,
+    )
+
+
 def map_brand_from_sdk(brand: 'SdkBrand') -> BrandEntity:
     """Преобразует SDK Brand в доменную сущность Brand.
 
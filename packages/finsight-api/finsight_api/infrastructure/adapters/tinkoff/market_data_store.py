@@ -0,0 +1,172 @@
+"""Хранилище последнего состояния потоковых маркет-данных в памяти.
+
+Поток маркет-данных присылает стакан при каждом его изменении, последнюю цену —
+при каждой сделке, свечу — при её обновлении. Хранилище держит только последнее
+значение по каждому FIGI; чтение O(1) и не обращается к API.
+
+Значение считается актуальным, пока поток, в котором оно получено, не оборвался
+(`clear` при разрыве соединения) и, если задан `max_age`, оно получено не раньше
+max_age секунд назад.
+
+На новые последние цены можно подписаться (`add_last_price_listener`): слушатели
+вызываются синхронно при каждом `put_last_price` и не должны блокировать.
+"""
+
+import time
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from finsight_api.domain.value_objects.money import Money
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from finsight_api.domain.entities.candle import CandleEntity
+    from finsight_api.domain.value_objects.last_price import LastPrice
+    from finsight_api.domain.value_objects.order_book import OrderBook
+
+
+class MarketDataStore:
+    """Последние стаканы, цены и свечи по FIGI."""
+
+    def __init__(self, *, max_age: float | None = None, clock: 'Callable[[], float]' = time.monotonic) -> None:
+        """Инициализирует пустое хранилище.
+
+        Args:
+            max_age: Максимальный возраст значения в секундах (None — без ограничения).
+            clock: Монотонные часы в секундах.
+        """
+        self._max_age = max_age
+        self._clock = clock
+        self._order_books: dict[str, tuple[OrderBook, float]] = {}
+        self._last_prices: dict[str, tuple[LastPrice, float]] = {}
+        self._candles: dict[str, tuple[CandleEntity, float]] = {}
+        self._last_price_listeners: list[Callable[[LastPrice], None]] = []
+
+    def put_order_book(self, order_book: 'OrderBook') -> None:
+        """Сохраняет стакан.
+
+        Args:
+            order_book: Стакан из потока.
+        """
+        self._order_books[order_book.figi] = (order_book, self._clock())
+
+    def put_last_price(self, last_price: 'LastPrice') -> None:
+        """Сохраняет последнюю цену.
+
+        Args:
+            last_price: Последняя цена из потока.
+        """
+        self._last_prices[last_price.figi] = (last_price, self._clock())
+        for listener in tuple(self._last_price_listeners):
+            listener(last_price)
+
+    def add_last_price_listener(self, listener: 'Callable[[LastPrice], None]') -> 'Callable[[], None]':
+        """Подписывает слушателя на новые последние цены.
+
+        Args:
+            listener: Функция, вызываемая с каждой сохранённой последней ценой.
+
+        Returns:
+            Функция отписки слушателя.
+        """
+        self._last_price_listeners.append(listener)
+
+        def remove() -> None:
+            if listener in self._last_price_listeners:
+                self._last_price_listeners.remove(listener)
+
+        return remove
+
+    def put_candle(self, candle: 'CandleEntity') -> None:
+        """Сохраняет свечу.
+
+        Args:
+            candle: Свеча из потока.
+        """
+        self._candles[candle.figi] = (candle, self._clock())
+
+    def get_order_book(self, figi: str, *, depth: int = 1) -> 'OrderBook | None':
+        """Возвращает актуальный стакан не глубже depth.
+
+        Стакан из потока не содержит последней цены: она подставляется из
+        последней цены по инструменту, если та известна.
+
+        Args:
+            figi: FIGI инструмента.
+            depth: Требуемая глубина стакана.
+
+        Returns:
+            Стакан или None, если актуального стакана такой глубины нет.
+        """
+        order_book = self._fresh(self._order_books.get(figi))
+        if order_book is None or order_book.depth < depth:
+            return None
+
+        last_price = order_book.last_price
+        if last_price is None and (price := self.get_last_price(figi)) is not None:
+            last_price = Money(currency='rub', amount=price.price)
+
+        if order_book.depth == depth and last_price is order_book.last_price:
+            return order_book
+        return replace(
+            order_book,
+            depth=depth,
+            bids=order_book.bids[:depth],
+            asks=order_book.asks[:depth],
+            last_price=last_price,
+        )
+
+    def get_last_price(self, figi: str) -> 'LastPrice | None':
+        """Возвращает актуальную последнюю цену.
+
+        Args:
+            figi: FIGI инструмента.
+
+        Returns:
+            Последняя цена или None.
+        """
+        return self._fresh(self._last_prices.get(figi))
+
+    def get_candle(self, figi: str) -> 'CandleEntity | None':
+        """Возвращает актуальную последнюю свечу.
+
+        Args:
+            figi: FIGI инструмента.
+
+        Returns:
+            Свеча или None.
+        """
+        return self._fresh(self._candles.get(figi))
+
+    def discard(self, figi: str) -> None:
+        """Удаляет значения инструмента (например, после отписки от него).
+
+        Args:
+            figi: FIGI инструмента.
+        """
+        self._order_books.pop(figi, None)
+        self._last_prices.pop(figi, None)
+        self._candles.pop(figi, None)
+
+    def clear(self) -> None:
+        """Удаляет все значения (например, при разрыве потока)."""
+        self._order_books.clear()
+        self._last_prices.clear()
+        self._candles.clear()
+
+    def _fresh[T](self, entry: tuple[T, float] | None) -> T | None:
+        """Возвращает значение записи, если оно не старше max_age.
+
+        Args:
+            entry: Пара (значение, момент получения) или None.
+
+        Returns:
+            Значение или None.
+        """
+        if entry is None:
+            return None
+        value, received_at = entry
+        if self._max_age is not None and self._clock() - received_at > self._max_age:
+            return None
+        return value
@@ -0,0 +1,307 @@
+"""Подписки на поток маркет-данных Tinkoff Invest API.
+
+Дашборд, обновляющий 100 позиций раз в несколько секунд, расходует unary-лимит
+GetOrderBook за минуты. `TinkoffMarketDataStream` держит одно соединение
+MarketDataStream на все отслеживаемые FIGI: подписывается на стаканы, последние
+цены и минутные свечи и складывает приходящие данные в MarketDataStore.
+
+Соединение открывается при первой подписке (`watch`) и переоткрывается с
+экспоненциальной паузой после разрыва; подписки восстанавливаются, а данные
+оборванного соединения удаляются из хранилища, чтобы не выдавать устаревшее
+состояние за актуальное.
+
+Подписки считаются по ссылкам: `watch` возвращает функцию освобождения, и FIGI,
+который больше никто не отслеживает, отписывается через `release_delay` секунд
+(повторный `watch` за это время сохраняет подписку), а его данные удаляются из
+хранилища. Так число подписок соединения ограничено инструментами, которые
+сейчас нужны открытым подпискам счетов и снапшотам.
+"""
+
+import asyncio
+import bisect
+import contextlib
+from typing import Final, TYPE_CHECKING
+
+from t_tech.invest import CandleInstrument, LastPriceInstrument, OrderBookInstrument, SubscriptionInterval
+
+from finsight_api.application.ports.tinkoff.market_data_stream import TinkoffMarketDataStreamPort
+from finsight_api.domain.value_objects.candle_interval import CandleInterval
+from finsight_api.infrastructure.adapters.tinkoff.mappers import (
+    map_candle_from_sdk,
+    map_last_price_from_sdk,
+    map_stream_order_book_from_sdk,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection
+
+    from t_tech.invest import MarketDataResponse
+    from t_tech.invest.market_data_stream.async_market_data_stream_manager import AsyncMarketDataStreamManager
+
+    from finsight_api.application.ports.logger import LoggerPort
+    from finsight_api.domain.entities.candle import CandleEntity
+    from finsight_api.domain.value_objects.last_price import LastPrice
+    from finsight_api.domain.value_objects.order_book import OrderBook
+    from finsight_api.infrastructure.adapters.tinkoff.adapter import AsyncClientFactory
+    from finsight_api.infrastructure.adapters.tinkoff.market_data_store import MarketDataStore
+
+
+# Глубины стакана, на которые принимает подписку MarketDataStream.
+_ORDER_BOOK_DEPTHS: Final[tuple[int, ...]] = (1, 10, 20, 30, 40, 50)
+_RECONNECT_MIN_DELAY_SECONDS: Final[float] = 1.0
+_RECONNECT_MAX_DELAY_SECONDS: Final[float] = 60.0
+DEFAULT_RELEASE_DELAY_SECONDS: Final[float] = 60.0
+
+
+class TinkoffMarketDataStream(TinkoffMarketDataStreamPort):
+    """Подписки на стаканы, последние цены и минутные свечи с хранилищем в памяти."""
+
+    def __init__(
+        self,
+        *,
+        client_factory: 'AsyncClientFactory',
+        store: 'MarketDataStore',
+        logger: 'LoggerPort',
+        release_delay: float = DEFAULT_RELEASE_DELAY_SECONDS,
+    ) -> None:
+        """Инициализирует поток без подписок.
+
+        Args:
+            client_factory: Фабрика сессий асинхронного клиента SDK (например, пул каналов).
+            store: Хранилище последнего состояния маркет-данных.
+            logger: Логгер приложения.
+            release_delay: Через сколько секунд отписывается FIGI, который больше не отслеживается (0 — сразу).
+        """
+        self._client_factory = client_factory
+        self._store = store
+        self._logger = logger
+        self._release_delay = release_delay
+
+        self._figis: set[str] = set()
+        self._order_book_depths: dict[str, int] = {}
+        self._watchers: dict[str, int] = {}
+        self._pending_releases: dict[str, asyncio.TimerHandle] = {}
+        self._manager: AsyncMarketDataStreamManager | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def figis(self) -> frozenset[str]:
+        """FIGI отслеживаемых инструментов."""
+        return frozenset(self._figis)
+
+    def watch(self, figis: 'Collection[str]', *, order_book_depth: int = 1) -> 'Callable[[], None]':
+        """Подписывается на стаканы, последние цены и свечи инструментов.
+
+        Args:
+            figis: FIGI инструментов.
+            order_book_depth: Глубина стакана (округляется вверх до поддерживаемой API).
+
+        Returns:
+            Функция освобождения подписки; повторные вызовы ничего не делают.
+        """
+        figis = list(dict.fromkeys(figis))
+        for figi in figis:
+            self._watchers[figi] = self._watchers.get(figi, 0) + 1
+            if (handle := self._pending_releases.pop(figi, None)) is not None:
+                handle.cancel()
+
+        depth = _subscription_depth(order_book_depth)
+        new_figis = [figi for figi in figis if figi not in self._figis]
+        deeper_books = {
+            figi: depth for figi in figis if figi in self._order_book_depths and self._order_book_depths[figi] < depth
+        }
+
+        self._figis.update(new_figis)
+        for figi in new_figis:
+            self._order_book_depths[figi] = depth
+        previous_depths = {figi: self._order_book_depths[figi] for figi in deeper_books}
+        self._order_book_depths.update(deeper_books)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        elif self._manager is not None:
+            if previous_depths:
+                self._manager.order_book.unsubscribe(
+                    [OrderBookInstrument(figi=figi, depth=old) for figi, old in previous_depths.items()],
+                )
+            self._subscribe(self._manager, new_figis, {**dict.fromkeys(new_figis, depth), **deeper_books})
+
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self._release(figis)
+
+        return release
+
+    def get_order_book(self, figi: str, *, depth: int = 1) -> 'OrderBook | None':
+        """Возвращает актуальный стакан из потока.
+
+        Args:
+            figi: FIGI инструмента.
+            depth: Требуемая глубина стакана.
+
+        Returns:
+            Стакан или None, если актуального стакана такой глубины нет.
+        """
+        return self._store.get_order_book(figi, depth=depth)
+
+    def get_last_price(self, figi: str) -> 'LastPrice | None':
+        """Возвращает актуальную последнюю цену из потока.
+
+        Args:
+            figi: FIGI инструмента.
+
+        Returns:
+            Последняя цена или None.
+        """
+        return self._store.get_last_price(figi)
+
+    def get_candle(self, figi: str) -> 'CandleEntity | None':
+        """Возвращает последнюю минутную свечу из потока.
+
+        Args:
+            figi: FIGI инструмента.
+
+        Returns:
+            Свеча или None.
+        """
+        return self._store.get_candle(figi)
+
+    def add_last_price_listener(self, listener: 'Callable[[LastPrice], None]') -> 'Callable[[], None]':
+        """Подписывает слушателя на последние цены из потока.
+
+        Args:
+            listener: Функция, вызываемая с каждой новой последней ценой.
+
+        Returns:
+            Функция отписки слушателя.
+        """
+        return self._store.add_last_price_listener(listener)
+
+    async def stop(self) -> None:
+        """Закрывает поток и прекращает переподключения."""
+        for handle in self._pending_releases.values():
+            handle.cancel()
+        self._pending_releases.clear()
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        """Читает поток, переподключаясь после разрывов, пока задача не отменена."""
+        delay = _RECONNECT_MIN_DELAY_SECONDS
+        while True:
+            try:
+                async with self._client_factory() as client:
+                    manager = client.create_market_data_stream()
+                    self._manager = manager
+                    try:
+                        self._subscribe(manager, list(self._figis), dict(self._order_book_depths))
+                        async for response in manager:
+                            delay = _RECONNECT_MIN_DELAY_SECONDS
+                            self._dispatch(response)
+                    finally:
+                        self._manager = None
+                        manager.stop()
+                        self._store.clear()
+            except Exception as exc:
+                self._logger.warning(f'Tinkoff market data stream interrupted: {exc!r}', retry_in=delay)
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _RECONNECT_MAX_DELAY_SECONDS)
+
+    def _release(self, figis: 'Collection[str]') -> None:
+        """Уменьшает счётчики подписок и откладывает отписку неотслеживаемых FIGI.
+
+        Args:
+            figis: FIGI освобождаемой подписки.
+        """
+        loop = asyncio.get_running_loop()
+        for figi in figis:
+            count = self._watchers[figi] - 1
+            if count:
+                self._watchers[figi] = count
+                continue
+            del self._watchers[figi]
+            if self._release_delay > 0:
+                self._pending_releases[figi] = loop.call_later(self._release_delay, self._unwatch, figi)
+            else:
+                self._unwatch(figi)
+
+    def _unwatch(self, figi: str) -> None:
+        """Отписывается от инструмента и удаляет его данные из хранилища.
+
+        Args:
+            figi: FIGI инструмента.
+        """
+        self._pending_releases.pop(figi, None)
+        self._figis.discard(figi)
+        depth = self._order_book_depths.pop(figi, None)
+        self._store.discard(figi)
+        if self._manager is None:
+            return
+        self._manager.last_price.unsubscribe([LastPriceInstrument(figi=figi)])
+        self._manager.candles.unsubscribe(
+            [CandleInstrument(figi=figi, interval=SubscriptionInterval.SUBSCRIPTION_INTERVAL_ONE_MINUTE)],
+        )
+        if depth is not None:
+            self._manager.order_book.unsubscribe([OrderBookInstrument(figi=figi, depth=depth)])
+
+    def _subscribe(
+        self,
+        manager: 'AsyncMarketDataStreamManager',
+        figis: 'Collection[str]',
+        order_book_depths: dict[str, int],
+    ) -> None:
+        """Отправляет запросы подписки в открытый поток.
+
+        Args:
+            manager: Менеджер потока маркет-данных SDK.
+            figis: FIGI для подписки на последние цены и свечи.
+            order_book_depths: Глубина стакана по FIGI для подписки на стаканы.
+        """
+        if figis:
+            manager.last_price.subscribe([LastPriceInstrument(figi=figi) for figi in figis])
+            manager.candles.subscribe(
+                [
+                    CandleInstrument(figi=figi, interval=SubscriptionInterval.SUBSCRIPTION_INTERVAL_ONE_MINUTE)
+                    for figi in figis
+                ],
+            )
+        if order_book_depths:
+            manager.order_book.subscribe(
+                [OrderBookInstrument(figi=figi, depth=depth) for figi, depth in order_book_depths.items()],
+            )
+
+    def _dispatch(self, response: 'MarketDataResponse') -> None:
+        """Складывает данные ответа потока в хранилище.
+
+        Args:
+            response: Ответ потока маркет-данных.
+        """
+        if response.orderbook is not None:
+            self._store.put_order_book(map_stream_order_book_from_sdk(response.orderbook))
+        if response.last_price is not None:
+            self._store.put_last_price(map_last_price_from_sdk(response.last_price))
+        if response.candle is not None:
+            candle = response.candle
+            self._store.put_candle(map_candle_from_sdk(candle, figi=candle.figi, interval=CandleInterval.MIN_1))
+
+
+def _subscription_depth(depth: int) -> int:
+    """Округляет глубину стакана вверх до поддерживаемой подпиской.
+
+    Args:
+        depth: Требуемая глубина.
+
+    Returns:
+        Ближайшая не меньшая глубина из поддерживаемых (не больше максимальной).
+    """
+    index = bisect.bisect_left(_ORDER_BOOK_DEPTHS, depth)
+    return _ORDER_BOOK_DEPTHS[min(index, len(_ORDER_BOOK_DEPTHS) - 1)]
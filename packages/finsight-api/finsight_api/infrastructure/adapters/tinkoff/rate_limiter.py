@@ -0,0 +1,459 @@
+"""Клиентское ограничение частоты unary-запросов к Tinkoff Invest API.
+
+Тариф пользователя (`users.get_user_tariff`) задаёт лимит запросов в минуту для
+групп gRPC-методов. Без клиентского ограничения массовые операции (загрузка
+истории, пакетный поиск облигаций) упираются в RESOURCE_EXHAUSTED и падают.
+
+`TinkoffRateLimiter` держит token bucket на каждый метод тарифа. Ёмкость корзины
+— десятая часть минутного лимита, скорость пополнения подобрана так, чтобы за
+любую минуту не уйти за лимит. Вызывающие ждут токен в порядке очереди (FIFO),
+а не получают ошибку. Ошибки SDK с метаданными `ratelimit_remaining` и
+`ratelimit_reset` подстраивают корзину под фактический остаток на сервере.
+
+`RateLimitedClientFactory` оборачивает фабрику сессий: сервисы выданной сессии
+(`client.instruments`, `client.market_data`, ...) пропускают каждый unary-вызов
+через лимитер, поэтому адаптеру не нужно помнить об ограничении в каждом методе.
+Если фабрике передан `Retrier`, временные ошибки вызова (см. errors.py)
+повторяются, и каждая попытка тоже ждёт токен лимитера. Первая попытка идёт по
+сессии, которую уже держит вызывающий, а каждый повтор берёт собственную сессию
+исходной фабрики: пул выдаёт наименее загруженный канал, поэтому повтор после
+ошибки канала (UNAVAILABLE) обычно идёт по другому каналу, а ошибка повтора
+выходит из его сессии, и пул переподключает канал.
+"""
+
+import asyncio
+import inspect
+import re
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import cast, Final, TYPE_CHECKING
+
+from grpc import StatusCode
+
+from finsight_api.infrastructure.adapters.tinkoff.errors import DEFAULT_RATELIMIT_RESET_SECONDS, status_code
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+
+    from t_tech.invest.async_services import AsyncServices
+
+    from finsight_api.application.ports.logger import LoggerPort
+    from finsight_api.infrastructure.adapters.tinkoff.adapter import AsyncClientFactory
+    from finsight_api.infrastructure.utils.retry import Retrier
+
+
+_SECONDS_PER_MINUTE: Final[float] = 60.0
+_BURST_DIVISOR: Final[int] = 10
+_LIMIT_PATTERN: Final[re.Pattern[str]] = re.compile(r'\d+')
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RateLimitBudget:
+    """Текущий бюджет запросов метода.
+
+    Attributes:
+        limit_per_minute: Лимит запросов в минуту по тарифу.
+        available: Сколько запросов можно выполнить прямо сейчас без ожидания.
+        waiting: Сколько вызовов ждут токен.
+        blocked_for: Сколько секунд метод ещё заблокирован по ответу сервера.
+    """
+
+    limit_per_minute: int
+    available: float
+    waiting: int
+    blocked_for: float
+
+
+class _TokenBucket:
+    """Token bucket одного метода с FIFO-очередью ожидающих."""
+
+    def __init__(self, limit_per_minute: int, clock: 'Callable[[], float]') -> None:
+        """Инициализирует полную корзину.
+
+        Args:
+            limit_per_minute: Лимит запросов в минуту.
+            clock: Монотонные часы в секундах.
+        """
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self.waiting = 0
+        self.limit_per_minute = 0
+        self.capacity = 0.0
+        self.rate = 0.0
+        self.tokens = 0.0
+        self.blocked_until = 0.0
+        self.updated_at = clock()
+        self.reconfigure(limit_per_minute)
+        self.tokens = self.capacity
+
+    def reconfigure(self, limit_per_minute: int) -> None:
+        """Меняет лимит корзины, сохраняя накопленные токены в пределах новой ёмкости.
+
+        Ёмкость и скорость выбраны так, что capacity + rate * 60 == limit_per_minute:
+        даже полная корзина и непрерывное пополнение не превышают лимит за минуту.
+
+        Args:
+            limit_per_minute: Новый лимит запросов в минуту.
+        """
+        self._refill()
+        self.limit_per_minute = max(1, limit_per_minute)
+        self.capacity = float(max(1, self.limit_per_minute // _BURST_DIVISOR))
+        self.rate = max(self.limit_per_minute - self.capacity, 1.0) / _SECONDS_PER_MINUTE
+        self.tokens = min(self.tokens, self.capacity)
+
+    async def acquire(self) -> None:
+        """Забирает токен, при необходимости дожидаясь его в порядке очереди."""
+        self.waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    self._refill()
+                    now = self._clock()
+                    if now < self.blocked_until:
+                        await asyncio.sleep(self.blocked_until - now)
+                        continue
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    await asyncio.sleep((1 - self.tokens) / self.rate)
+        finally:
+            self.waiting -= 1
+
+    def observe(self, *, remaining: int | None, reset_seconds: float | None, exhausted: bool) -> None:
+        """Подстраивает корзину под остаток лимита, сообщённый сервером.
+
+        Args:
+            remaining: Сколько запросов осталось в текущем окне сервера.
+            reset_seconds: Через сколько секунд окно сервера обнулится.
+            exhausted: Сервер ответил RESOURCE_EXHAUSTED.
+        """
+        self._refill()
+        if remaining is not None:
+            self.tokens = min(self.tokens, float(remaining))
+        if exhausted or remaining == 0:
+            self.tokens = 0.0
+            reset_at = self._clock() + (reset_seconds or DEFAULT_RATELIMIT_RESET_SECONDS)
+            self.blocked_until = max(self.blocked_until, reset_at)
+
+    def budget(self) -> RateLimitBudget:
+        """Возвращает текущий бюджет корзины.
+
+        Returns:
+            Снимок бюджета.
+        """
+        self._refill()
+        return RateLimitBudget(
+            limit_per_minute=self.limit_per_minute,
+            available=round(self.tokens, 2),
+            waiting=self.waiting,
+            blocked_for=round(max(0.0, self.blocked_until - self._clock()), 2),
+        )
+
+    def _refill(self) -> None:
+        """Пополняет корзину за время, прошедшее с последнего пополнения."""
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+
+class TinkoffRateLimiter:
+    """Набор token bucket по gRPC-методам, настроенный по тарифу пользователя.
+
+    Методы задаются в виде `<Service>/<Method>` (например, `InstrumentsService/BondBy`).
+    Методы, которых нет в тарифе, не ограничиваются. Тариф загружается при
+    первом вызове (или заранее через `load_tariff`); если загрузить его не удалось,
+    лимитер пропускает вызовы без ограничения до следующей попытки.
+    """
+
+    def __init__(
+        self,
+        *,
+        client_factory: 'AsyncClientFactory',
+        logger: 'LoggerPort',
+        clock: 'Callable[[], float]' = time.monotonic,
+    ) -> None:
+        """Инициализирует лимитер без загруженного тарифа.
+
+        Args:
+            client_factory: Фабрика сессий клиента SDK (без ограничения частоты).
+            logger: Логгер приложения.
+            clock: Монотонные часы в секундах.
+        """
+        self._client_factory = client_factory
+        self._logger = logger
+        self._clock = clock
+        self._buckets: dict[str, _TokenBucket] = {}
+        self._tariff_loaded = False
+        self._tariff_lock = asyncio.Lock()
+
+    async def load_tariff(self) -> None:
+        """Загружает тариф пользователя и настраивает корзины методов."""
+        async with self._client_factory() as client:
+            tariff = await client.users.get_user_tariff()
+
+        self.configure((limit.limit_per_minute, limit.methods) for limit in tariff.unary_limits)
+        self._tariff_loaded = True
+        self._logger.info('Tinkoff rate limits loaded', methods=len(self._buckets))
+
+    def configure(self, unary_limits: 'Iterable[tuple[int, Iterable[str]]]') -> None:
+        """Настраивает корзины по unary-лимитам тарифа.
+
+        Args:
+            unary_limits: Пары (лимит в минуту, полные имена gRPC-методов группы).
+        """
+        for limit_per_minute, methods in unary_limits:
+            for method in methods:
+                self._set_limit(_short_method_name(method), limit_per_minute)
+
+    def budget(self) -> dict[str, RateLimitBudget]:
+        """Возвращает текущий бюджет запросов по методам.
+
+        Returns:
+            Бюджет по имени метода `<Service>/<Method>`.
+        """
+        return {method: bucket.budget() for method, bucket in sorted(self._buckets.items())}
+
+    async def acquire(self, method: str) -> None:
+        """Ждёт разрешения на вызов метода.
+
+        Args:
+            method: Имя метода `<Service>/<Method>`.
+        """
+        if not self._tariff_loaded:
+            await self.ensure_tariff()
+
+        bucket = self._buckets.get(method)
+        if bucket is not None:
+            await bucket.acquire()
+
+    def observe_error(self, method: str, exc: BaseException) -> None:
+        """Подстраивает лимит метода по метаданным ошибки SDK.
+
+        Args:
+            method: Имя метода `<Service>/<Method>`.
+            exc: Ошибка вызова (AioRequestError несёт metadata с ratelimit_*).
+        """
+        metadata = getattr(exc, 'metadata', None)
+        remaining = getattr(metadata, 'ratelimit_remaining', None)
+        reset = getattr(metadata, 'ratelimit_reset', None)
+        exhausted = status_code(exc) == StatusCode.RESOURCE_EXHAUSTED
+        if remaining is None and not exhausted:
+            return
+
+        limit = _parse_limit(getattr(metadata, 'ratelimit_limit', None))
+        bucket = self._buckets.get(method)
+        if bucket is None:
+            if limit is None:
+                return
+            bucket = self._set_limit(method, limit)
+        elif limit is not None and limit != bucket.limit_per_minute:
+            bucket.reconfigure(limit)
+
+        bucket.observe(
+            remaining=int(remaining) if remaining is not None else None,
+            reset_seconds=float(reset) if reset is not None else None,
+            exhausted=exhausted,
+        )
+        if exhausted:
+            self._logger.warning('Tinkoff rate limit exhausted', method=method, reset_seconds=reset)
+
+    async def ensure_tariff(self) -> None:
+        """Загружает тариф один раз; ошибка загрузки пишется в лог и не прерывает вызов."""
+        async with self._tariff_lock:
+            if self._tariff_loaded:
+                return
+            try:
+                await self.load_tariff()
+            except Exception as exc:
+                self._logger.warning(f'Failed to load Tinkoff tariff, calls are not rate limited: {exc!r}')
+
+    def _set_limit(self, method: str, limit_per_minute: int) -> _TokenBucket:
+        """Создаёт корзину метода или меняет её лимит.
+
+        Args:
+            method: Имя метода `<Service>/<Method>`.
+            limit_per_minute: Лимит запросов в минуту.
+
+        Returns:
+            Корзина метода.
+        """
+        bucket = self._buckets.get(method)
+        if bucket is None:
+            bucket = self._buckets[method] = _TokenBucket(limit_per_minute, self._clock)
+        else:
+            bucket.reconfigure(limit_per_minute)
+        return bucket
+
+
+class RateLimitedClientFactory:
+    """Фабрика сессий, пропускающая unary-вызовы сервисов SDK через TinkoffRateLimiter.
+
+    Совместима с AsyncClientFactory: `factory()` возвращает асинхронный контекстный
+    менеджер сессии.
+    """
+
+    def __init__(
+        self,
+        *,
+        client_factory: 'AsyncClientFactory',
+        limiter: TinkoffRateLimiter,
+        retrier: 'Retrier | None' = None,
+    ) -> None:
+        """Инициализирует фабрику.
+
+        Args:
+            client_factory: Исходная фабрика сессий (например, пул каналов).
+            limiter: Лимитер частоты запросов.
+            retrier: Политика повторов unary-вызовов. Если None — без повторов.
+        """
+        self._client_factory = client_factory
+        self._limiter = limiter
+        self._retrier = retrier
+
+    @asynccontextmanager
+    async def __call__(self) -> 'AsyncGenerator[AsyncServices]':
+        """Открывает сессию исходной фабрики и отдаёт её с ограничением частоты.
+
+        Yields:
+            Сессия, сервисы которой ожидают токен перед каждым unary-вызовом.
+        """
+        async with self._client_factory() as client:
+            yield cast('AsyncServices', _RateLimitedServices(client, self))
+
+
+class _RateLimitedServices:
+    """Прокси сессии AsyncServices: сервисы SDK заменяются ограничивающими прокси."""
+
+    def __init__(self, client: object, factory: RateLimitedClientFactory) -> None:
+        """Инициализирует прокси.
+
+        Args:
+            client: Сессия AsyncServices.
+            factory: Фабрика, выдавшая сессию.
+        """
+        self._client = client
+        self._factory = factory
+
+    def __getattr__(self, name: str) -> object:
+        """Возвращает атрибут сессии; сервисы SDK оборачиваются прокси.
+
+        Args:
+            name: Имя атрибута.
+
+        Returns:
+            Атрибут сессии или прокси сервиса.
+        """
+        value = getattr(self._client, name)
+        service = type(value).__name__
+        if service.endswith('Service'):
+            return _RateLimitedService(value, service, attribute=name, factory=self._factory)
+        return value
+
+
+class _RateLimitedService:
+    """Прокси сервиса SDK: unary-методы ждут токен, повторяются и сообщают лимитеру об ошибках."""
+
+    def __init__(self, service: object, name: str, *, attribute: str, factory: RateLimitedClientFactory) -> None:
+        """Инициализирует прокси.
+
+        Args:
+            service: Сервис SDK (например, InstrumentsService).
+            name: Имя gRPC-сервиса.
+            attribute: Имя атрибута сервиса в сессии (например, instruments).
+            factory: Фабрика, выдавшая сессию.
+        """
+        self._service = service
+        self._name = name
+        self._attribute = attribute
+        self._factory = factory
+
+    def __getattr__(self, name: str) -> object:
+        """Возвращает метод сервиса; корутинные (unary) методы оборачиваются.
+
+        Args:
+            name: Имя метода SDK в snake_case.
+
+        Returns:
+            Метод сервиса или обёртка с ограничением частоты.
+        """
+        method = getattr(self._service, name)
+        if not inspect.iscoroutinefunction(method):
+            return method
+
+        grpc_method = f'{self._name}/{_camel_case(name)}'
+        attribute = self._attribute
+        client_factory = self._factory._client_factory
+        limiter = self._factory._limiter
+        retrier = self._factory._retrier
+
+        async def _invoke(target: 'Callable[..., Awaitable[object]]', *args: object, **kwargs: object) -> object:
+            try:
+                return await target(*args, **kwargs)
+            except Exception as exc:
+                limiter.observe_error(grpc_method, exc)
+                raise
+
+        async def _call(*args: object, **kwargs: object) -> object:
+            # Ожидание в очереди лимитера перед первой попыткой не входит в deadline
+            # политики повторов: при массовой загрузке очередь может быть длинной.
+            await limiter.acquire(grpc_method)
+            if retrier is None:
+                return await _invoke(method, *args, **kwargs)
+
+            attempts = 0
+
+            async def _attempt() -> object:
+                nonlocal attempts
+                attempts += 1
+                if attempts == 1:
+                    return await _invoke(method, *args, **kwargs)
+                await limiter.acquire(grpc_method)
+                # Повтор — в своей сессии: его ошибка канала выводит канал из пула.
+                async with client_factory() as client:
+                    target = getattr(getattr(client, attribute), name)
+                    return await _invoke(target, *args, **kwargs)
+
+            return await retrier.call(_attempt, name=grpc_method)
+
+        return _call
+
+
+def _short_method_name(method: str) -> str:
+    """Сокращает полное имя gRPC-метода до `<Service>/<Method>`.
+
+    Args:
+        method: Имя вида `tinkoff.public.invest.api.contract.v1.InstrumentsService/BondBy`.
+
+    Returns:
+        Имя вида `InstrumentsService/BondBy`.
+    """
+    service, _, name = method.rpartition('/')
+    return f'{service.rsplit(".", 1)[-1]}/{name}'
+
+
+def _camel_case(name: str) -> str:
+    """Переводит имя метода SDK в имя gRPC-метода.
+
+    Args:
+        name: Имя в snake_case (например, get_candles).
+
+    Returns:
+        Имя в CamelCase (например, GetCandles).
+    """
+    return ''.join(part.capitalize() for part in name.split('_'))
+
+
+def _parse_limit(value: object) -> int | None:
+    """Извлекает минутный лимит из заголовка ratelimit_limit.
+
+    Args:
+        value: Значение заголовка (например, '200' или '200, 200;w=60').
+
+    Returns:
+        Лимит или None, если его нет в значении.
+    """
+    if value is None:
+        return None
+    match = _LIMIT_PATTERN.search(str(value))
+    return int(match.group()) if match else None
@@ -5,13 +5,18 @@
 
 import os
 from pathlib import Path  # noqa: TC003
-from typing import Final  # noqa: TC003
+from typing import Final
 
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from finsight_api.domain.constants import AppEnv, LogLevel
 from finsight_api.infrastructure.utils.pyproject import extract_project_field, find_pyproject_path
+from finsight_core.telemetry.log_queue import (
+    DEFAULT_LOG_QUEUE_CAPACITY,
+    DEFAULT_LOG_QUEUE_OVERFLOW_POLICY,
+    OverflowPolicy,
+)
 
 DEFAULT_APP_ENV: Final[str] = 'local'
 DEFAULT_APP_HOST: Final[str] = '127.0.0.1'
@@ -25,6 +30,16 @@ DEFAULT_APP_DESCRIPTION: Final[str] = (
 )
 DEFAULT_APP_RELOAD: Final[bool] = False
 DEFAULT_APP_DEBUG: Final[bool] = False
+DEFAULT_TINKOFF_CHANNEL_POOL_SIZE: Final[int] = 2
+DEFAULT_TINKOFF_CANDLES_CONCURRENCY: Final[int] = 4
+DEFAULT_TINKOFF_INSTRUMENT_INDEX_TTL_SECONDS: Final[int] = 24 * 60 * 60
+DEFAULT_TINKOFF_INSTRUMENT_INDEX_PATH: Final[str] = '.cache/tinkoff_instruments.json'
+DEFAULT_TINKOFF_CACHE_MAX_ENTRIES: Final[int] = 4096
+DEFAULT_TINKOFF_BOND_CATALOG_TTL_SECONDS: Final[int] = 6 * 60 * 60
+DEFAULT_TINKOFF_MARKET_DATA_MAX_AGE_SECONDS: Final[float] = 300.0
+DEFAULT_TINKOFF_RETRY_MAX_ATTEMPTS: Final[int] = 4
+DEFAULT_TINKOFF_RETRY_DEADLINE_SECONDS: Final[float] = 30.0
+DEFAULT_STORAGE_CANDLES_DIR: Final[str] = 'data/candles'
 
 PYPROJECT_PATH: Final[Path] = find_pyproject_path()
 
@@ -99,12 +114,23 @@ class LoggingSettings(BaseModel):
 
     Attributes:
         log_level: Уровень логирования приложения.
+        queue_capacity: Ёмкость очереди логов.
+        queue_overflow_policy: Поведение при переполнении очереди логов.
     """
 
     log_level: LogLevel = Field(
         default=DEFAULT_APP_LOG_LEVEL,
         description='Уровень логирования приложения: debug, info, warning или error (в зависимости от enum).',
     )
+    queue_capacity: int = Field(
+        default=DEFAULT_LOG_QUEUE_CAPACITY,
+        gt=0,
+        description='Ёмкость очереди логов: записи рендерятся и пишутся фоновым потоком.',
+    )
+    queue_overflow_policy: OverflowPolicy = Field(
+        default=DEFAULT_LOG_QUEUE_OVERFLOW_POLICY,
+        description='Поведение при переполнении очереди логов: block, drop или drop_debug.',
+    )
 
 
 class TinkoffInvestApiSettings(BaseModel):
@@ -118,6 +144,15 @@ class TinkoffInvestApiSettings(BaseModel):
     Attributes:
         token: Read-only токен Tinkoff Invest API. Торговые поручения недоступны.
         sandbox_token: Публичный sandbox токен (опционально).
+        channel_pool_size: Количество долгоживущих gRPC-каналов в пуле адаптера.
+        candles_concurrency: Максимум одновременных запросов окон свечей при загрузке истории.
+        instrument_index_ttl_seconds: Время жизни индекса идентификаторов инструментов.
+        instrument_index_path: Путь к снимку индекса инструментов (None — без снимка).
+        cache_max_entries: Максимум записей кэша справочных ответов (облигации, купоны, бренды).
+        bond_catalog_ttl_seconds: Период обновления каталога облигаций.
+        market_data_max_age_seconds: Максимальный возраст данных потока маркет-данных.
+        retry_max_attempts: Максимум попыток unary-вызова при временных ошибках API.
+        retry_deadline_seconds: Время на unary-вызов со всеми повторами.
     """
 
     token: str = Field(
@@ -127,6 +162,65 @@ class TinkoffInvestApiSettings(BaseModel):
         default=None,
         description='Публичный sandbox токен для Tinkoff Invest API (опционально).',
     )
+    channel_pool_size: int = Field(
+        default=DEFAULT_TINKOFF_CHANNEL_POOL_SIZE,
+        ge=1,
+        description='Количество долгоживущих gRPC-каналов, разделяемых между вызовами адаптера.',
+    )
+    candles_concurrency: int = Field(
+        default=DEFAULT_TINKOFF_CANDLES_CONCURRENCY,
+        ge=1,
+        description='Сколько окон истории свечей загружается одновременно (держите ниже лимита GetCandles).',
+    )
+    instrument_index_ttl_seconds: int = Field(
+        default=DEFAULT_TINKOFF_INSTRUMENT_INDEX_TTL_SECONDS,
+        gt=0,
+        description='Через сколько секунд индекс ISIN/FIGI/UID инструментов перестраивается из API.',
+    )
+    instrument_index_path: Path | None = Field(
+        default=Path(DEFAULT_TINKOFF_INSTRUMENT_INDEX_PATH),
+        description='JSON-снимок индекса инструментов для быстрого старта. Если не задан, снимок не пишется.',
+    )
+    cache_max_entries: int = Field(
+        default=DEFAULT_TINKOFF_CACHE_MAX_ENTRIES,
+        ge=1,
+        description='Сколько справочных ответов API (облигации, купоны, бренды) держит LRU-кэш адаптера.',
+    )
+    bond_catalog_ttl_seconds: int = Field(
+        default=DEFAULT_TINKOFF_BOND_CATALOG_TTL_SECONDS,
+        gt=0,
+        description='Раз в сколько секунд каталог облигаций перезагружается одним вызовом bonds().',
+    )
+    market_data_max_age_seconds: float = Field(
+        default=DEFAULT_TINKOFF_MARKET_DATA_MAX_AGE_SECONDS,
+        gt=0,
+        description='Сколько секунд стакан или цена из потока маркет-данных считаются актуальными.',
+    )
+    retry_max_attempts: int = Field(
+        default=DEFAULT_TINKOFF_RETRY_MAX_ATTEMPTS,
+        ge=1,
+        description='Сколько раз выполняется unary-вызов при UNAVAILABLE/RESOURCE_EXHAUSTED (1 — без повторов).',
+    )
+    retry_deadline_seconds: float = Field(
+        default=DEFAULT_TINKOFF_RETRY_DEADLINE_SECONDS,
+        gt=0,
+        description='Сколько секунд отводится на unary-вызов вместе с повторами и паузами между ними.',
+    )
+
+
+class StorageSettings(BaseModel):
+    """Настройки локального хранения данных.
+
+    Вложенная секция с env-префиксом APP_STORAGE__ (например APP_STORAGE__CANDLES_DIR).
+
+    Attributes:
+        candles_dir: Каталог колоночного хранилища исторических свечей.
+    """
+
+    candles_dir: Path = Field(
+        default=Path(DEFAULT_STORAGE_CANDLES_DIR),
+        description='Каталог колоночного хранилища свечей (партиции figi/interval/месяц).',
+    )
 
 
 class Settings(BaseSettings):
@@ -139,10 +233,12 @@ class Settings(BaseSettings):
         app: Настройки приложения.
         logging: Настройки логирования.
         tinkoff_invest_api: Настройки интеграции с Tinkoff Invest API.
+        storage: Настройки локального хранения данных.
     """
 
     app: AppSettings = Field(default_factory=AppSettings)
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
     tinkoff_invest_api: TinkoffInvestApiSettings
+    storage: StorageSettings = Field(default_factory=StorageSettings)
 
     model_config = _ENV_SETTINGS
@@ -4,16 +4,31 @@ from typing import TYPE_CHECKING
 
 from dependency_injector import containers, providers
 
+from finsight_api.application.use_cases.get_account_summary import GetAccountsUseCase
+from finsight_api.application.use_cases.get_portfolio import GetPortfolioUseCase
+from finsight_api.application.use_cases.watch_portfolio import WatchPortfolioUseCase
+from finsight_api.infrastructure.adapters.storage import ColumnarCandleRepository
 from finsight_api.infrastructure.adapters.telemetry.logger import StructlogLogger
 from finsight_api.infrastructure.adapters.tinkoff.adapter import TinkoffInvestAdapter
+from finsight_api.infrastructure.adapters.tinkoff.bond_catalog import TinkoffBondCatalog
+from finsight_api.infrastructure.adapters.tinkoff.cache import CachingTinkoffInvestAdapter
+from finsight_api.infrastructure.adapters.tinkoff.channel_pool import TinkoffChannelPool
+from finsight_api.infrastructure.adapters.tinkoff.coalescing import CoalescingTinkoffInvestAdapter
+from finsight_api.infrastructure.adapters.tinkoff.errors import classify_tinkoff_error
 from finsight_api.infrastructure.adapters.tinkoff.factory import (
     async_client_factory as async_tinkoff_api_client_factory,
 )
+from finsight_api.infrastructure.adapters.tinkoff.instrument_index import TinkoffInstrumentIndex
+from finsight_api.infrastructure.adapters.tinkoff.market_data_store import MarketDataStore
+from finsight_api.infrastructure.adapters.tinkoff.market_data_stream import TinkoffMarketDataStream
+from finsight_api.infrastructure.adapters.tinkoff.rate_limiter import RateLimitedClientFactory, TinkoffRateLimiter
 from finsight_api.infrastructure.config import Settings
+from finsight_api.infrastructure.utils.retry import Retrier, RetryPolicy
 
 if TYPE_CHECKING:
     from finsight_api.application.ports.logger import LoggerPort
     from finsight_api.application.ports.tinkoff import TinkoffInvestPort
+    from finsight_api.domain.repositories.candle_repository import CandleRepository
     from finsight_api.infrastructure.adapters.tinkoff.adapter import AsyncClientFactory
 
 
@@ -37,20 +52,46 @@ class AppContainer(containers.DeclarativeContainer):
 
     Attributes:
         settings: Singleton настроек приложения (Settings).
-        logger: Factory логгера StructlogLogger, реализующего LoggerPort.
+        logger: Singleton логгера StructlogLogger, реализующего LoggerPort: один на
+            процесс, чтобы logging настраивался один раз.
         tinkoff_client_factory: Factory фабрики async-клиента Tinkoff с подставленным токеном.
-        tinkoff_invest: Singleton адаптера TinkoffInvestAdapter (порт TinkoffInvestPort).
+        tinkoff_channel_pool: Singleton пула долгоживущих gRPC-сессий Tinkoff.
+        tinkoff_rate_limiter: Singleton лимитера частоты запросов по тарифу пользователя.
+        tinkoff_retrier: Singleton политики повторов unary-вызовов Tinkoff при временных ошибках.
+        tinkoff_rate_limited_client_factory: Singleton фабрики сессий поверх пула,
+            пропускающей unary-вызовы через tinkoff_rate_limiter и tinkoff_retrier.
+        tinkoff_instrument_index: Singleton индекса идентификаторов инструментов Tinkoff.
+        tinkoff_bond_catalog: Singleton каталога облигаций, загружаемого вызовом bonds()
+            (реализует BondCatalogPort).
+        tinkoff_market_data_store: Singleton хранилища последних стаканов, цен и свечей потока.
+        tinkoff_market_data_stream: Singleton подписок на поток маркет-данных
+            (порт TinkoffMarketDataStreamPort).
+        tinkoff_invest_adapter: Singleton адаптера TinkoffInvestAdapter без кэша.
+        tinkoff_invest_coalescing: Singleton декоратора CoalescingTinkoffInvestAdapter,
+            объединяющего одинаковые одновременные вызовы tinkoff_invest_adapter.
+        tinkoff_invest: Singleton кэширующего декоратора CachingTinkoffInvestAdapter
+            над tinkoff_invest_coalescing (порт TinkoffInvestPort).
+        candle_repository: Singleton колоночного хранилища свечей (порт CandleRepository).
+        get_portfolio_use_case: Singleton сценария получения портфеля.
+        get_accounts_use_case: Singleton сценария получения счетов.
+        watch_portfolio_use_case: Singleton сценария подписки на стоимость портфеля:
+            хранит общие подписки счетов, поэтому один на приложение.
+
+    Use cases HTTP-обработчиков не хранят состояния запроса, поэтому создаются
+    один раз и берутся FastAPI-зависимостями из общего `app_container`.
     """
 
     settings: 'providers.Provider[Settings]' = providers.Singleton(Settings)
 
-    logger: 'providers.Provider[LoggerPort]' = providers.Factory(
+    logger: 'providers.Provider[LoggerPort]' = providers.Singleton(
         StructlogLogger,
         app_name=settings.provided.app.name,
         app_version=settings.provided.app.version,
         app_env=settings.provided.app.env,
         app_instance=settings.provided.app.host,
         log_level=settings.provided.logging.log_level,
+        log_queue_capacity=settings.provided.logging.queue_capacity,
+        log_queue_overflow_policy=settings.provided.logging.queue_overflow_policy,
     )
 
     tinkoff_client_factory = providers.Factory(
@@ -58,11 +99,106 @@ class AppContainer(containers.DeclarativeContainer):
         token=settings.provided.tinkoff_invest_api.token,
     )
 
-    tinkoff_invest: 'providers.Provider[TinkoffInvestPort]' = providers.Singleton(
+    tinkoff_channel_pool: 'providers.Provider[TinkoffChannelPool]' = providers.Singleton(
+        TinkoffChannelPool,
+        connect=tinkoff_client_factory,
+        logger=logger,
+        size=settings.provided.tinkoff_invest_api.channel_pool_size,
+    )
+
+    tinkoff_rate_limiter: 'providers.Provider[TinkoffRateLimiter]' = providers.Singleton(
+        TinkoffRateLimiter,
+        client_factory=tinkoff_channel_pool,
+        logger=logger,
+    )
+
+    tinkoff_retrier: 'providers.Provider[Retrier]' = providers.Singleton(
+        Retrier,
+        classify=classify_tinkoff_error,
+        policy=providers.Factory(
+            RetryPolicy,
+            max_attempts=settings.provided.tinkoff_invest_api.retry_max_attempts,
+            deadline=settings.provided.tinkoff_invest_api.retry_deadline_seconds,
+        ),
+        logger=logger,
+    )
+
+    tinkoff_rate_limited_client_factory: 'providers.Provider[RateLimitedClientFactory]' = providers.Singleton(
+        RateLimitedClientFactory,
+        client_factory=tinkoff_channel_pool,
+        limiter=tinkoff_rate_limiter,
+        retrier=tinkoff_retrier,
+    )
+
+    tinkoff_instrument_index: 'providers.Provider[TinkoffInstrumentIndex]' = providers.Singleton(
+        TinkoffInstrumentIndex,
+        client_factory=tinkoff_rate_limited_client_factory,
+        logger=logger,
+        ttl=settings.provided.tinkoff_invest_api.instrument_index_ttl_seconds,
+        snapshot_path=settings.provided.tinkoff_invest_api.instrument_index_path,
+    )
+
+    tinkoff_bond_catalog: 'providers.Provider[TinkoffBondCatalog]' = providers.Singleton(
+        TinkoffBondCatalog,
+        client_factory=tinkoff_rate_limited_client_factory,
+        logger=logger,
+        ttl=settings.provided.tinkoff_invest_api.bond_catalog_ttl_seconds,
+    )
+
+    tinkoff_market_data_store: 'providers.Provider[MarketDataStore]' = providers.Singleton(
+        MarketDataStore,
+        max_age=settings.provided.tinkoff_invest_api.market_data_max_age_seconds,
+    )
+
+    tinkoff_market_data_stream: 'providers.Provider[TinkoffMarketDataStream]' = providers.Singleton(
+        TinkoffMarketDataStream,
+        client_factory=tinkoff_channel_pool,
+        store=tinkoff_market_data_store,
+        logger=logger,
+    )
+
+    tinkoff_invest_adapter: 'providers.Provider[TinkoffInvestPort]' = providers.Singleton(
         TinkoffInvestAdapter,
         token=settings.provided.tinkoff_invest_api.token,
         logger=logger,
-        client_factory=tinkoff_client_factory,
+        client_factory=tinkoff_rate_limited_client_factory,
+        instrument_index=tinkoff_instrument_index,
+        candles_concurrency=settings.provided.tinkoff_invest_api.candles_concurrency,
+    )
+
+    tinkoff_invest_coalescing: 'providers.Provider[TinkoffInvestPort]' = providers.Singleton(
+        CoalescingTinkoffInvestAdapter,
+        inner=tinkoff_invest_adapter,
+    )
+
+    tinkoff_invest: 'providers.Provider[TinkoffInvestPort]' = providers.Singleton(
+        CachingTinkoffInvestAdapter,
+        inner=tinkoff_invest_coalescing,
+        logger=logger,
+        max_entries=settings.provided.tinkoff_invest_api.cache_max_entries,
+    )
+
+    candle_repository: 'providers.Provider[CandleRepository]' = providers.Singleton(
+        ColumnarCandleRepository,
+        root=settings.provided.storage.candles_dir,
+        logger=logger,
+    )
+
+    get_portfolio_use_case: 'providers.Provider[GetPortfolioUseCase]' = providers.Singleton(
+        GetPortfolioUseCase,
+        gateway=tinkoff_invest,
+    )
+
+    get_accounts_use_case: 'providers.Provider[GetAccountsUseCase]' = providers.Singleton(
+        GetAccountsUseCase,
+        invest=tinkoff_invest,
+    )
+
+    watch_portfolio_use_case: 'providers.Provider[WatchPortfolioUseCase]' = providers.Singleton(
+        WatchPortfolioUseCase,
+        tinkoff=tinkoff_invest,
+        market_data_stream=tinkoff_market_data_stream,
+        logger=logger,
     )
 
 
@@ -0,0 +1,24 @@
+"""Повторное возбуждение общих исключений (кэш, объединение вызовов).
+
+Одно и то же исключение, возбуждаемое для многих вызывающих, накапливает кадры в
+`__traceback__` при каждом `raise` и получает чужие `__context__`. Поэтому каждому
+вызывающему возбуждается собственная копия (`raise copy_error(error) from error`):
+исходное исключение с исходным traceback остаётся её причиной.
+"""
+
+
+def copy_error[E: BaseException](error: E) -> E:
+    """Возвращает копию исключения без traceback, причины и контекста.
+
+    Копия создаётся без вызова конструктора: тот же тип, те же `args` и атрибуты
+    экземпляра, поэтому копируются и исключения SDK с нестандартным `__init__`.
+
+    Args:
+        error: Общее исключение.
+
+    Returns:
+        Новое исключение того же типа.
+    """
+    fresh = type(error).__new__(type(error), *error.args)
+    fresh.__dict__.update(error.__dict__)
+    return fresh
@@ -1,10 +1,28 @@
-"""Утилиты для повторных попыток вызова внешних API (только для async функций)."""
+"""Утилиты для повторных попыток вызова внешних API (только для async функций).
+
+`Retrier` — политика повторов для адаптеров внешних API:
+
+- повторяются только ошибки, которые классификатор адаптера признал временными
+  (для gRPC — UNAVAILABLE, RESOURCE_EXHAUSTED; INVALID_ARGUMENT и NOT_FOUND — нет);
+- задержка — decorrelated jitter: случайная между базовой и утроенной предыдущей,
+  но не больше max_delay, а если сервер сообщил время сброса лимита — не меньше его;
+- логическая операция целиком (все попытки и паузы) укладывается в deadline;
+- повторы расходуют общий на процесс RetryBudget: когда ошибок становится много
+  относительно успешных вызовов, повторы прекращаются, и сбой внешнего сервиса не
+  превращается в лавину повторных запросов.
+"""
 
 import asyncio
 import functools
 import logging
+import random
+import time
 from collections.abc import Awaitable, Callable
-from typing import ParamSpec, TypeVar
+from dataclasses import dataclass
+from typing import Final, ParamSpec, TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from finsight_api.application.ports.logger import LoggerPort
 
 P = ParamSpec('P')
 R = TypeVar('R')
@@ -59,3 +77,190 @@ def retry_on_exception(
         return wrapper
 
     return decorator
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RetryDecision:
+    """Решение классификатора об ошибке вызова.
+
+    Attributes:
+        retryable: Ошибка временная, вызов можно повторить.
+        retry_after: Не повторять раньше, чем через столько секунд (например, ratelimit_reset).
+    """
+
+    retryable: bool
+    retry_after: float | None = None
+
+
+NO_RETRY: Final[RetryDecision] = RetryDecision(retryable=False)
+RETRY: Final[RetryDecision] = RetryDecision(retryable=True)
+
+type RetryClassifier = Callable[[BaseException], RetryDecision]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RetryPolicy:
+    """Параметры повторов одной логической операции.
+
+    Attributes:
+        max_attempts: Максимум попыток, включая первую.
+        base_delay: Минимальная пауза перед повтором в секундах.
+        max_delay: Максимальная пауза перед повтором в секундах.
+        deadline: Время на всю операцию (попытки и паузы) в секундах.
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 0.1
+    max_delay: float = 5.0
+    deadline: float = 30.0
+
+
+class RetryBudget:
+    """Общий бюджет повторов (retry throttling, как в gRPC).
+
+    Каждая временная ошибка списывает токен, каждый успешный вызов возвращает
+    token_ratio токена. Повторы разрешены, пока токенов больше половины max_tokens:
+    при массовых сбоях бюджет быстро исчерпывается, и адаптеры возвращают ошибку
+    сразу, а не умножают нагрузку на упавший сервис.
+    """
+
+    def __init__(self, *, max_tokens: float = 20.0, token_ratio: float = 0.1) -> None:
+        """Инициализирует полный бюджет.
+
+        Args:
+            max_tokens: Ёмкость бюджета.
+            token_ratio: Сколько токена возвращает успешный вызов.
+        """
+        self._max_tokens = max_tokens
+        self._token_ratio = token_ratio
+        self._tokens = max_tokens
+
+    @property
+    def tokens(self) -> float:
+        """Текущее количество токенов."""
+        return self._tokens
+
+    @property
+    def allows_retry(self) -> bool:
+        """Разрешены ли сейчас повторы."""
+        return self._tokens > self._max_tokens / 2
+
+    def record_success(self) -> None:
+        """Учитывает успешный вызов."""
+        self._tokens = min(self._max_tokens, self._tokens + self._token_ratio)
+
+    def record_failure(self) -> None:
+        """Учитывает временную ошибку вызова."""
+        self._tokens = max(0.0, self._tokens - 1)
+
+
+_PROCESS_RETRY_BUDGET: Final[RetryBudget] = RetryBudget()
+
+
+class Retrier:
+    """Выполняет асинхронные операции с повторами по политике RetryPolicy."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        classify: RetryClassifier,
+        policy: RetryPolicy | None = None,
+        budget: RetryBudget | None = None,
+        logger: 'LoggerPort | None' = None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Инициализирует политику повторов.
+
+        Args:
+            classify: Классификатор ошибок адаптера.
+            policy: Параметры повторов. По умолчанию RetryPolicy().
+            budget: Бюджет повторов. По умолчанию общий на процесс.
+            logger: Логгер для записи о повторах.
+            clock: Монотонные часы в секундах.
+            rng: Генератор случайных чисел для jitter.
+        """
+        self._classify = classify
+        self._policy = policy or RetryPolicy()
+        self._budget = budget or _PROCESS_RETRY_BUDGET
+        self._logger = logger
+        self._clock = clock
+        self._rng = rng or random.Random()
+
+    @property
+    def budget(self) -> RetryBudget:
+        """Бюджет повторов, который расходует политика."""
+        return self._budget
+
+    async def call[T](self, operation: Callable[[], Awaitable[T]], *, name: str = 'operation') -> T:
+        """Выполняет операцию, повторяя её при временных ошибках.
+
+        Args:
+            operation: Фабрика корутины одной попытки.
+            name: Имя операции для лога.
+
+        Returns:
+            Результат первой успешной попытки.
+
+        Raises:
+            TimeoutError: Если операция не уложилась в deadline.
+            Exception: Ошибка последней попытки, если повтор невозможен.
+        """
+        policy = self._policy
+        deadline = self._clock() + policy.deadline
+        delay = policy.base_delay
+        attempt = 1
+
+        while True:
+            try:
+                async with asyncio.timeout(max(0.0, deadline - self._clock())):
+                    result = await operation()
+            except Exception as exc:
+                decision = self._classify(exc)
+                if not decision.retryable:
+                    raise
+                self._budget.record_failure()
+
+                delay = min(policy.max_delay, self._rng.uniform(policy.base_delay, delay * 3))
+                if decision.retry_after is not None:
+                    delay = max(delay, decision.retry_after)
+
+                reason = self._refusal(attempt, delay, deadline)
+                if reason is not None:
+                    self._log(f'{name} failed, not retrying ({reason}): {exc!r}', attempt=attempt)
+                    raise
+                self._log(f'{name} failed, retrying in {delay:.2f}s: {exc!r}', attempt=attempt)
+                await asyncio.sleep(delay)
+                attempt += 1
+            else:
+                self._budget.record_success()
+                return result
+
+    def _refusal(self, attempt: int, delay: float, deadline: float) -> str | None:
+        """Возвращает причину отказа от повтора или None, если повтор разрешён.
+
+        Args:
+            attempt: Номер неудавшейся попытки.
+            delay: Пауза перед следующей попыткой.
+            deadline: Момент истечения deadline по часам политики.
+
+        Returns:
+            Причина отказа или None.
+        """
+        if attempt >= self._policy.max_attempts:
+            return 'attempts exhausted'
+        if self._clock() + delay >= deadline:
+            return 'deadline'
+        if not self._budget.allows_retry:
+            return 'retry budget exhausted'
+        return None
+
+    def _log(self, message: str, *, attempt: int) -> None:
+        """Пишет предупреждение о неудавшейся попытке.
+
+        Args:
+            message: Текст сообщения.
+            attempt: Номер попытки.
+        """
+        if self._logger is not None:
+            self._logger.warning(message, attempt=attempt, max_attempts=self._policy.max_attempts)
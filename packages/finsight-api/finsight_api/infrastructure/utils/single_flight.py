@@ -0,0 +1,81 @@
+"""Объединение одновременных одинаковых асинхронных вызовов (single-flight).
+
+Если несколько корутин одновременно запрашивают одно и то же (один ключ), вызов
+выполняется один раз: первая корутина запускает его, остальные ждут тот же
+результат или ту же ошибку (каждая ждущая корутина получает собственную копию
+исключения). После завершения вызова ключ освобождается, и
+следующий запрос выполняется заново — это не кэш.
+"""
+
+import asyncio
+from typing import cast, TYPE_CHECKING
+
+from finsight_api.infrastructure.utils.errors import copy_error
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """Реестр вызовов, выполняющихся в данный момент, по ключу.
+
+    Вызов выполняется в отдельной задаче: отмена одной из ждущих корутин не отменяет
+    его для остальных.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует пустой реестр."""
+        self._in_flight: dict[Hashable, asyncio.Future[object]] = {}
+        self._coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Количество вызовов, выполняющихся в данный момент."""
+        return len(self._in_flight)
+
+    @property
+    def coalesced(self) -> int:
+        """Сколько вызовов было обслужено чужим запросом вместо собственного."""
+        return self._coalesced
+
+    async def do[T](self, key: 'Hashable', call: 'Callable[[], Awaitable[T]]') -> T:
+        """Выполняет вызов или присоединяется к уже выполняющемуся с тем же ключом.
+
+        Args:
+            key: Ключ вызова (например, имя метода и аргументы).
+            call: Вызов, выполняемый, если с этим ключом сейчас ничего не выполняется.
+
+        Returns:
+            Результат вызова (общий для всех ждущих корутин).
+
+        Raises:
+            Exception: Ошибка вызова: запустившая его корутина получает исходное
+                исключение, присоединившиеся — его копию.
+        """
+        future = cast('asyncio.Future[T] | None', self._in_flight.get(key))
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._in_flight[key] = cast('asyncio.Future[object]', future)
+            future.add_done_callback(lambda done: self._release(key, done))
+            return await asyncio.shield(future)
+
+        self._coalesced += 1
+        try:
+            return await asyncio.shield(future)
+        except Exception as exc:
+            raise copy_error(exc) from exc
+
+    def _release[T](self, key: 'Hashable', future: 'asyncio.Future[T]') -> None:
+        """Освобождает ключ завершившегося вызова.
+
+        Исключение вызова помечается полученным, даже если все ждущие корутины были
+        отменены, чтобы asyncio не писал «exception was never retrieved».
+
+        Args:
+            key: Ключ вызова.
+            future: Завершившийся вызов.
+        """
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            future.exception()
@@ -3,7 +3,6 @@
 Команды получают данные по облигациям через Use Case и выводят JSON в stdout или в файл.
 """
 
-import asyncio
 import json
 from dataclasses import asdict
 from datetime import datetime
@@ -24,9 +23,10 @@ from finsight_api.application.use_cases.get_bonds_by_isin import (
 )
 from finsight_api.domain.value_objects.isin import ISIN
 from finsight_api.infrastructure.container import app_container
-from finsight_api.presentation.cli.utils import write_json_file
+from finsight_api.presentation.cli.utils import run_async, write_json_file
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import Any
 
 
@@ -91,7 +91,7 @@ def get(
     uc = GetBondByIsinUseCase(tinkoff=tinkoff, logger=logger)
 
     try:
-        result = asyncio.run(uc.execute(GetBondByIsinInput(isin=isin_vo)))
+        result = run_async(uc.execute(GetBondByIsinInput(isin=isin_vo)))
     except Exception as exc:
         logger.error(f'Failed to run GetBondByIsinUseCase: {exc!r}')
         raise typer.Exit(code=1) from exc
@@ -109,44 +109,81 @@ def get(
 
 @app.command('bulk')
 def bulk(
-    isin: list[str] = typer.Option(..., '--isin', help='Bond ISIN (repeatable)'),
+    isin: list[str] | None = typer.Option(None, '--isin', help='Bond ISIN (repeatable)'),
+    isins_file: Path | None = typer.Option(None, '--isins-file', help='File with one ISIN per line'),
     concurrency: int = typer.Option(5, '--concurrency', help='Max parallel requests'),
-    output: Path | None = typer.Option(None, '--output', '-o', help='Path to JSON output file'),
-    pretty: bool = typer.Option(True, '--pretty/--no-pretty', help='Pretty print JSON'),
+    ordered: bool = typer.Option(True, '--ordered/--unordered', help='Keep input order of results'),
+    output: Path | None = typer.Option(None, '--output', '-o', help='Path to JSON Lines output file'),
 ) -> None:
-    """Получает данные по нескольким облигациям по списку ISIN и выводит JSON.
+    """Получает данные по нескольким облигациям по списку ISIN и выводит JSON Lines.
 
-    Запросы выполняются параллельно с ограничением `concurrency`. При отсутствии
-    `output` JSON печатается в stdout, иначе сохраняется в файл.
+    ISIN берутся из `--isin` и файла `--isins-file` (по одному в строке, пустые
+    строки и строки с `#` пропускаются), повторы запрашиваются один раз. Каждый
+    результат пишется отдельной JSON-строкой `{"isin", "bond", "error"}`, как только
+    он получен, в stdout или в файл `output`.
 
     Raises:
-        typer.Exit: При невалидном ISIN (код 2) или ошибке Use Case (код 1).
+        typer.Exit: При невалидном ISIN или пустом списке (код 2) или ошибке Use Case (код 1).
     """
     logger = app_container.logger()
     tinkoff = app_container.tinkoff_invest()
 
+    raw_isins = list(isin or [])
+    if isins_file is not None:
+        lines = isins_file.read_text(encoding='utf-8').splitlines()
+        raw_isins.extend(line.strip() for line in lines if line.strip() and not line.lstrip().startswith('#'))
+    if not raw_isins:
+        logger.error('No ISIN provided: use --isin or --isins-file')
+        raise typer.Exit(code=2)
+
     isins: list[ISIN] = []
-    for raw in isin:
+    for raw in raw_isins:
         try:
             isins.append(ISIN(value=raw))
         except Exception as exc:
             logger.error(f'Invalid ISIN provided: {raw!r}, error={exc!r}')
             raise typer.Exit(code=2) from exc
 
-    uc = GetBondsByIsinUseCase(tinkoff=tinkoff, logger=logger)
+    uc = GetBondsByIsinUseCase(tinkoff=tinkoff, logger=logger, catalog=app_container.tinkoff_bond_catalog())
+    data = GetBondsByIsinInput(isins=tuple(isins), concurrency=concurrency, preserve_order=ordered)
 
     try:
-        result = asyncio.run(uc.execute(GetBondsByIsinInput(isins=tuple(isins), concurrency=concurrency)))
+        if output is None:
+            total, failed = run_async(_write_bulk(uc, data, typer.echo))
+            return
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with output.open('w', encoding='utf-8') as stream:
+            total, failed = run_async(_write_bulk(uc, data, lambda line: typer.echo(line, file=stream)))
     except Exception as exc:
         logger.error(f'Failed to run GetBondsByIsinUseCase: {exc!r}')
         raise typer.Exit(code=1) from exc
 
-    payload = _json_normalize(asdict(result))
-    text = _dump(payload, pretty=pretty)
+    rprint(f'Saved {total} results ({failed} failed) to: {output}')
 
-    if output is None:
-        rprint(text)
-        return
 
-    write_json_file(obj=payload, path=output)
-    rprint(f'Snapshot saved to: {output}')
+async def _write_bulk(
+    uc: GetBondsByIsinUseCase,
+    data: GetBondsByIsinInput,
+    write_line: 'Callable[[str], object]',
+) -> tuple[int, int]:
+    """Пишет результаты bulk-получения JSON-строками по мере их готовности.
+
+    Args:
+        uc: Use Case bulk-получения облигаций.
+        data: Входные данные.
+        write_line: Запись одной строки (stdout или файл).
+
+    Returns:
+        tuple[int, int]: Количество результатов и количество ошибок.
+    """
+    total = failed = 0
+    async for result in uc.stream(data):
+        payload = {
+            'isin': result.isin.value,
+            'bond': _json_normalize(asdict(result.bond)) if result.bond is not None else None,
+            'error': result.error,
+        }
+        write_line(json.dumps(payload, ensure_ascii=False))
+        total += 1
+        failed += result.bond is None
+    return total, failed
@@ -3,7 +3,6 @@
 Команда строит снапшот через Use Case и выводит JSON в stdout или в файл.
 """
 
-import asyncio
 import json
 from dataclasses import asdict
 from datetime import date, datetime
@@ -20,7 +19,7 @@ from finsight_api.application.use_cases.build_portfolio_snapshot import (
     BuildPortfolioSnapshotUseCase,
 )
 from finsight_api.infrastructure.container import app_container
-from finsight_api.presentation.cli.utils import write_json_file
+from finsight_api.presentation.cli.utils import run_async, write_json_file
 
 if TYPE_CHECKING:
     from typing import Any
@@ -39,7 +38,7 @@ def _json_normalize(value: 'Any') -> 'Any':
     """
     if isinstance(value, Decimal):
         return str(value)
-    if isinstance(value, datetime):
+    if isinstance(value, (datetime, date)):
         return value.isoformat()
     if isinstance(value, (list, tuple)):
         return [_json_normalize(v) for v in value]
@@ -53,7 +52,7 @@ def snapshot_to_json_dict(output: BuildPortfolioSnapshotOutput) -> dict[str, obj
 
     Особенности:
         - Decimal сериализуется как строка для сохранения точности.
-        - datetime сериализуется в ISO 8601.
+        - datetime и date сериализуются в ISO 8601.
 
     Args:
         output: Результат Use Case.
@@ -83,12 +82,14 @@ def _parse_date(value: str | None) -> date | None:
 
 
 @app.command('build')
-def build(
+def build(  # noqa: PLR0913
     account_id: str = typer.Argument(..., help='Идентификатор счёта'),
     output: Path | None = typer.Option(None, '--output', '-o', help='Путь до JSON-файла результата'),
-    depth: int = typer.Option(1, '--depth', help='Глубина стакана'),
+    depth: int = typer.Option(10, '--depth', help='Глубина стакана'),
     coupons_from: str | None = typer.Option(None, '--coupons-from', help='YYYY-MM-DD нижняя граница купонов'),
     coupons_to: str | None = typer.Option(None, '--coupons-to', help='YYYY-MM-DD верхняя граница купонов'),
+    concurrency: int = typer.Option(8, '--concurrency', min=1, help='Максимум одновременных запросов обогащения'),
+    step_timeout: float = typer.Option(10.0, '--step-timeout', min=0.1, help='Таймаут шага обогащения, секунды'),
     pretty: bool = typer.Option(True, '--pretty/--no-pretty', help='Pretty print JSON'),
 ) -> None:
     """Строит снапшот портфеля по счёту и выводит JSON.
@@ -107,10 +108,12 @@ def build(
         order_book_depth=depth,
         coupons_from_date=_parse_date(coupons_from),
         coupons_to_date=_parse_date(coupons_to),
+        concurrency=concurrency,
+        step_timeout_seconds=step_timeout,
     )
 
     try:
-        result = asyncio.run(uc.execute(data))
+        result = run_async(uc.execute(data))
     except Exception as exc:
         logger.error(f'Failed to build portfolio snapshot: {exc!r}')
         raise typer.Exit(code=1) from exc
@@ -1,7 +1,9 @@
 """Вспомогательные утилиты CLI."""
 
+from .async_runner import run_async
 from .json_file import write_json_file
 
 __all__ = [
+    'run_async',
     'write_json_file',
 ]
@@ -0,0 +1,31 @@
+"""Запуск асинхронных Use Case из синхронных CLI-команд.
+
+Каждая CLI-команда выполняется в собственном event loop (`asyncio.run`), а gRPC-каналы
+пула Tinkoff привязаны к loop, в котором были открыты. Поэтому пул закрывается до
+завершения loop, иначе каналы остаются незакрытыми.
+"""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+from finsight_api.infrastructure.container import app_container
+
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Выполняет корутину в новом event loop и закрывает пул каналов Tinkoff.
+
+    Args:
+        coro: Корутина для выполнения (обычно `use_case.execute(...)`).
+
+    Returns:
+        Результат корутины.
+    """
+
+    async def _runner() -> T:
+        try:
+            return await coro
+        finally:
+            await app_container.tinkoff_channel_pool().close()
+
+    return asyncio.run(_runner())
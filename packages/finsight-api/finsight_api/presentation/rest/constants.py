@@ -1,5 +1,5 @@
 """Константы REST API."""
 
-from typing import Final  # noqa: TC003
+from typing import Final
 
 API_V1_PREFIX: Final[str] = '/api/v1'
@@ -1,10 +1,11 @@
-"""Маппер для преобразования доменной модели портфеля в схему ответа API."""
+"""Мапперы доменных моделей портфеля в схемы ответа API."""
 
 from typing import TYPE_CHECKING
 
-from .schemas import PortfolioResponse, Position
+from .schemas import PortfolioResponse, Position, PositionValuationEvent
 
 if TYPE_CHECKING:
+    from finsight_api.application.use_cases.watch_portfolio import PositionValuation
     from finsight_api.domain.entities.portfolio import PortfolioEntity
 
 
@@ -24,8 +25,27 @@ def map_portfolio_to_response(model: 'PortfolioEntity') -> PortfolioResponse:
                 instrument_name='UNKNOWN',  # Заглушка, пока имя инструмента не извлекается
                 balance=float(position.quantity),
                 current_price=float(position.current_price),
+                value=float(position.value),
                 currency='UNKNOWN',  # Заглушка, пока валюта не извлекается
             )
             for position in model.positions
         ]
     )
+
+
+def map_position_valuation_to_event(valuation: 'PositionValuation') -> PositionValuationEvent:
+    """Преобразует изменение стоимости позиции в событие потока стоимости портфеля.
+
+    Args:
+        valuation: Изменение стоимости позиции.
+
+    Returns:
+        Объект PositionValuationEvent, совместимый с Pydantic.
+    """
+    return PositionValuationEvent(
+        ticker=valuation.figi,
+        current_price=float(valuation.current_price),
+        value=float(valuation.value),
+        total_value=float(valuation.total_value),
+        time=valuation.time,
+    )
@@ -1,20 +1,33 @@
-"""Маршрут REST API для получения портфеля пользователя.
+"""Маршруты REST API для получения портфеля пользователя.
 
 Обрабатывает GET-запрос на получение информации о текущем портфеле пользователя
-по идентификатору счёта, используя бизнес-сценарий `GetPortfolioUseCase`.
+по идентификатору счёта, используя бизнес-сценарий `GetPortfolioUseCase`, и
+поток стоимости портфеля (Server-Sent Events) на основе `WatchPortfolioUseCase`.
 """
 
 from http import HTTPStatus
+from typing import TYPE_CHECKING
 
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
+from finsight_api.application.use_cases.watch_portfolio import PositionValuation
 from finsight_api.presentation.webserver.dependencies.get_portfolio_use_case import (
     PortfolioUseCaseDep,  # noqa: TC001
 )
+from finsight_api.presentation.webserver.dependencies.get_watch_portfolio_use_case import (
+    WatchPortfolioUseCaseDep,  # noqa: TC001
+)
 
-from .mappers import map_portfolio_to_response
+from .mappers import map_portfolio_to_response, map_position_valuation_to_event
 from .schemas import PortfolioResponse  # noqa: TC001
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterator
+
+    from finsight_api.domain.entities.portfolio import PortfolioEntity
+
 router = APIRouter(
     prefix='/account',
     tags=['Account'],
@@ -38,3 +51,81 @@ async def get_portfolio(account_id: str, use_case: PortfolioUseCaseDep) -> Portf
     """
     result = await use_case.execute(account_id)
     return map_portfolio_to_response(result)
+
+
+@router.get(
+    '/{account_id}/portfolio/stream',
+    status_code=HTTPStatus.OK,
+    summary='Поток стоимости портфеля пользователя по ID счёта (Server-Sent Events)',
+    response_class=StreamingResponse,
+)
+async def stream_portfolio(account_id: str, use_case: WatchPortfolioUseCaseDep) -> StreamingResponse:
+    """Обработчик подписки на стоимость портфеля пользователя по ID счёта.
+
+    Первое событие `snapshot` содержит портфель (PortfolioResponse), последующие
+    события `position` — изменения стоимости позиций (PositionValuationEvent).
+    Портфель загружается до начала ответа, поэтому ошибка его получения
+    возвращается обычным HTTP-ответом об ошибке. Подписка закрывается и при
+    ошибке до начала ответа, и после его завершения (в том числе при отключении
+    клиента).
+
+    Args:
+        account_id: Идентификатор счёта.
+        use_case: Сценарий подписки на стоимость портфеля.
+
+    Returns:
+        Потоковый ответ `text/event-stream`.
+    """
+    events = use_case.watch(account_id)
+    try:
+        snapshot = await anext(events)
+    except BaseException:
+        await events.aclose()
+        raise
+    return StreamingResponse(
+        _to_server_sent_events(snapshot, events),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+        background=BackgroundTask(_close_events, events),
+    )
+
+
+async def _to_server_sent_events(
+    snapshot: 'PortfolioEntity | PositionValuation',
+    events: 'AsyncIterator[PortfolioEntity | PositionValuation]',
+) -> 'AsyncIterator[str]':
+    """Форматирует события стоимости портфеля как Server-Sent Events.
+
+    Args:
+        snapshot: Первое событие (портфель).
+        events: Последующие события подписки.
+
+    Yields:
+        Строки событий в формате text/event-stream.
+    """
+    yield _format_event(snapshot)
+    async for event in events:
+        yield _format_event(event)
+
+
+async def _close_events(events: 'AsyncGenerator[PortfolioEntity | PositionValuation]') -> None:
+    """Закрывает подписку на стоимость портфеля после завершения ответа.
+
+    Args:
+        events: События подписки.
+    """
+    await events.aclose()
+
+
+def _format_event(event: 'PortfolioEntity | PositionValuation') -> str:
+    """Форматирует одно событие text/event-stream.
+
+    Args:
+        event: Портфель или изменение стоимости позиции.
+
+    Returns:
+        Событие `snapshot` или `position` с JSON-данными.
+    """
+    if isinstance(event, PositionValuation):
+        return f'event: position\ndata: {map_position_valuation_to_event(event).model_dump_json()}\n\n'
+    return f'event: snapshot\ndata: {map_portfolio_to_response(event).model_dump_json()}\n\n'
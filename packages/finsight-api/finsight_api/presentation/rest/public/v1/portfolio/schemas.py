@@ -1,10 +1,12 @@
 """Схемы ответа API для отображения данных портфеля пользователя.
 
 Содержит модели ответа `PortfolioResponse` и `Position`, используемые в endpoint'ах
-для представления списка позиций по тикерам, количеству лотов, текущей цене и валюте.
+для представления списка позиций по тикерам, количеству лотов, текущей цене и валюте,
+а также событие `PositionValuationEvent` потока стоимости портфеля.
 """
 
 from collections.abc import Sequence
+from datetime import datetime  # noqa: TC003
 
 from pydantic import BaseModel
 
@@ -17,6 +19,7 @@ class Position(BaseModel):
         instrument_name: Название инструмента.
         balance: Количество лотов.
         current_price: Текущая цена одного лота.
+        value: Рыночная стоимость позиции.
         currency: Валюта инструмента.
     """
 
@@ -24,6 +27,7 @@ class Position(BaseModel):
     instrument_name: str
     balance: float
     current_price: float
+    value: float
     currency: str
 
 
@@ -46,6 +50,7 @@ class PortfolioResponse(BaseModel):
                         'instrument_name': 'Сбербанк',
                         'balance': 10.5,
                         'current_price': 251.34,
+                        'value': 2639.07,
                         'currency': 'RUB',
                     },
                     {
@@ -53,9 +58,41 @@ class PortfolioResponse(BaseModel):
                         'instrument_name': 'Яндекс',
                         'balance': 3.0,
                         'current_price': 2934.0,
+                        'value': 8802.0,
                         'currency': 'RUB',
                     },
                 ]
             }
         },
     }
+
+
+class PositionValuationEvent(BaseModel):
+    """Изменение стоимости позиции в потоке стоимости портфеля.
+
+    Attributes:
+        ticker: Тикер инструмента.
+        current_price: Новая цена одного лота.
+        value: Новая рыночная стоимость позиции.
+        total_value: Новая стоимость портфеля.
+        time: Время сделки, давшей цену.
+    """
+
+    ticker: str
+    current_price: float
+    value: float
+    total_value: float
+    time: datetime | None
+
+    model_config = {
+        'title': 'PositionValuationEvent',
+        'json_schema_extra': {
+            'example': {
+                'ticker': 'SBER',
+                'current_price': 251.5,
+                'value': 2640.75,
+                'total_value': 11442.75,
+                'time': '2026-01-15T10:30:00Z',
+            }
+        },
+    }
@@ -1,11 +1,13 @@
 """Модуль для создания и настройки FastAPI приложения."""
 
+from contextlib import asynccontextmanager
 from itertools import chain
 from typing import TYPE_CHECKING
 
 from fastapi import FastAPI
 
 from finsight_api.domain.exceptions import BaseAppError
+from finsight_api.infrastructure.container import app_container
 from finsight_api.presentation.rest.public.v1.router import api_v1_router
 from finsight_api.presentation.rest.system.router import system_router
 from finsight_api.presentation.webserver.error_handler import base_app_error_handler, validation_error_handler
@@ -13,9 +15,36 @@ from finsight_api.presentation.webserver.middlewares.request_id import RequestID
 from finsight_api.presentation.webserver.middlewares.request_logging import RequestLoggingMiddleware
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
     from finsight_api.infrastructure.config import Settings
 
 
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> 'AsyncGenerator[None]':
+    """Открывает общие ресурсы приложения при старте и закрывает их при остановке.
+
+    Пул gRPC-каналов Tinkoff прогревается до приёма первого запроса, чтобы
+    TLS-рукопожатие не попадало во время ответа. Там же загружаются лимиты тарифа,
+    чтобы первые запросы уже шли с ограничением частоты. Поток маркет-данных
+    открывается при первой подписке и закрывается при остановке.
+
+    Args:
+        _: Экземпляр FastAPI-приложения (не используется).
+
+    Yields:
+        None: Управление на время работы приложения.
+    """
+    channel_pool = app_container.tinkoff_channel_pool()
+    await channel_pool.open()
+    await app_container.tinkoff_rate_limiter().ensure_tariff()
+    try:
+        yield
+    finally:
+        await app_container.tinkoff_market_data_stream().stop()
+        await channel_pool.close()
+
+
 class AppFactory:
     """Фабрика для создания и настройки экземпляра FastAPI приложения."""
 
@@ -40,6 +69,7 @@ class AppFactory:
             version=self.settings.app.version,
             description=self.settings.app.description,
             debug=self.settings.app.debug,
+            lifespan=lifespan,
         )
 
         for router in chain([system_router, api_v1_router]):
@@ -1,5 +1,5 @@
 """Константы, используемые в веб-сервере FastAPI."""
 
-from typing import Final  # noqa: TC003
+from typing import Final
 
 DEFAULT_DISABLED_LOGGER_NAMES: Final[frozenset[str]] = frozenset(['uvicorn.access'])
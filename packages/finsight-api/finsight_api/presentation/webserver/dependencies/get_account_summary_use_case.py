@@ -5,17 +5,18 @@ from typing import Annotated
 from fastapi import Depends
 
 from finsight_api.application.use_cases.get_account_summary import GetAccountsUseCase
-from finsight_api.infrastructure.container import AppContainer
+from finsight_api.infrastructure.container import app_container
 
 
-def get_accounts_use_case() -> GetAccountsUseCase:
-    """Создаёт экземпляр сценария получения информации о счетах.
+async def get_accounts_use_case() -> GetAccountsUseCase:
+    """Возвращает общий экземпляр сценария получения информации о счетах.
+
+    Сценарий — синглтон общего контейнера приложения (см. `get_portfolio_use_case`).
 
     Returns:
         Экземпляр GetAccountsUseCase.
     """
-    container = AppContainer()
-    return GetAccountsUseCase(invest=container.tinkoff_invest())
+    return app_container.get_accounts_use_case()
 
 
 GetAccountsUseCaseDep = Annotated[GetAccountsUseCase, Depends(get_accounts_use_case)]
@@ -5,12 +5,12 @@ from typing import Annotated
 from fastapi import Depends
 
 from finsight_api.infrastructure.config import Settings
-from finsight_api.infrastructure.container import AppContainer
+from finsight_api.infrastructure.container import app_container
 
 
-def get_app_settings() -> 'Settings':
+async def get_app_settings() -> 'Settings':
     """Возвращает экземпляр настроек приложения."""
-    return AppContainer.settings()
+    return app_container.settings()
 
 
 AppSettingsDep = Annotated[Settings, Depends(get_app_settings)]
@@ -8,18 +8,20 @@ from typing import Annotated
 from fastapi import Depends
 
 from finsight_api.application.use_cases.get_portfolio import GetPortfolioUseCase
-from finsight_api.infrastructure.container import AppContainer
+from finsight_api.infrastructure.container import app_container
 
 
-# TODO: Вынести tinkoff_invest_gateway через DI
-def get_portfolio_use_case() -> GetPortfolioUseCase:
-    """Создаёт экземпляр сценария получения портфеля пользователя.
+async def get_portfolio_use_case() -> GetPortfolioUseCase:
+    """Возвращает общий экземпляр сценария получения портфеля пользователя.
+
+    Сценарий и его адаптер — синглтоны общего контейнера приложения, поэтому
+    запросы разделяют один пул каналов Tinkoff и кэши. Зависимость асинхронная:
+    FastAPI вызывает её в цикле событий, без перехода в пул потоков.
 
     Returns:
         Экземпляр GetPortfolioUseCase.
     """
-    container = AppContainer()
-    return GetPortfolioUseCase(gateway=container.tinkoff_invest())
+    return app_container.get_portfolio_use_case()
 
 
 PortfolioUseCaseDep = Annotated[GetPortfolioUseCase, Depends(get_portfolio_use_case)]
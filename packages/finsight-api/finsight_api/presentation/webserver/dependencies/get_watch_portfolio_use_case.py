@@ -0,0 +1,23 @@
+"""FastAPI зависимость для получения сценария подписки на стоимость портфеля."""
+
+from typing import Annotated
+
+from fastapi import Depends
+
+from finsight_api.application.use_cases.watch_portfolio import WatchPortfolioUseCase
+from finsight_api.infrastructure.container import app_container
+
+
+async def get_watch_portfolio_use_case() -> WatchPortfolioUseCase:
+    """Возвращает общий экземпляр сценария подписки на стоимость портфеля.
+
+    Сценарий хранит подписки счетов, поэтому, в отличие от остальных use cases,
+    не создаётся на каждый запрос, а берётся синглтоном из контейнера.
+
+    Returns:
+        Экземпляр WatchPortfolioUseCase.
+    """
+    return app_container.watch_portfolio_use_case()
+
+
+WatchPortfolioUseCaseDep = Annotated[WatchPortfolioUseCase, Depends(get_watch_portfolio_use_case)]
@@ -8,7 +8,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
 from finsight_api.domain.exceptions import BaseAppError
-from finsight_api.infrastructure.container import AppContainer
+from finsight_api.infrastructure.container import app_container
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -16,7 +16,7 @@ if TYPE_CHECKING:
     from fastapi import Request
 
 
-logger = AppContainer.logger()
+logger = app_container.logger()
 
 
 async def base_app_error_handler(_: 'Request', exc: Exception) -> JSONResponse:
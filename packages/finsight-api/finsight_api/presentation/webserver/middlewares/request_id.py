@@ -2,35 +2,52 @@
 
 from typing import TYPE_CHECKING
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 
-from finsight_core.telemetry.context import DEFAULT_REQUEST_ID_HEADER, extract_request_id, set_request_id
+from finsight_core.telemetry.context import (
+    DEFAULT_REQUEST_ID_HEADER,
+    extract_request_id_from_scope,
+    set_request_id,
+)
 
 if TYPE_CHECKING:
-    from starlette.middleware.base import RequestResponseEndpoint
-    from starlette.requests import Request
-    from starlette.responses import Response
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """Middleware для добавления X-Request-ID и установки контекста структурированного логгера.
 
-    Извлекает идентификатор запроса из входящего HTTP-запроса, устанавливает его
-    через set_request_id и добавляет заголовок X-Request-ID в ответ.
+    Извлекает идентификатор запроса из заголовков HTTP-запроса, устанавливает его
+    через set_request_id и добавляет заголовок X-Request-ID в начало ответа.
+    Реализован как ASGI-middleware: тело ответа проходит без буферизации, поэтому
+    потоковые ответы (SSE) не задерживаются.
     """
 
-    async def dispatch(self, request: 'Request', call_next: 'RequestResponseEndpoint') -> 'Response':
-        """Обрабатывает входящий запрос, добавляя в ответ заголовок X-Request-ID.
+    def __init__(self, app: 'ASGIApp') -> None:
+        """Инициализирует middleware.
 
         Args:
-            request: Входящий HTTP-запрос.
-            call_next: Функция вызова следующего middleware/обработчика запроса.
+            app: Следующее ASGI-приложение.
+        """
+        self.app = app
+
+    async def __call__(self, scope: 'Scope', receive: 'Receive', send: 'Send') -> None:
+        """Обрабатывает HTTP-запрос, добавляя в ответ заголовок X-Request-ID.
 
-        Returns:
-            Response: HTTP-ответ с добавленным заголовком X-Request-ID.
+        Args:
+            scope: ASGI scope запроса.
+            receive: Канал получения сообщений запроса.
+            send: Канал отправки сообщений ответа.
         """
-        request_id = extract_request_id(request)
-        request_id = set_request_id(request_id)
-        response = await call_next(request)
-        response.headers[DEFAULT_REQUEST_ID_HEADER] = request_id
-        return response
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        request_id = set_request_id(extract_request_id_from_scope(scope))
+
+        async def send_with_request_id(message: 'Message') -> None:
+            if message['type'] == 'http.response.start':
+                MutableHeaders(scope=message)[DEFAULT_REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
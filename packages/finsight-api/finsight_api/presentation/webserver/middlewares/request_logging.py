@@ -7,25 +7,24 @@
 import time
 import urllib.parse
 from collections.abc import MutableMapping
+from http import HTTPStatus
 from typing import TYPE_CHECKING
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-
-from finsight_api.infrastructure.container import AppContainer
+from finsight_api.infrastructure.container import app_container
 
 if TYPE_CHECKING:
     from typing import Any
 
-    from starlette.requests import Request
-    from starlette.responses import Response
-    from starlette.types import ASGIApp
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """Middleware для логирования завершения HTTP-запроса.
 
     Логирует окончание HTTP-запроса, включая время обработки, HTTP-метод, версию HTTP,
-    статус-код и URL запроса.
+    статус-код и URL запроса. Реализован как ASGI-middleware: статус-код берётся
+    из сообщения `http.response.start`, тело ответа проходит без буферизации.
+    Время обработки считается до отправки последнего сообщения ответа.
 
     Attributes:
         exclude_urls_from_logging: Множество URL, которые исключены из логирования.
@@ -38,8 +37,9 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             app: Объект приложения ASGI.
             exclude_urls_from_logging: Множество URL для исключения из логирования.
         """
-        super().__init__(app)
+        self.app = app
         self.exclude_urls_from_logging: frozenset[str] = exclude_urls_from_logging
+        self._logger = app_container.logger()
 
     @staticmethod
     def get_path_with_query_string(scope: 'MutableMapping[str, Any]') -> str:
@@ -59,42 +59,66 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
         return path_with_query_string
 
-    async def dispatch(self, request: 'Request', call_next: 'RequestResponseEndpoint') -> 'Response':
-        """Обрабатывает входящий запрос, логируя его завершение с HTTP-статусом.
+    async def __call__(self, scope: 'Scope', receive: 'Receive', send: 'Send') -> None:
+        """Обрабатывает HTTP-запрос, логируя его завершение с HTTP-статусом.
 
         Args:
-            request: Входящий HTTP-запрос.
-            call_next: Функция передачи запроса следующему обработчику.
-
-        Returns:
-            Response: HTTP-ответ с логированием времени выполнения.
+            scope: ASGI scope запроса.
+            receive: Канал получения сообщений запроса.
+            send: Канал отправки сообщений ответа.
         """
-        logger = AppContainer.logger()
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.perf_counter_ns()
+        status_code: int = HTTPStatus.INTERNAL_SERVER_ERROR
+
+        async def send_with_status(message: 'Message') -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
         try:
-            response: Response = await call_next(request)
+            await self.app(scope, receive, send_with_status)
         except Exception as exc:
-            logger.error('unhandled_exception', error=str(exc))
+            self._logger.error('unhandled_exception', error=str(exc))
             raise
         finally:
-            elapsed_time: int = (time.perf_counter_ns() - start_time) // 1_000_000
-            status_code: int = response.status_code if 'response' in locals() else 500
-            host: str | None = request.client.host if request.client else None
-            url: str = self.get_path_with_query_string(request.scope)
-            http_method: str = request.method
-            http_version: str = request.scope.get('http_version', '')
-
-            if url not in self.exclude_urls_from_logging:
-                logger.info(
-                    f'{host} - {http_method} {url} HTTP/{http_version} {status_code}',
-                    elapsed_time=elapsed_time,
-                    client={'host': host},
-                    http={
-                        'method': http_method,
-                        'status_code': status_code,
-                        'version': http_version,
-                        'url': url,
-                    },
-                )
-
-        return response
+            self._log_request(scope, status_code, start_time)
+
+    def _log_request(self, scope: 'Scope', status_code: int, start_time: int) -> None:
+        """Логирует завершение запроса, если его URL не исключён из логирования.
+
+        Путь без строки запроса сверяется с исключениями до URL-кодирования, поэтому
+        для исключённых URL (health-checks) путь не кодируется.
+
+        Args:
+            scope: ASGI scope запроса.
+            status_code: HTTP-статус ответа.
+            start_time: Время начала обработки, `time.perf_counter_ns()`.
+        """
+        if not scope.get('query_string') and scope['path'] in self.exclude_urls_from_logging:
+            return
+        url: str = self.get_path_with_query_string(scope)
+        if url in self.exclude_urls_from_logging:
+            return
+
+        elapsed_time: int = (time.perf_counter_ns() - start_time) // 1_000_000
+        client = scope.get('client')
+        host: str | None = client[0] if client else None
+        http_method: str = scope['method']
+        http_version: str = scope.get('http_version', '')
+
+        self._logger.info(
+            f'{host} - {http_method} {url} HTTP/{http_version} {status_code}',
+            elapsed_time=elapsed_time,
+            client={'host': host},
+            http={
+                'method': http_method,
+                'status_code': status_code,
+                'version': http_version,
+                'url': url,
+            },
+        )
@@ -4,20 +4,31 @@
 - глобальных настроек приложения;
 - создания экземпляра FastAPI-приложения;
 - асинхронного клиента HTTP API;
-- клиента для работы с Tinkoff Invest API.
+- клиента для работы с Tinkoff Invest API;
+- фабрик доменных объектов (облигации, купоны, позиции портфеля, стаканы).
 """
 
+from datetime import timedelta
+from decimal import Decimal
 from typing import Final, TYPE_CHECKING
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+from finsight_api.domain.entities.bond import BondEntity
+from finsight_api.domain.value_objects.bond_coupon import BondCoupon
+from finsight_api.domain.value_objects.instrument_type import InstrumentType
+from finsight_api.domain.value_objects.money import Money
+from finsight_api.domain.value_objects.order_book import OrderBook, OrderBookLevel
+from finsight_api.domain.value_objects.portfolio_position import PortfolioPosition
+from finsight_api.domain.value_objects.risk_level import RiskLevel
 from finsight_api.infrastructure.config import Settings
 from finsight_api.infrastructure.container import AppContainer
 from finsight_api.presentation.webserver.app_factory import AppFactory
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, Callable, Sequence
+    from datetime import datetime
 
     from fastapi import FastAPI
 
@@ -25,6 +36,7 @@ if TYPE_CHECKING:
 
 
 TEST_API_BASE_URL: Final[str] = 'http://test'
+COUPON_PERIOD_DAYS: Final[int] = 182
 
 
 @pytest.fixture(scope='session')
@@ -96,3 +108,136 @@ def tinkoff_gateway(app_container: 'AppContainer') -> 'TinkoffInvestPort':
         Реализация порта TinkoffInvestGateway.
     """
     return app_container.tinkoff_invest()
+
+
+@pytest.fixture
+def make_bond() -> 'Callable[..., BondEntity]':
+    """Возвращает фабрику облигаций с номиналом 1000 и двумя купонами в год.
+
+    Returns:
+        Функция `make_bond(figi, *, maturity_date, currency, floating, amortizing)`.
+    """
+
+    def factory(
+        figi: str = 'BOND',
+        *,
+        maturity_date: 'datetime',
+        currency: str = 'rub',
+        floating: bool = False,
+        amortizing: bool = False,
+    ) -> BondEntity:
+        return BondEntity(
+            figi=figi,
+            uid=f'uid-{figi}',
+            isin='',
+            name=figi,
+            currency=currency,
+            sector='other',
+            risk_level=RiskLevel.LOW,
+            coupon_quantity_per_year=2,
+            maturity_date=maturity_date,
+            nominal=Money(currency=currency, amount=Decimal(1000)),
+            aci_value=None,
+            class_code='TQCB',
+            issue_size=0,
+            issue_size_plan=0,
+            floating_coupon_flag=floating,
+            amortization_flag=amortizing,
+            liquidity_flag=True,
+            for_iis_flag=True,
+            for_qual_investor_flag=False,
+        )
+
+    return factory
+
+
+@pytest.fixture
+def make_coupon() -> 'Callable[..., BondCoupon]':
+    """Возвращает фабрику купонов с периодом 182 дня, заканчивающимся датой выплаты.
+
+    Returns:
+        Функция `make_coupon(figi, coupon_date, amount, *, number, currency)`.
+    """
+
+    def factory(
+        figi: str,
+        coupon_date: 'datetime',
+        amount: str,
+        *,
+        number: int = 1,
+        currency: str = 'rub',
+    ) -> BondCoupon:
+        period_start = coupon_date - timedelta(days=COUPON_PERIOD_DAYS)
+        return BondCoupon(
+            figi=figi,
+            coupon_date=coupon_date,
+            coupon_number=number,
+            fix_date=period_start,
+            pay_one_bond=Money(currency=currency, amount=Decimal(amount)),
+            coupon_type='',
+            coupon_start_date=period_start,
+            coupon_end_date=coupon_date,
+            coupon_period=COUPON_PERIOD_DAYS,
+        )
+
+    return factory
+
+
+@pytest.fixture
+def make_position() -> 'Callable[..., PortfolioPosition]':
+    """Возвращает фабрику позиций портфеля со стоимостью quantity * price.
+
+    Returns:
+        Функция `make_position(figi, instrument_type, *, quantity, price)`.
+    """
+
+    def factory(
+        figi: str,
+        instrument_type: InstrumentType = InstrumentType.BOND,
+        *,
+        quantity: int = 1,
+        price: int = 100,
+    ) -> PortfolioPosition:
+        return PortfolioPosition(
+            figi=figi,
+            instrument_type=instrument_type,
+            quantity=Decimal(quantity),
+            expected_yield=Decimal(0),
+            average_position_price=Decimal(price),
+            current_price=Decimal(price),
+            current_nkd=None,
+            value=Decimal(quantity * price),
+            instrument_uid=f'uid-{figi}',
+        )
+
+    return factory
+
+
+@pytest.fixture
+def make_order_book() -> 'Callable[..., OrderBook]':
+    """Возвращает фабрику рублёвых стаканов по уровням (цена, количество).
+
+    Returns:
+        Функция `make_order_book(figi, *, bids, asks)`.
+    """
+
+    def levels(side: 'Sequence[tuple[str, int]]') -> list[OrderBookLevel]:
+        return [OrderBookLevel(price=Money(currency='rub', amount=Decimal(price)), quantity=q) for price, q in side]
+
+    def factory(
+        figi: str = 'BOND',
+        *,
+        bids: 'Sequence[tuple[str, int]]',
+        asks: 'Sequence[tuple[str, int]]',
+    ) -> OrderBook:
+        return OrderBook(
+            figi=figi,
+            depth=max(len(bids), len(asks)),
+            bids=levels(bids),
+            asks=levels(asks),
+            last_price=None,
+            close_price=None,
+            timestamp=None,
+        )
+
+    return factory
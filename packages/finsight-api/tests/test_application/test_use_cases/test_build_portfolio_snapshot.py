@@ -0,0 +1,303 @@
+"""Юнит-тесты Use Case сборки снапшота портфеля."""
+
+import asyncio
+from datetime import date, datetime, timedelta, UTC
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_api.application.use_cases.build_portfolio_snapshot import (
+    BuildPortfolioSnapshotInput,
+    BuildPortfolioSnapshotUseCase,
+)
+from finsight_api.domain.entities.portfolio import PortfolioEntity
+from finsight_api.domain.value_objects.instrument_type import InstrumentType
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_mock import MockerFixture
+
+    from finsight_api.domain.entities.bond import BondEntity
+    from finsight_api.domain.value_objects.bond_coupon import BondCoupon
+    from finsight_api.domain.value_objects.order_book import OrderBook
+    from finsight_api.domain.value_objects.portfolio_position import PortfolioPosition
+
+
+COUPON_DATE = datetime(2999, 1, 15, tzinfo=UTC)
+BIDS = [('99.5', 2), ('99', 10)]
+ASKS = [('100.5', 3), ('101', 10)]
+
+
+def make_portfolio(*positions: 'PortfolioPosition') -> PortfolioEntity:
+    return PortfolioEntity(
+        account_id='account',
+        total_amount_shares=Decimal(0),
+        total_amount_bonds=Decimal(0),
+        total_amount_etf=Decimal(0),
+        total_amount_futures=Decimal(0),
+        total_value=Decimal(0),
+        cash_balance=Decimal(0),
+        currency='rub',
+        positions=positions,
+    )
+
+
+class FakeTinkoff:
+    """Фиктивный порт Tinkoff, отслеживающий число одновременных запросов."""
+
+    def __init__(
+        self,
+        portfolio: PortfolioEntity,
+        *,
+        bond: 'Callable[[str], BondEntity]',
+        coupon: 'Callable[[str], BondCoupon]',
+        order_book: 'Callable[[str], OrderBook]',
+        slow_figi: str | None = None,
+    ) -> None:
+        """Инициализирует порт.
+
+        Args:
+            portfolio: Портфель, который вернёт get_portfolio.
+            bond: Облигация по FIGI.
+            coupon: Купон облигации по FIGI.
+            order_book: Стакан по FIGI.
+            slow_figi: FIGI, для которого запрос стакана зависает.
+        """
+        self.portfolio = portfolio
+        self.bond = bond
+        self.coupon = coupon
+        self.order_book = order_book
+        self.slow_figi = slow_figi
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.order_book_calls: list[str] = []
+
+    async def _call(self, figi: str) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return figi
+        finally:
+            self.in_flight -= 1
+
+    async def get_portfolio(self, account_id: str) -> PortfolioEntity:  # noqa: ARG002
+        return self.portfolio
+
+    async def get_bond_by_figi(self, figi: str) -> 'BondEntity':
+        if figi == 'BOND-BROKEN':
+            raise RuntimeError('bond not found')
+        return self.bond(await self._call(figi))
+
+    async def get_bond_coupons(self, *, figi: str, **_: object) -> 'list[BondCoupon]':
+        if figi == 'BOND-DEADLINE':
+            raise TimeoutError('Retry deadline exceeded')
+        return [self.coupon(await self._call(figi))]
+
+    async def get_order_book(self, *, figi: str, **_: object) -> 'OrderBook':
+        self.order_book_calls.append(figi)
+        if figi == self.slow_figi:
+            await asyncio.sleep(10)
+        return self.order_book(await self._call(figi))
+
+
+@pytest.fixture
+def make_tinkoff(
+    make_bond: 'Callable[..., BondEntity]',
+    make_coupon: 'Callable[..., BondCoupon]',
+    make_order_book: 'Callable[..., OrderBook]',
+) -> 'Callable[..., FakeTinkoff]':
+    """Возвращает фабрику порта с облигациями, погашаемыми через полгода после купона 35.5."""
+
+    def factory(portfolio: PortfolioEntity, *, slow_figi: str | None = None) -> FakeTinkoff:
+        return FakeTinkoff(
+            portfolio,
+            bond=lambda figi: make_bond(figi, maturity_date=COUPON_DATE + timedelta(days=182)),
+            coupon=lambda figi: make_coupon(figi, COUPON_DATE, '35.5'),
+            order_book=lambda figi: make_order_book(figi, bids=BIDS, asks=ASKS),
+            slow_figi=slow_figi,
+        )
+
+    return factory
+
+
+@pytest.mark.unit
+class TestBuildPortfolioSnapshotUseCase:
+    async def test_execute__bounds_concurrency_and_keeps_order(
+        self,
+        mocker: 'MockerFixture',
+        make_position: 'Callable[..., PortfolioPosition]',
+        make_tinkoff: 'Callable[..., FakeTinkoff]',
+    ) -> None:
+        """Должен обогащать позиции параллельно в пределах concurrency и сохранять порядок позиций."""
+        figis = [f'BOND-{i}' for i in range(6)]
+        portfolio = make_portfolio(
+            make_position('SHARE', InstrumentType.SHARE),
+            *(make_position(figi, InstrumentType.BOND) for figi in figis),
+        )
+        tinkoff = make_tinkoff(portfolio)
+        uc = BuildPortfolioSnapshotUseCase(tinkoff=tinkoff, logger=mocker.Mock())  # type: ignore[arg-type]
+
+        concurrency = 4
+        result = await uc.execute(BuildPortfolioSnapshotInput(account_id='account', concurrency=concurrency))
+
+        assert [snapshot.position.figi for snapshot in result.positions] == ['SHARE', *figis]
+        assert result.positions[0].enrichment is None
+        assert [
+            snapshot.enrichment.bond.figi
+            for snapshot in result.positions[1:]
+            if snapshot.enrichment and snapshot.enrichment.bond
+        ] == figis
+        assert tinkoff.max_in_flight == concurrency
+        assert [(timing.figi, timing.step) for timing in result.enrichment_timings[:3]] == [
+            ('BOND-0', 'bond_by_figi'),
+            ('BOND-0', 'coupons'),
+            ('BOND-0', 'order_book'),
+        ]
+
+    async def test_execute__isolates_step_errors_and_timeouts(
+        self,
+        mocker: 'MockerFixture',
+        make_position: 'Callable[..., PortfolioPosition]',
+        make_tinkoff: 'Callable[..., FakeTinkoff]',
+    ) -> None:
+        """Должен фиксировать ошибку и таймаут шага, не прерывая остальные шаги и позиции."""
+        portfolio = make_portfolio(
+            make_position('BOND-BROKEN', InstrumentType.BOND),
+            make_position('BOND-SLOW', InstrumentType.BOND),
+        )
+        tinkoff = make_tinkoff(portfolio, slow_figi='BOND-SLOW')
+        uc = BuildPortfolioSnapshotUseCase(tinkoff=tinkoff, logger=mocker.Mock())  # type: ignore[arg-type]
+
+        result = await uc.execute(BuildPortfolioSnapshotInput(account_id='account', step_timeout_seconds=0.05))
+
+        assert [(error.figi, error.step, error.error_type) for error in result.enrichment_errors] == [
+            ('BOND-BROKEN', 'bond_by_figi', 'RuntimeError'),
+            ('BOND-SLOW', 'order_book', 'TimeoutError'),
+        ]
+        slow = result.positions[1].enrichment
+        assert slow is not None
+        assert slow.bond is not None
+        assert slow.bond.figi == 'BOND-SLOW'
+        assert slow.order_book is None
+        assert slow.order_book_metrics is None
+
+    async def test_execute__starts_step_timeout_after_semaphore(
+        self,
+        mocker: 'MockerFixture',
+        make_position: 'Callable[..., PortfolioPosition]',
+        make_tinkoff: 'Callable[..., FakeTinkoff]',
+    ) -> None:
+        """Должен не засчитывать ожидание слота семафора в таймаут и время шага."""
+        portfolio = make_portfolio(*(make_position(f'BOND-{i}', InstrumentType.BOND) for i in range(4)))
+        uc = BuildPortfolioSnapshotUseCase(tinkoff=make_tinkoff(portfolio), logger=mocker.Mock())  # type: ignore[arg-type]
+
+        timeout_seconds = 0.05
+        result = await uc.execute(
+            BuildPortfolioSnapshotInput(account_id='account', concurrency=1, step_timeout_seconds=timeout_seconds)
+        )
+
+        assert result.enrichment_errors == ()
+        assert result.enrichment_duration_ms > timeout_seconds * 1000
+        assert all(timing.duration_ms < timeout_seconds * 1000 for timing in result.enrichment_timings)
+
+    async def test_execute__reports_call_timeout_as_step_error(
+        self,
+        mocker: 'MockerFixture',
+        make_position: 'Callable[..., PortfolioPosition]',
+        make_tinkoff: 'Callable[..., FakeTinkoff]',
+    ) -> None:
+        """Должен отличать TimeoutError из вызова провайдера от истечения таймаута шага."""
+        portfolio = make_portfolio(make_position('BOND-DEADLINE', InstrumentType.BOND))
+        uc = BuildPortfolioSnapshotUseCase(tinkoff=make_tinkoff(portfolio), logger=mocker.Mock())  # type: ignore[arg-type]
+
+        result = await uc.execute(BuildPortfolioSnapshotInput(account_id='account', step_timeout_seconds=5))
+
+        [error] = result.enrichment_errors
+        assert (error.step, error.error_type, error.message) == ('coupons', 'TimeoutError', 'Retry deadline exceeded')
+
+    async def test_execute__takes_order_book_from_stream(
+        self,
+        mocker: 'MockerFixture',
+        make_position: 'Callable[..., PortfolioPosition]',
+        make_order_book: 'Callable[..., OrderBook]',
+        make_tinkoff: 'Callable[..., FakeTinkoff]',
+    ) -> None:
+        """Должен подписываться на облигации на время сборки и брать стакан из потока без запроса к API."""
+        portfolio = make_portfolio(
+            make_position('SHARE', InstrumentType.SHARE),
+            make_position('BOND-STREAMED', InstrumentType.BOND),
+            make_position('BOND-MISSED', InstrumentType.BOND),
+        )
+        tinkoff = make_tinkoff(portfolio)
+        stream = mocker.Mock()
+        streamed = make_order_book('BOND-STREAMED', bids=BIDS, asks=ASKS)
+        stream.get_order_book.side_effect = lambda figi, **_: streamed if figi == 'BOND-STREAMED' else None
+        uc = BuildPortfolioSnapshotUseCase(tinkoff=tinkoff, logger=mocker.Mock(), market_data_stream=stream)  # type: ignore[arg-type]
+
+        result = await uc.execute(BuildPortfolioSnapshotInput(account_id='account', order_book_depth=10))
+
+        stream.watch.assert_called_once_with(['BOND-STREAMED', 'BOND-MISSED'], order_book_depth=10)
+        stream.watch.return_value.assert_called_once_with()
+        order_books = [snapshot.enrichment.order_book for snapshot in result.positions[1:] if snapshot.enrichment]
+        assert order_books[0] is streamed
+        assert order_books[1] is not None
+        assert order_books[1].figi == 'BOND-MISSED'
+        assert tinkoff.order_book_calls == ['BOND-MISSED']
+
+    async def test_execute__evaluates_order_book_metrics_for_position_size(
+        self,
+        mocker: 'MockerFixture',
+        make_position: 'Callable[..., PortfolioPosition]',
+        make_tinkoff: 'Callable[..., FakeTinkoff]',
+    ) -> None:
+        """Должен считать метрики ликвидности стакана для продажи всей позиции."""
+        portfolio = make_portfolio(
+            make_position('SHARE', InstrumentType.SHARE),
+            make_position('BOND', InstrumentType.BOND, quantity=4),
+        )
+        uc = BuildPortfolioSnapshotUseCase(tinkoff=make_tinkoff(portfolio), logger=mocker.Mock())  # type: ignore[arg-type]
+
+        result = await uc.execute(BuildPortfolioSnapshotInput(account_id='account'))
+
+        enrichment = result.positions[1].enrichment
+        assert enrichment is not None
+        metrics = enrichment.order_book_metrics
+        assert metrics is not None
+        assert metrics.figi == 'BOND'
+        assert metrics.lots == 4  # noqa: PLR2004
+        assert metrics.mid == 100.0  # noqa: PLR2004
+        assert metrics.sell_vwap == pytest.approx(99.25)
+
+    async def test_execute__projects_income_calendar(
+        self,
+        mocker: 'MockerFixture',
+        make_position: 'Callable[..., PortfolioPosition]',
+        make_tinkoff: 'Callable[..., FakeTinkoff]',
+    ) -> None:
+        """Должен строить помесячный прогноз купонов и погашений по количеству бумаг позиций."""
+        portfolio = make_portfolio(
+            make_position('BOND-A', InstrumentType.BOND, quantity=2),
+            make_position('BOND-B', InstrumentType.BOND, quantity=3),
+            make_position('BOND-BROKEN', InstrumentType.BOND),
+        )
+        uc = BuildPortfolioSnapshotUseCase(tinkoff=make_tinkoff(portfolio), logger=mocker.Mock())  # type: ignore[arg-type]
+
+        result = await uc.execute(BuildPortfolioSnapshotInput(account_id='account'))
+
+        assert [
+            (bucket.currency, bucket.period_start, bucket.coupons, bucket.redemptions)
+            for bucket in result.income_calendar
+        ] == [
+            ('rub', date(2999, 1, 1), Decimal('177.5'), Decimal(0)),
+            ('rub', date(2999, 7, 1), Decimal(0), Decimal(5000)),
+        ]
+
+    async def test_execute__non_positive_concurrency_raises_value_error(self, mocker: 'MockerFixture') -> None:
+        """Должен выбрасывать ValueError при неположительном concurrency."""
+        uc = BuildPortfolioSnapshotUseCase(tinkoff=mocker.Mock(), logger=mocker.Mock())
+
+        with pytest.raises(ValueError, match='Concurrency must be a positive integer'):
+            await uc.execute(BuildPortfolioSnapshotInput(account_id='account', concurrency=0))
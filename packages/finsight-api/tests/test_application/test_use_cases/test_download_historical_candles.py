@@ -0,0 +1,85 @@
+"""Юнит-тесты Use Case загрузки исторических свечей."""
+
+from datetime import datetime, UTC
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_api.application.use_cases.download_historical_candles import DownloadHistoricalCandlesUseCase
+from finsight_api.domain.entities.candle_frame import CandleFrame, int64_column
+from finsight_api.domain.value_objects.candle_interval import CandleInterval
+from finsight_core.market_data.candle_coverage import CandleCoverage
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from pytest_mock import MockerFixture
+
+
+def make_frame(*times: int) -> CandleFrame:
+    return CandleFrame(
+        figi='BBG004730N88',
+        interval=CandleInterval.DAY,
+        time=int64_column(times),
+        open=int64_column(1 for _ in times),
+        high=int64_column(1 for _ in times),
+        low=int64_column(1 for _ in times),
+        close=int64_column(1 for _ in times),
+        volume=int64_column(1 for _ in times),
+    )
+
+
+@pytest.mark.unit
+class TestDownloadHistoricalCandlesUseCase:
+    async def test_execute__saves_each_window(self, mocker: 'MockerFixture') -> None:
+        """Должен сохранять свечи каждого окна по мере получения и возвращать их количество."""
+        frames = [make_frame(0, 86_400), make_frame(172_800)]
+
+        async def stream(*_: object) -> 'AsyncIterator[CandleFrame]':
+            for frame in frames:
+                yield frame
+
+        gateway = mocker.Mock()
+        gateway.stream_candle_frames_by_isin = stream
+        repository = mocker.AsyncMock()
+        repository.append.side_effect = len
+
+        saved = await DownloadHistoricalCandlesUseCase(gateway=gateway, repository=repository).execute(
+            'RU0009029540',
+            datetime(2024, 1, 1, tzinfo=UTC),
+            datetime(2024, 1, 4, tzinfo=UTC),
+            CandleInterval.DAY,
+        )
+
+        expected_saved = 3
+        assert saved == expected_saved
+        assert [len(call.args[0]) for call in repository.append.await_args_list] == [2, 1]
+
+    async def test_execute__incremental_fetches_only_missing_ranges(self, mocker: 'MockerFixture') -> None:
+        """Должен в инкрементальном режиме запрашивать только дыру и хвост после watermark."""
+        jan_1, jan_3, jan_5, jan_8 = (datetime(2024, 1, day, tzinfo=UTC) for day in (1, 3, 5, 8))
+        requested: list[tuple[datetime, datetime]] = []
+
+        async def stream(_isin: str, from_: datetime, to: datetime, _interval: object) -> 'AsyncIterator[CandleFrame]':
+            requested.append((from_, to))
+            yield make_frame(int(from_.timestamp()))
+
+        gateway = mocker.Mock()
+        gateway.stream_candle_frames_by_isin = stream
+        gateway.get_figi_by_isin = mocker.AsyncMock(return_value='BBG004730N88')
+        repository = mocker.AsyncMock()
+        repository.append.side_effect = len
+        repository.load_coverage.return_value = CandleCoverage().add(jan_1, jan_3).add(jan_5, jan_8)
+
+        use_case = DownloadHistoricalCandlesUseCase(
+            gateway=gateway, repository=repository, clock=lambda: datetime(2024, 2, 1, tzinfo=UTC)
+        )
+        saved = await use_case.execute(
+            'RU0009029540', jan_1, datetime(2024, 1, 10, tzinfo=UTC), CandleInterval.DAY, incremental=True
+        )
+
+        expected_saved = 2
+        assert saved == expected_saved
+        assert requested == [(jan_3, jan_5), (jan_8, datetime(2024, 1, 10, tzinfo=UTC))]
+        final_coverage = repository.save_coverage.await_args_list[-1].args[0]
+        assert final_coverage.missing(jan_1, datetime(2024, 1, 10, tzinfo=UTC)) == []
@@ -0,0 +1,97 @@
+"""Юнит-тесты Use Case bulk-получения облигаций по ISIN."""
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_api.application.use_cases.get_bonds_by_isin import GetBondsByIsinInput, GetBondsByIsinUseCase
+from finsight_api.domain.value_objects.isin import ISIN
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+class FakeInstruments:
+    """Фиктивный порт инструментов: отвечает с задержкой по ISIN и считает запросы."""
+
+    def __init__(self, delays: dict[str, float]) -> None:
+        """Инициализирует порт.
+
+        Args:
+            delays: Задержка ответа по ISIN; ISIN, начинающийся с 'XX', завершается ошибкой.
+        """
+        self.delays = delays
+        self.requested: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_bond_by_isin(self, isin: ISIN) -> str:
+        self.requested.append(isin.value)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(isin.value, 0))
+        finally:
+            self.in_flight -= 1
+        if isin.value.startswith('XX'):
+            raise LookupError(isin.value)
+        return f'bond-{isin.value}'
+
+
+SLOW = 'RU000A000001'
+FAST = 'RU000A000002'
+FAILING = 'XX000A000003'
+
+
+@pytest.mark.unit
+class TestGetBondsByIsinUseCase:
+    @staticmethod
+    def _make(instruments: FakeInstruments, mocker: 'MockerFixture') -> GetBondsByIsinUseCase:
+        return GetBondsByIsinUseCase(tinkoff=instruments, logger=mocker.Mock())  # type: ignore[arg-type]
+
+    async def test_stream__preserves_input_order_and_deduplicates(self, mocker: 'MockerFixture') -> None:
+        """Должен отдавать результаты в порядке входа и запрашивать повторы один раз."""
+        instruments = FakeInstruments({SLOW: 0.02})
+        uc = self._make(instruments, mocker)
+        isins = tuple(ISIN(value) for value in (SLOW, FAST, FAILING, FAST))
+
+        results = [result async for result in uc.stream(GetBondsByIsinInput(isins=isins, concurrency=2))]
+
+        assert [result.isin.value for result in results] == [SLOW, FAST, FAILING]
+        assert [result.bond for result in results] == [f'bond-{SLOW}', f'bond-{FAST}', None]
+        assert results[2].error == FAILING
+        assert sorted(instruments.requested) == sorted([SLOW, FAST, FAILING])
+        assert instruments.max_in_flight <= 2  # noqa: PLR2004
+
+    async def test_stream__yields_in_completion_order_when_unordered(self, mocker: 'MockerFixture') -> None:
+        """Должен отдавать быстрый ответ раньше медленного без preserve_order."""
+        instruments = FakeInstruments({SLOW: 0.02})
+        uc = self._make(instruments, mocker)
+        data = GetBondsByIsinInput(isins=(ISIN(SLOW), ISIN(FAST)), concurrency=2, preserve_order=False)
+
+        results = [result.isin.value async for result in uc.stream(data)]
+
+        assert results == [FAST, SLOW]
+
+    async def test_execute__collects_bonds_and_errors(self, mocker: 'MockerFixture') -> None:
+        """Должен собирать облигации и ошибки в один результат."""
+        uc = self._make(FakeInstruments({}), mocker)
+
+        output = await uc.execute(GetBondsByIsinInput(isins=(ISIN(FAST), ISIN(FAILING))))
+
+        assert output.bonds == (f'bond-{FAST}',)
+        assert output.failed_count == 1
+        assert output.errors[0].isin == ISIN(FAILING)
+
+    async def test_stream__answers_from_catalog_and_falls_back_on_miss(self, mocker: 'MockerFixture') -> None:
+        """Должен брать облигацию из каталога и запрашивать в Tinkoff только промахи."""
+        instruments = FakeInstruments({})
+        catalog = mocker.Mock()
+        catalog.get_by_isin = mocker.AsyncMock(side_effect=lambda isin: 'cached' if isin.value == SLOW else None)
+        uc = GetBondsByIsinUseCase(tinkoff=instruments, logger=mocker.Mock(), catalog=catalog)  # type: ignore[arg-type]
+
+        results = [result.bond async for result in uc.stream(GetBondsByIsinInput(isins=(ISIN(SLOW), ISIN(FAST))))]
+
+        assert results == ['cached', f'bond-{FAST}']
+        assert instruments.requested == [FAST]
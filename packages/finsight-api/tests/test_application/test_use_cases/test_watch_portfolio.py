@@ -0,0 +1,157 @@
+"""Юнит-тесты Use Case подписки на стоимость портфеля."""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_api.application.use_cases.watch_portfolio import PositionValuation, WatchPortfolioUseCase
+from finsight_api.domain.entities.portfolio import PortfolioEntity
+from finsight_api.domain.value_objects.instrument_type import InstrumentType
+from finsight_api.domain.value_objects.last_price import LastPrice
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_mock import MockerFixture
+
+    from finsight_api.domain.value_objects.portfolio_position import PortfolioPosition
+
+
+@pytest.fixture
+def portfolio(make_position: 'Callable[..., PortfolioPosition]') -> PortfolioEntity:
+    """Возвращает портфель из акции (10 x 250) и облигации (2 x 990)."""
+    return PortfolioEntity(
+        account_id='account',
+        total_amount_shares=Decimal(0),
+        total_amount_bonds=Decimal(0),
+        total_amount_etf=Decimal(0),
+        total_amount_futures=Decimal(0),
+        total_value=Decimal(0),
+        cash_balance=Decimal(0),
+        currency='rub',
+        positions=(
+            make_position('SHARE', InstrumentType.SHARE, quantity=10, price=250),
+            make_position('BOND', InstrumentType.BOND, quantity=2, price=990),
+        ),
+    )
+
+
+class FakeStream:
+    """Фиктивный поток маркет-данных с одним набором слушателей."""
+
+    def __init__(self) -> None:
+        """Инициализирует поток без слушателей."""
+        self.listeners: list[Callable[[LastPrice], None]] = []
+        self.watched: list[str] = []
+        self.released: list[str] = []
+
+    def watch(self, figis: list[str], **_: object) -> 'Callable[[], None]':
+        self.watched.extend(figis)
+        return lambda: self.released.extend(figis)
+
+    def add_last_price_listener(self, listener: 'Callable[[LastPrice], None]') -> 'Callable[[], None]':
+        self.listeners.append(listener)
+        return lambda: self.listeners.remove(listener)
+
+    def publish(self, figi: str, price: str) -> None:
+        for listener in list(self.listeners):
+            listener(LastPrice(figi=figi, price=Decimal(price), time=None))
+
+
+@pytest.mark.unit
+class TestWatchPortfolioUseCase:
+    @staticmethod
+    def _make(
+        mocker: 'MockerFixture',
+        stream: FakeStream,
+        portfolio: PortfolioEntity,
+    ) -> tuple[WatchPortfolioUseCase, SimpleNamespace]:
+        tinkoff = SimpleNamespace(
+            get_portfolio=mocker.AsyncMock(return_value=portfolio),
+            get_bond_by_figi=mocker.AsyncMock(
+                return_value=SimpleNamespace(nominal=SimpleNamespace(amount=Decimal(1000))),
+            ),
+        )
+        uc = WatchPortfolioUseCase(tinkoff=tinkoff, market_data_stream=stream, logger=mocker.Mock())  # type: ignore[arg-type]
+        return uc, tinkoff
+
+    async def test_watch__fans_out_revalued_positions_from_one_subscription(
+        self,
+        mocker: 'MockerFixture',
+        portfolio: PortfolioEntity,
+    ) -> None:
+        """Должен раздавать пересчитанную стоимость всем подписчикам счёта из одной подписки."""
+        stream = FakeStream()
+        uc, tinkoff = self._make(mocker, stream, portfolio)
+        first, second = uc.watch('account'), uc.watch('account')
+
+        snapshots = [await anext(first), await anext(second)]
+        stream.publish('BOND', '101.5')
+        updates = await asyncio.gather(anext(first), anext(second))
+
+        assert all(isinstance(snapshot, PortfolioEntity) for snapshot in snapshots)
+        tinkoff.get_portfolio.assert_awaited_once_with('account')
+        assert len(stream.listeners) == 1
+        assert sorted(stream.watched) == ['BOND', 'SHARE']
+        expected = PositionValuation(
+            figi='BOND',
+            current_price=Decimal('1015.0'),
+            value=Decimal('2030.0'),
+            total_value=Decimal('4530.0'),
+            time=None,
+        )
+        assert updates == [expected, expected]
+
+    async def test_watch__coalesces_pending_updates_and_closes_with_last_subscriber(
+        self,
+        mocker: 'MockerFixture',
+        portfolio: PortfolioEntity,
+    ) -> None:
+        """Должен отдавать медленному подписчику последнее изменение позиции и снимать подписку с последним."""
+        stream = FakeStream()
+        uc, _ = self._make(mocker, stream, portfolio)
+        events = uc.watch('account')
+        await anext(events)
+
+        stream.publish('SHARE', '251')
+        stream.publish('SHARE', '252')
+        update = await anext(events)
+        await events.aclose()
+
+        assert isinstance(update, PositionValuation)
+        assert update.current_price == Decimal(252)
+        assert stream.listeners == []
+        assert sorted(stream.released) == ['BOND', 'SHARE']
+        assert uc.account_ids == frozenset()
+
+    async def test_watch__opens_accounts_independently(
+        self,
+        mocker: 'MockerFixture',
+        portfolio: PortfolioEntity,
+    ) -> None:
+        """Должен открывать подписку счёта, не дожидаясь загрузки портфеля другого счёта."""
+        stream = FakeStream()
+        uc, tinkoff = self._make(mocker, stream, portfolio)
+        release = asyncio.Event()
+
+        async def get_portfolio(account_id: str) -> PortfolioEntity:
+            if account_id == 'slow':
+                await release.wait()
+            return portfolio
+
+        tinkoff.get_portfolio.side_effect = get_portfolio
+        slow_events, fast_events = uc.watch('slow'), uc.watch('fast')
+        slow = asyncio.ensure_future(anext(slow_events))
+        await asyncio.sleep(0)
+
+        fast = await asyncio.wait_for(anext(fast_events), timeout=1)
+        release.set()
+
+        assert isinstance(fast, PortfolioEntity)
+        assert isinstance(await slow, PortfolioEntity)
+        assert uc.account_ids == frozenset({'slow', 'fast'})
+        await slow_events.aclose()
+        await fast_events.aclose()
@@ -0,0 +1,116 @@
+"""Тесты доходности и риск-метрик облигаций."""
+
+from datetime import date, datetime, timedelta, UTC
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_api.domain.analytics.bond import analyze_bonds, BondCashFlows
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from finsight_api.domain.entities.bond import BondEntity
+    from finsight_api.domain.value_objects.bond_coupon import BondCoupon
+
+SETTLEMENT = date(2025, 1, 1)
+
+
+def at(days: int) -> datetime:
+    return datetime.combine(SETTLEMENT, datetime.min.time(), tzinfo=UTC) + timedelta(days=days)
+
+
+@pytest.fixture
+def coupons(make_coupon: 'Callable[..., BondCoupon]') -> 'list[BondCoupon]':
+    """Возвращает график из трёх купонов по 40: один выплачен, два впереди."""
+    return [
+        make_coupon('BOND', at(-91), '40', number=1),
+        make_coupon('BOND', at(91), '40', number=2),
+        make_coupon('BOND', at(273), '40', number=3),
+    ]
+
+
+@pytest.mark.unit
+class TestBondAnalytics:
+    """Тесты пакетного расчёта метрик облигаций."""
+
+    @staticmethod
+    def test_analyze_bonds__zero_coupon_closed_form(make_bond: 'Callable[..., BondEntity]') -> None:
+        """Должен совпадать с аналитическим решением для бескупонной облигации."""
+        flows = BondCashFlows.from_schedule(make_bond(maturity_date=at(365)), [], settlement=SETTLEMENT)
+
+        [result] = analyze_bonds([flows], [Decimal(900)])
+
+        assert result.ytm == pytest.approx(1000 / 900 - 1)
+        assert result.macaulay_duration == pytest.approx(1.0)
+        assert result.modified_duration == pytest.approx(900 / 1000)
+        assert result.convexity == pytest.approx(2 / (1000 / 900) ** 2)
+        assert result.current_yield == 0.0
+
+    @staticmethod
+    def test_analyze_bonds__solves_batch_with_accrued_interest(
+        make_bond: 'Callable[..., BondEntity]',
+        coupons: 'list[BondCoupon]',
+    ) -> None:
+        """Должен решать доходность для пакета облигаций с учётом НКД в грязной цене."""
+        flows = BondCashFlows.from_schedule(make_bond(maturity_date=at(273)), coupons, settlement=SETTLEMENT)
+        zero = BondCashFlows.from_schedule(make_bond(maturity_date=at(365)), [], settlement=SETTLEMENT)
+
+        coupon_bond, zero_bond = analyze_bonds([flows, zero], [Decimal(980), Decimal(900)])
+
+        assert list(flows.times) == [91 / 365, 273 / 365]
+        assert list(flows.amounts) == [40.0, 1040.0]
+        assert coupon_bond.accrued_interest == Decimal('20.00')
+        assert coupon_bond.dirty_price == Decimal('1000.00')
+        assert coupon_bond.ytm is not None
+        present_value = sum(a / (1 + coupon_bond.ytm) ** t for t, a in zip(flows.times, flows.amounts, strict=True))
+        assert present_value == pytest.approx(1000.0)
+        assert coupon_bond.current_yield == pytest.approx(80 / 980)
+        assert zero_bond.ytm == pytest.approx(1000 / 900 - 1)
+
+    @staticmethod
+    def test_analyze_bonds__matured_bond_has_no_yield(
+        make_bond: 'Callable[..., BondEntity]',
+        coupons: 'list[BondCoupon]',
+    ) -> None:
+        """Должен возвращать None для метрик облигации без будущих выплат."""
+        flows = BondCashFlows.from_schedule(make_bond(maturity_date=at(-1)), coupons[:1], settlement=SETTLEMENT)
+
+        [result] = analyze_bonds([flows], [Decimal(1000)])
+
+        assert len(flows) == 0
+        assert (result.ytm, result.macaulay_duration, result.convexity) == (None, None, None)
+        assert result.accrued_interest == Decimal(0)
+
+    @staticmethod
+    def test_analyze_bonds__distressed_short_bond_has_no_yield(make_bond: 'Callable[..., BondEntity]') -> None:
+        """Должен возвращать None для облигации, доходность которой не представима, не роняя пакет."""
+        distressed = BondCashFlows.from_schedule(make_bond(maturity_date=at(1)), [], settlement=SETTLEMENT)
+        zero = BondCashFlows.from_schedule(make_bond(maturity_date=at(365)), [], settlement=SETTLEMENT)
+
+        distressed_bond, zero_bond = analyze_bonds([distressed, zero], [Decimal(50), Decimal(900)])
+
+        assert list(distressed.times) == [1 / 365]
+        assert (distressed_bond.ytm, distressed_bond.macaulay_duration, distressed_bond.convexity) == (None, None, None)
+        assert zero_bond.ytm == pytest.approx(1000 / 900 - 1)
+
+    @staticmethod
+    def test_from_schedule__projects_floating_coupons_and_flags_estimates(
+        make_bond: 'Callable[..., BondEntity]',
+        make_coupon: 'Callable[..., BondCoupon]',
+        coupons: 'list[BondCoupon]',
+    ) -> None:
+        """Должен принимать неустановленные плавающие купоны равными последнему и помечать допущения."""
+        coupons = [*coupons[:2], make_coupon('BOND', at(273), '0', number=3)]
+
+        floater = BondCashFlows.from_schedule(
+            make_bond(maturity_date=at(273), floating=True), coupons, settlement=SETTLEMENT
+        )
+        amortizing = BondCashFlows.from_schedule(
+            make_bond(maturity_date=at(273), amortizing=True), coupons, settlement=SETTLEMENT
+        )
+
+        assert list(floater.amounts) == [40.0, 1040.0]
+        assert floater.estimated
+        assert amortizing.estimated
@@ -0,0 +1,117 @@
+"""Тесты прогноза купонных выплат и погашений портфеля."""
+
+from datetime import date, datetime, UTC
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_api.domain.analytics.cash_flows import CashFlowPeriod, CashFlowProjection
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from finsight_api.domain.entities.bond import BondEntity
+    from finsight_api.domain.value_objects.bond_coupon import BondCoupon
+    from finsight_api.domain.value_objects.portfolio_position import PortfolioPosition
+
+START = date(2025, 1, 1)
+
+
+def at(year: int, month: int, day: int) -> datetime:
+    return datetime(year, month, day, tzinfo=UTC)
+
+
+@pytest.fixture
+def ofz(
+    make_bond: 'Callable[..., BondEntity]',
+    make_coupon: 'Callable[..., BondCoupon]',
+) -> 'tuple[BondEntity, list[BondCoupon]]':
+    """Возвращает рублёвую облигацию с полугодовыми купонами по 30 и погашением в марте 2026."""
+    coupon_dates = [at(2024, 9, 10), at(2025, 3, 10), at(2025, 9, 10), at(2026, 3, 10)]
+    return make_bond('OFZ', maturity_date=at(2026, 3, 10)), [make_coupon('OFZ', day, '30') for day in coupon_dates]
+
+
+@pytest.fixture
+def usd(
+    make_bond: 'Callable[..., BondEntity]',
+    make_coupon: 'Callable[..., BondCoupon]',
+) -> 'tuple[BondEntity, list[BondCoupon]]':
+    """Возвращает долларовую облигацию с одним купоном 12.5 и погашением в 2027 году."""
+    bond = make_bond('USD', maturity_date=at(2027, 1, 1), currency='usd')
+    return bond, [make_coupon('USD', at(2025, 3, 20), '12.5', currency='usd')]
+
+
+def as_rows(projection: CashFlowProjection, period: CashFlowPeriod) -> list[tuple[str, date, Decimal, Decimal]]:
+    return [
+        (bucket.currency, bucket.period_start, bucket.coupons, bucket.redemptions)
+        for bucket in projection.buckets(period)
+    ]
+
+
+@pytest.mark.unit
+class TestCashFlowProjection:
+    """Тесты прогноза выплат портфеля."""
+
+    @staticmethod
+    def test_buckets__groups_coupons_and_redemptions_by_period_and_currency(
+        make_position: 'Callable[..., PortfolioPosition]',
+        ofz: 'tuple[BondEntity, list[BondCoupon]]',
+        usd: 'tuple[BondEntity, list[BondCoupon]]',
+    ) -> None:
+        """Должен суммировать будущие выплаты позиций по периодам и валютам."""
+        projection = CashFlowProjection.from_positions(
+            [(make_position('OFZ', quantity=2), *ofz), (make_position('USD', quantity=4), *usd)],
+            start=START,
+        )
+
+        assert as_rows(projection, CashFlowPeriod.MONTH) == [
+            ('rub', date(2025, 3, 1), Decimal(60), Decimal(0)),
+            ('rub', date(2025, 9, 1), Decimal(60), Decimal(0)),
+            ('rub', date(2026, 3, 1), Decimal(60), Decimal(2000)),
+            ('usd', date(2025, 3, 1), Decimal(50), Decimal(0)),
+            ('usd', date(2027, 1, 1), Decimal(0), Decimal(4000)),
+        ]
+        assert as_rows(projection, CashFlowPeriod.YEAR)[0] == ('rub', date(2025, 1, 1), Decimal(120), Decimal(0))
+        assert as_rows(projection, CashFlowPeriod.DAY)[0] == ('rub', date(2025, 3, 10), Decimal(60), Decimal(0))
+
+    @staticmethod
+    def test_set_position__recomputes_only_changed_position(
+        make_position: 'Callable[..., PortfolioPosition]',
+        ofz: 'tuple[BondEntity, list[BondCoupon]]',
+        usd: 'tuple[BondEntity, list[BondCoupon]]',
+    ) -> None:
+        """Должен пересчитывать прогноз при изменении и удалении одной позиции."""
+        projection = CashFlowProjection.from_positions([(make_position('OFZ', quantity=2), *ofz)], start=START)
+        projection.set_position(make_position('USD', quantity=1), *usd)
+
+        projection.set_position(make_position('OFZ', quantity=1), *ofz)
+        assert as_rows(projection, CashFlowPeriod.YEAR) == [
+            ('rub', date(2025, 1, 1), Decimal(60), Decimal(0)),
+            ('rub', date(2026, 1, 1), Decimal(30), Decimal(1000)),
+            ('usd', date(2025, 1, 1), Decimal('12.5'), Decimal(0)),
+            ('usd', date(2027, 1, 1), Decimal(0), Decimal(1000)),
+        ]
+
+        projection.remove_position('OFZ')
+        assert projection.figis == frozenset({'USD'})
+        assert {bucket.currency for bucket in projection.buckets()} == {'usd'}
+
+    @staticmethod
+    def test_from_schedule__projects_floating_coupons_within_window(
+        make_bond: 'Callable[..., BondEntity]',
+        make_coupon: 'Callable[..., BondCoupon]',
+        make_position: 'Callable[..., PortfolioPosition]',
+    ) -> None:
+        """Должен принимать неустановленный плавающий купон равным последнему и учитывать окно прогноза."""
+        floater = make_bond('FLOAT', maturity_date=at(2030, 1, 1), floating=True)
+        coupons = [make_coupon('FLOAT', at(2025, 2, 1), '45'), make_coupon('FLOAT', at(2025, 8, 1), '0')]
+
+        projection = CashFlowProjection.from_positions(
+            [(make_position('FLOAT', quantity=1), floater, coupons)], start=START, end=date(2025, 12, 31)
+        )
+
+        assert as_rows(projection, CashFlowPeriod.MONTH) == [
+            ('rub', date(2025, 2, 1), Decimal(45), Decimal(0)),
+            ('rub', date(2025, 8, 1), Decimal(45), Decimal(0)),
+        ]
@@ -0,0 +1,65 @@
+"""Тесты аналитики ликвидности стакана."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_api.domain.analytics.order_book import analyze_order_books, OrderBookFrame
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from finsight_api.domain.value_objects.order_book import OrderBook
+
+
+@pytest.fixture
+def order_book(make_order_book: 'Callable[..., OrderBook]') -> 'OrderBook':
+    """Возвращает стакан облигации с тремя уровнями на каждой стороне и mid 100."""
+    return make_order_book(
+        bids=[('99.9', 3), ('99.8', 5), ('99.5', 10)],
+        asks=[('100.1', 1), ('100.2', 4), ('100.6', 10)],
+    )
+
+
+@pytest.mark.unit
+class TestOrderBookFrame:
+    """Тесты метрик колоночного стакана."""
+
+    @staticmethod
+    def test_metrics__top_of_book_and_cumulative_depth(order_book: 'OrderBook') -> None:
+        """Должен считать лучшие цены, спред, microprice и накопленную глубину."""
+        frame = OrderBookFrame.from_order_book(order_book)
+
+        metrics = frame.metrics(1)
+
+        assert (metrics.best_bid, metrics.best_ask, metrics.mid) == (99.9, 100.1, 100.0)
+        assert metrics.spread == pytest.approx(0.2)
+        assert metrics.spread_bps == pytest.approx(20.0)
+        assert metrics.microprice == pytest.approx((99.9 * 1 + 100.1 * 3) / 4)
+        assert list(frame.bids.cumulative_quantities) == [3, 8, 18]
+        assert (metrics.bid_depth, metrics.ask_depth) == (18, 15)
+
+    @staticmethod
+    def test_metrics__vwap_and_impact_walk_levels(order_book: 'OrderBook') -> None:
+        """Должен считать VWAP и impact исполнения объёма через несколько уровней."""
+        metrics = OrderBookFrame.from_order_book(order_book).metrics(6)
+
+        assert metrics.buy_vwap == pytest.approx((100.1 * 1 + 100.2 * 4 + 100.6 * 1) / 6)
+        assert metrics.sell_vwap == pytest.approx((99.9 * 3 + 99.8 * 3) / 6)
+        assert metrics.buy_impact_bps == pytest.approx((metrics.buy_vwap - 100.0) / 100.0 * 10_000)
+        assert metrics.sell_impact_bps == pytest.approx((100.0 - metrics.sell_vwap) / 100.0 * 10_000)
+
+    @staticmethod
+    def test_metrics__insufficient_liquidity_yields_none(
+        make_order_book: 'Callable[..., OrderBook]',
+        order_book: 'OrderBook',
+    ) -> None:
+        """Должен возвращать None для метрик, которые нельзя посчитать по стакану."""
+        one_sided = make_order_book(bids=[('99.9', 3)], asks=[])
+
+        metrics = analyze_order_books([(order_book, 100), (one_sided, 1)])
+
+        assert (metrics[0].buy_vwap, metrics[0].sell_impact_bps) == (None, None)
+        assert metrics[0].spread_bps is not None
+        assert (metrics[1].best_bid, metrics[1].best_ask, metrics[1].mid) == (99.9, None, None)
+        assert (metrics[1].sell_vwap, metrics[1].sell_impact_bps) == (99.9, None)
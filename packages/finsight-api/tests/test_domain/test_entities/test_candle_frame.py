@@ -0,0 +1,96 @@
+"""Тесты для колоночной серии свечей CandleFrame."""
+
+from array import array
+from datetime import datetime, timedelta, UTC
+
+import pytest
+
+from finsight_api.domain.entities.candle import CandleEntity
+from finsight_api.domain.entities.candle_frame import CandleFrame, int64_column
+from finsight_api.domain.value_objects.candle_interval import CandleInterval
+
+START = datetime(2024, 1, 1, 10, 0, tzinfo=UTC)
+
+
+def make_candles(count: int) -> list[CandleEntity]:
+    return [
+        CandleEntity(
+            figi='BBG004730N88',
+            time=START + timedelta(minutes=i),
+            open=100.5 + i,
+            close=101.25 + i,
+            high=102.0 + i,
+            low=99.75 + i,
+            volume=10 * i,
+            interval=CandleInterval.MIN_1,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.unit
+class TestCandleFrame:
+    """Тесты колоночного представления свечей."""
+
+    @staticmethod
+    def test_from_entities__round_trip() -> None:
+        """Должен без потерь переводить свечи в колонки и обратно."""
+        candles = make_candles(5)
+
+        frame = CandleFrame.from_entities(candles, figi='BBG004730N88', interval=CandleInterval.MIN_1)
+
+        expected_open_nanos = 100_500_000_000
+        assert len(frame) == len(candles)
+        assert frame.open[0] == expected_open_nanos
+        assert frame.to_entities() == candles
+
+    @staticmethod
+    def test_between__slices_without_copy() -> None:
+        """Должен возвращать свечи полуинтервала [from_, to), разделяя буферы с исходной серией."""
+        frame = CandleFrame.from_entities(make_candles(10), figi='BBG004730N88', interval=CandleInterval.MIN_1)
+
+        window = frame.between(START + timedelta(minutes=2), START + timedelta(minutes=5))
+
+        assert [candle.time.minute for candle in window.to_entities()] == [2, 3, 4]
+        assert window.close.obj is frame.close.obj
+
+    @staticmethod
+    def test_columns__are_read_only_and_frame_is_hashable() -> None:
+        """Должен отдавать колонки только на чтение и хешироваться по идентичности."""
+        frame = CandleFrame.from_entities(make_candles(3), figi='BBG004730N88', interval=CandleInterval.MIN_1)
+        merged = CandleFrame.concat([frame], figi='BBG004730N88', interval=CandleInterval.MIN_1)
+
+        with pytest.raises(TypeError):
+            frame.slice(0, 2).close[0] = 0
+        assert merged.close.readonly
+        assert len({frame, merged}) == 2  # noqa: PLR2004
+
+    @staticmethod
+    def test_init__writable_columns_raise_value_error() -> None:
+        """Должен выбрасывать ValueError, если колонка доступна на запись."""
+        with pytest.raises(ValueError, match='read-only'):
+            CandleFrame(
+                figi='BBG004730N88',
+                interval=CandleInterval.DAY,
+                time=memoryview(array('q', [1])),
+                open=int64_column([1]),
+                high=int64_column([1]),
+                low=int64_column([1]),
+                close=int64_column([1]),
+                volume=int64_column([1]),
+            )
+
+    @staticmethod
+    def test_init__columns_of_different_length_raise_value_error() -> None:
+        """Должен выбрасывать ValueError, если колонки разной длины."""
+        with pytest.raises(ValueError, match='equal length'):
+            CandleFrame(
+                figi='BBG004730N88',
+                interval=CandleInterval.DAY,
+                time=int64_column([1, 2]),
+                open=int64_column([1]),
+                high=int64_column([1]),
+                low=int64_column([1]),
+                close=int64_column([1]),
+                volume=int64_column([1]),
+            )
@@ -0,0 +1,84 @@
+"""Тесты быстрого создания доменных объектов из доверенных данных."""
+
+import dataclasses
+from datetime import datetime, UTC
+from decimal import Decimal
+
+import pytest
+
+from finsight_api.domain.entities.candle import CandleEntity
+from finsight_api.domain.trusted import slot_setters
+from finsight_api.domain.value_objects.bond_coupon import BondCoupon
+from finsight_api.domain.value_objects.candle_interval import CandleInterval
+from finsight_api.domain.value_objects.instrument_type import InstrumentType
+from finsight_api.domain.value_objects.money import Money
+from finsight_api.domain.value_objects.order_book import OrderBookLevel
+from finsight_api.domain.value_objects.portfolio_position import PortfolioPosition
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+RUB = Money(currency='rub', amount=Decimal('12.5'))
+
+FIELDS = [
+    (
+        CandleEntity,
+        {
+            'figi': 'FIGI',
+            'time': NOW,
+            'open': 1.0,
+            'close': 2.0,
+            'high': 3.0,
+            'low': 0.5,
+            'volume': 10,
+            'interval': CandleInterval.MIN_1,
+        },
+    ),
+    (OrderBookLevel, {'price': RUB, 'quantity': 3}),
+    (
+        BondCoupon,
+        {
+            'figi': 'FIGI',
+            'coupon_date': NOW,
+            'coupon_number': 1,
+            'fix_date': NOW,
+            'pay_one_bond': RUB,
+            'coupon_type': 'COUPON_TYPE_CONSTANT',
+            'coupon_start_date': NOW,
+            'coupon_end_date': NOW,
+            'coupon_period': 182,
+        },
+    ),
+    (
+        PortfolioPosition,
+        {
+            'figi': 'FIGI',
+            'instrument_type': InstrumentType.BOND,
+            'quantity': Decimal(2),
+            'expected_yield': Decimal(0),
+            'average_position_price': Decimal(990),
+            'current_price': Decimal(1000),
+            'current_nkd': None,
+            'value': Decimal(2000),
+            'instrument_uid': 'uid',
+        },
+    ),
+]
+
+
+@pytest.mark.unit
+class TestFromTrusted:
+    @staticmethod
+    @pytest.mark.parametrize(('domain_type', 'fields'), FIELDS, ids=[cls.__name__ for cls, _ in FIELDS])
+    def test_from_trusted__equals_validated_construction(domain_type: type, fields: dict[str, object]) -> None:
+        """Должен создавать объект, равный созданному конструктором, и остающийся неизменяемым."""
+        trusted = domain_type._from_trusted(**fields)  # type: ignore[attr-defined]
+
+        assert trusted == domain_type(**fields)
+        assert hash(trusted) == hash(domain_type(**fields))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            setattr(trusted, next(iter(fields)), None)
+
+    @staticmethod
+    def test_slot_setters__rejects_non_slot_field() -> None:
+        """Должен выбрасывать TypeError для поля, не являющегося слотом."""
+        with pytest.raises(TypeError, match='is not a slot'):
+            slot_setters(OrderBookLevel, 'missing')
@@ -0,0 +1,123 @@
+"""Юнит-тесты колоночного хранилища свечей ColumnarCandleRepository."""
+
+from datetime import datetime, UTC
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_api.domain.entities.candle_frame import CandleFrame, int64_column
+from finsight_api.domain.value_objects.candle_interval import CandleInterval
+from finsight_api.infrastructure.adapters.storage import ColumnarCandleRepository
+from finsight_core.market_data.candle_coverage import CandleCoverage
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+FIGI = 'BBG004730N88'
+DAY = 86_400
+JAN_30 = int(datetime(2024, 1, 30, tzinfo=UTC).timestamp())
+
+
+def make_frame(times: list[int], price: int = 100) -> CandleFrame:
+    return CandleFrame(
+        figi=FIGI,
+        interval=CandleInterval.DAY,
+        time=int64_column(times),
+        open=int64_column(price for _ in times),
+        high=int64_column(price for _ in times),
+        low=int64_column(price for _ in times),
+        close=int64_column(price for _ in times),
+        volume=int64_column(1 for _ in times),
+    )
+
+
+@pytest.mark.unit
+class TestColumnarCandleRepository:
+    async def test_append__partitions_by_month_and_reads_range(self, tmp_path: 'Path', mocker: 'MockerFixture') -> None:
+        """Должен раскладывать свечи по месячным партициям и читать только запрошенный период."""
+        repository = ColumnarCandleRepository(root=tmp_path, logger=mocker.Mock())
+        times = [JAN_30 + i * DAY for i in range(4)]
+
+        added = await repository.append(make_frame(times))
+
+        partitions = sorted(path.name for path in (tmp_path / FIGI / 'day').iterdir())
+        assert added == len(times)
+        assert partitions == ['2024-01.candles', '2024-02.candles']
+
+        loaded = await repository.load(
+            figi=FIGI,
+            interval=CandleInterval.DAY,
+            from_=datetime(2024, 1, 31, tzinfo=UTC),
+            to=datetime(2024, 2, 2, tzinfo=UTC),
+        )
+        assert list(loaded.time) == times[1:3]
+
+    async def test_append__deduplicates_by_time(self, tmp_path: 'Path', mocker: 'MockerFixture') -> None:
+        """Должен заменять свечи с уже сохранённым временем новыми значениями, не дублируя их."""
+        repository = ColumnarCandleRepository(root=tmp_path, logger=mocker.Mock())
+        await repository.append(make_frame([JAN_30 - 2 * DAY, JAN_30]))
+
+        added = await repository.append(make_frame([JAN_30 - DAY, JAN_30], price=200))
+
+        loaded = await repository.load(
+            figi=FIGI,
+            interval=CandleInterval.DAY,
+            from_=datetime(2024, 1, 1, tzinfo=UTC),
+            to=datetime(2024, 2, 1, tzinfo=UTC),
+        )
+        assert added == 1
+        assert list(loaded.time) == [JAN_30 - 2 * DAY, JAN_30 - DAY, JAN_30]
+        assert list(loaded.close) == [100, 200, 200]
+
+    async def test_load__ignores_torn_tail(self, tmp_path: 'Path', mocker: 'MockerFixture') -> None:
+        """Должен игнорировать недописанный блок в конце партиции и отрезать его при следующей записи."""
+        repository = ColumnarCandleRepository(root=tmp_path, logger=mocker.Mock())
+        await repository.append(make_frame([JAN_30 - DAY]))
+        partition = tmp_path / FIGI / 'day' / '2024-01.candles'
+        partition.write_bytes(partition.read_bytes() + b'FSC1\x05\x00\x00\x00garbage')
+
+        await repository.append(make_frame([JAN_30]))
+
+        loaded = await repository.load(
+            figi=FIGI,
+            interval=CandleInterval.DAY,
+            from_=datetime(2024, 1, 1, tzinfo=UTC),
+            to=datetime(2024, 2, 1, tzinfo=UTC),
+        )
+        assert list(loaded.time) == [JAN_30 - DAY, JAN_30]
+
+    async def test_append__truncates_corrupted_block(self, tmp_path: 'Path', mocker: 'MockerFixture') -> None:
+        """Должен читать партицию до повреждённого блока и отрезать его при следующей записи с предупреждением."""
+        logger = mocker.Mock()
+        repository = ColumnarCandleRepository(root=tmp_path, logger=logger)
+        await repository.append(make_frame([JAN_30 - 2 * DAY]))
+        partition = tmp_path / FIGI / 'day' / '2024-01.candles'
+        valid = partition.read_bytes()
+        partition.write_bytes(valid + b'XXXX' + valid[4:])
+
+        await repository.append(make_frame([JAN_30]))
+
+        loaded = await repository.load(
+            figi=FIGI,
+            interval=CandleInterval.DAY,
+            from_=datetime(2024, 1, 1, tzinfo=UTC),
+            to=datetime(2024, 2, 1, tzinfo=UTC),
+        )
+        assert list(loaded.time) == [JAN_30 - 2 * DAY, JAN_30]
+        assert partition.read_bytes().startswith(valid + b'FSC1')
+        logger.warning.assert_called_once()
+
+    async def test_coverage__roundtrip(self, tmp_path: 'Path', mocker: 'MockerFixture') -> None:
+        """Должен сохранять покрытие загруженных периодов и читать его после перезапуска."""
+        coverage = CandleCoverage().add(datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 2, 1, tzinfo=UTC))
+        await ColumnarCandleRepository(root=tmp_path, logger=mocker.Mock()).save_coverage(
+            coverage, figi=FIGI, interval=CandleInterval.DAY
+        )
+
+        repository = ColumnarCandleRepository(root=tmp_path, logger=mocker.Mock())
+
+        assert await repository.load_coverage(figi=FIGI, interval=CandleInterval.DAY) == coverage
+        assert await repository.load_coverage(figi=FIGI, interval=CandleInterval.HOUR) == CandleCoverage()
@@ -0,0 +1,99 @@
+"""Юнит-тесты пула gRPC-сессий TinkoffChannelPool."""
+
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+import pytest
+from grpc import StatusCode
+
+from finsight_api.infrastructure.adapters.tinkoff.channel_pool import TinkoffChannelPool
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from pytest_mock import MockerFixture
+
+
+class FakeChannelError(Exception):
+    def __init__(self, code: StatusCode) -> None:
+        """Создаёт ошибку с gRPC-статусом, как у AioRequestError."""
+        super().__init__(code.name)
+        self.code = code
+
+
+class FakeConnector:
+    """Фабрика фиктивных сессий, считающая открытия и закрытия каналов."""
+
+    def __init__(self) -> None:
+        """Инициализирует счётчики открытий и закрытий."""
+        self.opened = 0
+        self.closed = 0
+
+    @asynccontextmanager
+    async def __call__(self) -> 'AsyncGenerator[object]':
+        self.opened += 1
+        try:
+            yield object()
+        finally:
+            self.closed += 1
+
+
+@pytest.mark.unit
+class TestTinkoffChannelPool:
+    @staticmethod
+    def _make_pool(connector: FakeConnector, mocker: 'MockerFixture', size: int = 2) -> TinkoffChannelPool:
+        return TinkoffChannelPool(connect=connector, logger=mocker.Mock(), size=size)
+
+    async def test_session__reuses_open_channels(self, mocker: 'MockerFixture') -> None:
+        """Должен открывать каналы один раз и переиспользовать их между вызовами."""
+        connector = FakeConnector()
+        pool = self._make_pool(connector, mocker)
+
+        await pool.open()
+        for _ in range(10):
+            async with pool():
+                pass
+
+        assert connector.opened == pool.size
+        assert connector.closed == 0
+
+        await pool.close()
+        assert connector.closed == pool.size
+
+    async def test_session__reconnects_after_unavailable(self, mocker: 'MockerFixture') -> None:
+        """Должен переоткрывать канал после ошибки UNAVAILABLE."""
+        connector = FakeConnector()
+        pool = self._make_pool(connector, mocker, size=1)
+
+        with pytest.raises(FakeChannelError):
+            async with pool():
+                raise FakeChannelError(StatusCode.UNAVAILABLE)
+
+        assert connector.closed == 1
+
+        async with pool():
+            pass
+
+        expected_opened = 2
+        assert connector.opened == expected_opened
+
+    async def test_session__keeps_channel_on_request_error(self, mocker: 'MockerFixture') -> None:
+        """Не должен переоткрывать канал при ошибке запроса, не связанной с транспортом."""
+        connector = FakeConnector()
+        pool = self._make_pool(connector, mocker, size=1)
+
+        with pytest.raises(FakeChannelError):
+            async with pool():
+                raise FakeChannelError(StatusCode.INVALID_ARGUMENT)
+
+        async with pool():
+            pass
+
+        assert connector.opened == 1
+        assert connector.closed == 0
+
+    @staticmethod
+    def test_init__non_positive_size_raises_value_error(mocker: 'MockerFixture') -> None:
+        """Должен выбрасывать ValueError при неположительном размере пула."""
+        with pytest.raises(ValueError, match='Channel pool size must be a positive integer'):
+            TinkoffChannelPool(connect=FakeConnector(), logger=mocker.Mock(), size=0)
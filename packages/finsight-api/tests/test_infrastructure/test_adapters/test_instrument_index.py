@@ -0,0 +1,93 @@
+"""Юнит-тесты индекса инструментов TinkoffInstrumentIndex."""
+
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_api.infrastructure.adapters.tinkoff.instrument_index import InstrumentRef, TinkoffInstrumentIndex
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+BOND = InstrumentRef(figi='BBG00BOND001', isin='RU000A0JX0J2', uid='uid-bond', ticker='RU000A0JX0J2', class_code='TQCB')
+SHARE = InstrumentRef(figi='BBG004730N88', isin='RU0009029540', uid='uid-share', ticker='SBER', class_code='TQBR')
+
+
+class FakeInstruments:
+    """Фиктивный сервис инструментов, считающий загрузки справочников."""
+
+    def __init__(self) -> None:
+        """Инициализирует счётчик загрузок."""
+        self.loads = 0
+
+    async def bonds(self) -> SimpleNamespace:
+        self.loads += 1
+        return SimpleNamespace(instruments=[SimpleNamespace(**asdict(BOND))])
+
+    async def shares(self) -> SimpleNamespace:
+        return SimpleNamespace(instruments=[SimpleNamespace(**asdict(SHARE))])
+
+    async def etfs(self) -> SimpleNamespace:
+        return SimpleNamespace(instruments=[])
+
+    async def currencies(self) -> SimpleNamespace:
+        return SimpleNamespace(instruments=[])
+
+
+def make_client_factory(instruments: FakeInstruments) -> 'object':
+    @asynccontextmanager
+    async def factory() -> 'AsyncGenerator[SimpleNamespace]':
+        yield SimpleNamespace(instruments=instruments)
+
+    return factory
+
+
+@pytest.mark.unit
+class TestTinkoffInstrumentIndex:
+    async def test_get_by_isin__loads_catalog_once(self, mocker: 'MockerFixture') -> None:
+        """Должен загружать справочники один раз и отвечать на повторные запросы из памяти."""
+        instruments = FakeInstruments()
+        index = TinkoffInstrumentIndex(client_factory=make_client_factory(instruments), logger=mocker.Mock())
+
+        assert await index.get_by_isin(BOND.isin) == BOND
+        assert await index.get_by_figi(SHARE.figi) == SHARE
+        assert await index.get_by_uid('unknown') is None
+
+        assert instruments.loads == 1
+
+    async def test_get_by_isin__rebuilds_after_ttl(self, mocker: 'MockerFixture') -> None:
+        """Должен перестраивать индекс после истечения TTL."""
+        instruments = FakeInstruments()
+        clock = mocker.patch('finsight_api.infrastructure.adapters.tinkoff.instrument_index.time.time')
+        clock.return_value = 1_000.0
+        index = TinkoffInstrumentIndex(client_factory=make_client_factory(instruments), logger=mocker.Mock(), ttl=60)
+
+        await index.get_by_isin(BOND.isin)
+        clock.return_value = 1_061.0
+        await index.get_by_isin(BOND.isin)
+
+        expected_loads = 2
+        assert instruments.loads == expected_loads
+
+    async def test_snapshot__warm_start_without_network(self, mocker: 'MockerFixture', tmp_path: 'Path') -> None:
+        """Должен восстанавливать индекс из снимка на диске без обращения к API."""
+        snapshot_path = tmp_path / 'instruments.json'
+        first = FakeInstruments()
+        await TinkoffInstrumentIndex(
+            client_factory=make_client_factory(first), logger=mocker.Mock(), snapshot_path=snapshot_path
+        ).refresh()
+
+        second = FakeInstruments()
+        index = TinkoffInstrumentIndex(
+            client_factory=make_client_factory(second), logger=mocker.Mock(), snapshot_path=snapshot_path
+        )
+
+        assert await index.get_by_isin(SHARE.isin) == SHARE
+        assert second.loads == 0
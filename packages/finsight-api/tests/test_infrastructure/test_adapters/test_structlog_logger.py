@@ -0,0 +1,115 @@
+"""Юнит-тесты настройки logging и очереди логов StructlogLogger."""
+
+import logging
+from typing import TYPE_CHECKING
+
+import orjson
+import pytest
+import structlog
+
+from finsight_api.domain.constants import AppEnv, LogLevel
+from finsight_api.infrastructure.adapters.telemetry.logger.structlog import (
+    flush_logging,
+    log_queue_stats,
+    StructlogLogger,
+)
+from finsight_core.telemetry.log_queue import BoundedQueueHandler, LogPipeline, OverflowPolicy
+
+if TYPE_CHECKING:
+    from pytest import CaptureFixture
+
+
+def make_logger(log_level: LogLevel = LogLevel.INFO, app_instance: str = 'localhost') -> StructlogLogger:
+    """Создаёт логгер с тестовыми параметрами приложения."""
+    return StructlogLogger(
+        app_name='finsight-test',
+        app_version='0.0.0',
+        app_env=AppEnv.LOCAL,
+        app_instance=app_instance,
+        log_level=log_level,
+    )
+
+
+def structlog_handlers() -> list[logging.Handler]:
+    """Возвращает обработчики корневого логгера, установленные StructlogLogger."""
+    return [handler for handler in logging.getLogger().handlers if isinstance(handler, BoundedQueueHandler)]
+
+
+@pytest.mark.unit
+class TestStructlogLogger:
+    """Тесты настройки logging при создании StructlogLogger."""
+
+    def test_configures_logging_once(self) -> None:
+        """Должен настраивать logging один раз, сколько бы логгеров ни создавалось."""
+        make_logger()
+        (handler,) = structlog_handlers()
+
+        for _ in range(100):
+            make_logger()
+
+        assert structlog_handlers() == [handler]
+
+    def test_replaces_handler_on_reconfiguration(self) -> None:
+        """Должен заменять обработчик, а не добавлять новый, при других параметрах."""
+        make_logger(LogLevel.INFO)
+        make_logger(LogLevel.WARNING)
+
+        assert len(structlog_handlers()) == 1
+        assert logging.getLogger().level == logging.WARNING
+
+        make_logger(LogLevel.INFO)
+
+    def test_bind_returns_new_logger(self) -> None:
+        """Должен возвращать новый логгер с привязанными полями, не меняя исходный."""
+        logger = make_logger()
+
+        bound = logger.bind(figi='BBG00BOND001')
+
+        assert bound is not logger
+        assert bound._logger is not logger._logger
+        assert len(structlog_handlers()) == 1
+
+    def test_writes_foreign_records_with_caller_context(self, capsys: 'CaptureFixture[str]') -> None:
+        """Должен рендерить записи стандартных логгеров в фоне с контекстом вызывающего кода."""
+        make_logger(app_instance='context-test')
+        structlog.contextvars.bind_contextvars(request_id='req-1')
+        try:
+            logging.getLogger('finsight-test.foreign').warning('foreign event')
+        finally:
+            structlog.contextvars.clear_contextvars()
+
+        flush_logging()
+
+        (line,) = capsys.readouterr().err.splitlines()
+        assert orjson.loads(line)['request_id'] == 'req-1'
+        stats = log_queue_stats()
+        assert stats is not None
+        assert stats.depth == 0
+        with capsys.disabled():
+            make_logger()
+
+    def test_counts_dropped_records(self) -> None:
+        """Должен отбрасывать и считать записи, не поместившиеся в очередь."""
+        pipeline = LogPipeline(logging.NullHandler(), capacity=2, overflow_policy=OverflowPolicy.DROP)
+        record = logging.LogRecord('test', logging.ERROR, __file__, 1, 'event', None, None)
+
+        for _ in range(5):
+            pipeline.handler.handle(record)
+
+        stats = pipeline.stats()
+        assert (stats.capacity, stats.depth, stats.dropped) == (2, 2, 3)
+
+    def test_drop_debug_keeps_warnings(self) -> None:
+        """Должен при политике drop_debug отбрасывать только записи ниже WARNING."""
+        pipeline = LogPipeline(logging.NullHandler(), capacity=1, overflow_policy=OverflowPolicy.DROP_DEBUG)
+        info = logging.LogRecord('test', logging.INFO, __file__, 1, 'event', None, None)
+        error = logging.LogRecord('test', logging.ERROR, __file__, 1, 'event', None, None)
+
+        pipeline.handler.handle(info)
+        pipeline.handler.handle(info)
+        pipeline.start()
+        pipeline.handler.handle(error)
+        pipeline.stop()
+
+        stats = pipeline.stats()
+        assert (stats.depth, stats.dropped) == (0, 1)
@@ -0,0 +1,83 @@
+"""Юнит-тесты каталога облигаций TinkoffBondCatalog."""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_api.domain.value_objects.isin import ISIN
+from finsight_api.infrastructure.adapters.tinkoff import bond_catalog
+from finsight_api.infrastructure.adapters.tinkoff.bond_catalog import TinkoffBondCatalog
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from pytest_mock import MockerFixture
+
+
+ISIN_VALUE = 'RU000A000001'
+
+
+class FakeInstruments:
+    """Фиктивный сервис инструментов SDK, считающий вызовы bonds()."""
+
+    def __init__(self, *, fail: bool = False) -> None:
+        """Инициализирует сервис.
+
+        Args:
+            fail: Завершать bonds() ошибкой.
+        """
+        self.fail = fail
+        self.calls = 0
+
+    async def bonds(self) -> SimpleNamespace:
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError('unavailable')
+        bond = SimpleNamespace(figi='BBG00BOND001', uid='uid-1', isin=ISIN_VALUE)
+        return SimpleNamespace(instruments=[bond])
+
+
+def make_catalog(instruments: FakeInstruments, mocker: 'MockerFixture') -> TinkoffBondCatalog:
+    mocker.patch.object(bond_catalog, 'map_bond_from_sdk', side_effect=lambda instrument: instrument)
+
+    @asynccontextmanager
+    async def client_factory() -> 'AsyncGenerator[object]':
+        yield SimpleNamespace(instruments=instruments)
+
+    return TinkoffBondCatalog(client_factory=client_factory, logger=mocker.Mock())  # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+class TestTinkoffBondCatalog:
+    async def test_get__loads_catalog_once_and_indexes_all_identifiers(self, mocker: 'MockerFixture') -> None:
+        """Должен загружать справочник одним вызовом bonds() и искать по ISIN, FIGI и UID."""
+        instruments = FakeInstruments()
+        catalog = make_catalog(instruments, mocker)
+
+        by_isin = await catalog.get_by_isin(ISIN(ISIN_VALUE))
+        by_figi = await catalog.get_by_figi('BBG00BOND001')
+        by_uid = await catalog.get_by_uid('uid-1')
+
+        assert by_isin is by_figi is by_uid
+        assert by_isin is not None
+        assert instruments.calls == 1
+
+    async def test_get__returns_none_when_catalog_cannot_be_loaded(self, mocker: 'MockerFixture') -> None:
+        """Должен возвращать None при ошибке загрузки и не повторять её на каждом поиске."""
+        instruments = FakeInstruments(fail=True)
+        catalog = make_catalog(instruments, mocker)
+
+        assert await catalog.get_by_isin(ISIN(ISIN_VALUE)) is None
+        assert await catalog.get_by_figi('BBG00BOND001') is None
+        assert instruments.calls == 1
+
+    async def test_get__maps_bonds_off_event_loop(self, mocker: 'MockerFixture') -> None:
+        """Должен маппить справочник облигаций в отдельном потоке, а не в event loop."""
+        catalog = make_catalog(FakeInstruments(), mocker)
+        to_thread = mocker.spy(bond_catalog.asyncio, 'to_thread')
+
+        assert await catalog.get_by_figi('BBG00BOND001') is not None
+        to_thread.assert_awaited_once()
+        assert to_thread.call_args.args[0] is bond_catalog._index_bonds
@@ -0,0 +1,145 @@
+"""Юнит-тесты кэширующего декоратора CachingTinkoffInvestAdapter."""
+
+import asyncio
+import traceback
+from typing import TYPE_CHECKING
+
+import pytest
+from grpc import StatusCode
+
+from finsight_api.domain.exceptions import InstrumentNotFoundError
+from finsight_api.infrastructure.adapters.tinkoff.cache import CachePolicy, CachingTinkoffInvestAdapter
+
+if TYPE_CHECKING:
+    from unittest.mock import AsyncMock
+
+    from pytest_mock import MockerFixture
+
+
+FIGI = 'BBG00BOND001'
+
+
+class NotFoundError(Exception):
+    """Ошибка SDK со статусом NOT_FOUND."""
+
+    def code(self) -> StatusCode:
+        return StatusCode.NOT_FOUND
+
+
+class FakeClock:
+    """Управляемые монотонные часы."""
+
+    def __init__(self) -> None:
+        """Инициализирует часы нулём."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache(
+    mocker: 'MockerFixture',
+    clock: FakeClock,
+    *,
+    max_entries: int = 16,
+) -> tuple[CachingTinkoffInvestAdapter, 'AsyncMock']:
+    inner = mocker.AsyncMock()
+    inner.get_bond_by_figi.side_effect = lambda figi: f'bond:{figi}:{clock.now}'
+    cache = CachingTinkoffInvestAdapter(
+        inner=inner,
+        logger=mocker.Mock(),
+        policies={'get_bond_by_figi': CachePolicy(ttl=60, stale_ttl=30, negative_ttl=10)},
+        max_entries=max_entries,
+        clock=clock,
+    )
+    return cache, inner
+
+
+@pytest.mark.unit
+class TestCachingTinkoffInvestAdapter:
+    async def test_get_bond_by_figi__serves_repeated_calls_from_cache(self, mocker: 'MockerFixture') -> None:
+        """Должен обращаться к API один раз за TTL и считать попадания и промахи."""
+        clock = FakeClock()
+        cache, inner = make_cache(mocker, clock)
+
+        first = await cache.get_bond_by_figi(FIGI)
+        clock.now = 59
+        second = await cache.get_bond_by_figi(FIGI)
+
+        assert first == second
+        assert inner.get_bond_by_figi.await_count == 1
+        stats = cache.stats()['get_bond_by_figi']
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    async def test_get_bond_by_figi__serves_stale_and_refreshes_in_background(self, mocker: 'MockerFixture') -> None:
+        """Должен отдавать устаревшее значение в окне stale_ttl и обновлять его в фоне."""
+        clock = FakeClock()
+        cache, inner = make_cache(mocker, clock)
+        await cache.get_bond_by_figi(FIGI)
+
+        clock.now = 70
+        stale = await cache.get_bond_by_figi(FIGI)
+        await asyncio.sleep(0)
+
+        assert stale == f'bond:{FIGI}:0.0'
+        assert await cache.get_bond_by_figi(FIGI) == f'bond:{FIGI}:70'
+        assert cache.stats()['get_bond_by_figi'].stale_hits == 1
+
+    async def test_get_bond_by_figi__caches_not_found(self, mocker: 'MockerFixture') -> None:
+        """Должен кэшировать ответ NOT_FOUND на negative_ttl."""
+        clock = FakeClock()
+        cache, inner = make_cache(mocker, clock)
+        inner.get_bond_by_figi.side_effect = NotFoundError()
+
+        for _ in range(2):
+            with pytest.raises(NotFoundError):
+                await cache.get_bond_by_figi(FIGI)
+        clock.now = 11
+        with pytest.raises(NotFoundError):
+            await cache.get_bond_by_figi(FIGI)
+
+        expected_calls = 2
+        assert inner.get_bond_by_figi.await_count == expected_calls
+        assert cache.stats()['get_bond_by_figi'].negative_hits == 1
+
+    async def test_get_figi_by_isin__caches_instrument_not_found(self, mocker: 'MockerFixture') -> None:
+        """Должен кэшировать InstrumentNotFoundError адаптера и возбуждать на каждое попадание новую копию."""
+        inner = mocker.AsyncMock()
+        original = InstrumentNotFoundError('RU000A0JX0J2')
+        inner.get_figi_by_isin.side_effect = original
+        cache = CachingTinkoffInvestAdapter(
+            inner=inner,
+            logger=mocker.Mock(),
+            policies={'get_figi_by_isin': CachePolicy(ttl=60, negative_ttl=10)},
+            clock=FakeClock(),
+        )
+        with pytest.raises(InstrumentNotFoundError):
+            await cache.get_figi_by_isin('RU000A0JX0J2')
+        original_traceback_depth = len(traceback.extract_tb(original.__traceback__))
+
+        hits = []
+        for _ in range(3):
+            with pytest.raises(InstrumentNotFoundError) as exc_info:
+                await cache.get_figi_by_isin('RU000A0JX0J2')
+            hits.append(exc_info.value)
+
+        assert inner.get_figi_by_isin.await_count == 1
+        assert cache.stats()['get_figi_by_isin'].negative_hits == len(hits)
+        assert len({id(hit) for hit in hits}) == len(hits)
+        assert all(hit is not original and hit.__cause__ is original for hit in hits)
+        assert len(traceback.extract_tb(original.__traceback__)) == original_traceback_depth
+
+    async def test_get_bond_by_figi__evicts_least_recently_used(self, mocker: 'MockerFixture') -> None:
+        """Должен вытеснять давно не читанную запись при превышении max_entries."""
+        clock = FakeClock()
+        cache, inner = make_cache(mocker, clock, max_entries=2)
+
+        await cache.get_bond_by_figi('A')
+        await cache.get_bond_by_figi('B')
+        await cache.get_bond_by_figi('A')
+        await cache.get_bond_by_figi('C')
+        await cache.get_bond_by_figi('A')
+
+        expected_calls = 3
+        assert inner.get_bond_by_figi.await_count == expected_calls
+        assert cache.stats()['get_bond_by_figi'].evictions == 1
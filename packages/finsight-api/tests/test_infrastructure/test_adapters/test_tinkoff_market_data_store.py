@@ -0,0 +1,86 @@
+"""Юнит-тесты хранилища потоковых маркет-данных MarketDataStore."""
+
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_api.domain.value_objects.last_price import LastPrice
+from finsight_api.domain.value_objects.money import Money
+from finsight_api.infrastructure.adapters.tinkoff.market_data_store import MarketDataStore
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from finsight_api.domain.value_objects.order_book import OrderBook
+
+FIGI = 'BBG00BOND001'
+
+
+class FakeClock:
+    """Управляемые монотонные часы."""
+
+    def __init__(self) -> None:
+        """Инициализирует часы с нулевым временем."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def deep_order_book(make_order_book: 'Callable[..., OrderBook]') -> 'Callable[[int], OrderBook]':
+    """Возвращает фабрику стакана заданной глубины с уровнями 100, 101, ... по одному лоту."""
+
+    def factory(depth: int) -> 'OrderBook':
+        levels = [(str(100 + i), 1) for i in range(depth)]
+        return make_order_book(FIGI, bids=levels, asks=levels)
+
+    return factory
+
+
+@pytest.mark.unit
+class TestMarketDataStore:
+    def test_get_order_book__truncates_depth_and_fills_last_price(
+        self,
+        deep_order_book: 'Callable[[int], OrderBook]',
+    ) -> None:
+        """Должен обрезать стакан до запрошенной глубины и подставлять последнюю цену."""
+        store = MarketDataStore()
+        store.put_order_book(deep_order_book(10))
+        store.put_last_price(LastPrice(figi=FIGI, price=Decimal('99.5'), time=None))
+
+        order_book = store.get_order_book(FIGI, depth=2)
+
+        assert order_book is not None
+        assert order_book.depth == len(order_book.bids) == len(order_book.asks) == 2  # noqa: PLR2004
+        assert order_book.last_price == Money(currency='rub', amount=Decimal('99.5'))
+        assert store.get_order_book(FIGI, depth=20) is None
+
+    def test_get__returns_none_for_stale_or_cleared_values(self, deep_order_book: 'Callable[[int], OrderBook]') -> None:
+        """Должен не отдавать значения старше max_age и после clear."""
+        clock = FakeClock()
+        store = MarketDataStore(max_age=5, clock=clock)
+        store.put_last_price(LastPrice(figi=FIGI, price=Decimal(100), time=None))
+
+        clock.now = 6
+        assert store.get_last_price(FIGI) is None
+
+        store.put_last_price(LastPrice(figi=FIGI, price=Decimal(101), time=None))
+        store.put_order_book(deep_order_book(1))
+        store.clear()
+        assert store.get_last_price(FIGI) is None
+        assert store.get_order_book(FIGI) is None
+
+    def test_put_last_price__notifies_listeners_until_removed(self) -> None:
+        """Должен вызывать слушателей последних цен до их отписки."""
+        store = MarketDataStore()
+        received: list[LastPrice] = []
+        remove = store.add_last_price_listener(received.append)
+        price = LastPrice(figi=FIGI, price=Decimal(100), time=None)
+
+        store.put_last_price(price)
+        remove()
+        store.put_last_price(price)
+
+        assert received == [price]
@@ -0,0 +1,140 @@
+"""Юнит-тесты подписок потока маркет-данных TinkoffMarketDataStream."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_api.domain.value_objects.last_price import LastPrice
+from finsight_api.infrastructure.adapters.tinkoff.market_data_store import MarketDataStore
+from finsight_api.infrastructure.adapters.tinkoff.market_data_stream import TinkoffMarketDataStream
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from pytest_mock import MockerFixture
+
+
+class FakeSubscription:
+    """Подписка одного вида данных, запоминающая подписанные FIGI."""
+
+    def __init__(self) -> None:
+        """Инициализирует подписку без инструментов."""
+        self.figis: set[str] = set()
+
+    def subscribe(self, instruments: list[SimpleNamespace]) -> None:
+        self.figis.update(instrument.figi for instrument in instruments)
+
+    def unsubscribe(self, instruments: list[SimpleNamespace]) -> None:
+        self.figis.difference_update(instrument.figi for instrument in instruments)
+
+
+class FakeStreamManager:
+    """Менеджер потока без данных: ответы не приходят, пока поток не остановлен."""
+
+    def __init__(self) -> None:
+        """Инициализирует подписки на цены, свечи и стаканы."""
+        self.last_price = FakeSubscription()
+        self.candles = FakeSubscription()
+        self.order_book = FakeSubscription()
+        self.started = asyncio.Event()
+        self._stopped = asyncio.Event()
+
+    def __aiter__(self) -> 'FakeStreamManager':
+        """Отмечает начало чтения потока."""
+        self.started.set()
+        return self
+
+    async def __anext__(self) -> object:
+        """Ждёт остановки потока."""
+        await self._stopped.wait()
+        raise StopAsyncIteration
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+@pytest.fixture
+def manager() -> FakeStreamManager:
+    """Возвращает менеджер фиктивного потока."""
+    return FakeStreamManager()
+
+
+@pytest.fixture
+def release_delay() -> float:
+    """Возвращает задержку отписки: по умолчанию FIGI отписывается сразу."""
+    return 0
+
+
+@pytest.fixture
+def store() -> MarketDataStore:
+    """Возвращает пустое хранилище маркет-данных."""
+    return MarketDataStore()
+
+
+@pytest.fixture
+async def stream(
+    mocker: 'MockerFixture',
+    manager: FakeStreamManager,
+    store: MarketDataStore,
+    release_delay: float,
+) -> 'AsyncGenerator[TinkoffMarketDataStream]':
+    """Возвращает поток с фиктивным соединением и останавливает его после теста."""
+    client = SimpleNamespace(create_market_data_stream=lambda: manager)
+
+    @asynccontextmanager
+    async def client_factory() -> 'AsyncGenerator[SimpleNamespace]':
+        yield client
+
+    market_data_stream = TinkoffMarketDataStream(
+        client_factory=client_factory,  # type: ignore[arg-type]
+        store=store,
+        logger=mocker.Mock(),
+        release_delay=release_delay,
+    )
+    yield market_data_stream
+    await market_data_stream.stop()
+
+
+@pytest.mark.unit
+class TestTinkoffMarketDataStream:
+    async def test_watch__unsubscribes_when_last_lease_released(
+        self,
+        stream: TinkoffMarketDataStream,
+        manager: FakeStreamManager,
+        store: MarketDataStore,
+    ) -> None:
+        """Должен держать подписку, пока освобождены не все подписки на FIGI, и затем отписываться."""
+        release_first = stream.watch(['BOND', 'SHARE'])
+        release_second = stream.watch(['BOND'])
+        await manager.started.wait()
+        store.put_last_price(LastPrice(figi='SHARE', price=Decimal(100), time=None))
+
+        release_first()
+        release_first()
+
+        assert stream.figis == frozenset({'BOND'})
+        assert manager.last_price.figis == manager.candles.figis == manager.order_book.figis == {'BOND'}
+        assert stream.get_last_price('SHARE') is None
+
+        release_second()
+
+        assert stream.figis == frozenset()
+        assert manager.last_price.figis == manager.candles.figis == manager.order_book.figis == set()
+
+    @pytest.mark.parametrize('release_delay', [60])
+    async def test_watch__keeps_subscription_rewatched_before_release_delay(
+        self,
+        stream: TinkoffMarketDataStream,
+        manager: FakeStreamManager,
+    ) -> None:
+        """Должен сохранять подписку, если FIGI снова отслеживается до истечения задержки отписки."""
+        stream.watch(['BOND'])()
+        stream.watch(['BOND'])
+        await manager.started.wait()
+
+        assert stream.figis == frozenset({'BOND'})
+        assert manager.order_book.figis == {'BOND'}
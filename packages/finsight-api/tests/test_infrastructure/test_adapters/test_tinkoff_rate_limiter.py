@@ -0,0 +1,229 @@
+"""Юнит-тесты клиентского ограничения частоты запросов к Tinkoff Invest API."""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+from grpc import StatusCode
+
+from finsight_api.infrastructure.adapters.tinkoff import rate_limiter
+from finsight_api.infrastructure.adapters.tinkoff.errors import classify_tinkoff_error
+from finsight_api.infrastructure.adapters.tinkoff.rate_limiter import RateLimitedClientFactory, TinkoffRateLimiter
+from finsight_api.infrastructure.utils import retry
+from finsight_api.infrastructure.utils.retry import Retrier, RetryBudget, RetryPolicy
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from pytest_mock import MockerFixture
+
+
+BOND_BY = 'InstrumentsService/BondBy'
+
+
+class FakeClock:
+    """Управляемые монотонные часы."""
+
+    def __init__(self) -> None:
+        """Инициализирует часы нулём."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ResourceExhaustedError(Exception):
+    """Ошибка SDK со статусом RESOURCE_EXHAUSTED и метаданными лимита."""
+
+    def __init__(self, reset: int | None) -> None:
+        """Создаёт ошибку с заданным временем сброса окна."""
+        super().__init__('RESOURCE_EXHAUSTED')
+        self.metadata = SimpleNamespace(ratelimit_limit='60', ratelimit_remaining=0, ratelimit_reset=reset)
+
+    def code(self) -> StatusCode:
+        return StatusCode.RESOURCE_EXHAUSTED
+
+
+class UnavailableError(Exception):
+    """Ошибка SDK со статусом UNAVAILABLE (упал канал)."""
+
+    def code(self) -> StatusCode:
+        return StatusCode.UNAVAILABLE
+
+
+class InstrumentsService:
+    """Фиктивный сервис инструментов SDK."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        """Инициализирует счётчик вызовов и ошибку, которую вернёт каждый вызов."""
+        self.calls = 0
+        self.error = error
+
+    async def bond_by(self, **_: object) -> str:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return 'bond'
+
+
+def make_limiter(mocker: 'MockerFixture', clock: FakeClock) -> TinkoffRateLimiter:
+    tariff = SimpleNamespace(
+        unary_limits=[
+            SimpleNamespace(limit_per_minute=60, methods=[f'tinkoff.public.invest.api.contract.v1.{BOND_BY}']),
+        ],
+    )
+    client = SimpleNamespace(users=SimpleNamespace(get_user_tariff=mocker.AsyncMock(return_value=tariff)))
+
+    @asynccontextmanager
+    async def client_factory() -> 'AsyncGenerator[object]':
+        yield client
+
+    return TinkoffRateLimiter(client_factory=client_factory, logger=mocker.Mock(), clock=clock)  # type: ignore[arg-type]
+
+
+def make_retrier() -> Retrier:
+    """Создаёт политику повторов Tinkoff без пауз между попытками."""
+    return Retrier(
+        classify=classify_tinkoff_error,
+        policy=RetryPolicy(max_attempts=3, base_delay=0.0, max_delay=0.0, deadline=30.0),
+        budget=RetryBudget(),
+    )
+
+
+@pytest.mark.unit
+class TestTinkoffRateLimiter:
+    async def test_acquire__waits_for_refill_when_bucket_is_empty(self, mocker: 'MockerFixture') -> None:
+        """Должен ждать пополнения корзины, а не выполнять запрос сверх лимита."""
+        clock = FakeClock()
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+            clock.now += delay
+
+        mocker.patch.object(rate_limiter.asyncio, 'sleep', side_effect=fake_sleep)
+        limiter = make_limiter(mocker, clock)
+
+        burst = 6
+        for _ in range(burst):
+            await limiter.acquire(BOND_BY)
+        assert sleeps == []
+
+        await limiter.acquire(BOND_BY)
+
+        assert len(sleeps) == 1
+        assert limiter.budget()[BOND_BY].limit_per_minute == 60  # noqa: PLR2004
+
+    async def test_observe_error__blocks_method_until_reset(self, mocker: 'MockerFixture') -> None:
+        """Должен блокировать метод до сброса окна после RESOURCE_EXHAUSTED."""
+        clock = FakeClock()
+        limiter = make_limiter(mocker, clock)
+        await limiter.ensure_tariff()
+
+        limiter.observe_error(BOND_BY, ResourceExhaustedError(reset=15))
+
+        budget = limiter.budget()[BOND_BY]
+        assert budget.available == 0
+        assert budget.blocked_for == 15  # noqa: PLR2004
+
+    async def test_client_factory__routes_service_calls_through_limiter(self, mocker: 'MockerFixture') -> None:
+        """Должен запрашивать токен метода `<Service>/<Method>` перед вызовом SDK."""
+        service = InstrumentsService()
+
+        @asynccontextmanager
+        async def client_factory() -> 'AsyncGenerator[object]':
+            yield SimpleNamespace(instruments=service)
+
+        limiter = mocker.Mock(spec=TinkoffRateLimiter)
+        factory = RateLimitedClientFactory(client_factory=client_factory, limiter=limiter)  # type: ignore[arg-type]
+
+        async with factory() as client:
+            result = await client.instruments.bond_by(id='FIGI')
+
+        assert result == 'bond'
+        assert service.calls == 1
+        limiter.acquire.assert_awaited_once_with(BOND_BY)
+
+    async def test_client_factory__retries_channel_failure_in_new_session(self, mocker: 'MockerFixture') -> None:
+        """Должен выполнять первую попытку в сессии вызывающего, а повторы — в новых сессиях."""
+        caller, broken, healthy = (
+            InstrumentsService(UnavailableError()),
+            InstrumentsService(UnavailableError()),
+            InstrumentsService(),
+        )
+        services = [caller, broken, healthy]
+        session_errors: list[Exception] = []
+
+        @asynccontextmanager
+        async def client_factory() -> 'AsyncGenerator[object]':
+            try:
+                yield SimpleNamespace(instruments=services.pop(0))
+            except Exception as exc:
+                session_errors.append(exc)
+                raise
+
+        limiter = mocker.Mock(spec=TinkoffRateLimiter)
+        factory = RateLimitedClientFactory(
+            client_factory=client_factory,  # type: ignore[arg-type]
+            limiter=limiter,
+            retrier=make_retrier(),
+        )
+
+        async with factory() as client:
+            result = await client.instruments.bond_by(id='FIGI')
+
+        assert result == 'bond'
+        assert (caller.calls, broken.calls, healthy.calls) == (1, 1, 1)
+        assert session_errors == [broken.error]
+
+    async def test_client_factory__first_attempt_uses_caller_session(self, mocker: 'MockerFixture') -> None:
+        """Должен не открывать вторую сессию, если первая попытка с политикой повторов успешна."""
+        service = InstrumentsService()
+        sessions = 0
+
+        @asynccontextmanager
+        async def client_factory() -> 'AsyncGenerator[object]':
+            nonlocal sessions
+            sessions += 1
+            yield SimpleNamespace(instruments=service)
+
+        factory = RateLimitedClientFactory(
+            client_factory=client_factory,  # type: ignore[arg-type]
+            limiter=mocker.Mock(spec=TinkoffRateLimiter),
+            retrier=make_retrier(),
+        )
+
+        async with factory() as client:
+            result = await client.instruments.bond_by(id='FIGI')
+
+        assert result == 'bond'
+        assert (sessions, service.calls) == (1, 1)
+
+    @pytest.mark.parametrize('reset', [45, None])
+    async def test_client_factory__fails_fast_when_reset_exceeds_deadline(
+        self,
+        mocker: 'MockerFixture',
+        reset: int | None,
+    ) -> None:
+        """Должен сразу возвращать RESOURCE_EXHAUSTED, если окно лимита сбросится позже deadline."""
+        service = InstrumentsService(ResourceExhaustedError(reset=reset))
+
+        @asynccontextmanager
+        async def client_factory() -> 'AsyncGenerator[object]':
+            yield SimpleNamespace(instruments=service)
+
+        sleep = mocker.patch.object(retry.asyncio, 'sleep')
+        limiter = mocker.Mock(spec=TinkoffRateLimiter)
+        factory = RateLimitedClientFactory(
+            client_factory=client_factory,  # type: ignore[arg-type]
+            limiter=limiter,
+            retrier=make_retrier(),
+        )
+
+        async with factory() as client:
+            with pytest.raises(ResourceExhaustedError):
+                await client.instruments.bond_by(id='FIGI')
+
+        assert service.calls == 1
+        sleep.assert_not_called()
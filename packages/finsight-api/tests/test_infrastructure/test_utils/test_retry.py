@@ -1,10 +1,19 @@
-"""Юнит-тесты для декоратора retry_on_exception (async версии)."""
+"""Юнит-тесты для декоратора retry_on_exception (async версии) и политики Retrier."""
 
 from typing import TYPE_CHECKING
 
 import pytest
 
-from finsight_api.infrastructure.utils.retry import retry_on_exception
+from finsight_api.infrastructure.utils import retry
+from finsight_api.infrastructure.utils.retry import (
+    NO_RETRY,
+    Retrier,
+    RETRY,
+    retry_on_exception,
+    RetryBudget,
+    RetryDecision,
+    RetryPolicy,
+)
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
@@ -120,3 +129,77 @@ class TestRetryOnException:
         result = await wrapped()
         assert result == 'async done'
         logger.warning.assert_not_called()
+
+
+class TransientError(Exception):
+    """Временная ошибка внешнего API."""
+
+
+def classify(exc: BaseException) -> RetryDecision:
+    return RETRY if isinstance(exc, TransientError) else NO_RETRY
+
+
+@pytest.mark.unit
+class TestRetrier:
+    @staticmethod
+    def _patch_sleep(mocker: 'MockerFixture') -> list[float]:
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        mocker.patch.object(retry.asyncio, 'sleep', side_effect=fake_sleep)
+        return sleeps
+
+    async def test_call__retries_transient_errors_with_bounded_jitter(self, mocker: 'MockerFixture') -> None:
+        """Должен повторять временные ошибки с паузами в пределах [base_delay, max_delay]."""
+        sleeps = self._patch_sleep(mocker)
+        operation = mocker.AsyncMock(side_effect=[TransientError(), TransientError(), 'ok'])
+        policy = RetryPolicy(max_attempts=3, base_delay=0.1, max_delay=1.0)
+        retrier = Retrier(classify=classify, policy=policy, budget=RetryBudget())
+
+        result = await retrier.call(operation)
+
+        assert result == 'ok'
+        assert operation.await_count == policy.max_attempts
+        assert len(sleeps) == policy.max_attempts - 1
+        assert all(policy.base_delay <= delay <= policy.max_delay for delay in sleeps)
+
+    async def test_call__does_not_retry_permanent_errors(self, mocker: 'MockerFixture') -> None:
+        """Не должен повторять ошибки, которые классификатор считает постоянными."""
+        self._patch_sleep(mocker)
+        operation = mocker.AsyncMock(side_effect=ValueError('bad request'))
+        retrier = Retrier(classify=classify, budget=RetryBudget())
+
+        with pytest.raises(ValueError, match='bad request'):
+            await retrier.call(operation)
+
+        operation.assert_awaited_once()
+
+    async def test_call__honors_retry_after_and_deadline(self, mocker: 'MockerFixture') -> None:
+        """Должен отказываться от повтора, если пауза Retry-After не укладывается в deadline."""
+        self._patch_sleep(mocker)
+        operation = mocker.AsyncMock(side_effect=TransientError())
+        retrier = Retrier(
+            classify=lambda _: RetryDecision(retryable=True, retry_after=60.0),
+            policy=RetryPolicy(deadline=10.0),
+            budget=RetryBudget(),
+        )
+
+        with pytest.raises(TransientError):
+            await retrier.call(operation)
+
+        operation.assert_awaited_once()
+
+    async def test_call__stops_retrying_when_budget_is_exhausted(self, mocker: 'MockerFixture') -> None:
+        """Должен прекращать повторы, когда общий бюджет исчерпан ошибками."""
+        self._patch_sleep(mocker)
+        budget = RetryBudget(max_tokens=2.0)
+        retrier = Retrier(classify=classify, policy=RetryPolicy(max_attempts=10), budget=budget)
+        operation = mocker.AsyncMock(side_effect=TransientError())
+
+        with pytest.raises(TransientError):
+            await retrier.call(operation)
+
+        assert operation.await_count == 1
+        assert not budget.allows_retry
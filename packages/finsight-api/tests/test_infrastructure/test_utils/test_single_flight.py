@@ -0,0 +1,83 @@
+"""Юнит-тесты объединения одновременных вызовов SingleFlight."""
+
+import asyncio
+
+import pytest
+
+from finsight_api.infrastructure.utils.single_flight import SingleFlight
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    async def test_do__shares_one_call_between_concurrent_callers(self) -> None:
+        """Должен выполнять одинаковые одновременные вызовы один раз и отдавать всем один результат."""
+        flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 'portfolio'
+
+        waiters = [asyncio.create_task(flight.do(('get_portfolio', 'acc'), fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ['portfolio'] * 5
+        assert calls == 1
+        expected_coalesced = 4
+        assert flight.coalesced == expected_coalesced
+        assert flight.in_flight == 0
+
+    async def test_do__shares_exception_and_releases_key(self) -> None:
+        """Должен пробрасывать общую ошибку всем ждущим и выполнять следующий вызов заново."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fail() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise RuntimeError('unavailable')
+
+        results = await asyncio.gather(flight.do('key', fail), flight.do('key', fail), return_exceptions=True)
+        with pytest.raises(RuntimeError):
+            await flight.do('key', fail)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        expected_calls = 2
+        assert calls == expected_calls
+
+    async def test_do__raises_own_exception_copy_to_each_waiter(self) -> None:
+        """Должен возбуждать присоединившимся корутинам собственные копии общей ошибки."""
+        flight = SingleFlight()
+
+        async def fail() -> str:
+            await asyncio.sleep(0)
+            raise RuntimeError('unavailable')
+
+        owner, *waiters = await asyncio.gather(*(flight.do('key', fail) for _ in range(3)), return_exceptions=True)
+
+        assert isinstance(owner, RuntimeError)
+        assert all(type(waiter) is RuntimeError and waiter.__cause__ is owner for waiter in waiters)
+        assert len({id(error) for error in (owner, *waiters)}) == len(waiters) + 1
+
+    async def test_do__cancelled_waiter_does_not_cancel_call(self) -> None:
+        """Должен доводить вызов до конца для остальных, если одна из ждущих корутин отменена."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> int:
+            await release.wait()
+            return 1
+
+        first = asyncio.create_task(flight.do('key', fetch))
+        second = asyncio.create_task(flight.do('key', fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == 1
+        assert first.cancelled()
@@ -0,0 +1,100 @@
+"""Тесты маршрутов REST API портфеля."""
+
+from decimal import Decimal
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_api.application.use_cases.watch_portfolio import PositionValuation
+from finsight_api.domain.entities.portfolio import PortfolioEntity
+from finsight_api.domain.exceptions import BaseAppError
+from finsight_api.presentation.webserver.dependencies.get_watch_portfolio_use_case import (
+    get_watch_portfolio_use_case,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from fastapi import FastAPI
+    from httpx import AsyncClient
+
+
+STREAM_URL = '/api/v1/account/account/portfolio/stream'
+
+PORTFOLIO = PortfolioEntity(
+    account_id='account',
+    total_amount_shares=Decimal(0),
+    total_amount_bonds=Decimal(0),
+    total_amount_etf=Decimal(0),
+    total_amount_futures=Decimal(0),
+    total_value=Decimal(0),
+    cash_balance=Decimal(0),
+    currency='rub',
+    positions=(),
+)
+
+VALUATION = PositionValuation(
+    figi='BOND',
+    current_price=Decimal(1015),
+    value=Decimal(2030),
+    total_value=Decimal(2030),
+    time=None,
+)
+
+
+class FakeWatchPortfolioUseCase:
+    """Фиктивный сценарий подписки: портфель и одно изменение, либо ошибка до портфеля."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        """Инициализирует сценарий.
+
+        Args:
+            error: Ошибка, которой завершится подписка до отдачи портфеля.
+        """
+        self.error = error
+        self.closed = False
+
+    async def watch(self, _account_id: str) -> 'AsyncGenerator[PortfolioEntity | PositionValuation]':
+        try:
+            if self.error is not None:
+                raise self.error
+            yield PORTFOLIO
+            yield VALUATION
+        finally:
+            self.closed = True
+
+
+@pytest.mark.api
+class TestStreamPortfolio:
+    async def test_stream__sends_snapshot_then_position_events(
+        self,
+        fastapi_app: 'FastAPI',
+        api_client: 'AsyncClient',
+    ) -> None:
+        """Должен отдавать text/event-stream: сначала snapshot, затем position, и закрывать подписку."""
+        use_case = FakeWatchPortfolioUseCase()
+        fastapi_app.dependency_overrides[get_watch_portfolio_use_case] = lambda: use_case
+
+        response = await api_client.get(STREAM_URL)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers['content-type'].startswith('text/event-stream')
+        events = [event.split('\n', 1)[0] for event in response.text.split('\n\n') if event]
+        assert events == ['event: snapshot', 'event: position']
+        assert '"ticker":"BOND"' in response.text
+        assert use_case.closed
+
+    async def test_stream__returns_error_response_when_portfolio_fails(
+        self,
+        fastapi_app: 'FastAPI',
+        api_client: 'AsyncClient',
+    ) -> None:
+        """Должен возвращать обычный HTTP-ответ об ошибке, если портфель не загрузился."""
+        use_case = FakeWatchPortfolioUseCase(BaseAppError('Счёт не найден', HTTPStatus.NOT_FOUND))
+        fastapi_app.dependency_overrides[get_watch_portfolio_use_case] = lambda: use_case
+
+        response = await api_client.get(STREAM_URL)
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert use_case.closed
@@ -0,0 +1,67 @@
+"""Юнит-тесты ASGI-middleware RequestIDMiddleware."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from finsight_api.presentation.webserver.middlewares.request_id import RequestIDMiddleware
+from finsight_core.telemetry.context import DEFAULT_REQUEST_ID_HEADER, get_request_id
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from starlette.requests import Request
+
+
+async def echo_request_id(_: 'Request') -> PlainTextResponse:
+    """Возвращает идентификатор запроса из контекста."""
+    return PlainTextResponse(get_request_id() or '')
+
+
+async def stream(_: 'Request') -> StreamingResponse:
+    """Возвращает потоковый ответ из нескольких частей."""
+
+    async def chunks() -> 'AsyncIterator[bytes]':
+        for chunk in (b'a', b'b', b'c'):
+            yield chunk
+
+    return StreamingResponse(chunks())
+
+
+def make_client() -> AsyncClient:
+    """Создаёт HTTP-клиент приложения с RequestIDMiddleware."""
+    app = Starlette(routes=[Route('/echo', echo_request_id), Route('/stream', stream)])
+    app.add_middleware(RequestIDMiddleware)
+    return AsyncClient(transport=ASGITransport(app=app), base_url='http://test')
+
+
+@pytest.mark.unit
+class TestRequestIDMiddleware:
+    """Тесты привязки X-Request-ID к запросу и ответу."""
+
+    async def test_propagates_incoming_request_id(self) -> None:
+        """Должен класть входящий X-Request-ID в контекст и возвращать его в ответе."""
+        async with make_client() as client:
+            response = await client.get('/echo', headers={DEFAULT_REQUEST_ID_HEADER: 'req-1'})
+
+        assert response.text == 'req-1'
+        assert response.headers[DEFAULT_REQUEST_ID_HEADER] == 'req-1'
+
+    async def test_generates_request_id(self) -> None:
+        """Должен генерировать X-Request-ID, если заголовок не передан."""
+        async with make_client() as client:
+            response = await client.get('/echo')
+
+        assert response.headers[DEFAULT_REQUEST_ID_HEADER] == response.text != ''
+
+    async def test_passes_streaming_response(self) -> None:
+        """Должен пропускать потоковый ответ без изменений, добавляя заголовок."""
+        async with make_client() as client:
+            response = await client.get('/stream')
+
+        assert response.content == b'abc'
+        assert DEFAULT_REQUEST_ID_HEADER in response.headers
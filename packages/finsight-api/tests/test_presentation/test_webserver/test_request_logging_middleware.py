@@ -0,0 +1,86 @@
+"""Юнит-тесты ASGI-middleware RequestLoggingMiddleware."""
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from finsight_api.presentation.webserver.middlewares import request_logging
+from finsight_api.presentation.webserver.middlewares.request_logging import RequestLoggingMiddleware
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from pytest_mock import MockerFixture
+    from starlette.requests import Request
+
+
+async def created(_: 'Request') -> PlainTextResponse:
+    """Возвращает ответ со статусом 201."""
+    return PlainTextResponse('created', status_code=HTTPStatus.CREATED)
+
+
+async def fail(_: 'Request') -> PlainTextResponse:
+    """Падает с необработанным исключением."""
+    raise RuntimeError('boom')
+
+
+def make_client() -> AsyncClient:
+    """Создаёт HTTP-клиент приложения с RequestLoggingMiddleware."""
+    app = Starlette(routes=[Route('/created', created), Route('/health', created), Route('/fail', fail)])
+    app.add_middleware(RequestLoggingMiddleware, exclude_urls_from_logging=frozenset({'/health'}))
+    return AsyncClient(transport=ASGITransport(app=app, raise_app_exceptions=False), base_url='http://test')
+
+
+@pytest.fixture
+def logger(mocker: 'MockerFixture') -> 'MagicMock':
+    """Подменяет логгер middleware и возвращает его."""
+    container = mocker.patch.object(request_logging, 'app_container')
+    return container.logger.return_value
+
+
+@pytest.mark.unit
+class TestRequestLoggingMiddleware:
+    """Тесты логирования завершения HTTP-запроса."""
+
+    async def test_logs_status_from_response_start(self, logger: 'MagicMock') -> None:
+        """Должен логировать статус-код из сообщения http.response.start."""
+        async with make_client() as client:
+            response = await client.get('/created')
+
+        assert response.status_code == HTTPStatus.CREATED
+        logger.info.assert_called_once()
+        message = logger.info.call_args.args[0]
+        http = logger.info.call_args.kwargs['http']
+        assert message.endswith('GET /created HTTP/1.1 201')
+        assert (http['method'], http['status_code'], http['url']) == ('GET', HTTPStatus.CREATED, '/created')
+
+    async def test_logs_internal_server_error_when_app_raises(self, logger: 'MagicMock') -> None:
+        """Должен логировать исключение и статус 500, если приложение упало."""
+        async with make_client() as client:
+            response = await client.get('/fail')
+
+        assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+        logger.error.assert_called_once_with('unhandled_exception', error='boom')
+        assert logger.info.call_args.kwargs['http']['status_code'] == HTTPStatus.INTERNAL_SERVER_ERROR
+
+    async def test_skips_excluded_urls(self, logger: 'MagicMock') -> None:
+        """Должен не логировать запросы к исключённым URL."""
+        async with make_client() as client:
+            response = await client.get('/health')
+
+        assert response.status_code == HTTPStatus.CREATED
+        logger.info.assert_not_called()
+
+    async def test_logs_url_with_query_string(self, logger: 'MagicMock') -> None:
+        """Должен логировать URL вместе со строкой запроса, в том числе для исключённых путей."""
+        async with make_client() as client:
+            await client.get('/created', params={'account_id': '1'})
+            await client.get('/health', params={'full': 'true'})
+
+        urls = [call.kwargs['http']['url'] for call in logger.info.call_args_list]
+        assert urls == ['/created?account_id=1', '/health?full=true']
@@ -0,0 +1 @@
+"""Общие примитивы загрузки рыночных данных (окна запросов свечей, покрытие периода)."""
@@ -0,0 +1,109 @@
+"""Покрытие периода загруженными свечами для инкрементальной синхронизации.
+
+Для пары (инструмент, интервал) хранится набор непересекающихся полуинтервалов
+времени [start, end), за которые свечи уже загружены из API. Конец последнего
+полуинтервала — watermark: следующая синхронизация запрашивает только период
+после него. Непокрытые промежутки внутри сохранённого периода (например, окна,
+загрузка которых упала) — дыры: они тоже попадают в список недостающих периодов
+и догружаются.
+
+Покрытие описывает именно запрошенные периоды, а не сами свечи: период без торгов
+(выходные, ночь) покрыт, хотя свечей в нём нет, и повторно не запрашивается.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+@dataclass(frozen=True, slots=True)
+class CandleCoverage:
+    """Неизменяемый набор покрытых полуинтервалов [start, end).
+
+    Полуинтервалы упорядочены по времени, не пересекаются и не соприкасаются:
+    смежные периоды сливаются при добавлении.
+
+    Attributes:
+        ranges: Покрытые полуинтервалы (aware-datetime) в порядке времени.
+    """
+
+    ranges: tuple[tuple[datetime, datetime], ...] = ()
+
+    @property
+    def watermark(self) -> datetime | None:
+        """Конец последнего покрытого полуинтервала или None, если покрытия нет."""
+        return self.ranges[-1][1] if self.ranges else None
+
+    def add(self, from_: datetime, to: datetime) -> 'CandleCoverage':
+        """Возвращает покрытие с добавленным полуинтервалом [from_, to).
+
+        Args:
+            from_: Начало периода (включительно).
+            to: Конец периода (не включительно).
+
+        Returns:
+            Новое покрытие; пустой период возвращает исходное.
+        """
+        if from_ >= to:
+            return self
+
+        merged: list[tuple[datetime, datetime]] = []
+        start, end = from_, to
+        for range_start, range_end in self.ranges:
+            if range_end < start or range_start > end:
+                merged.append((range_start, range_end))
+            else:
+                start, end = min(start, range_start), max(end, range_end)
+        merged.append((start, end))
+        return CandleCoverage(tuple(sorted(merged)))
+
+    def missing(self, from_: datetime, to: datetime) -> list[tuple[datetime, datetime]]:
+        """Возвращает непокрытые части полуинтервала [from_, to).
+
+        Args:
+            from_: Начало периода (включительно).
+            to: Конец периода (не включительно).
+
+        Returns:
+            Непокрытые полуинтервалы в порядке времени: дыры внутри покрытого
+            периода и хвост после watermark.
+        """
+        gaps: list[tuple[datetime, datetime]] = []
+        cursor = from_
+        for range_start, range_end in self.ranges:
+            if range_end <= cursor:
+                continue
+            if range_start >= to:
+                break
+            if range_start > cursor:
+                gaps.append((cursor, range_start))
+            cursor = max(cursor, range_end)
+        if cursor < to:
+            gaps.append((cursor, to))
+        return gaps
+
+    def to_epoch_pairs(self) -> list[list[int]]:
+        """Сериализует покрытие в пары секунд Unix-эпохи.
+
+        Returns:
+            Список пар [start, end] для записи в JSON.
+        """
+        return [[int(start.timestamp()), int(end.timestamp())] for start, end in self.ranges]
+
+    @classmethod
+    def from_epoch_pairs(cls, pairs: 'Iterable[Iterable[int]]') -> 'CandleCoverage':
+        """Восстанавливает покрытие из пар секунд Unix-эпохи.
+
+        Args:
+            pairs: Пары [start, end] в любом порядке.
+
+        Returns:
+            Покрытие с объединёнными полуинтервалами.
+        """
+        coverage = cls()
+        for start, end in pairs:
+            coverage = coverage.add(datetime.fromtimestamp(start, tz=UTC), datetime.fromtimestamp(end, tz=UTC))
+        return coverage
@@ -0,0 +1,121 @@
+"""Нарезка периода свечей на окна запросов и их параллельная загрузка.
+
+Tinkoff Invest API ограничивает период одного запроса GetCandles в зависимости от
+интервала (например, не больше суток для минутных свечей). Модуль делит период на
+окна допустимой длины и загружает их параллельно с ограничением числа запросов,
+отдавая результаты окон по порядку по мере готовности.
+
+Интервалы задаются строковыми значениями ('1min', 'hour', 'day', ...), совпадающими
+со значениями CandleInterval в finsight_api и finsight_worker.
+"""
+
+import asyncio
+from collections import deque
+from datetime import timedelta
+from typing import Final, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
+    from datetime import datetime
+
+
+DEFAULT_CANDLE_WINDOW_CONCURRENCY: Final[int] = 4
+
+# Максимальный период одного запроса GetCandles по интервалу. Месяцы и годы взяты
+# с запасом (3 месяца — 89 дней, год — 365 дней), чтобы окно не превысило лимит
+# при любом календаре.
+CANDLE_WINDOW_LIMITS: Final['Mapping[str, timedelta]'] = {
+    '1min': timedelta(days=1),
+    '2min': timedelta(days=1),
+    '3min': timedelta(days=1),
+    '5min': timedelta(weeks=1),
+    '10min': timedelta(weeks=1),
+    '15min': timedelta(weeks=3),
+    '30min': timedelta(weeks=3),
+    'hour': timedelta(days=89),
+    '2hour': timedelta(days=89),
+    '4hour': timedelta(days=89),
+    'day': timedelta(days=6 * 365),
+    'week': timedelta(days=5 * 365),
+    'month': timedelta(days=10 * 365),
+}
+
+
+def split_candle_range(
+    from_: 'datetime',
+    to: 'datetime',
+    interval: str,
+) -> list[tuple['datetime', 'datetime']]:
+    """Делит период [from_, to) на последовательные окна допустимой для интервала длины.
+
+    Args:
+        from_: Начало периода (включительно).
+        to: Конец периода (не включительно).
+        interval: Значение интервала свечей (например, '1min' или 'day').
+
+    Returns:
+        Окна [start, end) в порядке времени; пустой список для пустого периода.
+
+    Raises:
+        ValueError: Если интервал неизвестен.
+    """
+    try:
+        step = CANDLE_WINDOW_LIMITS[interval]
+    except KeyError as exc:
+        raise ValueError(f'Unknown candle interval: {interval!r}') from exc
+
+    windows: list[tuple[datetime, datetime]] = []
+    start = from_
+    while start < to:
+        end = min(start + step, to)
+        windows.append((start, end))
+        start = end
+    return windows
+
+
+async def fetch_windows[T](
+    windows: 'Iterable[tuple[datetime, datetime]]',
+    fetch: 'Callable[[datetime, datetime], Awaitable[T]]',
+    *,
+    concurrency: int = DEFAULT_CANDLE_WINDOW_CONCURRENCY,
+) -> 'AsyncIterator[T]':
+    """Загружает окна параллельно и отдаёт результаты в порядке окон.
+
+    Одновременно выполняется не больше `concurrency` запросов: следующее окно
+    запрашивается, как только отдан результат очередного. Если потребитель прервал
+    итерацию или запрос окна упал, незавершённые запросы отменяются.
+
+    Args:
+        windows: Окна [start, end) в порядке времени.
+        fetch: Загрузка одного окна.
+        concurrency: Максимальное число одновременных запросов.
+
+    Yields:
+        Результаты загрузки окон в порядке окон.
+
+    Raises:
+        ValueError: Если concurrency не является положительным числом.
+    """
+    if concurrency <= 0:
+        raise ValueError('Concurrency must be a positive integer')
+
+    remaining = iter(windows)
+    pending: deque[asyncio.Future[T]] = deque()
+
+    def schedule_next() -> None:
+        window = next(remaining, None)
+        if window is not None:
+            pending.append(asyncio.ensure_future(fetch(*window)))
+
+    try:
+        for _ in range(concurrency):
+            schedule_next()
+
+        while pending:
+            result = await pending.popleft()
+            schedule_next()
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
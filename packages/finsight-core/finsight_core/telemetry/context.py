@@ -12,11 +12,14 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
     from fastapi import Request
+    from starlette.types import Scope
 
 _request_id_ctx: ContextVar[str | None] = ContextVar('request_id_ctx', default=None)
 
 DEFAULT_REQUEST_ID_HEADER: Final[str] = 'X-Request-ID'
 
+_REQUEST_ID_HEADER_KEY: Final[bytes] = DEFAULT_REQUEST_ID_HEADER.lower().encode('latin-1')
+
 
 def extract_request_id(request: 'Request') -> str | None:
     """Извлекает идентификатор запроса из заголовка X-Request-ID.
@@ -30,6 +33,25 @@ def extract_request_id(request: 'Request') -> str | None:
     return request.headers.get(DEFAULT_REQUEST_ID_HEADER)
 
 
+def extract_request_id_from_scope(scope: 'Scope') -> str | None:
+    """Извлекает идентификатор запроса из заголовков ASGI scope.
+
+    Вариант `extract_request_id` для ASGI-middlewares: заголовки читаются из scope
+    без создания объекта запроса.
+
+    Args:
+        scope: ASGI scope HTTP-запроса.
+
+    Returns:
+        Значение X-Request-ID из заголовков или None, если заголовок не передан.
+    """
+    headers: list[tuple[bytes, bytes]] = scope['headers']
+    for key, value in headers:
+        if key == _REQUEST_ID_HEADER_KEY:
+            return value.decode('latin-1')
+    return None
+
+
 def set_request_id(
     value: str | None = None,
     request_id_generator: 'Callable[[], str] | None' = None,
@@ -0,0 +1,224 @@
+"""Неблокирующий конвейер записи логов через ограниченную очередь.
+
+Логгеры приложения пишут записи в `QueueHandler`: он только кладёт запись в
+очередь и сразу возвращает управление. Форматирование (рендер JSON) и запись в
+поток выполняет `QueueListener` в фоновом потоке, поэтому медленный stdout не
+останавливает обработку запросов в event loop.
+
+Запись уходит в очередь вместе с копией контекста (`contextvars.copy_context()`),
+и фоновый поток форматирует её в этом контексте: процессоры, читающие
+контекстные переменные (request-id), видят значения потока, который записал лог.
+
+Очередь ограничена. При переполнении поведение задаёт `OverflowPolicy`, а
+отброшенные записи считаются (см. `LogPipeline.stats`). После остановки конвейера
+(`LogPipeline.stop`, при выходе из процесса — автоматически) очередь дописывается,
+а новые записи пишутся в целевой обработчик синхронно.
+"""
+
+import atexit
+import contextlib
+import contextvars
+import logging
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from enum import StrEnum, unique
+from logging.handlers import QueueHandler, QueueListener
+from typing import cast, Final, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+DEFAULT_LOG_QUEUE_CAPACITY: Final[int] = 10_000
+
+
+@unique
+class OverflowPolicy(StrEnum):
+    """Поведение при переполнении очереди логов.
+
+    Attributes:
+        BLOCK: Ждать места в очереди.
+        DROP: Отбрасывать новую запись.
+        DROP_DEBUG: Отбрасывать записи ниже WARNING (debug и info), записи
+            WARNING и выше ждут места в очереди.
+    """
+
+    BLOCK = 'block'
+    DROP = 'drop'
+    DROP_DEBUG = 'drop_debug'
+
+
+DEFAULT_LOG_QUEUE_OVERFLOW_POLICY: Final[OverflowPolicy] = OverflowPolicy.DROP_DEBUG
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LogQueueStats:
+    """Счётчики очереди логов.
+
+    Attributes:
+        capacity: Ёмкость очереди.
+        depth: Число записей в очереди в момент снятия счётчиков.
+        dropped: Число записей, отброшенных при переполнении с начала работы.
+    """
+
+    capacity: int
+    depth: int
+    dropped: int
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Обработчик, кладущий записи в ограниченную очередь без форматирования."""
+
+    def __init__(
+        self, log_queue: 'queue.Queue[Any]', *, overflow_policy: OverflowPolicy, fallback: logging.Handler
+    ) -> None:
+        """Инициализирует обработчик.
+
+        Args:
+            log_queue: Ограниченная очередь записей.
+            overflow_policy: Поведение при переполнении очереди.
+            fallback: Обработчик для синхронной записи после остановки конвейера.
+        """
+        super().__init__(log_queue)
+        self.overflow_policy = overflow_policy
+        self.fallback = fallback
+        self.stopped = False
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Кладёт запись в очередь вместе с текущим контекстом.
+
+        Args:
+            record: Запись лога.
+        """
+        if self.stopped:
+            self.fallback.handle(record)
+            return
+        try:
+            self.enqueue_item((contextvars.copy_context(), record), record.levelno)
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+    def enqueue_item(self, item: tuple[contextvars.Context, logging.LogRecord], levelno: int) -> None:
+        """Кладёт элемент в очередь по политике переполнения.
+
+        Args:
+            item: Контекст и запись лога.
+            levelno: Уровень записи.
+        """
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            if self.overflow_policy == OverflowPolicy.BLOCK or (
+                self.overflow_policy == OverflowPolicy.DROP_DEBUG and levelno >= logging.WARNING
+            ):
+                cast('queue.Queue[Any]', self.queue).put(item)
+                return
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+class _ContextQueueListener(QueueListener):
+    """Фоновый поток, форматирующий и записывающий записи в их контексте."""
+
+    def handle(self, record: object) -> None:
+        """Передаёт запись обработчикам в контексте, скопированном при записи.
+
+        Args:
+            record: Пара (контекст, запись лога) из очереди.
+        """
+        context, log_record = cast('tuple[contextvars.Context, logging.LogRecord]', record)
+        context.run(super().handle, log_record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Возвращает запись без изменений: форматирует целевой обработчик."""
+        return record
+
+    def enqueue_sentinel(self) -> None:
+        """Кладёт маркер остановки (None), дожидаясь места в заполненной очереди."""
+        cast('queue.Queue[Any]', self.queue).put(None)
+
+
+class LogPipeline:
+    """Очередь логов с фоновым потоком записи в целевой обработчик.
+
+    Логгеры подключают `handler`; целевой обработчик (с форматтером) вызывается
+    только из фонового потока.
+    """
+
+    def __init__(
+        self,
+        target: logging.Handler,
+        *,
+        capacity: int = DEFAULT_LOG_QUEUE_CAPACITY,
+        overflow_policy: OverflowPolicy = DEFAULT_LOG_QUEUE_OVERFLOW_POLICY,
+    ) -> None:
+        """Инициализирует конвейер.
+
+        Args:
+            target: Обработчик, выполняющий форматирование и запись.
+            capacity: Ёмкость очереди.
+            overflow_policy: Поведение при переполнении очереди.
+
+        Raises:
+            ValueError: Если ёмкость не положительна.
+        """
+        if capacity <= 0:
+            raise ValueError('Log queue capacity must be positive')
+        self.target = target
+        self.capacity = capacity
+        self._queue: queue.Queue[Any] = queue.Queue(capacity)
+        self.handler = BoundedQueueHandler(self._queue, overflow_policy=overflow_policy, fallback=target)
+        self._listener = _ContextQueueListener(self._queue, target, respect_handler_level=True)
+
+    def start(self) -> None:
+        """Запускает фоновый поток записи.
+
+        Остановка регистрируется на выход из процесса, а в дочернем процессе после
+        fork (где фонового потока нет) конвейер перезапускается с новой очередью.
+        """
+        self._listener.start()
+        atexit.register(self.stop)
+        os.register_at_fork(after_in_child=self._restart_in_child)
+
+    def stop(self) -> None:
+        """Дописывает очередь и останавливает фоновый поток.
+
+        Записи после остановки пишутся в целевой обработчик синхронно. Повторный
+        вызов ничего не делает.
+        """
+        if self.handler.stopped:
+            return
+        self.handler.stopped = True
+        self._listener.stop()
+        # Как logging.shutdown: поток вывода к этому моменту может быть уже закрыт.
+        with contextlib.suppress(OSError, ValueError):
+            self.target.flush()
+        atexit.unregister(self.stop)
+
+    def flush(self) -> None:
+        """Ждёт, пока фоновый поток запишет все записи из очереди."""
+        if not self.handler.stopped:
+            self._queue.join()
+        self.target.flush()
+
+    def stats(self) -> LogQueueStats:
+        """Возвращает счётчики очереди.
+
+        Returns:
+            Ёмкость, текущая глубина очереди и число отброшенных записей.
+        """
+        return LogQueueStats(capacity=self.capacity, depth=self._queue.qsize(), dropped=self.handler.dropped)
+
+    def _restart_in_child(self) -> None:
+        """Создаёт новую очередь и фоновый поток в дочернем процессе после fork."""
+        if self.handler.stopped:
+            return
+        self._queue = queue.Queue(self.capacity)
+        self.handler.queue = self._queue
+        self.handler._dropped_lock = threading.Lock()
+        self._listener.queue = self._queue
+        self._listener._thread = None
+        self._listener.start()
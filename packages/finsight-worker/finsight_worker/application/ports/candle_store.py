@@ -0,0 +1,31 @@
+"""Контракт порта хранения загруженных исторических свечей."""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from finsight_worker.domain.models import Candle
+    from finsight_worker.domain.value_objects import CandleInterval
+
+
+class CandleStore(ABC):
+    """Порт хранения исторических свечей по инструменту и интервалу.
+
+    Use case сохраняет свечи каждого загруженного окна до того, как отметить окно
+    в покрытии, поэтому покрытие никогда не опережает сохранённые данные.
+    """
+
+    @abstractmethod
+    async def save(self, isin: str, interval: 'CandleInterval', candles: 'Sequence[Candle]') -> None:
+        """Сохраняет свечи инструмента и интервала.
+
+        Свечи с уже сохранённым временем заменяются новыми значениями.
+
+        Args:
+            isin: Идентификатор инструмента (ISIN).
+            interval: Интервал свечей.
+            candles: Свечи для сохранения (в любом порядке).
+        """
+        raise NotImplementedError
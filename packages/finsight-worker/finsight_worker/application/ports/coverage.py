@@ -0,0 +1,40 @@
+"""Контракт порта хранения покрытия загруженных периодов свечей."""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from finsight_core.market_data.candle_coverage import CandleCoverage
+    from finsight_worker.domain.value_objects import CandleInterval
+
+
+class CandleCoverageStore(ABC):
+    """Порт хранения покрытия (CandleCoverage) по инструменту и интервалу.
+
+    Покрытие — периоды, уже загруженные из источника рыночных данных; по нему
+    инкрементальная загрузка определяет, какие периоды ещё нужно запросить.
+    """
+
+    @abstractmethod
+    async def load(self, isin: str, interval: 'CandleInterval') -> 'CandleCoverage':
+        """Читает покрытие инструмента и интервала.
+
+        Args:
+            isin: Идентификатор инструмента (ISIN).
+            interval: Интервал свечей.
+
+        Returns:
+            Покрытие (пустое, если загрузок ещё не было).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save(self, isin: str, interval: 'CandleInterval', coverage: 'CandleCoverage') -> None:
+        """Сохраняет покрытие инструмента и интервала.
+
+        Args:
+            isin: Идентификатор инструмента (ISIN).
+            interval: Интервал свечей.
+            coverage: Новое покрытие, заменяющее сохранённое.
+        """
+        raise NotImplementedError
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
-    from finsight_worker.domain.models import HistoricalDataRequest
+    from finsight_worker.domain.models import Candle, HistoricalDataRequest
 
 
 class MarketDataGateway(ABC):
@@ -17,13 +17,22 @@ class MarketDataGateway(ABC):
     """
 
     @abstractmethod
-    def download_candles(self, request: 'HistoricalDataRequest') -> 'Sequence[object]':
+    async def download_candles(self, request: 'HistoricalDataRequest') -> 'Sequence[Candle]':
         """Загружает исторические свечи по параметрам запроса.
 
+        Use case вызывает метод для окон, не превышающих лимит периода одного
+        запроса API для интервала, и может вызывать его параллельно.
+
         Args:
             request: Инструмент, период и интервал свечей.
 
         Returns:
-            Последовательность свечей за указанный период.
+            Свечи за указанный период, упорядоченные по времени.
         """
         raise NotImplementedError
+
+    async def close(self) -> None:  # noqa: B027
+        """Освобождает ресурсы шлюза (соединения) при остановке процесса.
+
+        По умолчанию ничего не делает.
+        """
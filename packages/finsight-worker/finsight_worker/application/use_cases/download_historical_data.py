@@ -1,16 +1,33 @@
-"""Use case для загрузки исторических рыночных данных."""
+"""Use case для загрузки исторических рыночных данных.
+
+Загруженные свечи сохраняются в хранилище свечей. В инкрементальном режиме
+загружаются только периоды, отсутствующие в покрытии (CandleCoverage)
+инструмента и интервала: хвост после watermark и дыры внутри уже загруженного
+периода.
+"""
 
 from dataclasses import dataclass
+from datetime import datetime, time, timedelta, UTC
 from typing import TYPE_CHECKING
 
+from finsight_core.market_data.candle_windows import (
+    DEFAULT_CANDLE_WINDOW_CONCURRENCY,
+    fetch_windows,
+    split_candle_range,
+)
 from finsight_worker.domain.models import HistoricalDataRequest
 from finsight_worker.domain.value_objects import CandleInterval
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
     from datetime import date
 
+    from finsight_core.market_data.candle_coverage import CandleCoverage
+    from finsight_worker.application.ports.candle_store import CandleStore
+    from finsight_worker.application.ports.coverage import CandleCoverageStore
     from finsight_worker.application.ports.gateway import MarketDataGateway
     from finsight_worker.application.ports.logger import Logger
+    from finsight_worker.domain.models import Candle
 
 
 @dataclass(frozen=True, slots=True, kw_only=True, repr=True, eq=False)
@@ -22,43 +39,70 @@ class DownloadHistoricalDataInputDto:
         from_date: Дата начала периода.
         to_date: Дата конца периода.
         interval: Интервал между свечами (например, 'day', 'hour').
+        concurrency: Максимальное число одновременных запросов окон периода.
+        incremental: Загружать только периоды, которых ещё нет в покрытии.
     """
 
     isin: str
     from_date: 'date'
     to_date: 'date'
     interval: CandleInterval = CandleInterval.DAY
+    concurrency: int = DEFAULT_CANDLE_WINDOW_CONCURRENCY
+    incremental: bool = False
 
 
 class DownloadHistoricalDataUseCase:
     """Сценарий загрузки исторических рыночных данных.
 
-    Принимает параметры инструмента и периода, формирует HistoricalDataRequest,
-    запрашивает свечи через MarketDataGateway и логирует начало и успешное
-    завершение загрузки.
+    Делит период на окна, допустимые API для интервала свечей, запрашивает окна
+    через MarketDataGateway параллельно (не больше concurrency одновременно) и
+    обрабатывает их по порядку по мере готовности: свечи окна сохраняются через
+    CandleStore. Логирует начало загрузки, каждое окно и успешное завершение.
+
+    После сохранения свечей окна его период добавляется в покрытие инструмента
+    (кроме текущих суток, свечи которых ещё не закрыты), поэтому следующая
+    инкрементальная загрузка запросит только недостающее, а покрытие не опережает
+    сохранённые данные.
     """
 
-    def __init__(self, market_data_gateway: 'MarketDataGateway', logger: 'Logger') -> None:
+    def __init__(
+        self,
+        market_data_gateway: 'MarketDataGateway',
+        logger: 'Logger',
+        candle_store: 'CandleStore',
+        coverage_store: 'CandleCoverageStore',
+        clock: 'Callable[[], datetime] | None' = None,
+    ) -> None:
         """Инициализирует use case для загрузки исторических данных.
 
         Args:
             market_data_gateway: Интерфейс для получения рыночных данных.
             logger: Интерфейс для логирования действий use case.
+            candle_store: Хранилище загруженных свечей.
+            coverage_store: Хранилище покрытия загруженных периодов.
+            clock: Источник текущего времени (UTC). По умолчанию datetime.now(UTC).
         """
         self._market_data_gateway = market_data_gateway
         self._logger = logger
+        self._candle_store = candle_store
+        self._coverage_store = coverage_store
+        self._clock = clock or (lambda: datetime.now(UTC))
 
-    def execute(
+    async def execute(
         self,
         dto: DownloadHistoricalDataInputDto,
-    ) -> None:
-        """Загружает исторические свечи по инструменту и логирует ход операции.
+    ) -> int:
+        """Загружает и сохраняет исторические свечи по инструменту, логируя ход операции.
 
-        Формирует запрос из DTO, получает свечи через gateway и пишет события
-        начала и успешного завершения с количеством загруженных свечей.
+        Период [from_date, to_date] (даты включительно) делится на окна; для
+        каждого окна gateway получает HistoricalDataRequest с датами окна. В
+        инкрементальном режиме на окна делятся только непокрытые части периода.
 
         Args:
             dto: Инструмент, период и интервал свечей.
+
+        Returns:
+            Количество загруженных и сохранённых свечей.
         """
         self._logger.info(
             'download_historical_data_started',
@@ -66,18 +110,61 @@ class DownloadHistoricalDataUseCase:
             from_date=dto.from_date.isoformat(),
             to_date=dto.to_date.isoformat(),
             interval=dto.interval,
+            incremental=dto.incremental,
         )
 
-        request = HistoricalDataRequest(
-            isin=dto.isin,
-            from_date=dto.from_date,
-            to_date=dto.to_date,
-            interval=dto.interval,
-        )
-
-        candles = self._market_data_gateway.download_candles(request)
+        # Окна считаются по полуинтервалу [from_date, to_date + 1 день) и всегда кратны суткам.
+        period_start = datetime.combine(dto.from_date, time.min, tzinfo=UTC)
+        period_end = datetime.combine(dto.to_date + timedelta(days=1), time.min, tzinfo=UTC)
+        coverage = await self._coverage_store.load(dto.isin, dto.interval)
+        gaps = coverage.missing(period_start, period_end) if dto.incremental else [(period_start, period_end)]
+        windows = [window for gap in gaps for window in split_candle_range(*gap, dto.interval)]
+        today = datetime.combine(self._clock().date(), time.min, tzinfo=UTC)
+
+        async def _download_window(start: datetime, end: datetime) -> tuple[datetime, datetime, 'Sequence[Candle]']:
+            request = HistoricalDataRequest(
+                isin=dto.isin,
+                from_date=start.date(),
+                to_date=(end - timedelta(days=1)).date(),
+                interval=dto.interval,
+            )
+            return start, end, await self._market_data_gateway.download_candles(request)
+
+        count = 0
+        async for window_start, window_end, candles in fetch_windows(
+            windows, _download_window, concurrency=dto.concurrency
+        ):
+            await self._candle_store.save(dto.isin, dto.interval, candles)
+            count += len(candles)
+            self._logger.info('download_historical_data_window_saved', count=len(candles))
+            coverage = await self._extend_coverage(dto, coverage, window_start, min(window_end, today))
 
         self._logger.info(
             'download_historical_data_succeeded',
-            count=len(candles),
+            count=count,
+            windows=len(windows),
         )
+        return count
+
+    async def _extend_coverage(
+        self,
+        dto: DownloadHistoricalDataInputDto,
+        coverage: 'CandleCoverage',
+        start: datetime,
+        end: datetime,
+    ) -> 'CandleCoverage':
+        """Добавляет загруженное окно в покрытие и сохраняет его.
+
+        Args:
+            dto: Параметры загрузки (инструмент и интервал).
+            coverage: Текущее покрытие.
+            start: Начало загруженного окна.
+            end: Конец загруженного окна (не позже начала текущих суток).
+
+        Returns:
+            Расширенное покрытие.
+        """
+        extended = coverage.add(start, end)
+        if extended != coverage:
+            await self._coverage_store.save(dto.isin, dto.interval, extended)
+        return extended
@@ -0,0 +1,92 @@
+"""Use case для загрузки исторических рыночных данных по набору инструментов."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Final, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from finsight_worker.application.ports.logger import Logger
+    from finsight_worker.application.use_cases.download_historical_data import (
+        DownloadHistoricalDataInputDto,
+        DownloadHistoricalDataUseCase,
+    )
+
+
+DEFAULT_BATCH_CONCURRENCY: Final[int] = 8
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DownloadHistoricalDataBatchResult:
+    """Итог пакетной загрузки.
+
+    Attributes:
+        downloaded: Количество загруженных и сохранённых свечей по ISIN успешно обработанных
+            инструментов.
+        failed: Текст ошибки по ISIN инструментов, загрузка которых упала.
+    """
+
+    downloaded: dict[str, int] = field(default_factory=dict)
+    failed: dict[str, str] = field(default_factory=dict)
+
+
+class DownloadHistoricalDataBatchUseCase:
+    """Сценарий загрузки исторических данных сразу по многим инструментам.
+
+    Инструменты обрабатываются параллельно (не больше concurrency одновременно)
+    через DownloadHistoricalDataUseCase, который сохраняет свечи каждого
+    инструмента. Ошибка одного инструмента не прерывает загрузку остальных: она
+    попадает в итог пакета.
+    """
+
+    def __init__(self, download: 'DownloadHistoricalDataUseCase', logger: 'Logger') -> None:
+        """Инициализирует пакетный use case.
+
+        Args:
+            download: Use case загрузки данных одного инструмента.
+            logger: Интерфейс для логирования действий use case.
+        """
+        self._download = download
+        self._logger = logger
+
+    async def execute(
+        self,
+        dtos: 'Sequence[DownloadHistoricalDataInputDto]',
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> DownloadHistoricalDataBatchResult:
+        """Загружает и сохраняет исторические данные по всем инструментам пакета.
+
+        Args:
+            dtos: Параметры загрузки по инструментам.
+            concurrency: Максимальное число одновременно загружаемых инструментов.
+
+        Returns:
+            Итог пакета: количество свечей по успешным инструментам и ошибки остальных.
+
+        Raises:
+            ValueError: Если concurrency не является положительным числом.
+        """
+        if concurrency <= 0:
+            raise ValueError('Concurrency must be a positive integer')
+
+        semaphore = asyncio.Semaphore(concurrency)
+        result = DownloadHistoricalDataBatchResult()
+
+        async def _download_one(dto: 'DownloadHistoricalDataInputDto') -> None:
+            async with semaphore:
+                try:
+                    result.downloaded[dto.isin] = await self._download.execute(dto)
+                except Exception as exc:
+                    self._logger.error('download_historical_data_failed', isin=dto.isin, error=repr(exc))
+                    result.failed[dto.isin] = repr(exc)
+
+        await asyncio.gather(*(_download_one(dto) for dto in dtos))
+
+        self._logger.info(
+            'download_historical_data_batch_succeeded',
+            instruments=len(dtos),
+            failed=len(result.failed),
+        )
+        return result
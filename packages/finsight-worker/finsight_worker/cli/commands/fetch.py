@@ -1,7 +1,7 @@
 """CLI-команда для загрузки исторических данных."""
 
 from datetime import date
-from typing import Annotated  # noqa: TC003
+from typing import Annotated
 
 import typer
 
@@ -18,6 +18,9 @@ def trigger_historical_data_download(
     from_date: Annotated[str, typer.Argument(help='Дата начала в формате YYYY-MM-DD')],
     to_date: Annotated[str, typer.Argument(help='Дата окончания в формате YYYY-MM-DD')],
     interval: Annotated[CandleInterval, typer.Option(help='Интервал между свечами')] = CandleInterval.DAY,
+    incremental: Annotated[
+        bool, typer.Option('--incremental', help='Загрузить только периоды, которых ещё нет в покрытии')
+    ] = False,
 ) -> None:
     """Ставит в очередь Celery-задачу загрузки исторических данных по инструменту.
 
@@ -29,6 +32,7 @@ def trigger_historical_data_download(
         from_date: Дата начала в формате YYYY-MM-DD.
         to_date: Дата окончания в формате YYYY-MM-DD.
         interval: Интервал между свечами.
+        incremental: Загрузить только периоды, которых ещё нет в покрытии.
 
     Raises:
         typer.Exit: Если формат даты не соответствует YYYY-MM-DD.
@@ -44,7 +48,46 @@ def trigger_historical_data_download(
 
     task = celery_app.send_task(
         name='download_historical_data',
-        args=[isin, from_date, to_date, interval.value],
+        args=[isin, from_date, to_date, interval.value, incremental],
     )
 
     typer.echo(f'✅ Задача отправлена: task_id={task.id}')
+
+
+@cli.command('historical-batch')
+def trigger_historical_data_batch_download(
+    isins: Annotated[list[str], typer.Argument(help='ISIN инструментов')],
+    from_date: Annotated[str, typer.Option('--from', help='Дата начала в формате YYYY-MM-DD')],
+    to_date: Annotated[str, typer.Option('--to', help='Дата окончания в формате YYYY-MM-DD')],
+    interval: Annotated[CandleInterval, typer.Option(help='Интервал между свечами')] = CandleInterval.DAY,
+    incremental: Annotated[
+        bool, typer.Option('--incremental', help='Загрузить только периоды, которых ещё нет в покрытии')
+    ] = False,
+) -> None:
+    """Ставит в очередь одну Celery-задачу загрузки исторических данных по набору инструментов.
+
+    Args:
+        isins: ISIN инструментов.
+        from_date: Дата начала в формате YYYY-MM-DD.
+        to_date: Дата окончания в формате YYYY-MM-DD.
+        interval: Интервал между свечами.
+        incremental: Загрузить только периоды, которых ещё нет в покрытии.
+
+    Raises:
+        typer.Exit: Если формат даты не соответствует YYYY-MM-DD.
+    """
+    try:
+        date.fromisoformat(from_date)
+        date.fromisoformat(to_date)
+    except ValueError as error:
+        typer.echo('❌ Неверный формат даты. Используйте YYYY-MM-DD.')
+        raise typer.Exit(code=1) from error
+
+    register_tasks(celery_app)
+
+    task = celery_app.send_task(
+        name='download_historical_data_batch',
+        args=[isins, from_date, to_date, interval.value, incremental],
+    )
+
+    typer.echo(f'✅ Задача отправлена: task_id={task.id}, инструментов: {len(isins)}')
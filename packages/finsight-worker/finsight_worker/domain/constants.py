@@ -1,7 +1,7 @@
 """Константы и перечисления, используемые в приложении."""
 
 from enum import StrEnum, unique
-from typing import Final  # noqa: TC003
+from typing import Final
 
 LOGGER_NAME: Final[str] = 'finsight-worker'
 
@@ -6,7 +6,8 @@ from typing import TYPE_CHECKING
 from finsight_worker.domain.value_objects import CandleInterval
 
 if TYPE_CHECKING:
-    from datetime import date
+    from datetime import date, datetime
+    from decimal import Decimal
 
 
 @dataclass(frozen=True)
@@ -24,3 +25,24 @@ class HistoricalDataRequest:
     from_date: 'date'
     to_date: 'date'
     interval: CandleInterval = CandleInterval.DAY
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Candle:
+    """Историческая свеча инструмента.
+
+    Attributes:
+        time: Время начала свечи (UTC).
+        open: Цена открытия.
+        high: Максимальная цена.
+        low: Минимальная цена.
+        close: Цена закрытия.
+        volume: Объём торгов в лотах.
+    """
+
+    time: 'datetime'
+    open: 'Decimal'
+    high: 'Decimal'
+    low: 'Decimal'
+    close: 'Decimal'
+    volume: int
@@ -1,4 +1,8 @@
-"""Настройка логирования через structlog."""
+"""Настройка логирования через structlog.
+
+Записи уходят в ограниченную очередь (`finsight_core.telemetry.log_queue`):
+рендер JSON через orjson и запись в stderr выполняются в фоновом потоке.
+"""
 
 import logging
 import sys
@@ -17,6 +21,13 @@ from structlog.stdlib import (
     ProcessorFormatter,
 )
 
+from finsight_core.telemetry.log_queue import (
+    DEFAULT_LOG_QUEUE_CAPACITY,
+    DEFAULT_LOG_QUEUE_OVERFLOW_POLICY,
+    LogPipeline,
+    OverflowPolicy,
+)
+
 if TYPE_CHECKING:
     from collections.abc import Iterable
     from types import TracebackType
@@ -24,6 +35,7 @@ if TYPE_CHECKING:
 
     from structlog.typing import Processor
 
+    from finsight_core.telemetry.log_queue import LogQueueStats
     from finsight_worker.application.ports.logger import Logger
     from finsight_worker.domain.constants import AppEnv, LogLevel
 
@@ -40,6 +52,21 @@ from finsight_worker.infrastructure.adapters.logger.processors import (
 _logger_ctx: ContextVar['Logger | None'] = ContextVar('_logger', default=None)
 
 
+class _LoggingState:
+    """Очередь логов процесса, установленная `configure_logging`.
+
+    Attributes:
+        pipeline: Очередь логов (None — logging ещё не настроен).
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует состояние ненастроенного процесса."""
+        self.pipeline: LogPipeline | None = None
+
+
+_state = _LoggingState()
+
+
 def configure_logging(  # noqa: PLR0913
     app_name: str,
     app_version: str,
@@ -48,13 +75,16 @@ def configure_logging(  # noqa: PLR0913
     log_level: 'LogLevel',
     disabled_logger_names: 'Iterable[str] | None' = None,
     propagate_log_message: bool = False,
+    queue_capacity: int = DEFAULT_LOG_QUEUE_CAPACITY,
+    queue_overflow_policy: OverflowPolicy = DEFAULT_LOG_QUEUE_OVERFLOW_POLICY,
 ) -> None:
     """Настраивает structlog и стандартное логирование для вывода JSON.
 
     Регистрирует общие процессоры (контекстные переменные, технические атрибуты,
-    request-id), JSON-рендер через orjson и единый handler для корневого,
-    пользовательских и uvicorn-логгеров. Устанавливает перехват необработанных
-    исключений в excepthook.
+    request-id), JSON-рендер через orjson и единый handler очереди логов для
+    корневого, пользовательских и uvicorn-логгеров. Устанавливает перехват
+    необработанных исключений в excepthook. Повторный вызов дописывает и
+    останавливает очередь предыдущей настройки.
 
     Args:
         app_name: Название приложения.
@@ -64,6 +94,8 @@ def configure_logging(  # noqa: PLR0913
         log_level: Уровень логирования.
         disabled_logger_names: Имена логгеров, которые нужно отключить.
         propagate_log_message: Включить ли проброс записей вверх по иерархии логгеров.
+        queue_capacity: Ёмкость очереди логов.
+        queue_overflow_policy: Поведение при переполнении очереди логов.
     """
     root_logger = logging.getLogger()
 
@@ -110,9 +142,17 @@ def configure_logging(  # noqa: PLR0913
         ],
     )
 
-    handler: logging.Handler = logging.StreamHandler()
-    handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    pipeline = LogPipeline(stream_handler, capacity=queue_capacity, overflow_policy=queue_overflow_policy)
+    pipeline.start()
+    handler: logging.Handler = pipeline.handler
 
+    if _state.pipeline is not None:
+        root_logger.removeHandler(_state.pipeline.handler)
+        _state.pipeline.stop()
+    _state.pipeline = pipeline
     root_logger.addHandler(handler)
     root_logger.setLevel(log_level.value.upper())
 
@@ -136,3 +176,20 @@ def configure_logging(  # noqa: PLR0913
         logger.handlers = [handler]
         logger.setLevel(root_logger.level)
         logger.propagate = False
+
+
+def log_queue_stats() -> 'LogQueueStats | None':
+    """Возвращает счётчики очереди логов процесса.
+
+    Returns:
+        Ёмкость, глубина очереди и число отброшенных записей; None, если logging
+        ещё не настроен.
+    """
+    pipeline = _state.pipeline
+    return None if pipeline is None else pipeline.stats()
+
+
+def shutdown_logging() -> None:
+    """Дописывает очередь логов процесса и останавливает её фоновый поток."""
+    if _state.pipeline is not None:
+        _state.pipeline.stop()
@@ -0,0 +1,6 @@
+"""Адаптеры локального хранения данных воркера."""
+
+from finsight_worker.infrastructure.adapters.storage.candle_store import JsonCandleStore
+from finsight_worker.infrastructure.adapters.storage.coverage_store import JsonCandleCoverageStore
+
+__all__ = ['JsonCandleCoverageStore', 'JsonCandleStore']
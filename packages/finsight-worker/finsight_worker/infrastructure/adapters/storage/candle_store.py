@@ -0,0 +1,140 @@
+"""Хранение загруженных исторических свечей в JSON-файлах по месяцам."""
+
+import asyncio
+import os
+from collections import defaultdict
+from datetime import UTC
+from typing import TYPE_CHECKING
+
+import orjson
+
+from finsight_worker.application.ports.candle_store import CandleStore
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from finsight_worker.application.ports.logger import Logger
+    from finsight_worker.domain.models import Candle
+    from finsight_worker.domain.value_objects import CandleInterval
+
+
+class JsonCandleStore(CandleStore):
+    """Реализация CandleStore: файл `<root>/<isin>/<interval>/<YYYY-MM>.json` на месяц.
+
+    Файл содержит строки `[time, open, high, low, close, volume]`, упорядоченные по
+    времени: время — секунды Unix-эпохи, цены — строки Decimal. Сохранение сливает
+    новые свечи с месяцем по времени свечи и перезаписывает файл атомарно
+    (временный файл, fsync и замена); файловые операции выполняются в пуле потоков.
+    """
+
+    def __init__(self, *, root: 'Path', logger: 'Logger') -> None:
+        """Инициализирует хранилище свечей.
+
+        Args:
+            root: Корневой каталог файлов свечей.
+            logger: Логгер воркера.
+        """
+        self._root = root
+        self._logger = logger
+
+    async def save(self, isin: str, interval: 'CandleInterval', candles: 'Sequence[Candle]') -> None:
+        """Сливает свечи с сохранёнными по месячным файлам.
+
+        Args:
+            isin: Идентификатор инструмента (ISIN).
+            interval: Интервал свечей.
+            candles: Свечи для сохранения (в любом порядке).
+        """
+        if candles:
+            await asyncio.to_thread(self._save_sync, isin, interval, candles)
+
+    def _save_sync(self, isin: str, interval: 'CandleInterval', candles: 'Sequence[Candle]') -> None:
+        """Синхронно сливает свечи с месячными файлами.
+
+        Args:
+            isin: Идентификатор инструмента (ISIN).
+            interval: Интервал свечей.
+            candles: Свечи для сохранения.
+        """
+        by_month: defaultdict[tuple[int, int], list[Candle]] = defaultdict(list)
+        for candle in candles:
+            time = candle.time.astimezone(UTC)
+            by_month[time.year, time.month].append(candle)
+
+        for month, month_candles in by_month.items():
+            path = self._path(isin, interval, month)
+            rows = self._read_rows(path)
+            for candle in month_candles:
+                rows[int(candle.time.timestamp())] = _candle_to_row(candle)
+            _write_rows(path, [rows[time] for time in sorted(rows)])
+
+    def _read_rows(self, path: 'Path') -> dict[int, list[object]]:
+        """Читает строки месячного файла.
+
+        Повреждённый файл не считается ошибкой: он логируется и перезаписывается
+        следующим сохранением.
+
+        Args:
+            path: Путь к файлу месяца.
+
+        Returns:
+            Строки файла по времени свечи (пустой словарь, если файла нет или он повреждён).
+        """
+        if not path.exists():
+            return {}
+
+        try:
+            return {row[0]: row for row in orjson.loads(path.read_bytes())}
+        except (OSError, ValueError, TypeError, IndexError) as exc:
+            self._logger.warning('candle_store_read_failed', path=str(path), error=repr(exc))
+            return {}
+
+    def _path(self, isin: str, interval: 'CandleInterval', month: tuple[int, int]) -> 'Path':
+        """Возвращает путь к файлу месяца.
+
+        Args:
+            isin: Идентификатор инструмента (ISIN).
+            interval: Интервал свечей.
+            month: Год и месяц.
+
+        Returns:
+            Путь вида <root>/<isin>/<interval>/<YYYY-MM>.json.
+        """
+        year, month_number = month
+        return self._root / isin / str(interval) / f'{year:04d}-{month_number:02d}.json'
+
+
+def _candle_to_row(candle: 'Candle') -> list[object]:
+    """Преобразует свечу в строку файла.
+
+    Args:
+        candle: Свеча.
+
+    Returns:
+        Строка `[time, open, high, low, close, volume]`.
+    """
+    return [
+        int(candle.time.timestamp()),
+        str(candle.open),
+        str(candle.high),
+        str(candle.low),
+        str(candle.close),
+        candle.volume,
+    ]
+
+
+def _write_rows(path: 'Path', rows: list[list[object]]) -> None:
+    """Записывает строки месяца через временный файл, fsync и атомарную замену.
+
+    Args:
+        path: Путь к файлу месяца.
+        rows: Строки, упорядоченные по времени.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'{path.name}.tmp')
+    with open(tmp_path, 'wb') as file:
+        file.write(orjson.dumps(rows))
+        file.flush()
+        os.fsync(file.fileno())
+    tmp_path.replace(path)
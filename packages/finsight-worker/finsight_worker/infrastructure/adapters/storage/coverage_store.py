@@ -0,0 +1,98 @@
+"""Хранение покрытия загруженных периодов свечей в JSON-файлах."""
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import orjson
+
+from finsight_core.market_data.candle_coverage import CandleCoverage
+from finsight_worker.application.ports.coverage import CandleCoverageStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from finsight_worker.application.ports.logger import Logger
+    from finsight_worker.domain.value_objects import CandleInterval
+
+
+class JsonCandleCoverageStore(CandleCoverageStore):
+    """Реализация CandleCoverageStore: файл `<root>/<isin>/<interval>.json` на пару.
+
+    Файл содержит пары секунд Unix-эпохи [start, end). Запись атомарна (временный
+    файл и замена), файловые операции выполняются в пуле потоков.
+    """
+
+    def __init__(self, *, root: 'Path', logger: 'Logger') -> None:
+        """Инициализирует хранилище покрытия.
+
+        Args:
+            root: Корневой каталог файлов покрытия.
+            logger: Логгер воркера.
+        """
+        self._root = root
+        self._logger = logger
+
+    async def load(self, isin: str, interval: 'CandleInterval') -> CandleCoverage:
+        """Читает покрытие; отсутствующий или повреждённый файл даёт пустое покрытие.
+
+        Args:
+            isin: Идентификатор инструмента (ISIN).
+            interval: Интервал свечей.
+
+        Returns:
+            Покрытие инструмента и интервала.
+        """
+        return await asyncio.to_thread(self._load_sync, self._path(isin, interval))
+
+    async def save(self, isin: str, interval: 'CandleInterval', coverage: CandleCoverage) -> None:
+        """Атомарно сохраняет покрытие.
+
+        Args:
+            isin: Идентификатор инструмента (ISIN).
+            interval: Интервал свечей.
+            coverage: Новое покрытие.
+        """
+        await asyncio.to_thread(_write_coverage, self._path(isin, interval), coverage)
+
+    def _load_sync(self, path: 'Path') -> CandleCoverage:
+        """Синхронно читает файл покрытия.
+
+        Args:
+            path: Путь к файлу покрытия.
+
+        Returns:
+            Покрытие (пустое, если файла нет или он повреждён).
+        """
+        if not path.exists():
+            return CandleCoverage()
+
+        try:
+            return CandleCoverage.from_epoch_pairs(orjson.loads(path.read_bytes()))
+        except (OSError, ValueError, TypeError) as exc:
+            self._logger.warning('candle_coverage_read_failed', path=str(path), error=repr(exc))
+            return CandleCoverage()
+
+    def _path(self, isin: str, interval: 'CandleInterval') -> 'Path':
+        """Возвращает путь к файлу покрытия.
+
+        Args:
+            isin: Идентификатор инструмента (ISIN).
+            interval: Интервал свечей.
+
+        Returns:
+            Путь вида <root>/<isin>/<interval>.json.
+        """
+        return self._root / isin / f'{interval}.json'
+
+
+def _write_coverage(path: 'Path', coverage: CandleCoverage) -> None:
+    """Записывает покрытие через временный файл и атомарную замену.
+
+    Args:
+        path: Путь к файлу покрытия.
+        coverage: Покрытие.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'{path.name}.tmp')
+    tmp_path.write_bytes(orjson.dumps(coverage.to_epoch_pairs()))
+    tmp_path.replace(path)
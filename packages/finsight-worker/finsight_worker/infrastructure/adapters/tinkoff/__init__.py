@@ -0,0 +1,5 @@
+"""Адаптер Tinkoff Invest API для воркера."""
+
+from finsight_worker.infrastructure.adapters.tinkoff.gateway import TinkoffMarketDataGateway
+
+__all__ = ['TinkoffMarketDataGateway']
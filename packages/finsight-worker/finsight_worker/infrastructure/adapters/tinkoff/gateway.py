@@ -0,0 +1,256 @@
+"""Реализация MarketDataGateway поверх асинхронного SDK Tinkoff Invest API.
+
+Шлюз держит один долгоживущий `AsyncClient` на процесс: gRPC-канал
+мультиплексирует параллельные запросы окон и инструментов поверх HTTP/2, поэтому
+отдельный канал на запрос не нужен. Канал привязан к event loop, в котором открыт
+(см. WorkerEventLoop), и переоткрывается после ошибки транспорта (UNAVAILABLE):
+сломанный канал выводится из работы и закрывается при остановке процесса, чтобы
+не оборвать параллельные запросы, которые ещё его используют.
+FIGI инструментов кэшируются на время жизни процесса; параллельные окна одного
+ISIN ждут один общий запрос FindInstrument.
+"""
+
+import asyncio
+from datetime import datetime, time, timedelta, UTC
+from decimal import Decimal
+from typing import Final, TYPE_CHECKING
+
+from grpc import StatusCode
+from t_tech.invest import AsyncClient
+from t_tech.invest import CandleInterval as SDKCandleInterval
+
+from finsight_worker.application.ports.gateway import MarketDataGateway
+from finsight_worker.domain.models import Candle
+from finsight_worker.domain.value_objects import CandleInterval
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from contextlib import AbstractAsyncContextManager
+
+    from t_tech.invest import HistoricCandle, Quotation
+    from t_tech.invest.async_services import AsyncServices
+
+    from finsight_worker.application.ports.logger import Logger
+    from finsight_worker.domain.models import HistoricalDataRequest
+
+
+_NANO_IN_UNIT: Final[Decimal] = Decimal(1_000_000_000)
+
+_SDK_INTERVALS: Final[dict[CandleInterval, SDKCandleInterval]] = {
+    CandleInterval.MIN_1: SDKCandleInterval.CANDLE_INTERVAL_1_MIN,
+    CandleInterval.MIN_2: SDKCandleInterval.CANDLE_INTERVAL_2_MIN,
+    CandleInterval.MIN_3: SDKCandleInterval.CANDLE_INTERVAL_3_MIN,
+    CandleInterval.MIN_5: SDKCandleInterval.CANDLE_INTERVAL_5_MIN,
+    CandleInterval.MIN_10: SDKCandleInterval.CANDLE_INTERVAL_10_MIN,
+    CandleInterval.MIN_15: SDKCandleInterval.CANDLE_INTERVAL_15_MIN,
+    CandleInterval.MIN_30: SDKCandleInterval.CANDLE_INTERVAL_30_MIN,
+    CandleInterval.HOUR: SDKCandleInterval.CANDLE_INTERVAL_HOUR,
+    CandleInterval.HOUR_2: SDKCandleInterval.CANDLE_INTERVAL_2_HOUR,
+    CandleInterval.HOUR_4: SDKCandleInterval.CANDLE_INTERVAL_4_HOUR,
+    CandleInterval.DAY: SDKCandleInterval.CANDLE_INTERVAL_DAY,
+    CandleInterval.WEEK: SDKCandleInterval.CANDLE_INTERVAL_WEEK,
+    CandleInterval.MONTH: SDKCandleInterval.CANDLE_INTERVAL_MONTH,
+}
+
+
+class TinkoffMarketDataGateway(MarketDataGateway):
+    """Шлюз исторических свечей Tinkoff Invest API с долгоживущим каналом."""
+
+    def __init__(self, *, token: str, logger: 'Logger') -> None:
+        """Инициализирует шлюз без открытия канала.
+
+        Args:
+            token: Read-only токен Tinkoff Invest API.
+            logger: Логгер воркера.
+        """
+        self._token = token
+        self._logger = logger
+        self._context: AbstractAsyncContextManager[AsyncServices] | None = None
+        self._client: AsyncServices | None = None
+        self._retired: list[AbstractAsyncContextManager[AsyncServices]] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = asyncio.Lock()
+        self._figi_by_isin: dict[str, str] = {}
+        self._figi_lookups: dict[str, asyncio.Future[str]] = {}
+
+    async def download_candles(self, request: 'HistoricalDataRequest') -> 'Sequence[Candle]':
+        """Загружает свечи инструмента за период запроса одним вызовом GetCandles.
+
+        Args:
+            request: Инструмент, период (даты включительно) и интервал свечей.
+
+        Returns:
+            Свечи за период, упорядоченные по времени.
+        """
+        client = await self._session()
+        try:
+            figi = await self._resolve_figi(client, request.isin)
+            response = await client.market_data.get_candles(
+                figi=figi,
+                from_=datetime.combine(request.from_date, time.min, tzinfo=UTC),
+                to=datetime.combine(request.to_date + timedelta(days=1), time.min, tzinfo=UTC),
+                interval=_SDK_INTERVALS[CandleInterval(request.interval)],
+            )
+        except Exception as exc:
+            if _is_channel_failure(exc) and self._client is client and self._context is not None:
+                self._logger.warning('tinkoff_channel_failed', error=repr(exc))
+                self._retired.append(self._context)
+                self._context, self._client = None, None
+            raise
+        return [_map_candle(candle) for candle in response.candles]
+
+    async def close(self) -> None:
+        """Закрывает текущий и выведенные из работы каналы; следующий запрос откроет новый."""
+        contexts = [*self._retired, *([self._context] if self._context is not None else [])]
+        self._retired, self._context, self._client = [], None, None
+        for context in contexts:
+            try:
+                await context.__aexit__(None, None, None)
+            except Exception as exc:
+                self._logger.warning('tinkoff_channel_close_failed', error=repr(exc))
+
+    async def _session(self) -> 'AsyncServices':
+        """Возвращает открытую сессию клиента, открывая канал при необходимости.
+
+        При смене event loop старый канал отбрасывается без закрытия: его loop уже
+        непригоден.
+
+        Returns:
+            Открытая сессия AsyncServices.
+
+        Raises:
+            ValueError: Если токен Tinkoff Invest API не задан.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._retired, self._context, self._client = [], None, None
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._figi_lookups = {}
+
+        if self._client is not None:
+            return self._client
+
+        async with self._lock:
+            if self._client is None:
+                if not self._token:
+                    raise ValueError('Tinkoff Invest API token is not configured')
+                context = AsyncClient(self._token)
+                self._client = await context.__aenter__()
+                self._context = context
+                self._logger.info('tinkoff_channel_opened')
+            return self._client
+
+    async def _resolve_figi(self, client: 'AsyncServices', isin: str) -> str:
+        """Возвращает FIGI инструмента по ISIN, кэшируя результат.
+
+        Одновременные вызовы для одного ISIN ждут один запрос FindInstrument. Запрос
+        выполняется в отдельной задаче: отмена одного окна не отменяет его для
+        остальных.
+
+        Args:
+            client: Открытая сессия клиента.
+            isin: ISIN инструмента.
+
+        Returns:
+            FIGI инструмента.
+
+        Raises:
+            ValueError: Если инструмент по ISIN не найден.
+        """
+        figi = self._figi_by_isin.get(isin)
+        if figi is not None:
+            return figi
+
+        lookup = self._figi_lookups.get(isin)
+        if lookup is None:
+            lookup = asyncio.ensure_future(self._find_figi(client, isin))
+            self._figi_lookups[isin] = lookup
+            lookup.add_done_callback(lambda done: self._release_lookup(isin, done))
+        return await asyncio.shield(lookup)
+
+    async def _find_figi(self, client: 'AsyncServices', isin: str) -> str:
+        """Находит FIGI инструмента по ISIN через FindInstrument и кэширует его.
+
+        Поиск идёт по подстроке, поэтому из найденных инструментов берётся тот, чей
+        ISIN совпадает с запрошенным.
+
+        Args:
+            client: Открытая сессия клиента.
+            isin: ISIN инструмента.
+
+        Returns:
+            FIGI инструмента.
+
+        Raises:
+            ValueError: Если инструмент с таким ISIN не найден.
+        """
+        response = await client.instruments.find_instrument(query=isin)
+        instrument = next((item for item in response.instruments if item.isin == isin), None)
+        if instrument is None:
+            raise ValueError(f'Instrument not found by ISIN: {isin}')
+
+        figi = str(instrument.figi)
+        self._figi_by_isin[isin] = figi
+        return figi
+
+    def _release_lookup(self, isin: str, lookup: 'asyncio.Future[str]') -> None:
+        """Освобождает ISIN завершившегося поиска FIGI.
+
+        Исключение поиска помечается полученным, даже если все ждущие окна были
+        отменены, чтобы asyncio не писал «exception was never retrieved».
+
+        Args:
+            isin: ISIN инструмента.
+            lookup: Завершившийся поиск.
+        """
+        if self._figi_lookups.get(isin) is lookup:
+            del self._figi_lookups[isin]
+        if not lookup.cancelled():
+            lookup.exception()
+
+
+def _map_candle(candle: 'HistoricCandle') -> Candle:
+    """Преобразует свечу SDK в доменную модель свечи.
+
+    Args:
+        candle: Свеча SDK (HistoricCandle).
+
+    Returns:
+        Доменная свеча.
+    """
+    return Candle(
+        time=candle.time,
+        open=_quotation_to_decimal(candle.open),
+        high=_quotation_to_decimal(candle.high),
+        low=_quotation_to_decimal(candle.low),
+        close=_quotation_to_decimal(candle.close),
+        volume=candle.volume,
+    )
+
+
+def _quotation_to_decimal(value: 'Quotation') -> Decimal:
+    """Преобразует Quotation (units + nano) в Decimal.
+
+    Args:
+        value: Цена SDK.
+
+    Returns:
+        Цена в виде Decimal.
+    """
+    return Decimal(value.units) + Decimal(value.nano) / _NANO_IN_UNIT
+
+
+def _is_channel_failure(exc: BaseException) -> bool:
+    """Проверяет, что ошибка вызова говорит о неработоспособности канала.
+
+    Args:
+        exc: Исключение вызова.
+
+    Returns:
+        True, если канал нужно переоткрыть.
+    """
+    code = getattr(exc, 'code', None)
+    if callable(code):
+        code = code()
+    return code == StatusCode.UNAVAILABLE
@@ -1,13 +1,20 @@
 """Конфигурация и настройки сервиса finsight-worker."""
 
 import os
-from pathlib import Path  # noqa: TC003
+from pathlib import Path
 from socket import gethostname
-from typing import Final  # noqa: TC003
+from typing import Final
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from finsight_core.market_data.candle_windows import DEFAULT_CANDLE_WINDOW_CONCURRENCY
+from finsight_core.telemetry.log_queue import (
+    DEFAULT_LOG_QUEUE_CAPACITY,
+    DEFAULT_LOG_QUEUE_OVERFLOW_POLICY,
+    OverflowPolicy,
+)
+from finsight_worker.application.use_cases.download_historical_data_batch import DEFAULT_BATCH_CONCURRENCY
 from finsight_worker.domain.constants import AppEnv, LogLevel
 from finsight_worker.infrastructure.utils.pyproject import extract_project_field, find_pyproject_path
 
@@ -20,6 +27,8 @@ DEFAULT_REDIS_PORT: Final[int] = 6379
 DEFAULT_REDIS_DB: Final[int] = 0
 DEFAULT_REDIS_URL: Final[str] = f'redis://{DEFAULT_REDIS_HOST}:{DEFAULT_REDIS_PORT}/{DEFAULT_REDIS_DB}'
 DEFAULT_CELERY_BACKEND: Final[str] = DEFAULT_REDIS_URL
+DEFAULT_COVERAGE_DIR: Final[Path] = Path('data/coverage')
+DEFAULT_CANDLES_DIR: Final[Path] = Path('data/candles')
 
 PYPROJECT_PATH: Final[Path] = find_pyproject_path()
 
@@ -69,12 +78,23 @@ class LoggingSettings(BaseSettings):
 
     Attributes:
         log_level: Уровень логирования воркера.
+        queue_capacity: Ёмкость очереди логов.
+        queue_overflow_policy: Поведение при переполнении очереди логов.
     """
 
     log_level: LogLevel = Field(
         default=DEFAULT_LOG_LEVEL,
         description='Уровень логирования воркера',
     )
+    queue_capacity: int = Field(
+        default=DEFAULT_LOG_QUEUE_CAPACITY,
+        gt=0,
+        description='Ёмкость очереди логов',
+    )
+    queue_overflow_policy: OverflowPolicy = Field(
+        default=DEFAULT_LOG_QUEUE_OVERFLOW_POLICY,
+        description='Поведение при переполнении очереди логов: block, drop или drop_debug',
+    )
 
     model_config = SettingsConfigDict(**_ENV_SETTINGS)
 
@@ -115,6 +135,53 @@ class RedisSettings(BaseSettings):
     model_config = SettingsConfigDict(**_ENV_SETTINGS)
 
 
+class TinkoffSettings(BaseSettings):
+    """Настройки доступа к Tinkoff Invest API.
+
+    Attributes:
+        tinkoff_token: Read-only токен Tinkoff Invest API.
+        candles_concurrency: Максимум одновременных запросов окон свечей одного инструмента.
+        batch_concurrency: Максимум одновременно загружаемых инструментов в пакетной задаче.
+    """
+
+    tinkoff_token: str = Field(
+        default='',
+        description='Read-only токен Tinkoff Invest API. Без него задачи загрузки завершаются ошибкой.',
+    )
+    candles_concurrency: int = Field(
+        default=DEFAULT_CANDLE_WINDOW_CONCURRENCY,
+        ge=1,
+        description='Сколько окон истории свечей одного инструмента загружается одновременно.',
+    )
+    batch_concurrency: int = Field(
+        default=DEFAULT_BATCH_CONCURRENCY,
+        ge=1,
+        description='Сколько инструментов пакетной задачи загружается одновременно.',
+    )
+
+    model_config = SettingsConfigDict(**_ENV_SETTINGS)
+
+
+class StorageSettings(BaseSettings):
+    """Настройки локального хранения данных воркера.
+
+    Attributes:
+        coverage_dir: Каталог файлов покрытия загруженных периодов свечей.
+        candles_dir: Каталог файлов загруженных свечей.
+    """
+
+    coverage_dir: Path = Field(
+        default=DEFAULT_COVERAGE_DIR,
+        description='Каталог файлов покрытия загруженных периодов свечей (isin/interval).',
+    )
+    candles_dir: Path = Field(
+        default=DEFAULT_CANDLES_DIR,
+        description='Каталог файлов загруженных свечей (isin/interval/YYYY-MM).',
+    )
+
+    model_config = SettingsConfigDict(**_ENV_SETTINGS)
+
+
 class Settings(BaseSettings):
     """Корневые настройки воркера, объединяющие вложенные секции.
 
@@ -122,10 +189,14 @@ class Settings(BaseSettings):
         worker: Настройки Celery-воркера.
         logging: Настройки логирования.
         redis: Настройки Redis (брокер и backend).
+        tinkoff: Настройки доступа к Tinkoff Invest API.
+        storage: Настройки локального хранения данных.
     """
 
     worker: WorkerSettings = Field(default_factory=WorkerSettings)
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
     redis: RedisSettings = Field(default_factory=RedisSettings)
+    tinkoff: TinkoffSettings = Field(default_factory=TinkoffSettings)
+    storage: StorageSettings = Field(default_factory=StorageSettings)
 
     model_config = SettingsConfigDict(**_ENV_SETTINGS)
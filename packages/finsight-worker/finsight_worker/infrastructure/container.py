@@ -6,19 +6,31 @@ from dependency_injector import containers, providers
 
 from finsight_worker.domain.constants import LOGGER_NAME
 from finsight_worker.infrastructure.adapters.logger.structlog_logger import StructlogLogger
+from finsight_worker.infrastructure.adapters.storage import JsonCandleCoverageStore, JsonCandleStore
+from finsight_worker.infrastructure.adapters.tinkoff import TinkoffMarketDataGateway
+from finsight_worker.infrastructure.utils.event_loop import WorkerEventLoop
 
 if TYPE_CHECKING:
+    from finsight_worker.application.ports.candle_store import CandleStore
+    from finsight_worker.application.ports.coverage import CandleCoverageStore
+    from finsight_worker.application.ports.gateway import MarketDataGateway
     from finsight_worker.application.ports.logger import Logger
 
 
 class WorkerContainer(containers.DeclarativeContainer):
     """DI-контейнер воркера.
 
-    Собирает конфигурацию и провайдеры зависимостей (логгер на основе structlog).
+    Собирает конфигурацию и провайдеры зависимостей (логгер на основе structlog,
+    хранилища загруженных свечей и покрытия загруженных периодов, шлюз Tinkoff Invest API и event loop
+    процесса). Singleton-провайдеры живут столько же, сколько процесс воркера.
 
     Attributes:
         config: Провайдер конфигурации воркера.
         logger: Провайдер логгера StructlogLogger.
+        candle_store: Singleton хранилища свечей JsonCandleStore.
+        coverage_store: Singleton хранилища покрытия JsonCandleCoverageStore.
+        event_loop: Singleton долгоживущего event loop процесса WorkerEventLoop.
+        market_data_gateway: Singleton шлюза TinkoffMarketDataGateway (порт MarketDataGateway).
     """
 
     config = providers.Configuration()
@@ -27,3 +39,23 @@ class WorkerContainer(containers.DeclarativeContainer):
         StructlogLogger,
         name=LOGGER_NAME,
     )
+
+    candle_store: 'providers.Provider[CandleStore]' = providers.Singleton(
+        JsonCandleStore,
+        root=config.storage.candles_dir,
+        logger=logger,
+    )
+
+    coverage_store: 'providers.Provider[CandleCoverageStore]' = providers.Singleton(
+        JsonCandleCoverageStore,
+        root=config.storage.coverage_dir,
+        logger=logger,
+    )
+
+    event_loop: 'providers.Provider[WorkerEventLoop]' = providers.Singleton(WorkerEventLoop)
+
+    market_data_gateway: 'providers.Provider[MarketDataGateway]' = providers.Singleton(
+        TinkoffMarketDataGateway,
+        token=config.tinkoff.tinkoff_token,
+        logger=logger,
+    )
@@ -1,28 +1,40 @@
-"""Фоновая задача для загрузки исторических рыночных данных."""
+"""Фоновые задачи для загрузки исторических рыночных данных."""
 
 from datetime import date
 from typing import TYPE_CHECKING
 
+from celery.signals import worker_process_shutdown
+
 from finsight_worker.application.use_cases.download_historical_data import (
     DownloadHistoricalDataInputDto,
     DownloadHistoricalDataUseCase,
 )
+from finsight_worker.application.use_cases.download_historical_data_batch import DownloadHistoricalDataBatchUseCase
 from finsight_worker.domain.value_objects import CandleInterval
+from finsight_worker.infrastructure.config import Settings
 from finsight_worker.infrastructure.container import WorkerContainer
 
 if TYPE_CHECKING:
+    from typing import Any
+
     from celery import Celery
 
 container = WorkerContainer()
+container.config.from_pydantic(Settings())
 
 
 def register_tasks(app: 'Celery') -> None:
-    """Регистрирует в Celery задачу download_historical_data.
+    """Регистрирует в Celery задачи download_historical_data и download_historical_data_batch.
+
+    Также подписывает процесс воркера на закрытие канала Tinkoff и event loop при
+    остановке процесса.
 
     Args:
-        app: Экземпляр Celery, в котором регистрируется задача.
+        app: Экземпляр Celery, в котором регистрируются задачи.
     """
     app.task(name='download_historical_data')(download_historical_data_task)
+    app.task(name='download_historical_data_batch')(download_historical_data_batch_task)
+    worker_process_shutdown.connect(_close_process_resources, weak=False)
 
 
 def download_historical_data_task(
@@ -30,28 +42,105 @@ def download_historical_data_task(
     from_date: str,
     to_date: str,
     interval: CandleInterval = CandleInterval.DAY,
-) -> None:
+    incremental: bool = False,
+) -> int:
     """Celery-задача загрузки исторических данных по инструменту.
 
     Собирает зависимости из контейнера, парсит даты из ISO-формата и запускает
-    DownloadHistoricalDataUseCase.
+    асинхронный DownloadHistoricalDataUseCase в event loop процесса воркера;
+    загруженные свечи сохраняются в хранилище свечей.
 
     Args:
         isin: ISIN инструмента.
         from_date: Начальная дата в формате YYYY-MM-DD.
         to_date: Конечная дата в формате YYYY-MM-DD.
         interval: Интервал между свечами (по умолчанию "day").
+        incremental: Загружать только периоды, которых ещё нет в покрытии.
+
+    Returns:
+        Количество загруженных и сохранённых свечей.
+    """
+    dto = _make_input_dto(isin, from_date, to_date, interval, incremental)
+    return container.event_loop().run(_make_download_use_case().execute(dto))
+
+
+def download_historical_data_batch_task(
+    isins: list[str],
+    from_date: str,
+    to_date: str,
+    interval: CandleInterval = CandleInterval.DAY,
+    incremental: bool = False,
+) -> 'dict[str, Any]':
+    """Celery-задача загрузки исторических данных по набору инструментов одним сообщением.
+
+    Инструменты загружаются параллельно в event loop процесса воркера через общий
+    канал Tinkoff, свечи каждого инструмента сохраняются в хранилище свечей; число
+    одновременно загружаемых инструментов задаётся настройкой batch_concurrency.
+
+    Args:
+        isins: ISIN инструментов (повторы игнорируются).
+        from_date: Начальная дата в формате YYYY-MM-DD.
+        to_date: Конечная дата в формате YYYY-MM-DD.
+        interval: Интервал между свечами (по умолчанию "day").
+        incremental: Загружать только периоды, которых ещё нет в покрытии.
+
+    Returns:
+        Итог пакета: {"downloaded": {isin: сохранённых свечей}, "failed": {isin: ошибка}}.
+    """
+    dtos = [_make_input_dto(isin, from_date, to_date, interval, incremental) for isin in dict.fromkeys(isins)]
+    use_case = DownloadHistoricalDataBatchUseCase(download=_make_download_use_case(), logger=container.logger())
+
+    result = container.event_loop().run(
+        use_case.execute(dtos, concurrency=container.config.tinkoff.batch_concurrency())
+    )
+    return {'downloaded': result.downloaded, 'failed': result.failed}
+
+
+def _make_download_use_case() -> DownloadHistoricalDataUseCase:
+    """Собирает DownloadHistoricalDataUseCase из зависимостей контейнера.
+
+    Returns:
+        Use case загрузки данных одного инструмента.
     """
-    use_case = DownloadHistoricalDataUseCase(
+    return DownloadHistoricalDataUseCase(
         market_data_gateway=container.market_data_gateway(),
         logger=container.logger(),
+        candle_store=container.candle_store(),
+        coverage_store=container.coverage_store(),
     )
 
-    use_case.execute(
-        DownloadHistoricalDataInputDto(
-            isin=isin,
-            from_date=date.fromisoformat(from_date),
-            to_date=date.fromisoformat(to_date),
-            interval=interval,
-        )
+
+def _make_input_dto(
+    isin: str,
+    from_date: str,
+    to_date: str,
+    interval: CandleInterval,
+    incremental: bool,
+) -> DownloadHistoricalDataInputDto:
+    """Собирает входные параметры use case из аргументов задачи.
+
+    Args:
+        isin: ISIN инструмента.
+        from_date: Начальная дата в формате YYYY-MM-DD.
+        to_date: Конечная дата в формате YYYY-MM-DD.
+        interval: Интервал между свечами.
+        incremental: Загружать только периоды, которых ещё нет в покрытии.
+
+    Returns:
+        Параметры загрузки инструмента.
+    """
+    return DownloadHistoricalDataInputDto(
+        isin=isin,
+        from_date=date.fromisoformat(from_date),
+        to_date=date.fromisoformat(to_date),
+        interval=CandleInterval(interval),
+        concurrency=container.config.tinkoff.candles_concurrency(),
+        incremental=incremental,
     )
+
+
+def _close_process_resources(**_: object) -> None:
+    """Закрывает канал Tinkoff и event loop процесса при его остановке."""
+    loop = container.event_loop()
+    loop.run(container.market_data_gateway().close())
+    loop.close()
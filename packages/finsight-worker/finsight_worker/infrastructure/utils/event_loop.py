@@ -0,0 +1,58 @@
+"""Долгоживущий event loop процесса воркера.
+
+`asyncio.run` в каждой задаче создаёт и закрывает новый loop, а вместе с ним —
+gRPC-канал к Tinkoff Invest API (TLS-рукопожатие на каждую задачу). Процесс
+Celery (prefork) выполняет задачи последовательно в главном потоке, поэтому один
+loop на процесс можно переиспользовать между задачами: каналы и кэши адаптеров,
+привязанные к loop, живут столько же, сколько процесс.
+"""
+
+import asyncio
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+
+class WorkerEventLoop:
+    """Event loop, переиспользуемый задачами одного процесса воркера.
+
+    Loop создаётся лениво при первом вызове `run`. Если процесс был форкнут после
+    создания loop (prefork-пул Celery), дочерний процесс создаёт собственный loop:
+    loop родителя в нём непригоден.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует держатель loop без создания самого loop."""
+        self._runner: asyncio.Runner | None = None
+        self._pid: int | None = None
+
+    def run[T](self, coroutine: 'Coroutine[object, object, T]') -> T:
+        """Выполняет корутину в loop процесса и возвращает её результат.
+
+        Args:
+            coroutine: Корутина задачи.
+
+        Returns:
+            Результат корутины.
+        """
+        return self._ensure_runner().run(coroutine)
+
+    def close(self) -> None:
+        """Закрывает loop процесса (при остановке процесса воркера)."""
+        if self._runner is not None and self._pid == os.getpid():
+            self._runner.close()
+        self._runner = None
+        self._pid = None
+
+    def _ensure_runner(self) -> asyncio.Runner:
+        """Возвращает Runner текущего процесса, создавая его при необходимости.
+
+        Returns:
+            Runner с долгоживущим loop.
+        """
+        if self._runner is None or self._pid != os.getpid():
+            self._runner = asyncio.Runner()
+            self._pid = os.getpid()
+        return self._runner
@@ -3,17 +3,30 @@
 from typing import TYPE_CHECKING
 
 from celery import Celery
+from celery.signals import worker_process_shutdown
 
-from finsight_worker.infrastructure.adapters.logger.logging import configure_logging
+from finsight_worker.infrastructure.adapters.logger.logging import configure_logging, shutdown_logging
 
 if TYPE_CHECKING:
+    from typing import Any
+
     from finsight_worker.infrastructure.config import Settings
 
 
+@worker_process_shutdown.connect
+def flush_logs_on_process_shutdown(**_: 'Any') -> None:
+    """Дописывает очередь логов дочернего процесса воркера перед его завершением.
+
+    Дочерние процессы пула завершаются без atexit-обработчиков, поэтому очередь
+    логов останавливается по сигналу Celery.
+    """
+    shutdown_logging()
+
+
 def create_celery_app(settings: 'Settings') -> 'Celery':
     """Создаёт и настраивает экземпляр Celery.
 
-    Настраивает логирование по параметрам воркера и создаёт Celery с Redis в роли
+    Настраивает логирование (с очередью логов) по параметрам воркера и создаёт Celery с Redis в роли
     брокера и backend и JSON-сериализацией задач.
 
     Args:
@@ -28,6 +41,8 @@ def create_celery_app(settings: 'Settings') -> 'Celery':
         env=settings.worker.env,
         instance=settings.worker.host,
         log_level=settings.logging.log_level,
+        queue_capacity=settings.logging.queue_capacity,
+        queue_overflow_policy=settings.logging.queue_overflow_policy,
     )
 
     app = Celery(
@@ -0,0 +1,169 @@
+"""Юнит-тесты Use Case загрузки исторических данных воркера."""
+
+from datetime import date, datetime, timedelta, UTC
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_core.market_data.candle_coverage import CandleCoverage
+from finsight_worker.application.ports.candle_store import CandleStore
+from finsight_worker.application.ports.coverage import CandleCoverageStore
+from finsight_worker.application.ports.gateway import MarketDataGateway
+from finsight_worker.application.use_cases.download_historical_data import (
+    DownloadHistoricalDataInputDto,
+    DownloadHistoricalDataUseCase,
+)
+from finsight_worker.domain.models import Candle
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pytest_mock import MockerFixture
+
+    from finsight_worker.domain.models import HistoricalDataRequest
+    from finsight_worker.domain.value_objects import CandleInterval
+
+
+ISIN = 'RU000A0JX0J2'
+NOW = datetime(2024, 2, 1, tzinfo=UTC)
+
+
+class FakeGateway(MarketDataGateway):
+    """Шлюз, отдающий по свече на каждые сутки окна и запоминающий запросы."""
+
+    def __init__(self, *, fail_on: 'date | None' = None) -> None:
+        """Инициализирует шлюз.
+
+        Args:
+            fail_on: Дата начала окна, запрос которого завершается ошибкой.
+        """
+        self.requests: list[HistoricalDataRequest] = []
+        self._fail_on = fail_on
+
+    async def download_candles(self, request: 'HistoricalDataRequest') -> 'Sequence[Candle]':
+        self.requests.append(request)
+        if request.from_date == self._fail_on:
+            raise ConnectionError('window failed')
+        days = (request.to_date - request.from_date).days + 1
+        return [make_candle(request.from_date + timedelta(days=day)) for day in range(days)]
+
+
+class FakeCandleStore(CandleStore):
+    """Хранилище свечей в памяти."""
+
+    def __init__(self) -> None:
+        """Инициализирует пустое хранилище."""
+        self.saved: dict[datetime, Candle] = {}
+
+    async def save(self, _isin: str, _interval: 'CandleInterval', candles: 'Sequence[Candle]') -> None:
+        self.saved.update((candle.time, candle) for candle in candles)
+
+
+class FakeCoverageStore(CandleCoverageStore):
+    """Хранилище покрытия в памяти."""
+
+    def __init__(self, coverage: CandleCoverage | None = None) -> None:
+        """Инициализирует хранилище.
+
+        Args:
+            coverage: Начальное покрытие.
+        """
+        self.coverage = coverage or CandleCoverage()
+
+    async def load(self, _isin: str, _interval: 'CandleInterval') -> CandleCoverage:
+        return self.coverage
+
+    async def save(self, _isin: str, _interval: 'CandleInterval', coverage: CandleCoverage) -> None:
+        self.coverage = coverage
+
+
+def make_candle(day: date) -> Candle:
+    return Candle(
+        time=datetime(day.year, day.month, day.day, tzinfo=UTC),
+        open=Decimal('100.5'),
+        high=Decimal('101'),
+        low=Decimal('99'),
+        close=Decimal('100'),
+        volume=10,
+    )
+
+
+def make_use_case(
+    gateway: FakeGateway,
+    candle_store: FakeCandleStore,
+    coverage_store: FakeCoverageStore,
+    mocker: 'MockerFixture',
+) -> DownloadHistoricalDataUseCase:
+    return DownloadHistoricalDataUseCase(
+        market_data_gateway=gateway,
+        logger=mocker.Mock(),
+        candle_store=candle_store,
+        coverage_store=coverage_store,
+        clock=lambda: NOW,
+    )
+
+
+def utc(day: int) -> datetime:
+    return datetime(2024, 1, day, tzinfo=UTC)
+
+
+@pytest.mark.unit
+class TestDownloadHistoricalDataUseCase:
+    async def test_execute__saves_candles_and_coverage(self, mocker: 'MockerFixture') -> None:
+        """Должен сохранять свечи загруженного периода и отмечать период в покрытии."""
+        gateway, candle_store, coverage_store = FakeGateway(), FakeCandleStore(), FakeCoverageStore()
+
+        count = await make_use_case(gateway, candle_store, coverage_store, mocker).execute(
+            DownloadHistoricalDataInputDto(isin=ISIN, from_date=date(2024, 1, 1), to_date=date(2024, 1, 9))
+        )
+
+        expected_count = 9
+        assert count == expected_count
+        assert sorted(candle_store.saved) == [utc(day) for day in range(1, 10)]
+        assert coverage_store.coverage == CandleCoverage().add(utc(1), utc(10))
+
+    async def test_execute__incremental_downloads_only_missing_periods(self, mocker: 'MockerFixture') -> None:
+        """Должен в инкрементальном режиме запрашивать и сохранять только дыру и хвост после watermark."""
+        gateway, candle_store = FakeGateway(), FakeCandleStore()
+        coverage_store = FakeCoverageStore(CandleCoverage().add(utc(1), utc(3)).add(utc(5), utc(8)))
+
+        await make_use_case(gateway, candle_store, coverage_store, mocker).execute(
+            DownloadHistoricalDataInputDto(
+                isin=ISIN, from_date=date(2024, 1, 1), to_date=date(2024, 1, 9), incremental=True
+            )
+        )
+
+        assert [(request.from_date, request.to_date) for request in gateway.requests] == [
+            (date(2024, 1, 3), date(2024, 1, 4)),
+            (date(2024, 1, 8), date(2024, 1, 9)),
+        ]
+        assert sorted(candle_store.saved) == [utc(3), utc(4), utc(8), utc(9)]
+        assert coverage_store.coverage == CandleCoverage().add(utc(1), utc(10))
+
+    async def test_execute__does_not_cover_unsaved_window(self, mocker: 'MockerFixture') -> None:
+        """Должен отмечать в покрытии только окна, свечи которых сохранены, если загрузка упала."""
+        gateway = FakeGateway(fail_on=date(2024, 1, 8))
+        candle_store = FakeCandleStore()
+        coverage_store = FakeCoverageStore(CandleCoverage().add(utc(5), utc(8)))
+
+        with pytest.raises(ConnectionError):
+            await make_use_case(gateway, candle_store, coverage_store, mocker).execute(
+                DownloadHistoricalDataInputDto(
+                    isin=ISIN, from_date=date(2024, 1, 3), to_date=date(2024, 1, 9), incremental=True
+                )
+            )
+
+        assert sorted(candle_store.saved) == [utc(3), utc(4)]
+        assert coverage_store.coverage == CandleCoverage().add(utc(3), utc(8))
+
+    async def test_execute__does_not_cover_current_day(self, mocker: 'MockerFixture') -> None:
+        """Должен сохранять свечи текущих суток, но не отмечать их в покрытии."""
+        gateway, candle_store, coverage_store = FakeGateway(), FakeCandleStore(), FakeCoverageStore()
+
+        await make_use_case(gateway, candle_store, coverage_store, mocker).execute(
+            DownloadHistoricalDataInputDto(isin=ISIN, from_date=date(2024, 1, 30), to_date=NOW.date())
+        )
+
+        assert max(candle_store.saved) == NOW
+        assert coverage_store.coverage == CandleCoverage().add(utc(30), NOW)
@@ -0,0 +1,58 @@
+"""Юнит-тесты Use Case пакетной загрузки исторических данных воркера."""
+
+import asyncio
+from datetime import date
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_worker.application.use_cases.download_historical_data import DownloadHistoricalDataInputDto
+from finsight_worker.application.use_cases.download_historical_data_batch import DownloadHistoricalDataBatchUseCase
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def make_dto(isin: str) -> DownloadHistoricalDataInputDto:
+    return DownloadHistoricalDataInputDto(isin=isin, from_date=date(2024, 1, 1), to_date=date(2024, 1, 31))
+
+
+class FakeDownload:
+    """Use case загрузки одного инструмента: считает одновременные загрузки, ISIN на 'XX' падает."""
+
+    def __init__(self) -> None:
+        """Инициализирует use case без загрузок."""
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def execute(self, dto: DownloadHistoricalDataInputDto) -> int:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if dto.isin.startswith('XX'):
+            raise ConnectionError(dto.isin)
+        return len(dto.isin)
+
+
+@pytest.mark.unit
+class TestDownloadHistoricalDataBatchUseCase:
+    async def test_execute__collects_downloaded_and_failed(self, mocker: 'MockerFixture') -> None:
+        """Должен загружать инструменты пакета, не прерываясь на ошибке одного из них."""
+        download = FakeDownload()
+        use_case = DownloadHistoricalDataBatchUseCase(download=download, logger=mocker.Mock())  # type: ignore[arg-type]
+
+        result = await use_case.execute([make_dto('RU01'), make_dto('XX02'), make_dto('RU003')], concurrency=2)
+
+        assert result.downloaded == {'RU01': 4, 'RU003': 5}
+        assert result.failed == {'XX02': repr(ConnectionError('XX02'))}
+        assert download.max_in_flight == 2  # noqa: PLR2004
+
+    async def test_execute__rejects_non_positive_concurrency(self, mocker: 'MockerFixture') -> None:
+        """Должен отклонять неположительное число одновременных загрузок."""
+        use_case = DownloadHistoricalDataBatchUseCase(download=FakeDownload(), logger=mocker.Mock())  # type: ignore[arg-type]
+
+        with pytest.raises(ValueError, match='Concurrency'):
+            await use_case.execute([make_dto('RU01')], concurrency=0)
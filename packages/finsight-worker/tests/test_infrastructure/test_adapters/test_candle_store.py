@@ -0,0 +1,66 @@
+"""Юнит-тесты файлового хранилища свечей JsonCandleStore."""
+
+from datetime import datetime, UTC
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import orjson
+import pytest
+
+from finsight_worker.domain.models import Candle
+from finsight_worker.domain.value_objects import CandleInterval
+from finsight_worker.infrastructure.adapters.storage import JsonCandleStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+ISIN = 'RU000A0JX0J2'
+
+
+def make_candle(time: datetime, close: str = '100') -> Candle:
+    return Candle(
+        time=time,
+        open=Decimal('100.5'),
+        high=Decimal('101'),
+        low=Decimal('99'),
+        close=Decimal(close),
+        volume=10,
+    )
+
+
+def read_times(path: 'Path') -> list[int]:
+    return [row[0] for row in orjson.loads(path.read_bytes())]
+
+
+@pytest.mark.unit
+class TestJsonCandleStore:
+    async def test_save__partitions_by_month_and_merges_by_time(
+        self, tmp_path: 'Path', mocker: 'MockerFixture'
+    ) -> None:
+        """Должен раскладывать свечи по месяцам и заменять сохранённые свечи с тем же временем."""
+        store = JsonCandleStore(root=tmp_path, logger=mocker.Mock())
+        jan_31, feb_1, feb_2 = (datetime(2024, *day, tzinfo=UTC) for day in ((1, 31), (2, 1), (2, 2)))
+
+        await store.save(ISIN, CandleInterval.DAY, [make_candle(feb_2), make_candle(jan_31)])
+        await store.save(ISIN, CandleInterval.DAY, [make_candle(feb_1), make_candle(feb_2, close='105.25')])
+
+        february = tmp_path / ISIN / 'day' / '2024-02.json'
+        assert read_times(tmp_path / ISIN / 'day' / '2024-01.json') == [int(jan_31.timestamp())]
+        assert read_times(february) == [int(feb_1.timestamp()), int(feb_2.timestamp())]
+        assert orjson.loads(february.read_bytes())[1] == [int(feb_2.timestamp()), '100.5', '101', '99', '105.25', 10]
+
+    async def test_save__overwrites_corrupted_file(self, tmp_path: 'Path', mocker: 'MockerFixture') -> None:
+        """Должен логировать повреждённый файл месяца и перезаписывать его новыми свечами."""
+        logger = mocker.Mock()
+        path = tmp_path / ISIN / 'day' / '2024-01.json'
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b'{not json')
+        jan_1 = datetime(2024, 1, 1, tzinfo=UTC)
+
+        await JsonCandleStore(root=tmp_path, logger=logger).save(ISIN, CandleInterval.DAY, [make_candle(jan_1)])
+
+        assert read_times(path) == [int(jan_1.timestamp())]
+        logger.warning.assert_called_once()
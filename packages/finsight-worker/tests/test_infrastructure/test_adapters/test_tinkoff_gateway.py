@@ -0,0 +1,143 @@
+"""Юнит-тесты шлюза TinkoffMarketDataGateway."""
+
+import asyncio
+from datetime import date, datetime, UTC
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_worker.domain.models import Candle, HistoricalDataRequest
+from finsight_worker.infrastructure.adapters.tinkoff import TinkoffMarketDataGateway
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+ISIN = 'RU000A0JX0J2'
+FIGI = 'BBG00BOND001'
+JAN_1 = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def quotation(units: int, nano: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(units=units, nano=nano)
+
+
+class FakeServices:
+    """Сессия SDK: FindInstrument уступает loop и возвращает заданные инструменты."""
+
+    def __init__(self, instruments: list[SimpleNamespace]) -> None:
+        """Инициализирует сессию.
+
+        Args:
+            instruments: Инструменты ответа FindInstrument.
+        """
+        self.queries: list[str] = []
+        self.candle_figis: list[str] = []
+        self.instruments = SimpleNamespace(find_instrument=self._find_instrument)
+        self.market_data = SimpleNamespace(get_candles=self._get_candles)
+        self._instruments = instruments
+
+    async def _find_instrument(self, *, query: str) -> SimpleNamespace:
+        self.queries.append(query)
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(instruments=self._instruments)
+
+    async def _get_candles(self, *, figi: str, **_: object) -> SimpleNamespace:
+        self.candle_figis.append(figi)
+        candle = SimpleNamespace(
+            time=JAN_1,
+            open=quotation(100, 500_000_000),
+            high=quotation(101),
+            low=quotation(99, 990_000_000),
+            close=quotation(100),
+            volume=7,
+        )
+        return SimpleNamespace(candles=[candle])
+
+
+class FakeClient:
+    """Контекстный менеджер AsyncClient, открывающий FakeServices."""
+
+    def __init__(self, services: FakeServices) -> None:
+        """Инициализирует клиент.
+
+        Args:
+            services: Сессия, которую отдаёт клиент.
+        """
+        self._services = services
+
+    async def __aenter__(self) -> FakeServices:
+        """Открывает сессию."""
+        return self._services
+
+    async def __aexit__(self, *_: object) -> None:
+        """Закрывает сессию."""
+        return None
+
+
+def make_gateway(mocker: 'MockerFixture', services: FakeServices) -> TinkoffMarketDataGateway:
+    mocker.patch(
+        'finsight_worker.infrastructure.adapters.tinkoff.gateway.AsyncClient',
+        return_value=FakeClient(services),
+    )
+    return TinkoffMarketDataGateway(token='token', logger=mocker.Mock())
+
+
+def make_request(day: int) -> HistoricalDataRequest:
+    return HistoricalDataRequest(isin=ISIN, from_date=date(2024, 1, day), to_date=date(2024, 1, day))
+
+
+@pytest.mark.unit
+class TestTinkoffMarketDataGateway:
+    async def test_download_candles__maps_sdk_candles(self, mocker: 'MockerFixture') -> None:
+        """Должен преобразовывать свечи SDK (units/nano) в доменные свечи с Decimal-ценами."""
+        gateway = make_gateway(mocker, FakeServices([SimpleNamespace(isin=ISIN, figi=FIGI)]))
+
+        candles = await gateway.download_candles(make_request(1))
+
+        assert candles == [
+            Candle(
+                time=JAN_1,
+                open=Decimal('100.5'),
+                high=Decimal('101'),
+                low=Decimal('99.99'),
+                close=Decimal('100'),
+                volume=7,
+            )
+        ]
+
+    async def test_download_candles__coalesces_concurrent_figi_lookups(self, mocker: 'MockerFixture') -> None:
+        """Должен искать FIGI один раз для параллельных окон одного ISIN."""
+        services = FakeServices([SimpleNamespace(isin=ISIN, figi=FIGI)])
+        gateway = make_gateway(mocker, services)
+
+        await asyncio.gather(*(gateway.download_candles(make_request(day)) for day in range(1, 6)))
+        await gateway.download_candles(make_request(6))
+
+        assert services.queries == [ISIN]
+        assert services.candle_figis == [FIGI] * 6
+
+    async def test_download_candles__picks_instrument_with_requested_isin(self, mocker: 'MockerFixture') -> None:
+        """Должен брать FIGI инструмента, ISIN которого совпадает с запрошенным, а не первого найденного."""
+        services = FakeServices(
+            [SimpleNamespace(isin=f'{ISIN}X', figi='BBG00OTHER01'), SimpleNamespace(isin=ISIN, figi=FIGI)]
+        )
+
+        await make_gateway(mocker, services).download_candles(make_request(1))
+
+        assert services.candle_figis == [FIGI]
+
+    async def test_download_candles__fails_without_exact_isin_match(self, mocker: 'MockerFixture') -> None:
+        """Должен падать с ValueError, если среди найденных нет инструмента с запрошенным ISIN."""
+        services = FakeServices([SimpleNamespace(isin=f'{ISIN}X', figi='BBG00OTHER01')])
+        gateway = make_gateway(mocker, services)
+
+        results = await asyncio.gather(
+            *(gateway.download_candles(make_request(day)) for day in (1, 2)), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert services.queries == [ISIN]
+        assert services.candle_figis == []
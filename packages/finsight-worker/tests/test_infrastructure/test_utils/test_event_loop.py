@@ -0,0 +1,54 @@
+"""Юнит-тесты долгоживущего event loop процесса воркера."""
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from finsight_worker.infrastructure.utils.event_loop import WorkerEventLoop
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+async def running_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+@pytest.mark.unit
+class TestWorkerEventLoop:
+    def test_run__reuses_loop_between_tasks(self) -> None:
+        """Должен выполнять задачи процесса в одном и том же loop."""
+        event_loop = WorkerEventLoop()
+        try:
+            first = event_loop.run(running_loop())
+            second = event_loop.run(running_loop())
+        finally:
+            event_loop.close()
+
+        assert first is second
+        assert first.is_closed()
+
+    def test_run__creates_new_loop_after_close(self) -> None:
+        """Должен создавать новый loop при первом запуске после закрытия."""
+        event_loop = WorkerEventLoop()
+        first = event_loop.run(running_loop())
+        event_loop.close()
+
+        second = event_loop.run(running_loop())
+        event_loop.close()
+
+        assert second is not first
+
+    def test_run__creates_new_loop_after_fork(self, mocker: 'MockerFixture') -> None:
+        """Должен создавать собственный loop в дочернем процессе и не закрывать loop родителя."""
+        event_loop = WorkerEventLoop()
+        parent = event_loop.run(running_loop())
+        mocker.patch('finsight_worker.infrastructure.utils.event_loop.os.getpid', return_value=-1)
+
+        child = event_loop.run(running_loop())
+
+        assert child is not parent
+        assert not parent.is_closed()
+        event_loop.close()
+        parent.close()